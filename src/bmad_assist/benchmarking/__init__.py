@@ -41,6 +41,9 @@ Public API:
     ExtractionContext: Context dataclass for extraction
     ExtractedMetrics: Result dataclass with all LLM-extracted fields
     MetricsExtractionError: Exception for extraction failures
+
+    Metrics store:
+    MetricsStore: SQLite store for aggregate duration queries
 """
 
 from bmad_assist.benchmarking.collector import (
@@ -70,6 +73,7 @@ from bmad_assist.benchmarking.ground_truth import (
     calculate_precision_recall,
     populate_ground_truth,
 )
+from bmad_assist.benchmarking.metrics_store import MetricsStore
 from bmad_assist.benchmarking.reports import (
     ComparisonResult,
     MetricComparison,
@@ -169,6 +173,7 @@ __all__ = [
     "RecordFilters",
     "RecordSummary",
     "StorageError",
+    "MetricsStore",
     # Ground Truth (Story 13.7)
     "populate_ground_truth",
     "amend_ground_truth",
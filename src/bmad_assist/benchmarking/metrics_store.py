@@ -0,0 +1,317 @@
+"""Queryable SQLite store for evaluation record metrics.
+
+Evaluation records are YAML files, one per validator/reviewer/synthesizer
+run. Aggregating them (e.g., for the dashboard's epic metrics panel) used to
+mean globbing and parsing every file on every request. This store keeps the
+queryable columns of each record in benchmarks/metrics.sqlite:
+
+- save_evaluation_record() adds each record as it is written
+- the first query backfills records written before the store existed
+- `bmad-assist benchmark backfill-metrics` re-scans benchmark directories
+
+The YAML records stay the source of truth; the store can be deleted and
+rebuilt at any time.
+
+Public API:
+    MetricsStore: Store bound to a benchmarks directory
+    METRICS_DB_FILENAME: Database filename inside the benchmarks directory
+"""
+
+import contextlib
+import logging
+import sqlite3
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+from typing import Any, Literal
+
+import yaml
+
+from bmad_assist.benchmarking.schema import LLMEvaluationRecord
+
+logger = logging.getLogger(__name__)
+
+METRICS_DB_FILENAME = "metrics.sqlite"
+
+# Bump when the table layout changes; older databases are rebuilt
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    record_id TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    epic TEXT NOT NULL,
+    story_num,
+    story_title TEXT,
+    workflow_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    provider TEXT,
+    model TEXT,
+    duration_ms INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_evaluations_epic ON evaluations (epic, story_num);
+CREATE INDEX IF NOT EXISTS idx_evaluations_path ON evaluations (path);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+_GROUP_COLUMNS: dict[str, str] = {
+    "epic": "epic",
+    "story": "epic, story_num",
+    "workflow": "workflow_id",
+    "role": "role",
+}
+
+GroupBy = Literal["epic", "story", "workflow", "role"]
+
+
+class MetricsStore:
+    """SQLite metrics store for one benchmarks directory.
+
+    Each operation opens a short-lived connection, so an instance can be
+    shared across threads and processes. WAL mode lets readers proceed while
+    parallel validators insert records.
+
+    Attributes:
+        benchmarks_dir: Directory holding YYYY-MM month directories.
+        db_path: Path to the SQLite database.
+
+    """
+
+    def __init__(self, benchmarks_dir: Path) -> None:
+        """Bind the store to a benchmarks directory.
+
+        Args:
+            benchmarks_dir: Directory holding YYYY-MM month directories.
+
+        """
+        self.benchmarks_dir = benchmarks_dir
+        self.db_path = benchmarks_dir / METRICS_DB_FILENAME
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, creating or upgrading the schema as needed."""
+        self.benchmarks_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.executescript(
+                    "DROP TABLE IF EXISTS evaluations; DROP TABLE IF EXISTS meta;"
+                )
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # -------------------------------------------------------------------------
+    # Population
+    # -------------------------------------------------------------------------
+
+    def add_record(self, record: LLMEvaluationRecord, path: Path) -> None:
+        """Insert or replace the metrics row for a saved record.
+
+        Args:
+            record: Evaluation record that was saved.
+            path: Path of the saved YAML file.
+
+        """
+        row = (
+            record.record_id,
+            str(path),
+            str(record.story.epic_num),
+            record.story.story_num,
+            record.story.title,
+            record.workflow.id,
+            record.evaluator.role.value,
+            record.evaluator.provider,
+            record.evaluator.model,
+            record.execution.duration_ms,
+            record.created_at.isoformat(),
+        )
+        with self._connect() as conn:
+            conn.execute(_INSERT_SQL, row)
+
+    def backfill(self) -> int:
+        """Add eval-*.yaml files that are not in the store yet.
+
+        Returns:
+            Number of records added.
+
+        """
+        added = 0
+        with self._connect() as conn:
+            known = {row[0] for row in conn.execute("SELECT path FROM evaluations")}
+            rows = []
+            for eval_file in self._iter_eval_files():
+                if str(eval_file) in known:
+                    continue
+                row = _row_from_file(eval_file)
+                if row is not None:
+                    rows.append(row)
+            conn.executemany(_INSERT_SQL, rows)
+            added = len(rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('backfilled', '1')"
+            )
+        if added:
+            logger.info("Backfilled %d evaluation records into %s", added, self.db_path)
+        return added
+
+    def ensure_backfilled(self) -> None:
+        """Backfill once, the first time the store is queried."""
+        with self._connect() as conn:
+            done = conn.execute("SELECT value FROM meta WHERE key = 'backfilled'").fetchone()
+        if done is None:
+            self.backfill()
+
+    def _iter_eval_files(self) -> Iterator[Path]:
+        """Yield evaluation record files from all month directories."""
+        if not self.benchmarks_dir.exists():
+            return
+        for month_dir in sorted(self.benchmarks_dir.iterdir()):
+            if month_dir.is_dir():
+                yield from sorted(month_dir.glob("eval-*.yaml"))
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def duration_summary(
+        self,
+        group_by: GroupBy,
+        epic_id: int | str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Aggregate durations per epic, story, workflow or role.
+
+        Args:
+            group_by: Grouping dimension.
+            epic_id: Optional epic to restrict the aggregation to.
+
+        Returns:
+            One dict per group with the group columns plus count,
+            total_duration_ms, avg_duration_ms and max_duration_ms.
+
+        """
+        columns = _GROUP_COLUMNS[group_by]
+        where, params = ("WHERE epic = ?", (str(epic_id),)) if epic_id is not None else ("", ())
+        self.ensure_backfilled()
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                f"SELECT {columns}, COUNT(*) AS count, "  # noqa: S608 - columns from allowlist
+                "SUM(duration_ms) AS total_duration_ms, "
+                "AVG(duration_ms) AS avg_duration_ms, "
+                "MAX(duration_ms) AS max_duration_ms "
+                f"FROM evaluations {where} GROUP BY {columns} ORDER BY {columns}",
+                params,
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def epic_metrics(self, epic_id: int | str) -> dict[str, Any] | None:
+        """Aggregate timing and workflow statistics for an epic.
+
+        Same shape as DashboardServer.get_epic_metrics().
+
+        Args:
+            epic_id: Epic identifier (numeric or string like 'testarch').
+
+        Returns:
+            Dictionary with aggregated metrics, or None if the epic has no records.
+
+        """
+        self.ensure_backfilled()
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT story_num, story_title, workflow_id, role, duration_ms "
+                "FROM evaluations WHERE epic = ? ORDER BY created_at, rowid",
+                (str(epic_id),),
+            ).fetchall()
+        if not rows:
+            return None
+
+        metrics: dict[str, Any] = {
+            "epic_id": epic_id,
+            "total_duration_ms": 0,
+            "story_count": 0,
+            "workflow_breakdown": {},
+            "stories": {},
+        }
+        for story_num, story_title, workflow_id, role, duration_ms in rows:
+            metrics["total_duration_ms"] += duration_ms
+
+            breakdown = metrics["workflow_breakdown"].setdefault(
+                workflow_id, {"count": 0, "total_duration_ms": 0}
+            )
+            breakdown["count"] += 1
+            breakdown["total_duration_ms"] += duration_ms
+
+            story = metrics["stories"].setdefault(
+                str(story_num),
+                {
+                    "story_num": story_num,
+                    "title": story_title or f"Story {story_num}",
+                    "total_duration_ms": 0,
+                    "workflows": {},
+                },
+            )
+            story["total_duration_ms"] += duration_ms
+            wf = story["workflows"].setdefault(workflow_id, {"duration_ms": 0, "roles": []})
+            wf["duration_ms"] += duration_ms
+            if role not in wf["roles"]:
+                wf["roles"].append(role)
+
+        metrics["story_count"] = len(metrics["stories"])
+        metrics["stories"] = sorted(
+            metrics["stories"].values(),
+            key=lambda s: _story_sort_key(s.get("story_num")),
+        )
+        return metrics
+
+
+_INSERT_SQL = (
+    "INSERT OR REPLACE INTO evaluations (record_id, path, epic, story_num, story_title, "
+    "workflow_id, role, provider, model, duration_ms, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _story_sort_key(story_num: Any) -> tuple[int, Any]:
+    """Sort numeric story numbers numerically, others after them as strings."""
+    if isinstance(story_num, int):
+        return (0, story_num)
+    return (1, str(story_num or ""))
+
+
+def _row_from_file(eval_file: Path) -> tuple[Any, ...] | None:
+    """Build a metrics row from an evaluation record file."""
+    try:
+        data = yaml.safe_load(eval_file.read_text(encoding="utf-8"))
+    except (yaml.YAMLError, OSError) as e:
+        logger.warning("Failed to parse benchmark file %s: %s", eval_file, e)
+        return None
+    if not isinstance(data, dict) or not data.get("record_id"):
+        return None
+
+    story = data.get("story") or {}
+    evaluator = data.get("evaluator") or {}
+    created_at = data.get("created_at")
+    if isinstance(created_at, date):
+        # yaml.safe_load parses ISO timestamps into datetime objects
+        created_at = created_at.isoformat()
+    return (
+        data["record_id"],
+        str(eval_file),
+        str(story.get("epic_num")),
+        story.get("story_num"),
+        story.get("title"),
+        (data.get("workflow") or {}).get("id", "unknown"),
+        evaluator.get("role", "unknown"),
+        evaluator.get("provider"),
+        evaluator.get("model"),
+        (data.get("execution") or {}).get("duration_ms", 0) or 0,
+        created_at,
+    )
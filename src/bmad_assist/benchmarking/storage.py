@@ -3,27 +3,37 @@
 Provides YAML-based persistence with atomic writes, index management,
 and query operations for benchmarking records.
 
+Each month directory has an append-only index.jsonl (one entry per line).
+Legacy index.yaml files are still read and are migrated into index.jsonl on
+the next save into that month.
+
 Public API:
     save_evaluation_record: Save record with atomic write
     load_evaluation_record: Load and validate record
     list_evaluation_records: List records with filtering
     get_records_for_story: Get all records for a story
+    compact_index: Drop duplicate/corrupt lines from a month's index
     StorageError: Storage operation exception
     RecordFilters: Filter criteria dataclass
     RecordSummary: Record metadata dataclass
 """
 
 import fcntl
+import json
 import logging
 import os
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import yaml
 from pydantic import ValidationError
 
+from bmad_assist.benchmarking.metrics_store import MetricsStore
 from bmad_assist.benchmarking.schema import (
     BenchmarkingError,
     EvaluatorRole,
@@ -32,6 +42,15 @@ from bmad_assist.benchmarking.schema import (
 
 logger = logging.getLogger(__name__)
 
+# Append-only per-month index; one JSON entry per line
+INDEX_FILENAME = "index.jsonl"
+
+# Pre-JSONL index format, migrated on the next save into that month
+LEGACY_INDEX_FILENAME = "index.yaml"
+
+# Duplicate entries seen by a reader before the index is compacted
+_COMPACTION_MIN_DUPLICATES = 50
+
 
 def get_benchmark_base_dir(project_path: Path) -> Path:
     """Get base directory for benchmark storage.
@@ -65,6 +84,7 @@ __all__ = [
     "load_evaluation_record",
     "list_evaluation_records",
     "get_records_for_story",
+    "compact_index",
 ]
 
 
@@ -118,6 +138,8 @@ class RecordSummary:
     provider: str
     created_at: datetime
     workflow_id: str | None = None  # e.g., "code-review", "validate-story"
+    model: str | None = None  # None for index entries written before it was recorded
+    duration_ms: int | None = None
 
 
 def _compute_role_segment(record: LLMEvaluationRecord) -> str:
@@ -182,16 +204,103 @@ def _atomic_write_yaml(path: Path, data: dict[str, Any]) -> None:
         raise StorageError(f"Failed to write {path}: {e}") from e
 
 
+def _index_entry(record: LLMEvaluationRecord, filename: str, role_segment: str) -> dict[str, Any]:
+    """Build the index entry for a saved record."""
+    # Story 13.10: Include workflow_id for cross-phase filtering
+    return {
+        "record_id": record.record_id,
+        "path": filename,
+        "epic": record.story.epic_num,
+        "story": record.story.story_num,
+        "role": record.evaluator.role.value,
+        "role_id": role_segment if record.evaluator.role == EvaluatorRole.VALIDATOR else None,
+        "provider": record.evaluator.provider,
+        "created_at": record.created_at.isoformat(),
+        "workflow_id": record.workflow.id,  # e.g., "code-review"
+        "model": record.evaluator.model,
+        "duration_ms": record.execution.duration_ms,
+    }
+
+
+def _migrate_legacy_index(month_dir: Path, index_file: IO[str]) -> None:
+    """Move entries from a legacy index.yaml into the locked JSONL index.
+
+    Must be called with the JSONL index open for append and exclusively
+    locked. The legacy file is renamed to index.yaml.migrated, not deleted.
+
+    Args:
+        month_dir: Directory containing the indexes.
+        index_file: Locked JSONL index opened in append mode.
+
+    """
+    legacy_path = month_dir / LEGACY_INDEX_FILENAME
+    if not legacy_path.exists():
+        return
+
+    entries = _load_legacy_index_entries(legacy_path)
+    for entry in entries:
+        index_file.write(json.dumps(entry, default=str) + "\n")
+    index_file.flush()
+    os.replace(legacy_path, legacy_path.with_name(LEGACY_INDEX_FILENAME + ".migrated"))
+    logger.info("Migrated %d entries from %s to %s", len(entries), legacy_path, INDEX_FILENAME)
+
+
+@contextmanager
+def _locked_index(index_path: Path, mode: str) -> Iterator[IO[str]]:
+    """Open the JSONL index and hold its exclusive lock.
+
+    compact_index() atomically replaces the index, so a process that opened
+    the old file before the swap would lock and append to an unlinked inode.
+    After taking the lock, the open file is compared with the file now at
+    index_path and reopened until they are the same.
+
+    Args:
+        index_path: Path to the JSONL index.
+        mode: Open mode; must create the file if missing ("a" or "a+").
+
+    Yields:
+        Open, exclusively locked index file.
+
+    """
+    while True:
+        f = open(index_path, mode, encoding="utf-8")  # noqa: SIM115 - closed below
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            opened = os.fstat(f.fileno())
+            try:
+                current = os.stat(index_path)
+            except FileNotFoundError:
+                current = None
+        except BaseException:
+            f.close()
+            raise
+        if current is not None and (current.st_dev, current.st_ino) == (
+            opened.st_dev,
+            opened.st_ino,
+        ):
+            break
+        # Replaced (or removed) while we waited for the lock; closing unlocks
+        f.close()
+
+    try:
+        yield f
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        f.close()
+
+
 def _update_index(
     month_dir: Path,
     record: LLMEvaluationRecord,
     filename: str,
     role_segment: str,
 ) -> None:
-    """Update index.yaml with new record entry.
+    """Append a record entry to the month's JSONL index.
 
-    Uses file locking to prevent race conditions during concurrent updates
-    from parallel validators/reviewers (Story 22.6 AC #1, #3, #4).
+    Appends one line under an exclusive file lock (Story 22.6 AC #1, #3,
+    #4), so parallel validators/reviewers never interleave entries and a
+    save costs O(1) regardless of index size. Duplicate record_ids are
+    dropped by readers and by compact_index().
 
     Args:
         month_dir: Directory containing the record file.
@@ -200,65 +309,59 @@ def _update_index(
         role_segment: Computed role segment for the record.
 
     """
-    index_path = month_dir / "index.yaml"
+    month_dir.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(_index_entry(record, filename, role_segment), default=str) + "\n"
 
-    # Ensure parent directory exists
-    index_path.parent.mkdir(parents=True, exist_ok=True)
+    with _locked_index(month_dir / INDEX_FILENAME, "a") as f:
+        _migrate_legacy_index(month_dir, f)
+        f.write(line)
+        f.flush()
 
-    # Open file for reading and writing (create if doesn't exist)
-    # Use 'a+' mode to allow both reading and writing, create if doesn't exist
-    with open(index_path, "a+", encoding="utf-8") as f:
-        # Acquire exclusive lock on file descriptor (blocking)
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
 
-        try:
-            # Read existing content
-            f.seek(0)
-            content = f.read()
-
-            # Parse existing index or create new
-            index_data: dict[str, Any] = {"records": [], "updated_at": None}
-            if content:
-                try:
-                    loaded = yaml.safe_load(content)
-                    if isinstance(loaded, dict) and "records" in loaded:
-                        index_data = dict(loaded)
-                except (yaml.YAMLError, OSError):
-                    # Corrupted index, start fresh
-                    logger.warning("Index file corrupted, rebuilding: %s", index_path)
-
-            # Check for duplicate record_id
-            existing_ids = {r["record_id"] for r in index_data["records"]}
-            if record.record_id in existing_ids:
-                logger.debug("Record %s already in index, skipping", record.record_id)
-                return
-
-            # Create new entry
-            # Story 13.10: Include workflow_id for cross-phase filtering
-            entry = {
-                "record_id": record.record_id,
-                "path": filename,
-                "epic": record.story.epic_num,
-                "story": record.story.story_num,
-                "role": record.evaluator.role.value,
-                "role_id": role_segment
-                if record.evaluator.role == EvaluatorRole.VALIDATOR
-                else None,
-                "provider": record.evaluator.provider,
-                "created_at": record.created_at.isoformat(),
-                "workflow_id": record.workflow.id,  # e.g., "code-review"
-            }
-            index_data["records"].append(entry)
-            index_data["updated_at"] = datetime.now(UTC).isoformat()
-
-            # Write back: truncate and rewrite
-            f.seek(0)
-            f.truncate()
-            yaml.dump(index_data, f, default_flow_style=False, sort_keys=False)
-
-        finally:
-            # Lock is automatically released when file is closed
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+def compact_index(month_dir: Path) -> int:
+    """Rewrite a month's JSONL index without duplicate or corrupt lines.
+
+    Holds the index lock so concurrent appends wait instead of being lost.
+    The compacted index replaces the old one atomically.
+
+    Args:
+        month_dir: Directory containing the index.
+
+    Returns:
+        Number of lines dropped.
+
+    """
+    index_path = month_dir / INDEX_FILENAME
+    if not index_path.exists():
+        return 0
+
+    with _locked_index(index_path, "a+") as f:
+        f.seek(0)
+        entries: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        total = 0
+        for raw_line in f:
+            if not raw_line.strip():
+                continue
+            total += 1
+            entry = _parse_index_line(raw_line)
+            if entry is None or entry["record_id"] in seen:
+                continue
+            seen.add(entry["record_id"])
+            entries.append(entry)
+
+        dropped = total - len(entries)
+        if dropped == 0:
+            return 0
+
+        temp_path = index_path.with_suffix(".jsonl.tmp")
+        with open(temp_path, "w", encoding="utf-8") as out:
+            for kept in entries:
+                out.write(json.dumps(kept, default=str) + "\n")
+        os.replace(temp_path, index_path)
+
+    logger.info("Compacted %s: dropped %d lines", index_path, dropped)
+    return dropped
 
 
 def save_evaluation_record(
@@ -303,6 +406,12 @@ def save_evaluation_record(
     # Update index
     _update_index(file_path.parent, record, filename, role_segment)
 
+    # Keep the queryable metrics store in sync; it can always be backfilled
+    try:
+        MetricsStore(base_dir / "benchmarks").add_record(record, file_path)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Failed to update metrics store for %s: %s", file_path, e)
+
     logger.info("Saved evaluation record: %s", file_path)
     return file_path
 
@@ -364,31 +473,102 @@ def _parse_datetime(dt_value: str | datetime) -> datetime:
     return datetime.fromisoformat(dt_str)
 
 
-def _load_index_entries(month_dir: Path) -> list[dict[str, Any]]:
-    """Load entries from index.yaml if valid.
+def _load_legacy_index_entries(legacy_path: Path) -> list[dict[str, Any]]:
+    """Load entries from a legacy index.yaml.
 
     Args:
-        month_dir: Directory containing index.yaml.
+        legacy_path: Path to index.yaml.
 
     Returns:
-        List of index entries, empty if index missing or corrupted.
+        List of index entries, empty if the file is missing or corrupted.
 
     """
-    index_path = month_dir / "index.yaml"
-    if not index_path.exists():
-        return []
-
     try:
-        with open(index_path, encoding="utf-8") as f:
+        with open(legacy_path, encoding="utf-8") as f:
             data = yaml.safe_load(f)
         if isinstance(data, dict) and isinstance(data.get("records"), list):
-            return list(data["records"])
+            return [e for e in data["records"] if isinstance(e, dict) and "record_id" in e]
+    except FileNotFoundError:
+        return []
     except (yaml.YAMLError, OSError) as e:
-        logger.warning("Index file corrupted, falling back to glob: %s (%s)", index_path, e)
+        logger.warning("Index file corrupted, falling back to glob: %s (%s)", legacy_path, e)
 
     return []
 
 
+def _parse_index_line(line: str) -> dict[str, Any] | None:
+    """Parse one JSONL index line, or None if it is not a valid entry."""
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(entry, dict) or "record_id" not in entry:
+        return None
+    return entry
+
+
+class _CorruptIndexError(Exception):
+    """Raised by _iter_index_entries when the JSONL index has invalid lines."""
+
+
+def _iter_index_entries(month_dir: Path) -> Iterator[dict[str, Any]]:
+    """Stream index entries for a month directory.
+
+    Reads index.jsonl line by line, or a legacy index.yaml that has not been
+    migrated yet. Entries with an already seen record_id are skipped, as is
+    an unterminated final line that does not parse (a concurrent append).
+    Once enough duplicates accumulate, the JSONL index is compacted.
+
+    Args:
+        month_dir: Directory containing the index.
+
+    Yields:
+        Index entry dicts.
+
+    Raises:
+        _CorruptIndexError: If the JSONL index contains an invalid line.
+
+    """
+    seen: set[str] = set()
+    legacy_path = month_dir / LEGACY_INDEX_FILENAME
+    if legacy_path.exists():
+        for legacy_entry in _load_legacy_index_entries(legacy_path):
+            if legacy_entry["record_id"] not in seen:
+                seen.add(legacy_entry["record_id"])
+                yield legacy_entry
+
+    index_path = month_dir / INDEX_FILENAME
+    duplicates = 0
+    try:
+        f = open(index_path, encoding="utf-8")  # noqa: SIM115 - closed below
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        raise _CorruptIndexError(str(e)) from e
+    with f:
+        for line_no, raw_line in enumerate(f, start=1):
+            if not raw_line.strip():
+                continue
+            entry = _parse_index_line(raw_line)
+            if entry is None:
+                if not raw_line.endswith("\n"):
+                    # Unterminated final line: an append still in progress
+                    break
+                raise _CorruptIndexError(f"{index_path}:{line_no}")
+            if entry["record_id"] in seen:
+                duplicates += 1
+                continue
+            seen.add(entry["record_id"])
+            yield entry
+
+    if duplicates >= _COMPACTION_MIN_DUPLICATES:
+        try:
+            compact_index(month_dir)
+        except OSError as e:
+            # Compaction is an optimization; the entries were already read
+            logger.warning("Failed to compact %s: %s", index_path, e)
+
+
 def _load_minimal_from_file(file_path: Path) -> dict[str, Any] | None:
     """Load minimal metadata from record file.
 
@@ -416,6 +596,8 @@ def _load_minimal_from_file(file_path: Path) -> dict[str, Any] | None:
             "created_at": data.get("created_at"),
             "role": data.get("evaluator", {}).get("role"),
             "workflow_id": data.get("workflow", {}).get("id"),
+            "model": data.get("evaluator", {}).get("model"),
+            "duration_ms": data.get("execution", {}).get("duration_ms"),
         }
     except (yaml.YAMLError, OSError) as e:
         logger.warning("Failed to load minimal metadata from %s: %s", file_path, e)
@@ -488,8 +670,8 @@ def list_evaluation_records(
 ) -> list[RecordSummary]:
     """List evaluation records with optional filtering.
 
-    Uses index.yaml for fast lookup when available, falls back to
-    glob + minimal parse when index is missing or corrupted.
+    Streams each month's index for fast lookup when available, falls back
+    to glob + minimal parse when the index is missing or corrupted.
 
     Args:
         base_dir: Base directory for storage (REQUIRED).
@@ -516,16 +698,16 @@ def list_evaluation_records(
         if not month_dir.is_dir():
             continue
 
-        # Try to load from index first
-        index_entries = _load_index_entries(month_dir)
-
-        if index_entries:
-            # Use index (fast path)
-            for entry in index_entries:
+        # Stream the index (fast path), falling back to glob if it is unusable
+        month_results: list[RecordSummary] = []
+        indexed = False
+        try:
+            for entry in _iter_index_entries(month_dir):
+                indexed = True
                 if _matches_filters(entry, filters):
                     try:
                         # Story 13.10: Include workflow_id in RecordSummary
-                        results.append(
+                        month_results.append(
                             RecordSummary(
                                 path=month_dir / entry["path"],
                                 record_id=entry["record_id"],
@@ -535,10 +717,18 @@ def list_evaluation_records(
                                 provider=entry["provider"],
                                 created_at=_parse_datetime(entry["created_at"]),
                                 workflow_id=entry.get("workflow_id"),
+                                model=entry.get("model"),
+                                duration_ms=entry.get("duration_ms"),
                             )
                         )
                     except (KeyError, ValueError, TypeError) as e:
                         logger.warning("Invalid index entry: %s (%s)", entry, e)
+        except _CorruptIndexError as e:
+            logger.warning("Index file corrupted, falling back to glob: %s", e)
+            month_results, indexed = [], False
+
+        if indexed:
+            results.extend(month_results)
         else:
             # Fallback to glob + minimal parse
             for file_path in month_dir.glob("eval-*.yaml"):
@@ -557,6 +747,8 @@ def list_evaluation_records(
                                 provider=entry["provider"],
                                 created_at=_parse_datetime(entry["created_at"]),
                                 workflow_id=entry.get("workflow_id"),
+                                model=entry.get("model"),
+                                duration_ms=entry.get("duration_ms"),
                             )
                         )
                     except (KeyError, ValueError, TypeError) as e:
@@ -38,7 +38,7 @@ from bmad_assist.core.exceptions import ConfigError
 from bmad_assist.core.io import get_original_cwd
 from bmad_assist.core.loop import LoopExitReason, run_loop
 from bmad_assist.core.loop.interactive import set_non_interactive, set_skip_story_prompts
-from bmad_assist.core.paths import init_paths
+from bmad_assist.core.paths import ProjectPaths, init_paths
 from bmad_assist.core.state import Phase, get_state_path, load_state, save_state, update_position
 from bmad_assist.core.types import EpicId, epic_sort_key, parse_epic_id
 
@@ -126,6 +126,62 @@ def _load_epic_data(
     return epic_list, stories_by_epic
 
 
+def _init_project_paths(config: Config, project_path: Path) -> ProjectPaths:
+    """Initialize the project paths singleton from loaded configuration.
+
+    Args:
+        config: Loaded configuration with paths and bmad_paths.
+        project_path: Path to project root directory.
+
+    Returns:
+        Initialized ProjectPaths with its directories created.
+
+    """
+    paths_config: dict[str, str | None] = {
+        "output_folder": config.paths.output_folder,
+        "planning_artifacts": config.paths.planning_artifacts,
+        "implementation_artifacts": config.paths.implementation_artifacts,
+        "project_knowledge": config.paths.project_knowledge,
+    }
+    # Add bmad_paths.epics if configured (supports custom epic locations)
+    if config.bmad_paths and config.bmad_paths.epics:
+        paths_config["epics"] = config.bmad_paths.epics
+    project_paths = init_paths(project_path, paths_config)
+    project_paths.ensure_directories()
+    logger.debug("Project paths initialized: %s", project_paths)
+    return project_paths
+
+
+def _finish_run(exit_reason: LoopExitReason, workflows_skipped: bool = False) -> None:
+    """Report how run_loop() ended and exit with the matching code.
+
+    Args:
+        exit_reason: Reason returned by run_loop().
+        workflows_skipped: Whether project setup skipped bundled workflows.
+
+    Raises:
+        typer.Exit: For interrupted, halted or warning runs.
+
+    """
+    if exit_reason == LoopExitReason.INTERRUPTED_SIGINT:
+        _warning("Loop interrupted by Ctrl+C, state saved")
+        raise typer.Exit(code=EXIT_SIGINT)
+    elif exit_reason == LoopExitReason.INTERRUPTED_SIGTERM:
+        _warning("Loop terminated by kill signal, state saved")
+        raise typer.Exit(code=EXIT_SIGTERM)
+    elif exit_reason == LoopExitReason.GUARDIAN_HALT:
+        # Phase failed - error already logged above, just exit with error code
+        raise typer.Exit(code=EXIT_ERROR)
+
+    # COMPLETED exit reason - show success message
+    # Final success message always shown (AC11 - quiet mode shows final result)
+    _success("Completed successfully")
+
+    # Exit with code 2 if workflows were skipped (CI warning)
+    if workflows_skipped:
+        raise typer.Exit(code=EXIT_WARNING)
+
+
 def _handle_debug_vars(config: Config, project_path: Path) -> None:
     """Display resolved variables for current phase without running LLM.
 
@@ -463,18 +519,7 @@ def run(
         logger.debug("Configuration loaded successfully")
 
         # Initialize project paths singleton
-        paths_config: dict[str, str | None] = {
-            "output_folder": loaded_config.paths.output_folder,
-            "planning_artifacts": loaded_config.paths.planning_artifacts,
-            "implementation_artifacts": loaded_config.paths.implementation_artifacts,
-            "project_knowledge": loaded_config.paths.project_knowledge,
-        }
-        # Add bmad_paths.epics if configured (supports custom epic locations)
-        if loaded_config.bmad_paths and loaded_config.bmad_paths.epics:
-            paths_config["epics"] = loaded_config.bmad_paths.epics
-        project_paths = init_paths(project_path, paths_config)
-        project_paths.ensure_directories()
-        logger.debug("Project paths initialized: %s", project_paths)
+        project_paths = _init_project_paths(loaded_config, project_path)
 
         # Implicit project setup (without gitignore modification)
         from bmad_assist.core.project_setup import check_gitignore_warning, ensure_project_setup
@@ -642,23 +687,7 @@ def run(
         )
 
         # Story 6.6: Handle exit reasons from run_loop
-        if exit_reason == LoopExitReason.INTERRUPTED_SIGINT:
-            _warning("Loop interrupted by Ctrl+C, state saved")
-            raise typer.Exit(code=EXIT_SIGINT)
-        elif exit_reason == LoopExitReason.INTERRUPTED_SIGTERM:
-            _warning("Loop terminated by kill signal, state saved")
-            raise typer.Exit(code=EXIT_SIGTERM)
-        elif exit_reason == LoopExitReason.GUARDIAN_HALT:
-            # Phase failed - error already logged above, just exit with error code
-            raise typer.Exit(code=EXIT_ERROR)
-
-        # COMPLETED exit reason - show success message
-        # Final success message always shown (AC11 - quiet mode shows final result)
-        _success("Completed successfully")
-
-        # Exit with code 2 if workflows were skipped (CI warning)
-        if setup_result.has_skipped:
-            raise typer.Exit(code=EXIT_WARNING)
+        _finish_run(exit_reason, workflows_skipped=setup_result.has_skipped)
 
     except ConfigError as e:
         _error(str(e))
@@ -731,11 +760,13 @@ def reset_lock_command(
 from bmad_assist.commands.compile import compile_command  # noqa: E402
 from bmad_assist.commands.init import init_command  # noqa: E402
 from bmad_assist.commands.serve import serve_command  # noqa: E402
+from bmad_assist.commands.worker import worker_command  # noqa: E402
 
 # Register standalone commands
 app.command(name="compile")(compile_command)
 app.command(name="serve")(serve_command)
 app.command(name="init")(init_command)
+app.command(name="worker", hidden=True)(worker_command)
 
 # Register sub-apps (command groups)
 from bmad_assist.commands.benchmark import benchmark_app  # noqa: E402
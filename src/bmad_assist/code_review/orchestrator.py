@@ -33,8 +33,9 @@ import json
 import logging
 import re
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -53,6 +54,7 @@ from bmad_assist.core.config.models.providers import (
 )
 from bmad_assist.core.exceptions import BmadAssistError, CompilerError
 from bmad_assist.core.extraction import CODE_REVIEW_MARKERS, extract_report
+from bmad_assist.core.hedging import HedgePlan, build_hedge_plan
 from bmad_assist.core.io import get_original_cwd, save_prompt
 from bmad_assist.core.loop.dashboard_events import (
     emit_security_review_completed,
@@ -60,6 +62,7 @@ from bmad_assist.core.loop.dashboard_events import (
     emit_security_review_started,
 )
 from bmad_assist.core.paths import get_paths
+from bmad_assist.core.report_stream import ReportStream
 from bmad_assist.core.retry import invoke_with_timeout_retry
 from bmad_assist.core.types import EpicId
 from bmad_assist.deep_verify.core.types import DeepVerifyValidationResult
@@ -299,6 +302,7 @@ async def _invoke_reviewer(
     provider_name: str | None = None,
     thinking: bool | None = None,
     reasoning_effort: str | None = None,
+    hedge: HedgePlan | None = None,
 ) -> tuple[str, ValidationOutput | None, DeterministicMetrics | None, str | None]:
     """Invoke a single reviewer using asyncio.to_thread.
 
@@ -322,6 +326,7 @@ async def _invoke_reviewer(
             access files in the target project directory.
         display_model: Human-readable model name for progress output.
         reasoning_effort: Reasoning effort level for supported providers (codex).
+        hedge: Optional HedgePlan launching a backup invocation on slow attempts.
 
     Returns:
         Tuple of (reviewer_id, ValidationOutput or None, DeterministicMetrics or None,
@@ -345,13 +350,37 @@ async def _invoke_reviewer(
             fallback_invoke_fn = ClaudeSubprocessProvider().invoke
             logger.debug("Configured subprocess fallback for %s", reviewer_id)
 
+        if hedge is not None:
+            # Backup invocation gets its own guard so tool-call counters stay separate
+            hedge = replace(hedge, backup_kwargs={"guard": ToolCallGuard()})
+
+        # Extract the report while the reviewer streams; once its end marker
+        # arrives, deterministic metrics are collected in the background
+        context = CollectorContext(
+            story_epic=epic_num,
+            story_num=story_num,
+            timestamp=review_timestamp,
+        )
+        report_stream: ReportStream[DeterministicMetrics] = ReportStream(
+            CODE_REVIEW_MARKERS,
+            parse=(
+                partial(collect_deterministic_metrics, context=context)
+                if benchmarking_enabled
+                else None
+            ),
+        )
+        invoke_fn = report_stream.wrap(provider.invoke)
+        if fallback_invoke_fn is not None:
+            fallback_invoke_fn = report_stream.wrap(fallback_invoke_fn)
+
         # Use asyncio.to_thread with timeout retry wrapper
         result = await asyncio.to_thread(
             invoke_with_timeout_retry,
-            provider.invoke,
+            invoke_fn,
             timeout_retries=timeout_retries,
             phase_name="code_review",
             fallback_invoke_fn=fallback_invoke_fn,
+            hedge=hedge,
             prompt=prompt,
             model=model,
             timeout=timeout,
@@ -379,10 +408,11 @@ async def _invoke_reviewer(
             guard.reset_for_retry()
             result = await asyncio.to_thread(
                 invoke_with_timeout_retry,
-                provider.invoke,
+                invoke_fn,
                 timeout_retries=timeout_retries,
                 phase_name="code_review",
                 fallback_invoke_fn=fallback_invoke_fn,
+                hedge=hedge,
                 prompt=prompt,
                 model=model,
                 timeout=timeout,
@@ -444,12 +474,9 @@ async def _invoke_reviewer(
         deterministic: DeterministicMetrics | None = None
         if benchmarking_enabled:
             try:
-                context = CollectorContext(
-                    story_epic=epic_num,
-                    story_num=story_num,
-                    timestamp=review_timestamp,
-                )
-                deterministic = collect_deterministic_metrics(extracted_content, context)
+                deterministic = report_stream.parsed(extracted_content)
+                if deterministic is None:
+                    deterministic = collect_deterministic_metrics(extracted_content, context)
                 logger.debug("Collected deterministic metrics for %s", reviewer_id)
             except Exception as e:
                 logger.warning(
@@ -713,16 +740,21 @@ async def run_code_review_phase(
             # Get hunk ranges for each file (for intelligent context extraction)
             file_hunk_ranges: dict[Path, list[tuple[int, int]]] = {}
             try:
-                from bmad_assist.compiler.source_context import get_hunk_ranges_for_file
+                from bmad_assist.compiler.source_context import get_hunk_ranges_for_files
 
+                rel_paths: dict[str, Path] = {}
                 for fp, _content in batch_files:
                     try:
-                        rel_path = str(fp.relative_to(project_path))
-                        ranges = get_hunk_ranges_for_file(project_path, rel_path)
-                        if ranges:
-                            file_hunk_ranges[fp] = ranges
-                    except (OSError, ValueError):
+                        rel_paths[str(fp.relative_to(project_path))] = fp
+                    except ValueError:
                         logger.debug("Could not get hunk ranges for %s", fp.name)
+
+                # Single batched git diff instead of one subprocess per file
+                hunk_map = get_hunk_ranges_for_files(project_path, list(rel_paths))
+                for rel_path, fp in rel_paths.items():
+                    ranges = hunk_map.get(rel_path)
+                    if ranges:
+                        file_hunk_ranges[fp] = ranges
             except ImportError:
                 logger.debug("source_context not available for hunk ranges")
 
@@ -776,6 +808,15 @@ async def run_code_review_phase(
             provider_name=multi_config.provider,
             thinking=multi_config.thinking,
             reasoning_effort=multi_config.reasoning_effort,
+            hedge=build_hedge_plan(
+                config,
+                project_path,
+                "code_review",
+                provider,
+                multi_config.provider,
+                multi_config.model,
+                timeout,
+            ),
         )
         task = asyncio.create_task(delayed_invoke(delay, coro))
         tasks.append(task)
@@ -806,6 +847,15 @@ async def run_code_review_phase(
             cwd=project_path,
             display_model=config.providers.master.display_model,
             provider_name=config.providers.master.provider,
+            hedge=build_hedge_plan(
+                config,
+                project_path,
+                "code_review",
+                master_provider,
+                config.providers.master.provider,
+                config.providers.master.model,
+                timeout,
+            ),
         )
         master_task = asyncio.create_task(delayed_invoke(master_delay, master_coro))
         tasks.append(master_task)
@@ -255,3 +255,47 @@ def benchmark_models(
     else:
         # Raw output to stdout (no Rich formatting for piping)
         sys.stdout.write(report)
+
+
+@benchmark_app.command("backfill-metrics")
+def benchmark_backfill_metrics(
+    project: str = typer.Option(
+        ".",
+        "--project",
+        "-p",
+        help="Path to project directory",
+    ),
+    rebuild: bool = typer.Option(
+        False,
+        "--rebuild",
+        help="Delete the metrics store and rebuild it from all evaluation records",
+    ),
+) -> None:
+    """Populate the benchmark metrics store from existing evaluation records.
+
+    Adds every eval-*.yaml under the benchmarks directory that is not yet in
+    benchmarks/metrics.sqlite. The dashboard's epic metrics are served from
+    this store.
+    """
+    from bmad_assist.benchmarking.metrics_store import MetricsStore
+
+    project_path = _validate_project_path(project)
+    benchmarks_dir = _get_benchmarks_dir(project_path)
+    if not benchmarks_dir.exists():
+        _error(f"Benchmarks directory not found: {benchmarks_dir}")
+        raise typer.Exit(code=EXIT_ERROR)
+
+    store = MetricsStore(benchmarks_dir)
+    if rebuild:
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{store.db_path}{suffix}").unlink(missing_ok=True)
+
+    try:
+        added = store.backfill()
+    except Exception as e:
+        _error(f"Backfill failed: {e}")
+        raise typer.Exit(code=EXIT_ERROR) from None
+
+    Console(stderr=True).print(
+        f"[green]Added {added} evaluation records to:[/green] {store.db_path}"
+    )
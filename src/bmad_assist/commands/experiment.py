@@ -1009,6 +1009,11 @@ def experiment_ab(
         "-n",
         help="Validate configuration without execution",
     ),
+    parallel: bool = typer.Option(
+        False,
+        "--parallel",
+        help="Run both variants at once in separate processes (overrides the YAML)",
+    ),
 ) -> None:
     """Run an A/B workflow test from a YAML definition file.
 
@@ -1018,6 +1023,7 @@ def experiment_ab(
     Examples:
         bmad-assist experiment ab experiments/ab-tests/prompt-v2-test.yaml
         bmad-assist experiment ab my-test.yaml --dry-run
+        bmad-assist experiment ab my-test.yaml --parallel
 
     """
     from bmad_assist.experiments.ab import ABTestRunner, load_ab_test_config
@@ -1035,6 +1041,8 @@ def experiment_ab(
     except ConfigError as e:
         _error(str(e))
         raise typer.Exit(code=EXIT_CONFIG_ERROR) from None
+    if parallel:
+        config = config.model_copy(update={"parallel": True})
 
     console.print(f"[bold]A/B Test: {config.name}[/bold]")
     console.print(f"  Fixture: {config.fixture}")
@@ -1059,6 +1067,9 @@ def experiment_ab(
     if config.variant_b.template_set:
         console.print(f"    template_set={config.variant_b.template_set}")
     console.print(f"  Scorecard: {'yes' if config.scorecard else 'no'}")
+    if config.parallel:
+        cap = f", max {config.max_llm_sessions} LLM sessions" if config.max_llm_sessions else ""
+        console.print(f"  Parallel: yes{cap}")
     console.print()
 
     if dry_run:
@@ -191,6 +191,13 @@ def qa_execute(
         "--retry-run",
         help="Specific run ID to retry from (default: latest run)",
     ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-j",
+        min=1,
+        help="Batches to run in parallel in batch mode (default: qa.batch_concurrency)",
+    ),
 ) -> None:
     """Execute E2E tests from a generated QA plan.
 
@@ -273,6 +280,7 @@ def qa_execute(
             retry=retry,
             include_skipped=include_skipped,
             retry_run=retry_run,
+            concurrency=concurrency,
         )
 
         if result.success:
@@ -0,0 +1,32 @@
+"""Worker command for bmad-assist CLI.
+
+Starts a warm workflow worker for the dashboard (see ipc/worker.py).
+Not meant to be run by hand, so the command is hidden from --help.
+"""
+
+import typer
+
+from bmad_assist.cli_utils import EXIT_ERROR, EXIT_SUCCESS, _error, _validate_project_path
+from bmad_assist.ipc.protocol import IPCError
+
+
+def worker_command(
+    project: str = typer.Option(
+        ".",
+        "--project",
+        "-p",
+        help="Path to the project directory",
+    ),
+) -> None:
+    """Serve dashboard workflow requests from a single long-lived process."""
+    from bmad_assist.ipc.worker import WorkflowWorker
+
+    project_path = _validate_project_path(project)
+
+    try:
+        WorkflowWorker(project_path).serve()
+    except IPCError as e:
+        _error(str(e))
+        raise typer.Exit(code=EXIT_ERROR) from None
+
+    raise typer.Exit(code=EXIT_SUCCESS)
@@ -0,0 +1,335 @@
+"""Size-bounded LRU cache of helper-LLM document compressions.
+
+Strategic documents that exceed their token budget are compressed by the
+helper LLM (see strategic_context._compress_or_truncate). Compressions are
+stored under .bmad-assist/cache/compressed/ and reused across runs.
+
+An entry is addressed by the SHA-256 of the source document, the target
+token count and the helper model, so workflows with different budgets and
+branches with different documents keep their own entries side by side
+instead of evicting each other. A single index.json records every entry's
+metadata and last use; the compressed text lives in one .md file per entry.
+
+When the index grows past max_entries or max_bytes, the least recently used
+entries are evicted. A lookup with no exact match may reuse a compression of
+the same document by the same model that already fits the requested budget.
+
+Public API:
+    CompressionCache: Index-backed LRU cache for one project
+    get_compression_cache_stats: Process-wide hit/miss/eviction counters
+    CompressionCacheStats: Hit/miss/eviction counters
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from bmad_assist.compiler.patching.cache import CACHE_DIR_NAME
+
+logger = logging.getLogger(__name__)
+
+# Subdirectory of .bmad-assist/cache holding compressed documents
+COMPRESSION_CACHE_SUBDIR = "compressed"
+
+INDEX_FILENAME = "index.json"
+
+# Bump when the index layout or key semantics change
+COMPRESSION_CACHE_FORMAT = 1
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Entry files missing from the index (lost to a concurrent index write) are
+# removed once they are older than this
+ORPHAN_GRACE_SECONDS = 3600
+
+
+@dataclass
+class CompressionCacheStats:
+    """Process-wide compression cache counters.
+
+    Attributes:
+        hits: Lookups served from cache.
+        misses: Lookups that required a helper LLM call.
+        evictions: Entries removed to stay within the size bounds.
+
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+_stats = CompressionCacheStats()
+_stats_lock = threading.Lock()
+
+# Serializes index read-modify-write cycles within the process
+_index_lock = threading.Lock()
+
+
+def get_compression_cache_stats() -> CompressionCacheStats:
+    """Get a snapshot of the process-wide counters.
+
+    Returns:
+        Copy of the current counters.
+
+    """
+    with _stats_lock:
+        return CompressionCacheStats(
+            hits=_stats.hits, misses=_stats.misses, evictions=_stats.evictions
+        )
+
+
+def reset_compression_cache_stats() -> None:
+    """Reset the process-wide counters (called at the start of each run)."""
+    with _stats_lock:
+        _stats.hits = 0
+        _stats.misses = 0
+        _stats.evictions = 0
+
+
+def compression_key(content_hash: str, target_tokens: int, model: str) -> str:
+    """Build the cache key for one compression request.
+
+    Args:
+        content_hash: SHA-256 hex digest of the source document.
+        target_tokens: Requested token budget.
+        model: Helper model identifier (provider/model).
+
+    Returns:
+        Hex digest identifying the entry.
+
+    """
+    raw = f"{content_hash}\0{target_tokens}\0{model}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+class CompressionCache:
+    """LRU cache of compressed documents for one project.
+
+    All failures are logged and treated as misses; the cache never raises.
+
+    Args:
+        project_root: Project root directory.
+        max_entries: Maximum number of entries kept.
+        max_bytes: Maximum total size of entry files in bytes.
+
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        project_root: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.cache_dir = project_root / CACHE_DIR_NAME / COMPRESSION_CACHE_SUBDIR
+        self.index_path = self.cache_dir / INDEX_FILENAME
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def get(
+        self,
+        content_hash: str,
+        target_tokens: int,
+        model: str,
+        max_tokens: float | None = None,
+    ) -> tuple[str, int] | None:
+        """Look up a compression and mark it as recently used.
+
+        Args:
+            content_hash: SHA-256 hex digest of the source document.
+            target_tokens: Requested token budget.
+            model: Helper model identifier.
+            max_tokens: Largest acceptable compressed size when falling back
+                to an entry made for a different budget. None disables the
+                fallback.
+
+        Returns:
+            Tuple of (compressed_content, compressed_tokens) or None on a miss.
+
+        """
+        with _index_lock:
+            entries = self._load_index()
+            key = compression_key(content_hash, target_tokens, model)
+            entry = entries.get(key)
+            if entry is None and max_tokens is not None:
+                key, entry = self._find_fitting(entries, content_hash, model, max_tokens)
+
+            content = self._read_entry(entry) if entry is not None else None
+            if content is None:
+                if entry is not None:
+                    entries.pop(key, None)
+                    self._save_index(entries)
+                with _stats_lock:
+                    _stats.misses += 1
+                return None
+
+            assert entry is not None
+            entry["last_used"] = time.time()
+            self._save_index(entries)
+        with _stats_lock:
+            _stats.hits += 1
+        return content, int(entry["compressed_tokens"])
+
+    def put(
+        self,
+        doc_type: str,
+        content_hash: str,
+        target_tokens: int,
+        model: str,
+        compressed: str,
+        original_tokens: int,
+        compressed_tokens: int,
+    ) -> None:
+        """Store a compression, evicting least recently used entries as needed.
+
+        Args:
+            doc_type: Document type (e.g., "ux", "prd"), for readability only.
+            content_hash: SHA-256 hex digest of the source document.
+            target_tokens: Requested token budget.
+            model: Helper model identifier.
+            compressed: Compressed document text.
+            original_tokens: Token count of the source document.
+            compressed_tokens: Token count of the compressed text.
+
+        """
+        key = compression_key(content_hash, target_tokens, model)
+        filename = f"{doc_type}-{key[:16]}.md"
+        data = compressed.encode("utf-8")
+        try:
+            with _index_lock:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                entries = self._load_index()
+                self._write_atomic(self.cache_dir / filename, data)
+                now = time.time()
+                entries[key] = {
+                    "file": filename,
+                    "doc_type": doc_type,
+                    "content_hash": content_hash,
+                    "target_tokens": target_tokens,
+                    "model": model,
+                    "original_tokens": original_tokens,
+                    "compressed_tokens": compressed_tokens,
+                    "size": len(data),
+                    "compressed_at": datetime.now(UTC).isoformat(),
+                    "last_used": now,
+                }
+                self._evict(entries, keep=key)
+                self._save_index(entries)
+                self._remove_orphans(entries, now)
+        except OSError as e:
+            logger.warning("Failed to save compression cache for %s: %s", doc_type, e)
+
+    def _find_fitting(
+        self,
+        entries: dict[str, dict[str, Any]],
+        content_hash: str,
+        model: str,
+        max_tokens: float,
+    ) -> tuple[str, dict[str, Any] | None]:
+        """Find the largest entry for this document and model within max_tokens."""
+        best_key = ""
+        best: dict[str, Any] | None = None
+        for key, entry in entries.items():
+            if entry.get("content_hash") != content_hash or entry.get("model") != model:
+                continue
+            tokens = entry.get("compressed_tokens", 0)
+            if tokens <= max_tokens and (best is None or tokens > best["compressed_tokens"]):
+                best_key, best = key, entry
+        return best_key, best
+
+    def _read_entry(self, entry: dict[str, Any]) -> str | None:
+        """Read an entry's compressed text, or None if it is missing."""
+        try:
+            path: Path = self.cache_dir / entry["file"]
+            return path.read_text(encoding="utf-8")
+        except (OSError, KeyError, UnicodeDecodeError) as e:
+            logger.debug("Dropping unreadable compression cache entry: %s", e)
+            return None
+
+    def _evict(self, entries: dict[str, dict[str, Any]], keep: str) -> None:
+        """Remove least recently used entries until within the size bounds."""
+        total = sum(entry.get("size", 0) for entry in entries.values())
+        by_age = sorted(entries, key=lambda k: entries[k].get("last_used", 0))
+        evicted = 0
+        for key in by_age:
+            if len(entries) <= self.max_entries and total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            entry = entries.pop(key)
+            total -= entry.get("size", 0)
+            with contextlib.suppress(OSError, KeyError):
+                (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+            evicted += 1
+        if evicted:
+            logger.debug("Evicted %d compression cache entries", evicted)
+            with _stats_lock:
+                _stats.evictions += evicted
+
+    def _remove_orphans(self, entries: dict[str, dict[str, Any]], now: float) -> None:
+        """Delete stale entry files the index no longer references."""
+        indexed = {entry.get("file") for entry in entries.values()}
+        for path in self.cache_dir.glob("*.md"):
+            if path.name in indexed:
+                continue
+            with contextlib.suppress(OSError):
+                if now - path.stat().st_mtime > ORPHAN_GRACE_SECONDS:
+                    path.unlink()
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        """Load the index, migrating away from per-entry YAML sidecars."""
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self._remove_legacy_entries()
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable compression cache index: %s", e)
+            return {}
+        if not isinstance(index, dict) or index.get("format") != COMPRESSION_CACHE_FORMAT:
+            return {}
+        entries = index.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _save_index(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Write the index atomically; failures only log a warning."""
+        payload = {"format": COMPRESSION_CACHE_FORMAT, "entries": entries}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(self.index_path, json.dumps(payload, indent=1).encode("utf-8"))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to write compression cache index: %s", e)
+
+    def _remove_legacy_entries(self) -> None:
+        """Delete entries written before the index existed.
+
+        They were keyed by content hash alone, so they cannot be matched to
+        a target budget or model and are dropped rather than imported.
+        """
+        if not self.cache_dir.is_dir():
+            return
+        for pattern in ("*.meta.yaml", "*.md", "*.tmp"):
+            for path in self.cache_dir.glob(pattern):
+                with contextlib.suppress(OSError):
+                    path.unlink()
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write bytes to path via a unique temp file and rename."""
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                temp_path.unlink(missing_ok=True)
+            raise
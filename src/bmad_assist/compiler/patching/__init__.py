@@ -17,18 +17,22 @@ Public API:
     extract_workflow_from_response: Extract workflow content from LLM response
     compile_patch: Compile a workflow patch into a template
     ensure_template_compiled: Ensure cached template exists for a workflow
+    warm_template_caches: Validate cached templates for all patched workflows
     load_workflow_ir: Load workflow IR from cache or original files
 """
 
 from bmad_assist.compiler.patching.cache import (
     CacheMeta,
     TemplateCache,
+    cached_file_hash,
+    clear_hash_memo,
     compute_file_hash,
 )
 from bmad_assist.compiler.patching.compiler import (
     compile_patch,
     ensure_template_compiled,
     load_workflow_ir,
+    warm_template_caches,
 )
 from bmad_assist.compiler.patching.config import (
     PatcherConfig,
@@ -43,6 +47,7 @@ from bmad_assist.compiler.patching.discovery import (
     load_patch,
 )
 from bmad_assist.compiler.patching.git_intelligence import (
+    clear_git_cache,
     extract_git_intelligence,
     is_git_repo,
     run_git_command,
@@ -90,7 +95,10 @@ __all__ = [
     "TransformResult",
     "Validation",
     "WorkflowPatch",
+    "cached_file_hash",
     "check_threshold",
+    "clear_git_cache",
+    "clear_hash_memo",
     "compile_patch",
     "compute_file_hash",
     "determine_patch_source_level",
@@ -112,4 +120,5 @@ __all__ = [
     "reset_patcher_config",
     "run_git_command",
     "validate_output",
+    "warm_template_caches",
 ]
@@ -3,18 +3,36 @@
 This module handles caching compiled templates with hash-based
 invalidation for source files and patches.
 
+Hashing every source file on every compile is avoided with two memos keyed
+by file stat (size, mtime_ns, inode):
+
+- File hashes: cached_file_hash() only re-reads a file when its stat changed.
+  Digests are kept in process and persisted per cache directory
+  (HASH_MEMO_FILENAME), so new processes start warm.
+- Validity: TemplateCache.is_valid() remembers, in process, the stat of every
+  file it validated and returns immediately while none of them changed.
+
+Files modified within the last RACY_WINDOW_NS are never memoized, since a
+second write within the same mtime tick could keep size and mtime unchanged.
+
 Classes:
     CacheMeta: Metadata stored with cached templates
     TemplateCache: Cache operations (save, load, validate)
 
 Functions:
     compute_file_hash: Compute SHA-256 hash of a file
+    cached_file_hash: SHA-256 hash of a file, memoized by stat
+    clear_hash_memo: Drop in-process hash and validity memos
 """
 
 import contextlib
 import hashlib
+import json
 import logging
 import os
+import tempfile
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -28,6 +46,26 @@ logger = logging.getLogger(__name__)
 # Cache directory names
 CACHE_DIR_NAME = ".bmad-assist/cache"
 
+# Stat-keyed hash memo persisted in each cache directory
+HASH_MEMO_FILENAME = "file-hashes.json"
+HASH_MEMO_VERSION = 1
+
+# Files modified this recently (ns) are re-hashed on every check
+RACY_WINDOW_NS = 2_000_000_000
+
+# (size, mtime_ns, inode)
+_StatKey = tuple[int, int, int]
+
+# path -> (stat key, sha256 hex digest)
+_file_hashes: dict[str, tuple[_StatKey, str]] = {}
+# Cache directories whose on-disk memo was merged into _file_hashes
+_loaded_memo_dirs: set[str] = set()
+# cache path -> stat signature of everything validated with it
+_valid_templates: dict[str, tuple[object, ...]] = {}
+_memo_lock = threading.Lock()
+# Serializes read-merge-write of on-disk memos (warm-up saves from many threads)
+_memo_save_lock = threading.Lock()
+
 
 def compute_file_hash(path: Path) -> str:
     """Compute SHA-256 hash of a file.
@@ -50,6 +88,143 @@ def compute_file_hash(path: Path) -> str:
     return sha256.hexdigest()
 
 
+def _stat_key(path: Path) -> _StatKey:
+    """Return the (size, mtime_ns, inode) memo key of a file.
+
+    Raises:
+        OSError: If the file cannot be stat'ed.
+
+    """
+    st = path.stat()
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def _is_racy(key: _StatKey) -> bool:
+    """Check whether a file was modified too recently to trust its stat."""
+    return time.time_ns() - key[1] < RACY_WINDOW_NS
+
+
+def cached_file_hash(path: Path) -> str:
+    """Compute SHA-256 hash of a file, reusing the digest while its stat is unchanged.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Hex digest of the SHA-256 hash.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist.
+
+    """
+    key = _stat_key(path)
+    name = str(path.absolute())
+    with _memo_lock:
+        entry = _file_hashes.get(name)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+
+    digest = compute_file_hash(path)
+    if not _is_racy(key):
+        with _memo_lock:
+            _file_hashes[name] = (key, digest)
+    return digest
+
+
+def clear_hash_memo() -> None:
+    """Drop in-process file hash and validity memos (e.g., between tests)."""
+    with _memo_lock:
+        _file_hashes.clear()
+        _loaded_memo_dirs.clear()
+        _valid_templates.clear()
+
+
+def _load_hash_memo(cache_dir: Path) -> None:
+    """Merge a cache directory's on-disk hash memo into the in-process memo.
+
+    Entries are only trusted at lookup time if the file stat still matches,
+    so a stale or foreign memo file can cost a re-hash but never a wrong result.
+    """
+    memo_dir = str(cache_dir)
+    with _memo_lock:
+        if memo_dir in _loaded_memo_dirs:
+            return
+        _loaded_memo_dirs.add(memo_dir)
+
+    memo_path = cache_dir / HASH_MEMO_FILENAME
+    try:
+        data = json.loads(memo_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    if not isinstance(data, dict) or data.get("version") != HASH_MEMO_VERSION:
+        return
+
+    loaded: dict[str, tuple[_StatKey, str]] = {}
+    for name, entry in data.get("entries", {}).items():
+        try:
+            size, mtime_ns, inode, digest = entry
+            loaded[name] = ((int(size), int(mtime_ns), int(inode)), str(digest))
+        except (TypeError, ValueError):
+            continue
+    with _memo_lock:
+        for name, value in loaded.items():
+            _file_hashes.setdefault(name, value)
+
+
+def _save_hash_memo(cache_dir: Path, paths: list[Path]) -> None:
+    """Persist memoized digests of the given files to the cache directory.
+
+    Caches of all workflows share one memo file and are validated concurrently
+    during warm-up, so the load/merge/write cycle runs under a module lock and
+    each write goes through its own temp file.
+
+    Best effort: the memo is an optimization, so write errors are only logged.
+    """
+    memo_path = cache_dir / HASH_MEMO_FILENAME
+    with _memo_save_lock:
+        try:
+            existing = json.loads(memo_path.read_text(encoding="utf-8"))
+            entries = existing.get("entries", {})
+            if existing.get("version") != HASH_MEMO_VERSION:
+                entries = {}
+        except (OSError, ValueError, AttributeError):
+            entries = {}
+
+        changed = False
+        with _memo_lock:
+            for path in paths:
+                name = str(path.absolute())
+                entry = _file_hashes.get(name)
+                if entry is None:
+                    continue
+                record = [*entry[0], entry[1]]
+                if entries.get(name) != record:
+                    entries[name] = record
+                    changed = True
+        if not changed:
+            return
+
+        temp_path: str | None = None
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=cache_dir,
+                prefix=f"{HASH_MEMO_FILENAME}.",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                temp_path = f.name
+                json.dump({"version": HASH_MEMO_VERSION, "entries": entries}, f)
+            os.replace(temp_path, memo_path)
+        except OSError as e:
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_path)
+            logger.debug("Could not save hash memo %s: %s", memo_path, e)
+
+
 @dataclass
 class CacheMeta:
     """Metadata stored with cached templates.
@@ -126,6 +301,9 @@ class TemplateCache:
         - Source file hashes match stored hashes
         - Patch file hash matches stored hash
 
+        Returns immediately if none of these files changed stat since they
+        were last found valid; otherwise hashes only files whose stat changed.
+
         Args:
             workflow: Workflow name.
             project_root: Project root path or None for global.
@@ -139,6 +317,16 @@ class TemplateCache:
         cache_path = self.get_cache_path(workflow, project_root)
         meta_path = self._get_meta_path(cache_path)
 
+        # Fast path: nothing validated last time has changed on disk
+        signature = self._validity_signature(
+            cache_path, meta_path, source_files, patch_path, defaults_hash
+        )
+        memo_key = str(cache_path)
+        if signature is not None:
+            with _memo_lock:
+                if _valid_templates.get(memo_key) == signature:
+                    return True
+
         # Check cache file exists
         if not cache_path.exists():
             logger.debug("Cache file does not exist: %s", cache_path)
@@ -149,65 +337,121 @@ class TemplateCache:
             logger.debug("Cache meta does not exist: %s", meta_path)
             return False
 
+        _load_hash_memo(cache_path.parent)
         try:
-            # Load metadata
-            with meta_path.open("r") as f:
-                meta_data = yaml.safe_load(f)
-
-            # Note: We don't check bmad_version here - file hashes are sufficient
-            # for cache invalidation. Version is stored for documentation only.
-
-            # Check source file hashes
-            stored_hashes = meta_data.get("source_hashes", {})
-            for name, path in source_files.items():
-                if not path.exists():
-                    logger.debug("Source file does not exist: %s", path)
-                    return False
-                current_hash = compute_file_hash(path)
-                stored_hash = stored_hashes.get(name)
-                if current_hash != stored_hash:
-                    logger.debug(
-                        "Source hash mismatch for %s: cached=%s, current=%s",
-                        name,
-                        stored_hash,
-                        current_hash,
-                    )
-                    return False
-
-            # Check patch hash
-            if not patch_path.exists():
-                logger.debug("Patch file does not exist: %s", patch_path)
-                return False
-            current_patch_hash = compute_file_hash(patch_path)
-            stored_patch_hash = meta_data.get("patch_hash")
-            if current_patch_hash != stored_patch_hash:
-                logger.debug(
-                    "Patch hash mismatch: cached=%s, current=%s",
-                    stored_patch_hash,
-                    current_patch_hash,
-                )
-                return False
+            valid = self._validate_hashes(meta_path, source_files, patch_path, defaults_hash)
+        except Exception as e:
+            logger.debug("Error validating cache: %s", e)
+            return False
+        finally:
+            _save_hash_memo(cache_path.parent, [*source_files.values(), patch_path])
+
+        if valid and signature is not None:
+            with _memo_lock:
+                _valid_templates[memo_key] = signature
+        return valid
 
-            # Check defaults_hash (backward compat: skip if either is None)
-            stored_defaults_hash = meta_data.get("defaults_hash")
-            if (
-                stored_defaults_hash is not None
-                and defaults_hash is not None
-                and stored_defaults_hash != defaults_hash
-            ):
+    def _validity_signature(
+        self,
+        cache_path: Path,
+        meta_path: Path,
+        source_files: dict[str, Path],
+        patch_path: Path,
+        defaults_hash: str | None,
+    ) -> tuple[object, ...] | None:
+        """Build the stat signature of everything is_valid() checks.
+
+        Returns:
+            Signature tuple, or None if a file is missing or too recently
+            modified to be memoized.
+
+        """
+        try:
+            keys = [
+                _stat_key(cache_path),
+                _stat_key(meta_path),
+                _stat_key(patch_path),
+                *(_stat_key(path) for path in source_files.values()),
+            ]
+        except OSError:
+            return None
+        if any(_is_racy(key) for key in keys):
+            return None
+        paths = (cache_path, meta_path, patch_path, *source_files.values())
+        return (
+            tuple(sorted(source_files)),
+            tuple(str(path.absolute()) for path in paths),
+            tuple(keys),
+            defaults_hash,
+        )
+
+    def _validate_hashes(
+        self,
+        meta_path: Path,
+        source_files: dict[str, Path],
+        patch_path: Path,
+        defaults_hash: str | None,
+    ) -> bool:
+        """Compare stored hashes in the meta file against current files.
+
+        Returns:
+            True if all hashes match.
+
+        """
+        # Load metadata
+        with meta_path.open("r") as f:
+            meta_data = yaml.safe_load(f)
+
+        # Note: We don't check bmad_version here - file hashes are sufficient
+        # for cache invalidation. Version is stored for documentation only.
+
+        # Check source file hashes
+        stored_hashes = meta_data.get("source_hashes", {})
+        for name, path in source_files.items():
+            if not path.exists():
+                logger.debug("Source file does not exist: %s", path)
+                return False
+            current_hash = cached_file_hash(path)
+            stored_hash = stored_hashes.get(name)
+            if current_hash != stored_hash:
                 logger.debug(
-                    "Defaults hash mismatch: cached=%s, current=%s",
-                    stored_defaults_hash,
-                    defaults_hash,
+                    "Source hash mismatch for %s: cached=%s, current=%s",
+                    name,
+                    stored_hash,
+                    current_hash,
                 )
                 return False
 
-            return True
+        # Check patch hash
+        if not patch_path.exists():
+            logger.debug("Patch file does not exist: %s", patch_path)
+            return False
+        current_patch_hash = cached_file_hash(patch_path)
+        stored_patch_hash = meta_data.get("patch_hash")
+        if current_patch_hash != stored_patch_hash:
+            logger.debug(
+                "Patch hash mismatch: cached=%s, current=%s",
+                stored_patch_hash,
+                current_patch_hash,
+            )
+            return False
 
-        except Exception as e:
-            logger.debug("Error validating cache: %s", e)
+        # Check defaults_hash (backward compat: skip if either is None)
+        stored_defaults_hash = meta_data.get("defaults_hash")
+        if (
+            stored_defaults_hash is not None
+            and defaults_hash is not None
+            and stored_defaults_hash != defaults_hash
+        ):
+            logger.debug(
+                "Defaults hash mismatch: cached=%s, current=%s",
+                stored_defaults_hash,
+                defaults_hash,
+            )
             return False
 
+        return True
+
     def load_cached(
         self,
         workflow: str,
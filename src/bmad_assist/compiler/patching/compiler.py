@@ -6,11 +6,14 @@ moved from CLI to allow use from any entry point (CLI, orchestrator, etc.).
 Public API:
     compile_patch: Compile a workflow patch into a template
     ensure_template_compiled: Ensure cached template exists for a workflow
+    warm_template_caches: Validate cached templates for all patched workflows
     load_workflow_ir: Load workflow IR from cache or original files
 """
 
+import contextlib
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -18,9 +21,12 @@ from bmad_assist.compiler.parser import parse_workflow
 from bmad_assist.compiler.patching.cache import (
     CacheMeta,
     TemplateCache,
+    cached_file_hash,
     compute_file_hash,
 )
 from bmad_assist.compiler.patching.discovery import (
+    _PACKAGE_DEFAULTS_DIR,
+    DEFAULT_PATCH_DIR,
     compute_defaults_hash,
     determine_patch_source_level,
     discover_patch,
@@ -452,45 +458,43 @@ def compile_patch(
     return template, cache_path, warning_count
 
 
-def ensure_template_compiled(
+def _local_copy_matches(cache_path: Path, tpl_content: str, meta_content: str) -> bool:
+    """Check whether the local cache already holds this bundled template."""
+    meta_path = cache_path.with_suffix(cache_path.suffix + ".meta.yaml")
+    try:
+        return (
+            meta_path.read_text(encoding="utf-8") == meta_content
+            and cache_path.read_text(encoding="utf-8") == tpl_content
+        )
+    except OSError:
+        return False
+
+
+def _find_valid_template(
     workflow: str,
     project_root: Path,
-    cwd: Path | None = None,
+    cwd: Path | None,
+    patch_path: Path,
 ) -> Path | None:
-    """Ensure cached template exists for a workflow if patch exists.
-
-    Checks cache validity and auto-compiles if needed. This is the pure
-    business logic version - CLI adds UI output on top.
+    """Find a valid cached template for a patched workflow without compiling.
 
-    Flow:
-    1. Check for cached template (project → CWD → global)
-    2. If valid cache found, return its path
-    3. If no cache, check for patch (project → CWD → global)
-    4. If patch exists, compile it and save to cache
-    5. If no patch, return None (use original workflow)
+    Checks the bundled cache, then project → CWD → global caches.
 
     Args:
         workflow: Workflow name (e.g., 'create-story').
         project_root: Project root directory.
-        cwd: Current working directory (for CWD-based discovery).
+        cwd: Current working directory (for CWD-based caches).
+        patch_path: Discovered patch file for the workflow.
 
     Returns:
-        Path to valid cached template, or None if no patch exists.
+        Path to a valid cached template, or None if none is valid.
 
     Raises:
-        PatchError: If patch exists but compilation fails.
         CompilerError: If workflow files not found.
 
     """
     cache = TemplateCache()
 
-    # Step 1: Check if patch exists
-    patch_path = discover_patch(workflow, project_root, cwd=cwd)
-    if patch_path is None:
-        # No patch → use original workflow
-        logger.debug("No patch for %s, using original workflow", workflow)
-        return None
-
     # Step 2: Find workflow source files for cache validation
     try:
         workflow_yaml_path, instructions_path = _find_workflow_files(workflow, project_root)
@@ -508,7 +512,7 @@ def ensure_template_compiled(
         raise CompilerError(str(e)) from e
 
     # Step 2b: Compute current hashes for validation
-    current_patch_hash = compute_file_hash(patch_path)
+    current_patch_hash = cached_file_hash(patch_path)
     current_defaults_hash = compute_defaults_hash(patch_path, workflow)
 
     # Step 2c: Check bundled cache (before local cache)
@@ -532,7 +536,7 @@ def ensure_template_compiled(
                     if not path.exists():
                         sources_valid = False
                         break
-                    if compute_file_hash(path) != bundled_source_hashes.get(name):
+                    if cached_file_hash(path) != bundled_source_hashes.get(name):
                         sources_valid = False
                         break
 
@@ -546,9 +550,13 @@ def ensure_template_compiled(
                     sources_valid = False
 
                 if sources_valid:
+                    local_cache_path = cache.get_cache_path(workflow, project_root)
+                    if _local_copy_matches(local_cache_path, tpl_content, meta_content):
+                        logger.debug("Using bundled cache for %s (already copied)", workflow)
+                        return local_cache_path
+
                     # Write bundled content to local cache (one-time copy)
                     # Use atomic writes (temp + rename) for crash resilience
-                    local_cache_path = cache.get_cache_path(workflow, project_root)
                     local_cache_path.parent.mkdir(parents=True, exist_ok=True)
                     tmp_tpl = local_cache_path.with_suffix(".tmp")
                     tmp_tpl.write_text(tpl_content, encoding="utf-8")
@@ -612,6 +620,51 @@ def ensure_template_compiled(
         logger.debug("Using global cache: %s", cache_path)
         return cache_path
 
+    return None
+
+
+def ensure_template_compiled(
+    workflow: str,
+    project_root: Path,
+    cwd: Path | None = None,
+) -> Path | None:
+    """Ensure cached template exists for a workflow if patch exists.
+
+    Checks cache validity and auto-compiles if needed. This is the pure
+    business logic version - CLI adds UI output on top.
+
+    Flow:
+    1. Check for cached template (project → CWD → global)
+    2. If valid cache found, return its path
+    3. If no cache, check for patch (project → CWD → global)
+    4. If patch exists, compile it and save to cache
+    5. If no patch, return None (use original workflow)
+
+    Args:
+        workflow: Workflow name (e.g., 'create-story').
+        project_root: Project root directory.
+        cwd: Current working directory (for CWD-based discovery).
+
+    Returns:
+        Path to valid cached template, or None if no patch exists.
+
+    Raises:
+        PatchError: If patch exists but compilation fails.
+        CompilerError: If workflow files not found.
+
+    """
+    # Step 1: Check if patch exists
+    patch_path = discover_patch(workflow, project_root, cwd=cwd)
+    if patch_path is None:
+        # No patch → use original workflow
+        logger.debug("No patch for %s, using original workflow", workflow)
+        return None
+
+    # Steps 2-3: Bundled, project, CWD and global caches
+    cache_path = _find_valid_template(workflow, project_root, cwd, patch_path)
+    if cache_path is not None:
+        return cache_path
+
     # Step 4: No valid cache - try auto-compile
     # If compilation fails (e.g., no LLM config), return None to use original files
     try:
@@ -634,6 +687,77 @@ def ensure_template_compiled(
         return None
 
 
+# Max workflows validated at once by warm_template_caches()
+WARM_UP_MAX_WORKERS = 4
+
+
+def _patched_workflow_names(project_root: Path, cwd: Path | None) -> list[str]:
+    """List workflows with a patch in any discovery location."""
+    patch_dirs = [project_root / DEFAULT_PATCH_DIR]
+    if cwd is not None:
+        patch_dirs.append(cwd / DEFAULT_PATCH_DIR)
+    patch_dirs += [Path.home() / DEFAULT_PATCH_DIR, _PACKAGE_DEFAULTS_DIR]
+
+    names: set[str] = set()
+    suffix = ".patch.yaml"
+    for patch_dir in patch_dirs:
+        with contextlib.suppress(OSError):
+            names.update(
+                path.name[: -len(suffix)] for path in patch_dir.glob(f"*{suffix}")
+            )
+    return sorted(names)
+
+
+def warm_template_caches(
+    project_root: Path,
+    cwd: Path | None = None,
+    workflows: list[str] | None = None,
+) -> dict[str, bool]:
+    """Validate cached templates for patched workflows in parallel.
+
+    Run at loop start so the first compile of each phase finds the file hash
+    and validity memos warm. Never compiles: stale or missing caches are
+    left for ensure_template_compiled() when the workflow is actually used.
+
+    Args:
+        project_root: Project root directory.
+        cwd: Current working directory (for CWD-based patches and caches).
+        workflows: Workflow names to validate. Defaults to every workflow
+            with a discoverable patch.
+
+    Returns:
+        Dict mapping workflow name to whether a valid cached template exists.
+
+    """
+    names = workflows if workflows is not None else _patched_workflow_names(project_root, cwd)
+
+    def check(workflow: str) -> tuple[str, bool] | None:
+        patch_path = discover_patch(workflow, project_root, cwd=cwd)
+        if patch_path is None:
+            return None
+        try:
+            cache_path = _find_valid_template(workflow, project_root, cwd, patch_path)
+            return workflow, cache_path is not None
+        except Exception as e:
+            logger.debug("Template cache warm-up skipped %s: %s", workflow, e)
+            return workflow, False
+
+    if not names:
+        return {}
+    with ThreadPoolExecutor(
+        max_workers=min(WARM_UP_MAX_WORKERS, len(names)),
+        thread_name_prefix="template-warmup",
+    ) as executor:
+        results = dict(r for r in executor.map(check, names) if r is not None)
+
+    logger.debug(
+        "Template cache warm-up: %d/%d valid",
+        sum(results.values()),
+        len(results),
+    )
+    return results
+
+
 def load_workflow_ir(
     workflow: str,
     project_root: Path,
@@ -10,12 +10,22 @@ Key functions:
     run_git_command: Execute a git command with variable substitution
     apply_exclusions_to_command: Apply glob exclusions to git command pathspecs
     extract_git_intelligence: Run all configured commands and format output
+    clear_git_cache: Drop memoized command outputs
+
+Commands run concurrently. Outputs of commands that depend only on history
+(git log, ls-tree, show, ...) are memoized per (HEAD, command), and
+``git diff --cached`` per (HEAD, index mtime, command), so the phases of one
+story compiled on the same commit reuse them. Commands reading the working
+tree (git status, git diff) always run.
 """
 
 import fnmatch
 import logging
 import re
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
@@ -303,6 +313,33 @@ GIT_COMMAND_TIMEOUT = 10
 # Max output length per command (characters)
 MAX_OUTPUT_LENGTH = 2000
 
+# Max git commands running at once during one extraction
+GIT_MAX_WORKERS = 4
+
+# Max memoized command outputs kept in process
+GIT_CACHE_MAX_ENTRIES = 256
+
+# Git subcommands whose output depends only on HEAD (not index or working tree)
+_HISTORY_SUBCOMMANDS = frozenset(
+    {"log", "show", "ls-tree", "shortlog", "rev-list", "rev-parse", "describe"}
+)
+
+# Options that make a history command read refs other than HEAD
+_ALL_REFS_OPTIONS = frozenset({"--all", "--branches", "--tags", "--remotes"})
+
+# Shell operators separating git invocations inside one command string
+_SHELL_SEPARATORS = re.compile(r"\|\||&&|[|;]")
+
+# (project root, HEAD sha, index mtime_ns or 0, substituted command) -> output
+_git_output_cache: OrderedDict[tuple[str, str, int, str], str] = OrderedDict()
+_git_output_cache_lock = threading.Lock()
+
+
+def clear_git_cache() -> None:
+    """Drop memoized git command outputs (e.g., between tests)."""
+    with _git_output_cache_lock:
+        _git_output_cache.clear()
+
 
 def is_git_repo(path: Path) -> bool:
     """Check if a directory is a git repository ROOT.
@@ -359,6 +396,118 @@ def _substitute_variables(command: str, variables: dict[str, str | int | None])
     return result
 
 
+def _git_state(project_root: Path) -> tuple[str, int] | None:
+    """Return (HEAD sha, index mtime_ns) for a repository.
+
+    Args:
+        project_root: Git repository root.
+
+    Returns:
+        Tuple of HEAD commit and index mtime (0 if there is no index yet),
+        or None if HEAD cannot be resolved (e.g., no commits).
+
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--git-path", "index", "HEAD"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            timeout=GIT_COMMAND_TIMEOUT,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+
+    lines = result.stdout.split()
+    if result.returncode != 0 or len(lines) != 2:
+        return None
+
+    index_path, head = lines
+    try:
+        index_mtime = (project_root / index_path).stat().st_mtime_ns
+    except OSError:
+        index_mtime = 0
+    return head, index_mtime
+
+
+def _cache_key_part(command: str, index_mtime: int) -> int | None:
+    """Classify a command for memoization.
+
+    Args:
+        command: Git command with variables already substituted.
+        index_mtime: Current index mtime_ns.
+
+    Returns:
+        The index component of the cache key: 0 for HEAD-only commands,
+        index_mtime for commands reading the index, None if the command
+        reads the working tree (or anything else that is not keyed) and
+        must always run.
+
+    """
+    if "$(" in command or "`" in command:
+        return None
+
+    key_part = 0
+    found_git = False
+    for segment in _SHELL_SEPARATORS.split(command):
+        tokens = segment.split()
+        if not tokens or tokens[0] != "git":
+            continue
+        found_git = True
+        subcommand = next((t for t in tokens[1:] if not t.startswith("-")), "")
+        if subcommand in _HISTORY_SUBCOMMANDS and not _ALL_REFS_OPTIONS & set(tokens):
+            continue
+        if subcommand == "diff" and ("--cached" in tokens or "--staged" in tokens):
+            key_part = index_mtime
+            continue
+        return None
+
+    return key_part if found_git else None
+
+
+def _run_git_command_cached(
+    command: str,
+    project_root: Path,
+    variables: dict[str, str | int | None] | None,
+    state: tuple[str, int] | None,
+) -> str:
+    """Run a git command, reusing the memoized output when the key matches.
+
+    Args:
+        command: Git command (variables not yet substituted).
+        project_root: Git repository root.
+        variables: Optional variables for substitution in command.
+        state: (HEAD sha, index mtime_ns) from _git_state(), or None to skip caching.
+
+    Returns:
+        Command output as returned by run_git_command().
+
+    """
+    key = None
+    if state is not None:
+        resolved = _substitute_variables(command, variables) if variables else command
+        index_part = _cache_key_part(resolved, state[1])
+        if index_part is not None:
+            key = (str(project_root.resolve()), state[0], index_part, resolved)
+            with _git_output_cache_lock:
+                cached = _git_output_cache.get(key)
+                if cached is not None:
+                    _git_output_cache.move_to_end(key)
+                    logger.debug("Git command cache hit: %s", resolved)
+                    return cached
+
+    output = run_git_command(command, project_root, variables)
+
+    # Errors and timeouts are transient; only memoize real output
+    if key is not None and not output.startswith(("(command timed out)", "(command error")):
+        with _git_output_cache_lock:
+            _git_output_cache[key] = output
+            _git_output_cache.move_to_end(key)
+            while len(_git_output_cache) > GIT_CACHE_MAX_ENTRIES:
+                _git_output_cache.popitem(last=False)
+    return output
+
+
 def run_git_command(
     command: str,
     cwd: Path,
@@ -455,14 +604,32 @@ def extract_git_intelligence(
     )
     parts.append("")
 
-    for git_cmd in config.commands:
-        # Apply exclusions to command before running
-        command_to_run = apply_exclusions_to_command(
-            git_cmd.command,
-            config.exclude_patterns,
-        )
-        output = run_git_command(command_to_run, project_root, variables)
-
+    # Apply exclusions to commands before running
+    commands_to_run = [
+        apply_exclusions_to_command(git_cmd.command, config.exclude_patterns)
+        for git_cmd in config.commands
+    ]
+
+    # Commands are independent: run them concurrently, keeping config order
+    state = _git_state(project_root)
+    if len(commands_to_run) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(GIT_MAX_WORKERS, len(commands_to_run)),
+            thread_name_prefix="git-intel",
+        ) as executor:
+            outputs = list(
+                executor.map(
+                    lambda cmd: _run_git_command_cached(cmd, project_root, variables, state),
+                    commands_to_run,
+                )
+            )
+    else:
+        outputs = [
+            _run_git_command_cached(cmd, project_root, variables, state)
+            for cmd in commands_to_run
+        ]
+
+    for git_cmd, output in zip(config.commands, outputs, strict=True):
         # For git status, filter output after execution
         # (git status doesn't support pathspec exclusion well)
         if "status" in git_cmd.command and config.exclude_patterns:
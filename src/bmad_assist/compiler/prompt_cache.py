@@ -0,0 +1,499 @@
+"""Persistent cache of compiled workflows keyed by input fingerprints.
+
+Compiling a workflow re-resolves variables, re-reads planning documents,
+re-walks the project tree and re-renders XML. On timeout retries and resumed
+runs those inputs are usually unchanged, so this module stores each
+CompiledWorkflow under .bmad-assist/cache/compiled/ and reuses it while its
+inputs are unchanged.
+
+An entry is addressed by a key built from the workflow name, patch hash,
+config hash, resolved variables and current date. Alongside the output it
+stores a fingerprint of the compilation's inputs, computed explicitly rather
+than by observing what the compiler happens to read (reads can be served
+from in-process memos, made on worker threads, or be plain existence probes):
+- every file under the project root that .gitignore does not exclude, plus
+  everything under the output folder, project knowledge, .bmad-assist and
+  the workflow directory: path, mtime_ns and size, hashed together
+- the project's git state: hash of `git status --porcelain=v2 --branch`
+
+Caches the compiler itself writes (compiled prompts, helper compressions,
+patched templates) and run-time files (prompts, logs) are not inputs.
+
+A lookup is a hit only if the fingerprint still matches. Compile-time
+timestamps (the "timestamp" variable used in output filenames) are
+regenerated on a hit, so reports from different attempts never collide.
+
+Entry filenames carry the date of the key, and every store drops entries from
+other dates (they can never hit again), then evicts the least recently used
+entries (by file mtime, refreshed on each hit) past DEFAULT_MAX_ENTRIES or
+DEFAULT_MAX_BYTES.
+
+Set BMAD_PROMPT_CACHE=0 to bypass the cache.
+
+Public API:
+    compile_workflow_cached: compile_workflow() with cache lookup and store
+    get_prompt_cache_stats: Process-wide hit/miss counters
+    PromptCacheStats: Hit/miss counters
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from bmad_assist import __version__
+from bmad_assist.compiler.compression_cache import COMPRESSION_CACHE_SUBDIR
+from bmad_assist.compiler.patching.cache import CACHE_DIR_NAME, HASH_MEMO_FILENAME
+from bmad_assist.compiler.types import CompiledWorkflow, CompilerContext
+from bmad_assist.core.project_tree.gitignore import GitignoreParser
+
+logger = logging.getLogger(__name__)
+
+# Subdirectory of .bmad-assist/cache holding compiled prompt entries
+PROMPT_CACHE_SUBDIR = "compiled"
+
+# Bump when the entry layout or fingerprint semantics change
+PROMPT_CACHE_FORMAT = 3
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# <workflow>-<YYYYMMDD>-<key prefix>.json
+_ENTRY_NAME = re.compile(r"-(\d{8})-[0-9a-f]{16}\.json$")
+
+
+@dataclass
+class PromptCacheStats:
+    """Process-wide compiled prompt cache counters.
+
+    Attributes:
+        hits: Lookups served from cache.
+        misses: Lookups that required a full compilation.
+
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+
+_stats = PromptCacheStats()
+_stats_lock = threading.Lock()
+
+
+def get_prompt_cache_stats() -> PromptCacheStats:
+    """Get a snapshot of the process-wide hit/miss counters.
+
+    Returns:
+        Copy of the current counters.
+
+    """
+    with _stats_lock:
+        return PromptCacheStats(hits=_stats.hits, misses=_stats.misses)
+
+
+def reset_prompt_cache_stats() -> None:
+    """Reset hit/miss counters, e.g. at the start of a run."""
+    with _stats_lock:
+        _stats.hits = 0
+        _stats.misses = 0
+
+
+# .bmad-assist entries written at run time; never compilation inputs
+_RUNTIME_STATE_NAMES = frozenset({"prompts", "debug", "runs", "runtime", "running.lock"})
+
+# .bmad-assist/cache entries the compiler derives from other inputs
+_DERIVED_CACHE_NAMES = frozenset(
+    {PROMPT_CACHE_SUBDIR, COMPRESSION_CACHE_SUBDIR, HASH_MEMO_FILENAME}
+)
+_DERIVED_CACHE_SUFFIXES = (".tpl.xml", ".meta.yaml", ".tmp")
+
+# Compile-time timestamp variables and the formats compilers produce them in
+_TIMESTAMP_VARIABLES = ("timestamp",)
+_TIMESTAMP_FORMATS = ("%Y%m%d_%H%M%S", "%Y%m%d_%H%M")
+
+
+def _is_derived_state(path: Path, state_dir: Path) -> bool:
+    """Check whether a path under .bmad-assist is run-time or derived state."""
+    rel = path.relative_to(state_dir).parts
+    if rel[0] in _RUNTIME_STATE_NAMES:
+        return True
+    if rel[0] == "cache" and len(rel) > 1:
+        return rel[1] in _DERIVED_CACHE_NAMES or path.name.endswith(_DERIVED_CACHE_SUFFIXES)
+    return False
+
+
+def _stat_tree(
+    root: Path,
+    stats: dict[str, tuple[int, int]],
+    gitignore: GitignoreParser | None = None,
+    skip: Callable[[Path], bool] | None = None,
+) -> None:
+    """Record (mtime_ns, size) of every file below root into stats.
+
+    Args:
+        root: Directory to walk; missing directories are skipped.
+        stats: Mapping of absolute file path to (mtime_ns, size) to fill.
+        gitignore: Parser for root's project; ignored directories are pruned.
+        skip: Predicate for paths (files or directories) to leave out.
+
+    """
+    pending = [root]
+    while pending:
+        dir_path = pending.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            path = Path(entry.path)
+            if skip is not None and skip(path):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == ".git":
+                        continue
+                    if gitignore is not None and gitignore.is_ignored_entry(
+                        path.relative_to(root), is_dir=True
+                    ):
+                        continue
+                    pending.append(path)
+                elif entry.is_file():
+                    st = entry.stat()
+                    stats[entry.path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue
+
+
+def _git_fingerprint(repo_dir: Path) -> str | None:
+    """Hash HEAD, branch and index state for a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v2", "--branch", "-z", "--untracked-files=no"],
+            cwd=repo_dir,
+            capture_output=True,
+            timeout=30,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return hashlib.sha256(result.stdout).hexdigest()
+
+
+def _workflow_dir(workflow_name: str, context: CompilerContext) -> Path | None:
+    """Get the workflow directory the compiler will load, if it resolves."""
+    from bmad_assist.compiler.core import get_workflow_compiler
+
+    try:
+        return get_workflow_compiler(workflow_name).get_workflow_dir(context)
+    except Exception as e:
+        logger.debug("Workflow directory for %s not fingerprinted: %s", workflow_name, e)
+        return None
+
+
+def _fingerprint_inputs(workflow_name: str, context: CompilerContext) -> dict[str, Any]:
+    """Fingerprint everything a compilation of this workflow can read.
+
+    Args:
+        workflow_name: Workflow identifier.
+        context: The compilation context with project paths.
+
+    Returns:
+        JSON-serializable fingerprint; equal fingerprints mean unchanged inputs.
+
+    """
+    project_root = Path(context.project_root)
+    state_dir = project_root / ".bmad-assist"
+
+    stats: dict[str, tuple[int, int]] = {}
+    _stat_tree(
+        project_root,
+        stats,
+        gitignore=GitignoreParser(project_root),
+        skip=lambda path: path == state_dir,
+    )
+    _stat_tree(state_dir, stats, skip=lambda path: _is_derived_state(path, state_dir))
+    extra_roots = [context.output_folder, context.project_knowledge]
+    extra_roots.append(_workflow_dir(workflow_name, context))
+    for root in extra_roots:
+        if root is not None:
+            _stat_tree(Path(root), stats)
+
+    digest = hashlib.sha256()
+    for path in sorted(stats):
+        mtime_ns, size = stats[path]
+        digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode("utf-8", "surrogateescape"))
+    return {
+        "files": digest.hexdigest(),
+        "file_count": len(stats),
+        "git": _git_fingerprint(project_root),
+    }
+
+
+def _refresh_timestamps(compiled: CompiledWorkflow) -> CompiledWorkflow:
+    """Replace compile-time timestamps in a cached result with current ones.
+
+    Args:
+        compiled: Workflow loaded from a cache entry (JSON-safe variables).
+
+    Returns:
+        The workflow with every occurrence of each stale timestamp replaced.
+
+    """
+    now = datetime.now()
+    replacements: dict[str, str] = {}
+    for name in _TIMESTAMP_VARIABLES:
+        value = compiled.variables.get(name)
+        if not isinstance(value, str):
+            continue
+        for fmt in _TIMESTAMP_FORMATS:
+            # strptime accepts single-digit fields; require an exact round trip
+            try:
+                if datetime.strptime(value, fmt).strftime(fmt) != value:
+                    continue
+            except ValueError:
+                continue
+            replacements[value] = now.strftime(fmt)
+            break
+    if not replacements:
+        return compiled
+
+    pattern = re.compile(
+        "|".join(rf"(?<!\d){re.escape(old)}(?!\d)" for old in sorted(replacements, key=len)[::-1])
+    )
+
+    def refresh(text: str) -> str:
+        return pattern.sub(lambda match: replacements[match.group(0)], text)
+
+    return replace(
+        compiled,
+        mission=refresh(compiled.mission),
+        context=refresh(compiled.context),
+        variables=json.loads(refresh(json.dumps(compiled.variables))),
+        instructions=refresh(compiled.instructions),
+        output_template=refresh(compiled.output_template),
+    )
+
+
+def _patch_hash(workflow_name: str, context: CompilerContext) -> str | None:
+    """Hash the patch file that applies to this workflow, if any."""
+    from bmad_assist.compiler.patching.cache import cached_file_hash
+    from bmad_assist.compiler.patching.discovery import discover_patch
+
+    try:
+        patch_path = discover_patch(workflow_name, context.project_root, cwd=context.cwd)
+        return cached_file_hash(patch_path) if patch_path is not None else None
+    except OSError:
+        return None
+
+
+def _config_hash() -> str | None:
+    """Hash the loaded configuration, or None if no config is loaded."""
+    from bmad_assist.core.config import get_config
+
+    try:
+        config = get_config()
+    except Exception:
+        return None
+    return hashlib.sha256(config.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def _cache_key(workflow_name: str, context: CompilerContext, today: date) -> str:
+    """Build the content address for a workflow compilation."""
+    key_material = {
+        "format": PROMPT_CACHE_FORMAT,
+        "version": __version__,
+        "workflow": workflow_name,
+        "patch": _patch_hash(workflow_name, context),
+        "config": _config_hash(),
+        "variables": context.resolved_variables,
+        "links_only": context.links_only,
+        "project_root": str(context.project_root),
+        "output_folder": str(context.output_folder),
+        "project_knowledge": str(context.project_knowledge),
+        "cwd": str(context.cwd),
+        # Compilers embed today's date; never reuse an entry across days
+        "date": today.isoformat(),
+    }
+    encoded = json.dumps(key_material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _entry_path(project_root: Path, workflow_name: str, key: str, today: date) -> Path:
+    """Get the cache entry path for a key."""
+    filename = f"{workflow_name}-{today:%Y%m%d}-{key[:16]}.json"
+    return project_root / CACHE_DIR_NAME / PROMPT_CACHE_SUBDIR / filename
+
+
+def _load_entry(path: Path, key: str, inputs: dict[str, Any]) -> CompiledWorkflow | None:
+    """Load a cache entry if it exists and was stored for the same inputs."""
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable prompt cache entry %s: %s", path, e)
+        return None
+
+    if entry.get("key") != key or entry.get("inputs") != inputs:
+        return None
+    try:
+        compiled = _refresh_timestamps(CompiledWorkflow(**entry["compiled"]))
+    except (KeyError, TypeError) as e:
+        logger.debug("Ignoring malformed prompt cache entry %s: %s", path, e)
+        return None
+    # Mark as recently used for eviction
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return compiled
+
+
+def _evict_entries(
+    cache_dir: Path,
+    keep: Path,
+    today: date,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> None:
+    """Drop entries from other dates, then least recently used ones over the bounds.
+
+    Args:
+        cache_dir: Directory holding the entries.
+        keep: Entry just written; never evicted.
+        today: Date the current keys are built for.
+        max_entries: Maximum number of entries kept.
+        max_bytes: Maximum total size of entry files in bytes.
+
+    """
+    stamp = f"{today:%Y%m%d}"
+    live: list[tuple[float, int, Path]] = []
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = list(it)
+    except OSError:
+        return
+    evicted = 0
+    for entry in entries:
+        if not entry.name.endswith(".json"):
+            continue
+        path = Path(entry.path)
+        match = _ENTRY_NAME.search(entry.name)
+        try:
+            if match is None or match.group(1) != stamp:
+                if path != keep:
+                    path.unlink(missing_ok=True)
+                    evicted += 1
+                continue
+            st = entry.stat()
+        except OSError:
+            continue
+        live.append((st.st_mtime, st.st_size, path))
+
+    total = sum(size for _, size, _ in live)
+    count = len(live)
+    for _, size, path in sorted(live):
+        if count <= max_entries and total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+            evicted += 1
+        count -= 1
+        total -= size
+    if evicted:
+        logger.debug("Evicted %d compiled prompt cache entries", evicted)
+
+
+def _save_entry(
+    path: Path,
+    key: str,
+    compiled: CompiledWorkflow,
+    inputs: dict[str, Any],
+    today: date,
+) -> None:
+    """Write a cache entry atomically and enforce the cache bounds.
+
+    Failures only log a warning.
+    """
+    temp_path = path.with_suffix(".json.tmp")
+    try:
+        entry = {"key": key, "inputs": inputs, "compiled": asdict(compiled)}
+        payload = json.dumps(entry, default=str)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(payload, encoding="utf-8")
+        os.replace(temp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        with contextlib.suppress(OSError):
+            temp_path.unlink(missing_ok=True)
+        logger.warning("Failed to write prompt cache entry %s: %s", path, e)
+        return
+    _evict_entries(path.parent, keep=path, today=today)
+
+
+def compile_workflow_cached(workflow_name: str, context: CompilerContext) -> CompiledWorkflow:
+    """Compile a workflow, reusing a cached result when its inputs are unchanged.
+
+    On a hit the compiler does not run, so context is not populated with
+    workflow_ir, patch_path or discovered files.
+
+    Args:
+        workflow_name: Workflow identifier (e.g., 'create-story').
+        context: The compilation context with project paths.
+
+    Returns:
+        CompiledWorkflow from cache or from a fresh compilation.
+
+    Raises:
+        CompilerError: If workflow invalid or compilation fails.
+
+    """
+    from bmad_assist.compiler import compile_workflow
+
+    if os.environ.get("BMAD_PROMPT_CACHE") == "0":
+        return compile_workflow(workflow_name, context)
+
+    today = date.today()
+    key = _cache_key(workflow_name, context, today)
+    path = _entry_path(context.project_root, workflow_name, key, today)
+
+    # Fingerprinted before compiling, so inputs changed mid-compilation
+    # invalidate the entry instead of being attributed to it
+    inputs = _fingerprint_inputs(workflow_name, context)
+    cached = _load_entry(path, key, inputs)
+    with _stats_lock:
+        if cached is not None:
+            _stats.hits += 1
+        else:
+            _stats.misses += 1
+        hits, misses = _stats.hits, _stats.misses
+
+    if cached is not None:
+        logger.info(
+            "Compiled prompt cache hit for %s (hits=%d, misses=%d)",
+            workflow_name,
+            hits,
+            misses,
+        )
+        return cached
+
+    logger.info(
+        "Compiled prompt cache miss for %s (hits=%d, misses=%d)",
+        workflow_name,
+        hits,
+        misses,
+    )
+    compiled = compile_workflow(workflow_name, context)
+    _save_entry(path, key, compiled, inputs, today)
+    return compiled
@@ -13,12 +13,17 @@ Usage:
 from __future__ import annotations
 
 import ast
+import codecs
 import logging
+import os
 import re
+import stat
 import subprocess
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from bmad_assist.compiler.shared_utils import estimate_tokens
 from bmad_assist.core.config import SourceContextConfig, get_config
@@ -35,6 +40,10 @@ MIN_ENABLED_BUDGET = 100
 # Max file size for AST parsing (100KB)
 MAX_AST_PARSE_SIZE = 100 * 1024
 
+# Files whose stat size exceeds budget * this factor (in ~tokens) are scored
+# from stat data alone and never read in full
+STAT_ONLY_BUDGET_FACTOR = 4
+
 # Binary file extensions to skip
 BINARY_EXTENSIONS: frozenset[str] = frozenset(
     {
@@ -149,6 +158,7 @@ class ScoredFile:
         is_config: Whether detected as config file.
         change_lines: Lines changed (from git diff, 0 if not in diff).
         hunk_ranges: Line ranges of changes [(start, end), ...].
+        size_only: Whether tokens were estimated from stat size (file not read).
 
     """
 
@@ -161,6 +171,7 @@ class ScoredFile:
     is_config: bool = False
     change_lines: int = 0
     hunk_ranges: list[tuple[int, int]] = field(default_factory=list)
+    size_only: bool = False
 
 
 @dataclass
@@ -377,6 +388,117 @@ def _is_config_file(path: str) -> bool:
     return suffix in CONFIG_EXTENSIONS
 
 
+class SourceContentStore:
+    """Per-compilation read-once cache of source file contents.
+
+    Entries are keyed by path and validated against (mtime_ns, size), so
+    scoring, extraction, hunk slicing and truncation share a single read of
+    each file while still noticing files that change mid-compilation.
+
+    Attributes:
+        reads: Number of full reads from disk.
+        hits: Number of reads served from cache.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._entries: dict[Path, tuple[int, int, str | None]] = {}
+        self.reads = 0
+        self.hits = 0
+
+    def stat(self, path: Path) -> os.stat_result | None:
+        """Stat a file, returning None if it is missing or not a regular file.
+
+        Args:
+            path: Absolute file path.
+
+        Returns:
+            Stat result or None.
+
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return st if stat.S_ISREG(st.st_mode) else None
+
+    def read(self, path: Path) -> str | None:
+        """Read full file content, reusing a cached copy if stat is unchanged.
+
+        Args:
+            path: Absolute file path.
+
+        Returns:
+            File content or None if unreadable.
+
+        """
+        st = self.stat(path)
+        if st is None:
+            return None
+        cached = self._entries.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            self.hits += 1
+            return cached[2]
+
+        content = safe_read_file(path)
+        self.reads += 1
+        self._entries[path] = (st.st_mtime_ns, st.st_size, content)
+        return content
+
+    def read_head(
+        self,
+        path: Path,
+        max_chars: int | None = None,
+        max_lines: int | None = None,
+    ) -> str | None:
+        """Read only the beginning of a file.
+
+        Serves from the full-content cache when available; otherwise reads
+        lines until either limit is reached, without caching the partial text.
+
+        Args:
+            path: Absolute file path.
+            max_chars: Stop after this many characters (None = no limit).
+            max_lines: Stop after this many lines (None = no limit).
+
+        Returns:
+            Head of the file content or None if unreadable.
+
+        """
+        st = self.stat(path)
+        cached = self._entries.get(path)
+        if (
+            st is not None
+            and cached is not None
+            and cached[0] == st.st_mtime_ns
+            and cached[1] == st.st_size
+        ):
+            self.hits += 1
+            content = cached[2]
+            if content is None:
+                return None
+            if max_lines is not None:
+                content = "".join(content.splitlines(keepends=True)[:max_lines])
+            return content[:max_chars] if max_chars is not None else content
+
+        parts: list[str] = []
+        chars = 0
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                for line_no, line in enumerate(f, start=1):
+                    parts.append(line)
+                    chars += len(line)
+                    if (max_chars is not None and chars >= max_chars) or (
+                        max_lines is not None and line_no >= max_lines
+                    ):
+                        break
+        except OSError:
+            return None
+        head = "".join(parts)
+        return head[:max_chars] if max_chars is not None else head
+
+
 class SourceContextService:
     """Service for collecting source files with configurable prioritization.
 
@@ -392,17 +514,25 @@ class SourceContextService:
 
     """
 
-    def __init__(self, context: CompilerContext, workflow_name: str) -> None:
+    def __init__(
+        self,
+        context: CompilerContext,
+        workflow_name: str,
+        content_store: SourceContentStore | None = None,
+    ) -> None:
         """Initialize service with compiler context and workflow name.
 
         Args:
             context: Compilation context with project_root.
             workflow_name: Name of workflow (e.g., 'code_review').
+            content_store: Optional content store to share with other services
+                in the same compilation. A fresh store is created if omitted.
 
         """
         self.context = context
         self.project_root = context.project_root.resolve()
         self.workflow_name = workflow_name
+        self.content_store = content_store or SourceContentStore()
 
         # Get config, fallback to defaults if not loaded
         try:
@@ -531,11 +661,21 @@ class SourceContextService:
             except ValueError:
                 continue
 
-            # Read content for token estimation
-            content = safe_read_file(abs_path)
-            if content is None:
+            # Estimate tokens: stat-only for files far beyond the budget,
+            # otherwise a full read shared with extraction via the store
+            st = self.content_store.stat(abs_path)
+            if st is None:
                 logger.debug("Skipping unreadable file: %s", path)
                 continue
+            size_only = st.st_size // 4 > self.budget * STAT_ONLY_BUDGET_FACTOR
+            if size_only:
+                tokens = st.st_size // 4
+            else:
+                content = self.content_store.read(abs_path)
+                if content is None:
+                    logger.debug("Skipping unreadable file: %s", path)
+                    continue
+                tokens = estimate_tokens(content)
 
             # Create scored file
             in_file_list = path in file_list_set
@@ -567,13 +707,14 @@ class SourceContextService:
             sf = ScoredFile(
                 path=path,
                 score=score,
-                tokens=estimate_tokens(content),
+                tokens=tokens,
                 in_file_list=in_file_list,
                 in_git_diff=in_git_diff,
                 is_test=is_test,
                 is_config=is_config,
                 change_lines=change_lines,
                 hunk_ranges=list(hunk_ranges),
+                size_only=size_only,
             )
             scored.append(sf)
 
@@ -665,7 +806,7 @@ class SourceContextService:
                 break
 
             abs_path = self.project_root / sf.path
-            content = safe_read_file(abs_path)
+            content = self._read_for_extraction(abs_path, sf, self.budget - tokens_used)
             if content is None:
                 continue
 
@@ -713,7 +854,7 @@ class SourceContextService:
         if not result and selected_files:
             sf = selected_files[0]
             abs_path = self.project_root / sf.path
-            content = safe_read_file(abs_path)
+            content = self._read_for_extraction(abs_path, sf, self.budget)
             if content:
                 truncated = self._truncate_at_symbol(
                     content,
@@ -736,6 +877,45 @@ class SourceContextService:
 
         return result
 
+    def _read_for_extraction(
+        self,
+        abs_path: Path,
+        scored_file: ScoredFile,
+        remaining_budget: int,
+    ) -> str | None:
+        """Read file content for extraction through the content store.
+
+        Files scored from stat size alone are only read as far as needed:
+        up to the last hunk (plus context) when hunk info exists, otherwise
+        a head slightly larger than the remaining budget.
+
+        Args:
+            abs_path: Absolute file path.
+            scored_file: Scored file being extracted.
+            remaining_budget: Tokens still available.
+
+        Returns:
+            Full or head content, or None if unreadable.
+
+        """
+        if not scored_file.size_only:
+            return self.content_store.read(abs_path)
+
+        if scored_file.hunk_ranges:
+            extraction = self.config.extraction
+            max_lines = max(
+                end
+                + max(
+                    extraction.hunk_context_lines,
+                    int((end - start + 1) * extraction.hunk_context_scale),
+                )
+                for start, end in scored_file.hunk_ranges
+            )
+            return self.content_store.read_head(abs_path, max_lines=max_lines)
+
+        # Over-read by one line-ish margin so truncation can find a boundary
+        return self.content_store.read_head(abs_path, max_chars=remaining_budget * 4 + 4096)
+
     def _extract_hunks(self, content: str, scored_file: ScoredFile) -> str:
         """Extract hunks (changed regions with context) from content.
 
@@ -939,6 +1119,9 @@ def get_git_diff_files(
 ) -> list[GitDiffFile]:
     """Parse git diff stat output and get hunk ranges.
 
+    Hunk ranges for all files are collected with a single batched
+    ``git diff -U0`` run (see get_hunk_ranges_for_files).
+
     Args:
         project_root: Project root for git commands.
         stat_output: Output from git diff --stat.
@@ -949,16 +1132,19 @@ def get_git_diff_files(
     """
     # Extract files from stat
     files = _parse_git_stat(stat_output)
+    if not files:
+        return []
+
+    # Get hunk ranges for all files in one pass
+    hunk_map = get_hunk_ranges_for_files(project_root, [path for path, _ in files])
 
-    # Get hunk ranges for each file
     result: list[GitDiffFile] = []
     for path, changes in files:
-        hunk_ranges = get_hunk_ranges_for_file(project_root, path)
         result.append(
             GitDiffFile(
                 path=path,
                 change_lines=changes,
-                hunk_ranges=hunk_ranges,
+                hunk_ranges=hunk_map.get(_normalize_path(path), []),
             )
         )
 
@@ -1011,42 +1197,184 @@ def _parse_git_stat(stat_output: str) -> list[tuple[str, int]]:
     return result
 
 
-def get_hunk_ranges_for_file(project_root: Path, path: str) -> list[tuple[int, int]]:
-    """Get hunk line ranges from git diff for a specific file.
+# Max pathspecs per batched git diff invocation (keeps argv well below ARG_MAX)
+_DIFF_PATHSPEC_BATCH = 500
+
+# Timeout for a single batched git diff invocation (seconds)
+_DIFF_BATCH_TIMEOUT = 30
+
+# Unified diff hunk header: @@ -old_start,old_count +new_start,new_count @@
+_HUNK_HEADER = re.compile(r"^@@\s+-\d+(?:,(\d+))?\s+\+(\d+)(?:,(\d+))?\s+@@")
+
+
+def _unquote_diff_path(raw: str) -> str | None:
+    """Extract the new-side path from a ``+++`` header value.
+
+    Args:
+        raw: Header value after ``+++ `` (e.g. ``b/src/app.py``).
+
+    Returns:
+        Normalized path, or None for deleted files (``/dev/null``).
+
+    """
+    raw = raw.rstrip("\n").rstrip("\t")
+    if raw == "/dev/null":
+        return None
+    if len(raw) >= 2 and raw.startswith('"') and raw.endswith('"'):
+        # git C-quotes paths with special characters
+        unescaped = cast(bytes, codecs.escape_decode(raw[1:-1].encode("utf-8"))[0])
+        raw = unescaped.decode("utf-8", errors="replace")
+    if raw.startswith("b/"):
+        raw = raw[2:]
+    return _normalize_path(raw)
+
+
+def _parse_unified_diff(lines: Iterable[str]) -> dict[str, list[tuple[int, int]]]:
+    """Split a streamed ``git diff -U0`` output into per-file hunk ranges.
+
+    Hunk bodies are skipped by line count, so changed lines that happen to
+    look like diff headers (e.g. an added ``++ x`` line) are never misread.
+
+    Args:
+        lines: Iterable of diff output lines.
+
+    Returns:
+        Mapping of normalized path to (start_line, end_line) tuples
+        (1-indexed inclusive). Files without new-side lines map to [].
+
+    """
+    ranges: dict[str, list[tuple[int, int]]] = {}
+    current: list[tuple[int, int]] | None = None
+    old_remaining = 0
+    new_remaining = 0
+
+    for line in lines:
+        if old_remaining > 0 or new_remaining > 0:
+            if line.startswith("-"):
+                old_remaining -= 1
+                continue
+            if line.startswith("+"):
+                new_remaining -= 1
+                continue
+            if line.startswith("\\"):
+                continue  # "\ No newline at end of file"
+            # Malformed hunk - fall through and resync on headers
+            old_remaining = new_remaining = 0
+
+        if line.startswith("diff --git "):
+            current = None
+        elif line.startswith("+++ "):
+            path = _unquote_diff_path(line[4:])
+            current = ranges.setdefault(path, []) if path is not None else None
+        elif line.startswith("@@"):
+            match = _HUNK_HEADER.match(line)
+            if not match:
+                continue
+            old_remaining = int(match.group(1)) if match.group(1) is not None else 1
+            start = int(match.group(2))
+            new_remaining = int(match.group(3)) if match.group(3) is not None else 1
+            if current is not None and new_remaining > 0:
+                current.append((start, start + new_remaining - 1))
+
+    return ranges
+
+
+def _run_batched_diff(project_root: Path, pathspecs: list[str]) -> dict[str, list[tuple[int, int]]]:
+    """Run one ``git diff -U0`` over pathspecs and parse the streamed output.
 
     Args:
         project_root: Project root for git command.
-        path: File path relative to project root.
+        pathspecs: Paths relative to project root.
 
     Returns:
-        List of (start_line, end_line) tuples (1-indexed inclusive).
+        Mapping of normalized path to hunk ranges. Empty on any git failure.
 
     """
     try:
-        result = subprocess.run(
-            ["git", "diff", "-U0", "--no-color", "--", path],
+        proc = subprocess.Popen(
+            [
+                "git",
+                "--literal-pathspecs",
+                "-c",
+                "core.quotePath=false",
+                "diff",
+                "-U0",
+                "--no-color",
+                "--no-ext-diff",
+                "--relative",
+                "--",
+                *pathspecs,
+            ],
             cwd=project_root,
-            capture_output=True,
-            timeout=10,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             encoding="utf-8",
             errors="replace",
         )
+    except OSError:
+        return {}
 
-        if result.returncode != 0:
-            return []
+    timer = threading.Timer(_DIFF_BATCH_TIMEOUT, proc.kill)
+    timer.start()
+    try:
+        assert proc.stdout is not None
+        ranges = _parse_unified_diff(proc.stdout)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        if proc.stdout is not None:
+            proc.stdout.close()
 
-        # Parse unified diff format
-        # @@ -old_start,old_count +new_start,new_count @@
-        hunk_pattern = re.compile(r"^@@\s+-\d+(?:,\d+)?\s+\+(\d+)(?:,(\d+))?\s+@@", re.MULTILINE)
+    if returncode != 0:
+        logger.debug("Batched git diff failed (rc=%d) for %d paths", returncode, len(pathspecs))
+        return {}
+    return ranges
 
-        ranges: list[tuple[int, int]] = []
-        for match in hunk_pattern.finditer(result.stdout):
-            start = int(match.group(1))
-            count = int(match.group(2)) if match.group(2) else 1
-            if count > 0:
-                ranges.append((start, start + count - 1))
 
-        return ranges
+def get_hunk_ranges_for_files(
+    project_root: Path,
+    paths: list[str],
+) -> dict[str, list[tuple[int, int]]]:
+    """Get hunk line ranges for many files with a single git diff pass.
 
-    except (subprocess.TimeoutExpired, OSError):
-        return []
+    Runs one ``git diff -U0`` per batch of up to _DIFF_PATHSPEC_BATCH paths
+    instead of one subprocess per file, streaming and splitting the
+    unified diff into per-file ranges.
+
+    Args:
+        project_root: Project root for git command.
+        paths: File paths relative to project root.
+
+    Returns:
+        Mapping of normalized path to (start_line, end_line) tuples
+        (1-indexed inclusive). Paths without changes are absent.
+
+    """
+    unique_paths = list(dict.fromkeys(paths))
+    result: dict[str, list[tuple[int, int]]] = {}
+    for i in range(0, len(unique_paths), _DIFF_PATHSPEC_BATCH):
+        result.update(_run_batched_diff(project_root, unique_paths[i : i + _DIFF_PATHSPEC_BATCH]))
+
+    logger.debug(
+        "Collected hunk ranges for %d/%d files in %d git diff call(s)",
+        len(result),
+        len(unique_paths),
+        -(-len(unique_paths) // _DIFF_PATHSPEC_BATCH),
+    )
+    return result
+
+
+def get_hunk_ranges_for_file(project_root: Path, path: str) -> list[tuple[int, int]]:
+    """Get hunk line ranges from git diff for a specific file.
+
+    Prefer get_hunk_ranges_for_files() when several files are needed.
+
+    Args:
+        project_root: Project root for git command.
+        path: File path relative to project root.
+
+    Returns:
+        List of (start_line, end_line) tuples (1-indexed inclusive).
+
+    """
+    return get_hunk_ranges_for_files(project_root, [path]).get(_normalize_path(path), [])
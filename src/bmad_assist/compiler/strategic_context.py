@@ -21,13 +21,13 @@ Token budget behavior:
 
 import hashlib
 import logging
-import os
 import re
 from pathlib import Path
 from typing import Literal, NamedTuple
 
 from bmad_assist.bmad.sharding import load_sharded_content
 from bmad_assist.bmad.sharding.sorting import DocType
+from bmad_assist.compiler.compression_cache import CompressionCache
 from bmad_assist.compiler.shared_utils import (
     estimate_tokens,
     find_file_in_planning_dir,
@@ -142,108 +142,6 @@ def _compute_content_hash(content: str) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
-def _get_compression_cache_dir(project_root: Path) -> Path:
-    """Return path to compression cache directory."""
-    return project_root / ".bmad-assist" / "cache" / "compressed"
-
-
-def _load_cached_compression(
-    project_root: Path, doc_type: str, content_hash: str
-) -> tuple[str, int] | None:
-    """Load cached compression result if available and valid.
-
-    Args:
-        project_root: Project root directory.
-        doc_type: Document type (e.g., "ux", "prd").
-        content_hash: Full SHA-256 hash of the source content.
-
-    Returns:
-        Tuple of (compressed_content, compressed_tokens) or None if not cached.
-
-    """
-    try:
-        cache_dir = _get_compression_cache_dir(project_root)
-        prefix = content_hash[:16]
-        cache_file = cache_dir / f"{doc_type}-{prefix}.md"
-        meta_file = cache_dir / f"{doc_type}-{prefix}.meta.yaml"
-
-        if not cache_file.exists() or not meta_file.exists():
-            return None
-
-        import yaml
-
-        meta = yaml.safe_load(meta_file.read_text(encoding="utf-8"))
-        if not meta or meta.get("content_hash") != content_hash:
-            return None
-
-        content = cache_file.read_text(encoding="utf-8")
-        return content, meta.get("compressed_tokens", estimate_tokens(content))
-    except Exception as e:
-        logger.warning("Failed to load compression cache for %s: %s", doc_type, e)
-        return None
-
-
-def _save_cached_compression(
-    project_root: Path,
-    doc_type: str,
-    content_hash: str,
-    compressed: str,
-    original_tokens: int,
-) -> None:
-    """Save compressed content to disk cache.
-
-    Writes atomically (tmp + rename) and cleans up stale entries for the same doc_type.
-
-    Args:
-        project_root: Project root directory.
-        doc_type: Document type (e.g., "ux", "prd").
-        content_hash: Full SHA-256 hash of the source content.
-        compressed: Compressed content to cache.
-        original_tokens: Token count of the original content.
-
-    """
-    try:
-        from datetime import UTC, datetime
-
-        import yaml
-
-        cache_dir = _get_compression_cache_dir(project_root)
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        prefix = content_hash[:16]
-        cache_file = cache_dir / f"{doc_type}-{prefix}.md"
-        meta_file = cache_dir / f"{doc_type}-{prefix}.meta.yaml"
-
-        # Atomic write: content
-        tmp_file = cache_file.with_suffix(".tmp")
-        tmp_file.write_text(compressed, encoding="utf-8")
-        os.rename(tmp_file, cache_file)
-
-        # Write metadata
-        compressed_tokens = estimate_tokens(compressed)
-        meta = {
-            "content_hash": content_hash,
-            "original_tokens": original_tokens,
-            "compressed_tokens": compressed_tokens,
-            "compressed_at": datetime.now(UTC).isoformat(),
-        }
-        tmp_meta = meta_file.with_suffix(".tmp")
-        tmp_meta.write_text(yaml.safe_dump(meta, default_flow_style=False), encoding="utf-8")
-        os.rename(tmp_meta, meta_file)
-
-        # Clean up stale entries for the same doc_type (different hash)
-        for stale in cache_dir.glob(f"{doc_type}-*.md"):
-            if stale.name != cache_file.name:
-                stale.unlink(missing_ok=True)
-        for stale in cache_dir.glob(f"{doc_type}-*.meta.yaml"):
-            if stale.name != meta_file.name:
-                stale.unlink(missing_ok=True)
-        for stale in cache_dir.glob(f"{doc_type}-*.tmp"):
-            stale.unlink(missing_ok=True)
-    except Exception as e:
-        logger.warning("Failed to save compression cache for %s: %s", doc_type, e)
-
-
 def _compress_or_truncate(
     content: str, target_tokens: int, doc_type: str, project_root: Path | None = None
 ) -> tuple[str, int]:
@@ -252,7 +150,7 @@ def _compress_or_truncate(
     Uses the helper provider (if configured) to compress the document
     while preserving key information. On any failure, falls back to
     simple truncation. Results are cached on disk keyed by SHA-256
-    content hash.
+    content hash, target tokens and helper model (see compression_cache).
 
     Args:
         content: Full document content.
@@ -278,8 +176,15 @@ def _compress_or_truncate(
 
         # Check cache before calling LLM
         content_hash = _compute_content_hash(content)
-        if project_root is not None:
-            cached = _load_cached_compression(project_root, doc_type, content_hash)
+        model = f"{helper.provider}/{helper.model}"
+        cache = CompressionCache(project_root) if project_root is not None else None
+        if cache is not None:
+            cached = cache.get(
+                content_hash,
+                target_tokens,
+                model,
+                max_tokens=target_tokens * BUDGET_OVERRUN_FACTOR,
+            )
             if cached is not None:
                 cached_content, cached_tokens = cached
                 if cached_tokens <= target_tokens * BUDGET_OVERRUN_FACTOR:
@@ -310,9 +215,9 @@ def _compress_or_truncate(
         )
 
         # Save to cache
-        if project_root is not None:
-            _save_cached_compression(
-                project_root, doc_type, content_hash, compressed, original_tokens
+        if cache is not None:
+            cache.put(
+                doc_type, content_hash, target_tokens, model, compressed, original_tokens, actual
             )
 
         # If compression result still exceeds budget, truncate it
@@ -62,6 +62,7 @@ from bmad_assist.core.config.models import (
     BmadPathsConfig,
     CompilerConfig,
     Config,
+    HedgingConfig,
     HelperProviderConfig,
     LoopConfig,
     MasterProviderConfig,
@@ -83,6 +84,7 @@ from bmad_assist.core.config.models import (
     StrategicContextWorkflowConfig,
     StrategicDocType,
     TimeoutsConfig,
+    ValidationQuorumConfig,
     WarningsConfig,
     _create_story_defaults,
     _validate_story_defaults,
@@ -149,11 +151,13 @@ __all__ = [
     "_validate_story_synthesis_defaults",
     # Models - Features
     "CompilerConfig",
+    "HedgingConfig",
     "TimeoutsConfig",
     "BenchmarkingConfig",
     "PlaywrightServerConfig",
     "PlaywrightConfig",
     "QAConfig",
+    "ValidationQuorumConfig",
     # Models - Loop
     "LoopConfig",
     "SprintConfig",
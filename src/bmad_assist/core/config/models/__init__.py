@@ -8,11 +8,13 @@ from bmad_assist.core.config.models.features import (
     AntipatternConfig,
     BenchmarkingConfig,
     CompilerConfig,
+    HedgingConfig,
     PlaywrightConfig,
     PlaywrightServerConfig,
     QAConfig,
     SynthesisConfig,
     TimeoutsConfig,
+    ValidationQuorumConfig,
 )
 from bmad_assist.core.config.models.loop import (
     DEFAULT_LOOP_CONFIG,
@@ -85,12 +87,14 @@ __all__ = [
     # features.py
     "AntipatternConfig",
     "CompilerConfig",
+    "HedgingConfig",
     "SynthesisConfig",
     "TimeoutsConfig",
     "BenchmarkingConfig",
     "PlaywrightServerConfig",
     "PlaywrightConfig",
     "QAConfig",
+    "ValidationQuorumConfig",
     # loop.py
     "LoopConfig",
     "SprintConfig",
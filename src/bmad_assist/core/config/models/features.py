@@ -113,6 +113,107 @@ class ToolGuardConfig(BaseModel):
     )
 
 
+class ValidationQuorumConfig(BaseModel):
+    """Quorum-based early completion for multi-LLM validation.
+
+    When enabled, validate_story proceeds once enough validators have
+    succeeded instead of waiting for the slowest one. Stragglers get a grace
+    window to finish, then are cancelled via their cancel tokens.
+
+    Attributes:
+        enabled: Whether quorum mode is active (default: wait for all).
+        min_validators: Successful validators needed to proceed (never below 2).
+        grace_period: Seconds stragglers may still finish after quorum is reached.
+        cancel_wait: Seconds to wait for cancelled stragglers to stop before
+            abandoning them.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    enabled: bool = Field(
+        default=False,
+        description="Proceed when N of M validators finished instead of waiting for all",
+        json_schema_extra={"security": "safe", "ui_widget": "checkbox"},
+    )
+    min_validators: int = Field(
+        default=2,
+        ge=1,
+        description="Successful validators needed to proceed (minimum 2 is always enforced)",
+        json_schema_extra={"security": "safe", "ui_widget": "number"},
+    )
+    grace_period: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds stragglers may still finish after quorum is reached",
+        json_schema_extra={"security": "safe", "ui_widget": "number"},
+    )
+    cancel_wait: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds to wait for cancelled stragglers before abandoning them",
+        json_schema_extra={"security": "safe", "ui_widget": "number"},
+    )
+
+
+class HedgingConfig(BaseModel):
+    """Hedged provider invocations for tail-latency reduction.
+
+    When enabled, a backup invocation is launched once the primary has run
+    longer than a percentile of past durations for the same provider, model
+    and workflow (learned from benchmark records). The first valid result
+    wins and the other invocation is cancelled. Only read-only reviewer
+    phases should be hedged, since both invocations run concurrently.
+
+    Attributes:
+        enabled: Whether hedging is active.
+        phases: Phases whose validator/reviewer invocations may be hedged.
+        percentile: Latency percentile after which the backup is launched.
+        min_samples: Benchmark records required before hedging kicks in.
+        max_samples: Most recent benchmark records considered.
+        min_delay: Lower bound in seconds for the hedge delay.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    enabled: bool = Field(
+        default=False,
+        description="Launch a backup invocation when the primary exceeds learned latency",
+        json_schema_extra={"security": "safe", "ui_widget": "checkbox"},
+    )
+    phases: list[str] = Field(
+        default_factory=lambda: ["validate_story", "code_review"],
+        description="Read-only phases whose provider invocations may be hedged",
+        json_schema_extra={"security": "safe", "ui_widget": "text"},
+    )
+    percentile: float = Field(
+        default=95.0,
+        gt=0,
+        le=100,
+        description="Latency percentile after which the backup invocation starts",
+        json_schema_extra={"security": "safe", "ui_widget": "number"},
+    )
+    min_samples: int = Field(
+        default=10,
+        ge=1,
+        description="Benchmark records required before hedging is used",
+        json_schema_extra={"security": "safe", "ui_widget": "number"},
+    )
+    max_samples: int = Field(
+        default=200,
+        ge=1,
+        description="Most recent benchmark records considered for the percentile",
+        json_schema_extra={"security": "safe", "ui_widget": "number"},
+    )
+    min_delay: float = Field(
+        default=120.0,
+        ge=0,
+        description="Minimum seconds before a backup invocation is launched",
+        json_schema_extra={"security": "safe", "ui_widget": "number"},
+    )
+
+
 class CompilerConfig(BaseModel):
     """Compiler configuration section.
 
@@ -473,6 +574,7 @@ class QAConfig(BaseModel):
         generate_after_retro: Generate QA plan after retrospective.
         qa_artifacts_path: Output path for QA artifacts.
         playwright: Playwright E2E test configuration.
+        batch_concurrency: Batches executed in parallel by `qa execute` (1 = sequential).
 
     """
 
@@ -522,6 +624,13 @@ class QAConfig(BaseModel):
         description="Max issues to send to LLM per remediation iteration (10-1000)",
         json_schema_extra={"security": "safe", "ui_widget": "number"},
     )
+    batch_concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=8,
+        description="QA test batches (and categories A/B) run in parallel (1-8, 1 = sequential)",
+        json_schema_extra={"security": "safe", "ui_widget": "number"},
+    )
 
 
 class AntipatternConfig(BaseModel):
@@ -9,9 +9,11 @@ from bmad_assist.core.config.models.features import (
     AntipatternConfig,
     BenchmarkingConfig,
     CompilerConfig,
+    HedgingConfig,
     QAConfig,
     TimeoutsConfig,
     ToolGuardConfig,
+    ValidationQuorumConfig,
 )
 from bmad_assist.core.config.models.loop import LoopConfig, SprintConfig, WarningsConfig
 from bmad_assist.core.config.models.paths import (
@@ -58,6 +60,8 @@ class Config(BaseModel):
         deep_verify: Deep Verify module configuration (optional).
         sprint: Sprint-status management configuration (optional).
         workflow_variant: Workflow variant identifier for A/B testing.
+        validation_quorum: Quorum-based early completion for validate_story.
+        hedging: Hedged provider invocations for tail-latency reduction.
 
     """
 
@@ -150,6 +154,14 @@ class Config(BaseModel):
         default_factory=ToolGuardConfig,
         description="ToolCallGuard watchdog thresholds (optional)",
     )
+    validation_quorum: ValidationQuorumConfig = Field(
+        default_factory=ValidationQuorumConfig,
+        description="Quorum-based early completion for multi-LLM validation (optional)",
+    )
+    hedging: HedgingConfig = Field(
+        default_factory=HedgingConfig,
+        description="Hedged provider invocations for tail-latency reduction (optional)",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -1,11 +1,19 @@
 """Debug JSON logger for provider communication.
 
 Provides resilient append-only logging of raw JSON messages from provider
-communication. Each message is immediately flushed to disk to survive:
+communication. Each message is written to the kernel immediately to survive:
 - Connection interruptions
 - User interrupts (Ctrl+C)
 - Application crashes
 
+Durability against power loss or an OS crash is set per logger (or with the
+BMAD_DEBUG_LOG_DURABILITY environment variable):
+- "group" (default): the file stays open and a background thread fsyncs
+  pending lines in batches, every FSYNC_INTERVAL seconds or sooner once
+  FSYNC_BATCH_BYTES are pending, and on close() and interpreter exit
+- "always": fsync after every line (one fsync per stream-json message)
+- "none": never fsync; the OS writes pages back on its own schedule
+
 Usage:
     logger = DebugJsonLogger(debug_dir)
     logger.append(json_line)  # First line with init extracts session_id
@@ -22,11 +30,15 @@ Timestamp format uses compact date-time for readability and sorting:
     25.12.14-17.30 (YY.MM.DD-HH.MM)
 """
 
+import atexit
 import json
 import logging
 import os
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
+from typing import Literal, get_args
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +49,86 @@ PROMPTS_DIR = Path.home() / ".bmad-assist" / "debug" / "prompts"
 # Maximum size for a single JSON line (1MB) - truncate larger messages
 MAX_LINE_SIZE = 1024 * 1024
 
+DebugLogDurability = Literal["always", "group", "none"]
+DURABILITY_ENV_VAR = "BMAD_DEBUG_LOG_DURABILITY"
+DEFAULT_DURABILITY: DebugLogDurability = "group"
+
+# Group commit: fsync pending lines at least this often (seconds)...
+FSYNC_INTERVAL = 1.0
+# ...or as soon as this many bytes are pending
+FSYNC_BATCH_BYTES = 256 * 1024
+
+
+def _default_durability() -> DebugLogDurability:
+    """Read the durability mode from the environment, falling back to group."""
+    value = os.environ.get(DURABILITY_ENV_VAR, "").strip().lower()
+    if not value:
+        return DEFAULT_DURABILITY
+    if value not in get_args(DebugLogDurability):
+        logger.warning(
+            "Ignoring invalid %s=%r (expected always, group or none)", DURABILITY_ENV_VAR, value
+        )
+        return DEFAULT_DURABILITY
+    return value  # type: ignore[return-value]
+
+
+class _GroupCommitter:
+    """Daemon thread that fsyncs group-durability debug logs in batches.
+
+    Provider reader threads only write() their lines; the fsync, which costs
+    milliseconds, happens here for every dirty logger at once.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._dirty: weakref.WeakSet[DebugJsonLogger] = weakref.WeakSet()
+        self._pending = threading.Event()
+        self._urgent = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def mark_dirty(self, json_logger: "DebugJsonLogger", urgent: bool) -> None:
+        """Schedule a logger for the next group commit.
+
+        Args:
+            json_logger: Logger with unsynced lines.
+            urgent: Commit now instead of waiting for the interval.
+
+        """
+        with self._lock:
+            self._dirty.add(json_logger)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="debug-log-fsync", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.commit)
+        self._pending.set()
+        if urgent:
+            self._urgent.set()
+
+    def commit(self) -> None:
+        """Fsync every dirty logger now."""
+        with self._lock:
+            loggers = list(self._dirty)
+            self._dirty.clear()
+        for json_logger in loggers:
+            json_logger.sync()
+
+    def _run(self) -> None:
+        """Commit dirty loggers once per interval while there is work."""
+        while True:
+            self._pending.wait()
+            self._urgent.wait(FSYNC_INTERVAL)
+            self._pending.clear()
+            self._urgent.clear()
+            try:
+                self.commit()
+            except Exception:
+                logger.exception("Debug log group commit failed")
+
+
+_committer = _GroupCommitter()
+
 
 def save_prompt(prompt: str, phase_name: str, enabled: bool | None = None) -> Path | None:
     """Save prompt to debug/prompts directory.
@@ -81,8 +173,10 @@ def save_prompt(prompt: str, phase_name: str, enabled: bool | None = None) -> Pa
 class DebugJsonLogger:
     """Resilient append-only JSON logger for provider communication.
 
-    Each append() call opens the file, writes, flushes, and closes immediately.
-    This ensures data survives crashes, interrupts, and connection failures.
+    The file is opened once and each append() writes its line straight to it,
+    so data survives application crashes, interrupts, and connection failures.
+    When the line reaches stable storage depends on ``durability`` (see the
+    module docstring).
 
     The first append() with a valid init message extracts session_id and creates
     the file with proper naming: {timestamp}-{session_id}.jsonl
@@ -92,6 +186,7 @@ class DebugJsonLogger:
         file_path: Path to the debug log file (set after first init message).
         session_id: Provider session ID (extracted from first init message).
         enabled: Whether logging is active.
+        durability: When lines are fsynced: "always", "group" or "none".
         run_timestamp: External timestamp for consistent naming across a run.
 
     """
@@ -101,6 +196,7 @@ class DebugJsonLogger:
         debug_dir: Path | None = None,
         enabled: bool | None = None,
         run_timestamp: datetime | None = None,
+        durability: DebugLogDurability | None = None,
     ) -> None:
         """Initialize debug logger.
 
@@ -109,6 +205,8 @@ class DebugJsonLogger:
             enabled: Whether to actually write. If None, uses logger.isEnabledFor(DEBUG).
             run_timestamp: External timestamp for filename. If None, uses current time.
                 Use this to ensure consistent timestamps across a validation run.
+            durability: Fsync policy. If None, uses BMAD_DEBUG_LOG_DURABILITY
+                or "group".
 
         """
         if enabled is None:
@@ -116,12 +214,18 @@ class DebugJsonLogger:
 
         self.debug_dir = debug_dir or DEBUG_DIR
         self.enabled = enabled
+        self.durability = durability or _default_durability()
         self.file_path: Path | None = None
         self.session_id: str | None = None
         self._run_timestamp = run_timestamp
         self._timestamp: str | None = None
         self._line_count = 0
         self._pending_lines: list[str] = []  # Buffer until we get session_id
+        self._fd: int | None = None
+        self._fd_lock = threading.Lock()
+        # Closes fd if never close()d
+        self._close_fd: weakref.finalize[[int], DebugJsonLogger] | None = None
+        self._unsynced_bytes = 0
 
     def _create_file(self, session_id: str) -> None:
         """Create log file with session_id in filename.
@@ -151,7 +255,10 @@ class DebugJsonLogger:
         self._pending_lines.clear()
 
     def _write_line(self, json_line: str) -> None:
-        """Write single line to file with immediate flush.
+        """Write single line to the open file.
+
+        With "always" durability the line is fsynced before returning; with
+        "group" the fsync is left to the background committer.
 
         Args:
             json_line: Raw JSON line to write.
@@ -174,26 +281,49 @@ class DebugJsonLogger:
             line = line[:safe_len] + truncated_marker
             logger.debug("Truncated debug log line: %d -> %d chars", len(json_line), len(line))
 
-        line = line + "\n"
+        data = (line + "\n").encode("utf-8")
 
         try:
-            # Atomic append: open → write → fsync → close
-            fd = os.open(
-                self.file_path,
-                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
-                0o644,
-            )
-            try:
-                os.write(fd, line.encode("utf-8"))
-                os.fsync(fd)  # Force write to disk
-            finally:
-                os.close(fd)
+            with self._fd_lock:
+                if self._fd is None:
+                    self._fd = os.open(
+                        self.file_path,
+                        os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                        0o644,
+                    )
+                    self._close_fd = weakref.finalize(self, os.close, self._fd)
+                os.write(self._fd, data)
+                if self.durability == "always":
+                    os.fsync(self._fd)
+                else:
+                    self._unsynced_bytes += len(data)
+                urgent = self._unsynced_bytes >= FSYNC_BATCH_BYTES
 
             self._line_count += 1
+            if self.durability == "group":
+                _committer.mark_dirty(self, urgent)
 
         except OSError as e:
             logger.warning("Failed to write debug log: %s - %s", self.file_path, e)
 
+    def sync(self) -> None:
+        """Fsync lines written so far.
+
+        The file descriptor is duplicated so the fsync runs without holding
+        the lock that append() needs.
+        """
+        with self._fd_lock:
+            if self._fd is None or self._unsynced_bytes == 0:
+                return
+            fd = os.dup(self._fd)
+            self._unsynced_bytes = 0
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            logger.warning("Failed to sync debug log: %s - %s", self.file_path, e)
+        finally:
+            os.close(fd)
+
     def _extract_session_id(self, json_line: str) -> str | None:
         """Try to extract session_id from init message.
 
@@ -236,7 +366,7 @@ class DebugJsonLogger:
         """Append JSON line to log file with immediate flush.
 
         First call with init message extracts session_id and creates the file.
-        Each write: open → write → fsync → close (survives crashes).
+        The line is written immediately; see ``durability`` for when it is fsynced.
 
         Args:
             json_line: Raw JSON line from provider stream.
@@ -262,11 +392,7 @@ class DebugJsonLogger:
             self._write_line(json_line)
 
     def close(self) -> None:
-        """Close logger and log summary.
-
-        Data is already flushed after each append - this just logs summary.
-
-        """
+        """Close logger, fsyncing any lines not yet committed, and log summary."""
         if not self.enabled:
             return
 
@@ -286,6 +412,14 @@ class DebugJsonLogger:
                 self._write_line(line)
             self._pending_lines.clear()
 
+        if self.durability != "none":
+            self.sync()
+        with self._fd_lock:
+            close_fd, self._close_fd = self._close_fd, None
+            self._fd = None
+        if close_fd is not None:
+            close_fd()
+
         if self._line_count > 0:
             logger.debug(
                 "Debug log complete: %s (%d lines)",
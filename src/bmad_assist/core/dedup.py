@@ -0,0 +1,164 @@
+"""Candidate index for fuzzy finding deduplication.
+
+Validation synthesis and Deep Verify both deduplicate findings greedily:
+each finding is merged into the first kept finding whose text is similar by
+difflib.SequenceMatcher ratio, otherwise it is kept. Comparing every new
+finding against every kept one with a full ratio() is quadratic in the
+expensive step.
+
+FuzzyMatchIndex returns the same first match while skipping most pairs:
+
+- identical texts are found through a dict
+- kept texts are bucketed by length, and only lengths that can reach the
+  threshold are visited (ratio <= 2 * min(len) / (len_a + len_b))
+- each kept text owns a SequenceMatcher with its text as seq2, so the
+  junk/b2j tables and character counts are built once, and quick_ratio()
+  (an upper bound on ratio()) rejects most remaining candidates
+
+Both bounds are exact upper bounds, so results match the all-pairs scan.
+Approximate blocking (MinHash, token sets) would merge or split different
+findings.
+
+Public API:
+    FuzzyMatchIndex: Earliest-similar-text lookup over numbered slots
+"""
+
+import difflib
+from bisect import bisect_left, bisect_right, insort
+from math import ceil, floor
+
+
+class FuzzyMatchIndex:
+    """Find the earliest indexed text similar to a query text.
+
+    Texts live in integer slots (e.g., positions in a list of kept
+    findings); "earliest" means the lowest slot number. A query text a is
+    similar to an indexed text b when SequenceMatcher(None, a, b).ratio()
+    reaches the threshold (inclusive) or exceeds it (inclusive=False).
+
+    Attributes:
+        threshold: Similarity threshold in [0, 1].
+        inclusive: Whether a ratio equal to the threshold counts as similar.
+
+    """
+
+    def __init__(self, threshold: float, *, inclusive: bool = True) -> None:
+        """Create an empty index.
+
+        Args:
+            threshold: Similarity threshold in [0, 1].
+            inclusive: Whether a ratio equal to the threshold counts as similar.
+
+        """
+        self.threshold = threshold
+        self.inclusive = inclusive
+        self._matchers: dict[int, difflib.SequenceMatcher[str]] = {}
+        self._texts: dict[int, str] = {}
+        self._exact: dict[str, set[int]] = {}
+        self._by_length: dict[int, set[int]] = {}
+        self._lengths: list[int] = []  # Sorted distinct lengths in _by_length
+
+    def __len__(self) -> int:
+        """Return the number of indexed texts."""
+        return len(self._matchers)
+
+    def set(self, slot: int, text: str) -> None:
+        """Index a text in a slot, replacing the slot's previous text.
+
+        Args:
+            slot: Slot number.
+            text: Text to index.
+
+        """
+        self.discard(slot)
+        matcher = difflib.SequenceMatcher(None, "", text)
+        self._matchers[slot] = matcher
+        self._texts[slot] = text
+        self._exact.setdefault(text, set()).add(slot)
+        bucket = self._by_length.get(len(text))
+        if bucket is None:
+            bucket = self._by_length[len(text)] = set()
+            insort(self._lengths, len(text))
+        bucket.add(slot)
+
+    def discard(self, slot: int) -> None:
+        """Remove a slot's text from the index, if present.
+
+        Args:
+            slot: Slot number.
+
+        """
+        text = self._texts.pop(slot, None)
+        if text is None:
+            return
+        del self._matchers[slot]
+        slots = self._exact[text]
+        slots.discard(slot)
+        if not slots:
+            del self._exact[text]
+        bucket = self._by_length[len(text)]
+        bucket.discard(slot)
+        if not bucket:
+            del self._by_length[len(text)]
+            self._lengths.pop(bisect_left(self._lengths, len(text)))
+
+    def find(self, text: str, before: int | None = None) -> int | None:
+        """Find the earliest slot whose text is similar to a query text.
+
+        Args:
+            text: Query text (passed as seq1 to SequenceMatcher).
+            before: Only consider slots lower than this one.
+
+        Returns:
+            Lowest matching slot number, or None if no slot matches.
+
+        """
+        limit = before
+        exact = self._exact.get(text)
+        if exact:
+            # Identical texts have ratio 1.0; only earlier slots can beat them
+            best = min(exact)
+            if limit is None or best < limit:
+                limit = best
+
+        found: int | None = None
+        for slot in self._candidates(len(text), limit):
+            if self._is_similar(self._matchers[slot], text):
+                found = slot
+                break
+
+        if found is None and exact and (before is None or min(exact) < before):
+            return min(exact)
+        return found
+
+    def _candidates(self, length: int, limit: int | None) -> list[int]:
+        """Slots below limit whose text length can reach the threshold, in order."""
+        t = self.threshold
+        if t <= 0:
+            lo, hi = 0, None
+        else:
+            # 2 * min(la, lb) / (la + lb) >= t bounds lb; widen by one for rounding
+            lo = max(0, floor(length * t / (2 - t)) - 1)
+            hi = ceil(length * (2 - t) / t) + 1
+        start = bisect_left(self._lengths, lo)
+        stop = len(self._lengths) if hi is None else bisect_right(self._lengths, hi)
+
+        slots: list[int] = []
+        for other_length in self._lengths[start:stop]:
+            bucket = self._by_length[other_length]
+            slots.extend(s for s in bucket if limit is None or s < limit)
+        slots.sort()
+        return slots
+
+    def _reaches(self, ratio: float) -> bool:
+        """Check a ratio (or an upper bound of one) against the threshold."""
+        return ratio >= self.threshold if self.inclusive else ratio > self.threshold
+
+    def _is_similar(self, matcher: "difflib.SequenceMatcher[str]", text: str) -> bool:
+        """Compare a query text against an indexed text, cheapest bounds first."""
+        matcher.set_seq1(text)
+        return (
+            self._reaches(matcher.real_quick_ratio())
+            and self._reaches(matcher.quick_ratio())
+            and self._reaches(matcher.ratio())
+        )
@@ -16,12 +16,15 @@ Fallback patterns exist for when LLMs ignore marker instructions.
 
 import logging
 import re
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 __all__ = [
     "ReportMarkers",
+    "StreamingReportExtractor",
     "extract_report",
     "strip_code_block",
     "VALIDATION_MARKERS",
@@ -242,6 +245,20 @@ def _extract_by_markers(
         # Normal case: extract between markers
         content = output[content_start:end_idx].strip()
 
+    return _clean_marker_content(content, markers)
+
+
+def _clean_marker_content(content: str, markers: ReportMarkers) -> str:
+    """Clean text found between report markers.
+
+    Args:
+        content: Stripped text following the start marker.
+        markers: Marker configuration.
+
+    Returns:
+        Content without code block wrappers or echoed start markers.
+
+    """
     # Remove code block wrappers if present
     content = strip_code_block(content)
 
@@ -252,6 +269,115 @@ def _extract_by_markers(
     return content
 
 
+class StreamingReportExtractor:
+    """Marker-based report extraction over text that is still streaming.
+
+    Fed the response text chunk by chunk while the LLM runs, it finds the
+    start and end markers even when a marker is split across chunks, and
+    finalizes the report as soon as the end marker arrives. The result is
+    the same as extract_report() on the concatenated text whenever both
+    markers are present. Streams that never close the report leave
+    ``report`` as None; callers fall back to extract_report() on the full
+    output.
+
+    feed() is called from provider reader threads; state is locked.
+
+    Args:
+        markers: Report markers to look for.
+        on_complete: Optional callback receiving the report once, on the
+            feeding thread. It must not block; hand heavy work to another
+            thread.
+
+    Example:
+        >>> extractor = StreamingReportExtractor(VALIDATION_MARKERS)
+        >>> extractor.feed("<!-- VALIDATION_REPORT_START --># Report<!-- VALIDATION_")
+        True
+        >>> extractor.feed("REPORT_END -->")
+        False
+        >>> extractor.report
+        '# Report'
+
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        markers: ReportMarkers,
+        on_complete: Callable[[str], None] | None = None,
+    ) -> None:
+        self.markers = markers
+        self._on_complete = on_complete
+        self._started = False
+        # Unmatched tail that may hold the beginning of a split marker
+        self._carry = ""
+        # Text after the start marker and its total length
+        self._parts: list[str] = []
+        self._length = 0
+        self._report: str | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def complete(self) -> bool:
+        """Whether the end marker has been seen."""
+        return self._report is not None
+
+    @property
+    def report(self) -> str | None:
+        """The finalized report, or None until the end marker arrives."""
+        return self._report
+
+    def feed(self, text: str) -> bool:
+        """Process the next chunk of response text.
+
+        Args:
+            text: Next chunk, in stream order.
+
+        Returns:
+            False once the report is complete (the stream may be stopped),
+            True while it is still needed.
+
+        """
+        with self._lock:
+            if self._report is not None:
+                return False
+            if not self._started:
+                window = self._carry + text
+                idx = window.find(self.markers.start_marker)
+                if idx == -1:
+                    self._carry = _marker_carry(window, self.markers.start_marker)
+                    return True
+                self._started = True
+                self._carry = ""
+                text = window[idx + len(self.markers.start_marker) :]
+
+            window = self._carry + text
+            idx = window.find(self.markers.end_marker)
+            if idx == -1:
+                self._parts.append(text)
+                self._length += len(text)
+                self._carry = _marker_carry(window, self.markers.end_marker)
+                return True
+
+            # End marker position relative to the report text
+            end = self._length - len(self._carry) + idx
+            self._parts.append(text)
+            content = "".join(self._parts)[:end].strip()
+            self._parts.clear()
+            report = _clean_marker_content(content, self.markers)
+            self._report = report
+
+        logger.debug(
+            "Extracted %s report while streaming (%d chars)", self.markers.name, len(report)
+        )
+        if self._on_complete is not None:
+            self._on_complete(report)
+        return False
+
+
+def _marker_carry(window: str, marker: str) -> str:
+    """Return the tail of window that could start a marker split across chunks."""
+    return window[-(len(marker) - 1) :] if len(marker) > 1 else ""
+
+
 def _extract_by_patterns(
     output: str,
     markers: ReportMarkers,
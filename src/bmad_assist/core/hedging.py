@@ -0,0 +1,370 @@
+"""Hedged provider invocations for tail-latency reduction.
+
+invoke_with_timeout_retry() only retries after a full timeout elapses, so a
+hung CLI costs the whole timeout before a second attempt starts. Hedging
+launches a backup invocation once the primary has run longer than a
+percentile of past durations (learned from benchmark records), takes the
+first valid result and cancels the other invocation.
+
+The backup is the first fallback of a FallbackProvider, or a fresh instance
+of the same provider. Both invocations run concurrently, so hedging is only
+meant for read-only phases (validators and reviewers).
+
+Public API:
+    HedgePlan: Delay and backup invocation for one hedged call
+    build_hedge_plan: Build a HedgePlan from config and benchmark history
+    learned_latency_ms: Latency percentile from benchmark records
+    invoke_hedged: Run one hedged invocation
+    clear_latency_cache: Drop cached benchmark durations
+"""
+
+import contextlib
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+if TYPE_CHECKING:
+    from bmad_assist.core.config import Config
+    from bmad_assist.providers.base import BaseProvider
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# How often waiting threads check the caller's cancel token
+_POLL_INTERVAL = 0.5
+
+
+@dataclass(frozen=True)
+class HedgePlan:
+    """Backup invocation to launch when the primary runs too long.
+
+    Attributes:
+        delay: Seconds the primary may run before the backup is launched.
+        backup_invoke_fn: Callable invoking the backup provider.
+        backup_name: Backup provider name for logging.
+        primary_cancel_fn: Cancels the primary provider if the backup wins.
+        backup_cancel_fn: Cancels the backup provider if the primary wins.
+        backup_kwargs: Invocation arguments overridden for the backup
+            (e.g., a separate ToolCallGuard).
+
+    """
+
+    delay: float
+    backup_invoke_fn: Callable[..., Any]
+    backup_name: str
+    primary_cancel_fn: Callable[[], None] | None = None
+    backup_cancel_fn: Callable[[], None] | None = None
+    backup_kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+# (base_dir, provider, model, workflow_id) -> (index signature, durations newest first)
+_latency_cache: dict[tuple[str, str, str | None, str], tuple[tuple[Any, ...], list[int]]] = {}
+_latency_cache_lock = threading.Lock()
+
+
+def clear_latency_cache() -> None:
+    """Drop cached benchmark durations (e.g., between tests)."""
+    with _latency_cache_lock:
+        _latency_cache.clear()
+
+
+def _index_signature(base_dir: Path) -> tuple[Any, ...]:
+    """Fingerprint benchmark month directories and their index files."""
+    from bmad_assist.benchmarking.storage import INDEX_FILENAME, LEGACY_INDEX_FILENAME
+
+    benchmarks_dir = base_dir / "benchmarks"
+    signature: list[tuple[str, int]] = []
+    try:
+        month_dirs = sorted(p for p in benchmarks_dir.iterdir() if p.is_dir())
+    except OSError:
+        return ()
+    for month_dir in month_dirs:
+        try:
+            signature.append((month_dir.name, month_dir.stat().st_mtime_ns))
+        except OSError:
+            continue
+        for index_name in (INDEX_FILENAME, LEGACY_INDEX_FILENAME):
+            with contextlib.suppress(OSError):
+                signature.append((index_name, (month_dir / index_name).stat().st_mtime_ns))
+    return tuple(signature)
+
+
+def _load_durations(
+    base_dir: Path,
+    provider: str,
+    model: str | None,
+    workflow_id: str,
+    max_samples: int,
+) -> list[int]:
+    """Load durations of the most recent matching benchmark records."""
+    from bmad_assist.benchmarking.storage import (
+        RecordFilters,
+        list_evaluation_records,
+        load_evaluation_record,
+    )
+
+    summaries = list_evaluation_records(
+        base_dir, RecordFilters(provider=provider, workflow_id=workflow_id)
+    )
+    summaries.sort(key=lambda s: s.created_at, reverse=True)
+
+    durations: list[int] = []
+    for summary in summaries:
+        if len(durations) >= max_samples:
+            break
+        duration_ms, record_model = summary.duration_ms, summary.model
+        if duration_ms is None or (model is not None and record_model is None):
+            # Index entries written before durations were indexed
+            try:
+                record = load_evaluation_record(summary.path)
+            except Exception as e:
+                logger.debug("Skipping benchmark record %s: %s", summary.path, e)
+                continue
+            duration_ms, record_model = record.execution.duration_ms, record.evaluator.model
+        if model is not None and record_model != model:
+            continue
+        if duration_ms > 0:
+            durations.append(duration_ms)
+    return durations
+
+
+def learned_latency_ms(
+    base_dir: Path,
+    provider: str,
+    model: str | None,
+    workflow_id: str,
+    percentile: float,
+    min_samples: int,
+    max_samples: int,
+) -> int | None:
+    """Get a latency percentile for a provider/model/workflow from benchmark records.
+
+    Durations are cached per process and reloaded when a benchmark index
+    changes.
+
+    Args:
+        base_dir: Benchmark base directory (see get_benchmark_base_dir()).
+        provider: Provider name as recorded in benchmark records.
+        model: Model name to match, or None for any model.
+        workflow_id: Workflow ID (e.g., "validate-story").
+        percentile: Percentile in (0, 100].
+        min_samples: Minimum records required for a result.
+        max_samples: Most recent records considered.
+
+    Returns:
+        Nearest-rank percentile in milliseconds, or None if too few records.
+
+    """
+    cache_key = (str(base_dir), provider, model, workflow_id)
+    signature = _index_signature(base_dir)
+    with _latency_cache_lock:
+        cached = _latency_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        durations = cached[1]
+    else:
+        try:
+            durations = _load_durations(base_dir, provider, model, workflow_id, max_samples)
+        except Exception as e:
+            logger.debug("Failed to load benchmark durations: %s", e)
+            return None
+        with _latency_cache_lock:
+            _latency_cache[cache_key] = (signature, durations)
+
+    samples = sorted(durations[:max_samples])
+    if len(samples) < min_samples:
+        return None
+    rank = max(1, math.ceil(percentile / 100 * len(samples)))
+    return samples[rank - 1]
+
+
+def build_hedge_plan(
+    config: "Config",
+    project_path: Path,
+    phase_name: str,
+    provider: "BaseProvider",
+    provider_name: str,
+    model: str | None,
+    timeout: int,
+) -> HedgePlan | None:
+    """Build a HedgePlan for one provider invocation, if hedging applies.
+
+    Args:
+        config: Application configuration.
+        project_path: Project root (locates benchmark records).
+        phase_name: Phase name (e.g., "validate_story").
+        provider: Primary provider instance.
+        provider_name: Provider name as configured and recorded in benchmarks.
+        model: Model used for the invocation.
+        timeout: Per-attempt timeout in seconds.
+
+    Returns:
+        HedgePlan, or None if hedging is disabled, not configured for this
+        phase, lacks benchmark history, or would not start before the timeout.
+
+    """
+    hedging = config.hedging
+    if not hedging.enabled or phase_name not in hedging.phases:
+        return None
+
+    from bmad_assist.benchmarking.storage import get_benchmark_base_dir
+
+    latency_ms = learned_latency_ms(
+        get_benchmark_base_dir(project_path),
+        provider_name,
+        model,
+        phase_name.replace("_", "-"),
+        hedging.percentile,
+        hedging.min_samples,
+        hedging.max_samples,
+    )
+    if latency_ms is None:
+        logger.debug("No hedging for %s/%s: too few benchmark records", provider_name, model)
+        return None
+
+    delay = max(hedging.min_delay, latency_ms / 1000)
+    if delay >= timeout:
+        return None
+
+    from bmad_assist.providers import get_provider
+    from bmad_assist.providers.fallback import FallbackProvider
+
+    if isinstance(provider, FallbackProvider) and provider.fallbacks:
+        fallback = provider.fallbacks[0]
+        return HedgePlan(
+            delay=delay,
+            backup_invoke_fn=fallback.invoke,
+            backup_name=fallback.provider.provider_name,
+            primary_cancel_fn=provider.primary.cancel,
+            backup_cancel_fn=fallback.provider.cancel,
+        )
+
+    backup = get_provider(provider_name)
+    return HedgePlan(
+        delay=delay,
+        backup_invoke_fn=backup.invoke,
+        backup_name=provider_name,
+        primary_cancel_fn=provider.cancel,
+        backup_cancel_fn=backup.cancel,
+    )
+
+
+def _is_valid(future: "Future[Any]") -> bool:
+    """Check whether a finished invocation produced a usable result."""
+    if future.exception() is not None:
+        return False
+    return getattr(future.result(), "exit_code", 0) == 0
+
+
+def _wait_any(
+    futures: "set[Future[Any]]",
+    timeout: float | None,
+    parent_token: threading.Event | None,
+    child_tokens: list[threading.Event],
+) -> "set[Future[Any]]":
+    """Wait until a future finishes, forwarding caller cancellation.
+
+    Returns:
+        Finished futures, or an empty set if the timeout elapsed first.
+
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        if parent_token is not None and parent_token.is_set():
+            for token in child_tokens:
+                token.set()
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            return set()
+        slice_timeout = _POLL_INTERVAL if remaining is None else min(remaining, _POLL_INTERVAL)
+        done, _ = wait(futures, timeout=slice_timeout, return_when=FIRST_COMPLETED)
+        if done:
+            return done
+
+
+def _cancel(token: threading.Event, cancel_fn: Callable[[], None] | None) -> None:
+    """Cancel a losing invocation via its token and provider."""
+    token.set()
+    if cancel_fn is not None:
+        try:
+            cancel_fn()
+        except Exception as e:
+            logger.debug("Provider cancel failed for hedged invocation: %s", e)
+
+
+def invoke_hedged(
+    invoke_fn: Callable[..., T],
+    plan: HedgePlan,
+    *,
+    phase_name: str,
+    **kwargs: Any,
+) -> T:
+    """Invoke a provider, launching a backup if it exceeds the hedge delay.
+
+    Each invocation gets its own cancel token; a cancel_token in kwargs is
+    treated as the caller's token and forwarded to both. The first valid
+    result (no exception, exit_code 0) wins and the other invocation is
+    cancelled. If both fail, the primary's outcome is returned or raised.
+
+    Args:
+        invoke_fn: Callable that invokes the primary provider.
+        plan: Hedge delay and backup invocation.
+        phase_name: Phase name for logging.
+        **kwargs: Arguments for invoke_fn (and the backup, with
+            plan.backup_kwargs applied on top).
+
+    Returns:
+        Result of the winning invocation.
+
+    """
+    parent_token: threading.Event | None = kwargs.pop("cancel_token", None)
+    primary_token = threading.Event()
+    backup_token = threading.Event()
+
+    # Not a context manager: a losing invocation that ignores its cancel
+    # token must not block the winner from returning
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"hedge-{phase_name}")
+    try:
+        primary = executor.submit(invoke_fn, cancel_token=primary_token, **kwargs)
+        _wait_any({primary}, plan.delay, parent_token, [primary_token])
+        if primary.done() or (parent_token is not None and parent_token.is_set()):
+            _wait_any({primary}, None, parent_token, [primary_token])
+            return primary.result()
+
+        logger.warning(
+            "Provider in %s phase exceeded hedge delay (%.0fs), launching backup %s",
+            phase_name,
+            plan.delay,
+            plan.backup_name,
+        )
+        backup_kwargs = {**kwargs, **plan.backup_kwargs}
+        backup = executor.submit(plan.backup_invoke_fn, cancel_token=backup_token, **backup_kwargs)
+        tokens = [primary_token, backup_token]
+
+        pending = {primary, backup}
+        while pending:
+            done = _wait_any(pending, None, parent_token, tokens)
+            pending -= done
+            # Prefer the primary when both finished in the same slice
+            for future in sorted(done, key=lambda f: f is not primary):
+                if not _is_valid(future):
+                    continue
+                if future is primary:
+                    _cancel(backup_token, plan.backup_cancel_fn)
+                    logger.info("Hedged %s: primary won, backup cancelled", phase_name)
+                else:
+                    _cancel(primary_token, plan.primary_cancel_fn)
+                    logger.info("Hedged %s: backup %s won", phase_name, plan.backup_name)
+                # The backup invokes a compatible provider, so its result is a T too
+                return cast(T, future.result())
+
+        logger.warning("Hedged %s: primary and backup both failed", phase_name)
+        return primary.result()
+    finally:
+        executor.shutdown(wait=False)
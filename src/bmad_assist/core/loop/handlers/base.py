@@ -315,7 +315,7 @@ class BaseHandler(ABC):
         """
         import os
 
-        from bmad_assist.compiler import compile_workflow
+        from bmad_assist.compiler.prompt_cache import compile_workflow_cached
         from bmad_assist.compiler.types import CompilerContext
         from bmad_assist.core.exceptions import CompilerError
 
@@ -346,8 +346,10 @@ class BaseHandler(ABC):
         )
 
         try:
-            # Compile workflow - returns CompiledWorkflow with full XML in context
-            compiled = compile_workflow(workflow_name, context)
+            # Compile workflow - returns CompiledWorkflow with full XML in context.
+            # Reuses the persistent compiled-prompt cache when no input changed
+            # (timeout retries, resumed runs).
+            compiled = compile_workflow_cached(workflow_name, context)
 
             # Add git intelligence if patch config specifies it
             prompt = compiled.context
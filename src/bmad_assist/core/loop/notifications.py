@@ -7,7 +7,6 @@ Extracted from runner.py as part of the runner refactoring.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from pathlib import Path
 
@@ -29,7 +28,8 @@ def _dispatch_event(
 ) -> None:
     """Fire-and-forget dispatch of notification events.
 
-    Runs dispatch in a new event loop to not block the main loop.
+    Queues the event on the dispatcher's background worker so delivery
+    never blocks the main loop.
     All errors are caught and logged - never raises.
 
     Args:
@@ -153,15 +153,8 @@ def _dispatch_event(
             logger.debug("Unknown event type for dispatch: %s", event_type)
             return
 
-        # Run dispatch with nested event loop safety (AC3 requirement)
-        # Check if we're inside an already-running event loop (test environments)
-        try:
-            loop = asyncio.get_running_loop()
-            # We're in an async context - create task (fire-and-forget)
-            loop.create_task(dispatcher.dispatch(event, payload))
-        except RuntimeError:
-            # No running loop - safe to use asyncio.run()
-            asyncio.run(dispatcher.dispatch(event, payload))
+        # Hand off to the background notification worker (never blocks the loop)
+        dispatcher.submit(event, payload)
 
     except Exception as e:
         logger.debug("Notification dispatch error (ignored): %s", str(e))
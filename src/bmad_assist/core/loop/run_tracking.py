@@ -107,6 +107,10 @@ class RunLog(BaseModel):
     current_phase: CurrentPhase | None = None  # Set on phase start, cleared on end
     phases: list[PhaseInvocation] = Field(default_factory=list)
     phase_events: list[PhaseEvent] = Field(default_factory=list)  # Timeline for CSV
+    prompt_cache_hits: int = 0  # Compiled prompts reused from .bmad-assist/cache/compiled
+    prompt_cache_misses: int = 0  # Compiled prompts built from scratch
+    compression_cache_hits: int = 0  # Helper LLM compressions reused from disk
+    compression_cache_misses: int = 0  # Compressions that called the helper LLM
 
 
 # F3: Sensitive flag patterns (for two-pass masking)
@@ -240,6 +244,14 @@ def _write_csv(run_log: RunLog, path: Path) -> None:
         f.write(f"# Project: {_sanitize_csv_value(run_log.project_path)}\n")
         f.write(f"# CLI Args (masked): {' '.join(run_log.cli_args_masked)}\n")
         f.write(f"# Status: {run_log.status.value}\n")
+        f.write(
+            f"# Prompt cache: {run_log.prompt_cache_hits} hits, "
+            f"{run_log.prompt_cache_misses} misses\n"
+        )
+        f.write(
+            f"# Compression cache: {run_log.compression_cache_hits} hits, "
+            f"{run_log.compression_cache_misses} misses\n"
+        )
 
         writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
 
@@ -373,6 +373,17 @@ def _start_ipc_server(
 # =============================================================================
 
 
+def _warm_template_caches(project_path: Path) -> None:
+    """Validate cached templates of all patched workflows (best effort)."""
+    try:
+        from bmad_assist.compiler.patching.compiler import warm_template_caches
+        from bmad_assist.core.io import get_original_cwd
+
+        warm_template_caches(project_path, cwd=get_original_cwd())
+    except Exception as e:
+        logger.debug("Template cache warm-up skipped: %s", e)
+
+
 def run_loop(
     config: Config,
     project_path: Path,
@@ -382,6 +393,7 @@ def run_loop(
     skip_signal_handlers: bool = False,
     ipc_enabled: bool = True,
     plain: bool = False,
+    handlers_ready: bool = False,
 ) -> LoopExitReason:
     """Execute the main BMAD development loop.
 
@@ -413,6 +425,9 @@ def run_loop(
             clients. Set to False via --no-ipc CLI flag.
         plain: If True, force PlainRenderer regardless of TTY detection.
             Set via --plain CLI flag.
+        handlers_ready: If True, the caller already set the loop config and
+            called init_handlers() for this config (warm worker), so neither
+            is reloaded.
 
     Returns:
         LoopExitReason indicating how the loop exited:
@@ -461,25 +476,36 @@ def run_loop(
         register_signal_handlers()
 
     try:
-        # Load loop config and set singleton for this run
-        from bmad_assist.core.config import load_loop_config, set_loop_config
-
-        loop_config = load_loop_config(project_path)
-        set_loop_config(loop_config)
-        logger.debug(
-            "Loaded loop config: epic_setup=%d phases, story=%d phases, epic_teardown=%d phases",
-            len(loop_config.epic_setup),
-            len(loop_config.story),
-            len(loop_config.epic_teardown),
-        )
+        if not handlers_ready:
+            # Load loop config and set singleton for this run
+            from bmad_assist.core.config import load_loop_config, set_loop_config
+
+            loop_config = load_loop_config(project_path)
+            set_loop_config(loop_config)
+            logger.debug(
+                "Loaded loop config: epic_setup=%d phases, story=%d phases, "
+                "epic_teardown=%d phases",
+                len(loop_config.epic_setup),
+                len(loop_config.story),
+                len(loop_config.epic_teardown),
+            )
+
+            # Initialize phase handlers with config and project path
+            init_handlers(config, project_path)
 
-        # Initialize phase handlers with config and project path
-        init_handlers(config, project_path)
+        # Validate patched workflow templates in parallel up front, so the first
+        # compile of each phase finds the template cache memos warm
+        _warm_template_caches(project_path)
 
         # Story 20.10: Register sprint sync callback at loop startup
         _ensure_sprint_sync_callback()
 
         # CLI Observability: Initialize run tracking
+        from bmad_assist.compiler.compression_cache import reset_compression_cache_stats
+        from bmad_assist.compiler.prompt_cache import reset_prompt_cache_stats
+
+        reset_prompt_cache_stats()
+        reset_compression_cache_stats()
         run_log = RunLog(
             cli_args=sys.argv[1:],
             cli_args_masked=mask_cli_args(sys.argv[1:]),
@@ -538,6 +564,7 @@ def run_loop(
                     pass
 
                 # Always save run log on exit
+                _record_prompt_cache_stats(run_log)
                 csv_enabled = os.environ.get("BMAD_CSV_OUTPUT") == "1"
                 try:
                     save_run_log(run_log, project_path, as_csv=csv_enabled)
@@ -550,6 +577,24 @@ def run_loop(
             unregister_signal_handlers()
 
 
+def _record_prompt_cache_stats(run_log: RunLog) -> None:
+    """Copy compiled prompt and compression cache hit/miss counters into the run log.
+
+    Args:
+        run_log: Run log to update.
+
+    """
+    from bmad_assist.compiler.compression_cache import get_compression_cache_stats
+    from bmad_assist.compiler.prompt_cache import get_prompt_cache_stats
+
+    stats = get_prompt_cache_stats()
+    run_log.prompt_cache_hits = stats.hits
+    run_log.prompt_cache_misses = stats.misses
+    compression = get_compression_cache_stats()
+    run_log.compression_cache_hits = compression.hits
+    run_log.compression_cache_misses = compression.misses
+
+
 def _should_stop(cancel_ctx: CancellationContext | None) -> bool:
     """Check if loop should stop (cancel OR signal).
 
@@ -1109,6 +1154,7 @@ def _run_loop_body(
                 )
                 # Clear current_phase now that it's recorded in phases list
                 run_log.current_phase = None
+                _record_prompt_cache_stats(run_log)
                 # Update run_log with current epic/story
                 run_log.epic = state.current_epic
                 run_log.story = state.current_story
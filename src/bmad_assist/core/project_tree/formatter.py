@@ -2,6 +2,7 @@
 
 import html
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 
 from bmad_assist.core.project_tree.time_format import format_relative_time
@@ -74,11 +75,15 @@ class TreeFormatter:
         """
         return len(text) // CHARS_PER_TOKEN
 
-    def format_tree(self, entries: list[TreeEntry], token_budget: int) -> str:
+    def format_tree(self, entries: Iterable[TreeEntry], token_budget: int) -> str:
         """Format tree entries as XML with token budget enforcement.
 
+        Entries are consumed lazily: iteration stops at the first entry that
+        does not fit, so a generator (e.g. TreeWalker.walk()) is never pulled
+        past the budget.
+
         Args:
-            entries: List of tree entries to format
+            entries: Tree entries to format, in output order
             token_budget: Maximum tokens allowed
 
         Returns:
@@ -107,7 +112,7 @@ class TreeFormatter:
 
     def format_tree_streaming(
         self,
-        entries: list[TreeEntry],
+        entries: Iterable[TreeEntry],
         token_budget: int,
     ) -> str:
         """Format tree entries with streaming budget checks.
@@ -116,7 +121,7 @@ class TreeFormatter:
         in batches and handles truncation gracefully.
 
         Args:
-            entries: List of tree entries to format
+            entries: Tree entries to format, consumed lazily
             token_budget: Maximum tokens allowed
 
         Returns:
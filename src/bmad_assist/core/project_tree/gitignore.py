@@ -93,6 +93,13 @@ class GitignoreParser:
         self.project_root = project_root.resolve()
         self._spec_cache: dict[Path, GitignoreSpec | None] = {}
         self._default_spec = GitignoreSpec(DEFAULT_EXCLUSIONS, project_root)
+        # Compiled spec stacks keyed by directory relative to project root.
+        # Each entry holds default + every .gitignore from root down to and
+        # including that directory; directories without their own .gitignore
+        # share their parent's compiled spec.
+        self._chain_cache: dict[Path, tuple[list[str], PathspecGitIgnore]] = {}
+        # st_mtime_ns of every .gitignore read, for snapshot invalidation
+        self.loaded_mtimes: dict[Path, int] = {}
 
     def load_gitignore_for_dir(self, dir_path: Path) -> GitignoreSpec | None:
         """Load .gitignore for a specific directory.
@@ -114,6 +121,7 @@ class GitignoreParser:
 
         if gitignore_path.exists():
             try:
+                self.loaded_mtimes[gitignore_path] = gitignore_path.stat().st_mtime_ns
                 content = gitignore_path.read_text(encoding="utf-8")
                 patterns = [
                     line.strip()
@@ -167,6 +175,86 @@ class GitignoreParser:
 
         return specs
 
+    def _extend_chain(
+        self,
+        parent: tuple[list[str], PathspecGitIgnore],
+        dir_path: Path,
+    ) -> tuple[list[str], PathspecGitIgnore]:
+        """Stack a directory's .gitignore on top of its parent's compiled chain.
+
+        Args:
+            parent: Parent directory's (patterns, compiled spec)
+            dir_path: Absolute directory path
+
+        Returns:
+            (patterns, compiled spec) for dir_path
+
+        """
+        spec = self.load_gitignore_for_dir(dir_path)
+        if spec is None or not spec.patterns:
+            return parent
+        patterns = parent[0] + spec.patterns
+        return patterns, PathspecGitIgnore.from_lines(patterns)
+
+    def _chain_spec(self, rel_dir: Path) -> PathspecGitIgnore:
+        """Get the memoized compiled spec stack for a directory.
+
+        Builds missing levels iteratively from the deepest cached ancestor,
+        so a BFS descent compiles each directory's stack at most once.
+
+        Args:
+            rel_dir: Directory path relative to project root
+
+        Returns:
+            Compiled spec of default + all .gitignore patterns down to rel_dir
+
+        """
+        cached = self._chain_cache.get(rel_dir)
+        if cached is not None:
+            return cached[1]
+
+        key = Path(".")
+        chain = self._chain_cache.get(key)
+        if chain is None:
+            default = (
+                list(DEFAULT_EXCLUSIONS),
+                PathspecGitIgnore.from_lines(DEFAULT_EXCLUSIONS),
+            )
+            chain = self._extend_chain(default, self.project_root)
+            self._chain_cache[key] = chain
+
+        for part in rel_dir.parts:
+            key = key / part
+            next_chain = self._chain_cache.get(key)
+            if next_chain is None:
+                next_chain = self._extend_chain(chain, self.project_root / key)
+                self._chain_cache[key] = next_chain
+            chain = next_chain
+
+        return chain[1]
+
+    def is_ignored_entry(self, rel_path: Path, is_dir: bool) -> bool:
+        """Check a non-symlink entry whose type is already known.
+
+        Fast path for tree walking: no resolve() or is_dir() calls, and the
+        compiled spec stack for the parent directory is reused across
+        siblings. Directories are matched against their own stack so that
+        their .gitignore applies to them, as in is_ignored().
+
+        Args:
+            rel_path: Entry path relative to project root (no symlinks)
+            is_dir: Whether the entry is a directory
+
+        Returns:
+            True if entry should be ignored, False otherwise
+
+        """
+        path_str = rel_path.as_posix()
+        if is_dir:
+            spec = self._chain_spec(rel_path)
+            return spec.match_file(path_str + "/") or spec.match_file(path_str)
+        return self._chain_spec(rel_path.parent).match_file(path_str)
+
     def is_ignored(self, path: Path) -> bool:
         """Check if a path is ignored using stacked rules.
 
@@ -189,37 +277,10 @@ class GitignoreParser:
             logger.warning(f"Path {path} is outside project root, treating as ignored")
             return True
 
-        # Collect all applicable specs
-        specs = self._collect_specs_for_path(rel_path)
-
-        # Check if path itself is a directory with its own .gitignore
-        if resolved_path.is_dir():
-            dir_spec = self.load_gitignore_for_dir(resolved_path)
-            if dir_spec:
-                specs.append(dir_spec)
-
-        # Combine all patterns into a single spec and check
-        # This properly handles negation patterns across all levels
-        all_patterns: list[str] = []
-        for spec in specs:
-            if spec.patterns:
-                all_patterns.extend(spec.patterns)
-
-        if not all_patterns:
-            return False
-
-        # Create combined spec and check
-        combined_spec = PathspecGitIgnore.from_lines(all_patterns)
-        path_str = rel_path.as_posix()
-
-        # Check if path is a directory and append trailing slash for matching
-        # This ensures patterns like "build/" match the directory itself
-        is_dir = resolved_path.is_dir()
-        if is_dir and combined_spec.match_file(path_str + "/"):
-            # Try matching with trailing slash first (for directory patterns)
-            return True
-
-        return combined_spec.match_file(path_str)
+        # Match against the memoized spec stack; directories include their
+        # own .gitignore, and are tried with a trailing slash first so that
+        # patterns like "build/" match the directory itself
+        return self.is_ignored_entry(rel_path, resolved_path.is_dir())
 
     def get_patterns_for_dir(self, dir_path: Path) -> list[str]:
         """Get all active patterns for a directory (for debugging).
@@ -1,6 +1,10 @@
 """High-level service for project tree generation."""
 
 import logging
+import os
+import threading
+from collections.abc import Generator
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from bmad_assist.core.paths import ProjectPaths
@@ -16,6 +20,87 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _TreeSnapshot:
+    """Lazily extended walk of one project tree, reusable across generations.
+
+    Keeps the entries already pulled from the walker together with the live
+    walk generator, so a later generation replays the cached prefix and only
+    resumes walking if its budget reaches past it. The snapshot stays valid
+    while every scanned directory and every loaded .gitignore keeps its mtime.
+    Edits to file contents that leave directory mtimes untouched are not
+    detected, so listed ages may lag until a directory changes.
+
+    Reusing a snapshot only lstats the recorded paths, so callers that cache
+    output derived from the tree must fingerprint the tree themselves (the
+    prompt cache walks the project independently of this snapshot).
+    """
+
+    def __init__(self, walker: TreeWalker) -> None:
+        """Start a snapshot over a fresh walk.
+
+        Args:
+            walker: Walker whose walk() is consumed on demand
+
+        """
+        self.walker = walker
+        self.entries: list[TreeEntry] = []
+        self.lock = threading.Lock()
+        self._walk: Generator[TreeEntry, None, None] | None = walker.walk()
+
+    def is_valid(self) -> bool:
+        """Check that nothing scanned so far has changed on disk.
+
+        Returns:
+            True if all recorded directory and .gitignore mtimes still match
+
+        """
+        recorded = [
+            *self.walker.scanned_dirs.items(),
+            *self.walker.gitignore.loaded_mtimes.items(),
+        ]
+        for path, mtime_ns in recorded:
+            try:
+                if os.lstat(path).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def iter_entries(self) -> Generator[TreeEntry, None, None]:
+        """Yield cached entries, then extend the walk only as far as consumed.
+
+        Yields:
+            TreeEntry objects in walk order
+
+        """
+        index = 0
+        while True:
+            if index < len(self.entries):
+                yield self.entries[index]
+                index += 1
+                continue
+            if self._walk is None:
+                return
+            try:
+                entry = next(self._walk)
+            except StopIteration:
+                self._walk = None
+                return
+            self.entries.append(entry)
+
+
+# Module-level snapshots keyed by resolved project root, shared by every
+# ProjectTreeService in the process
+_snapshots: dict[Path, _TreeSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def clear_tree_snapshots() -> None:
+    """Drop all cached project tree snapshots."""
+    with _snapshots_lock:
+        _snapshots.clear()
+
+
 class ProjectTreeService:
     """High-level service for generating project tree XML.
 
@@ -82,29 +167,36 @@ class ProjectTreeService:
             logger.debug("Project tree generation disabled or budget is 0")
             return ""
 
-        # Create runtime config
-        tree_config = ProjectTreeConfig(tree_budget=budget)
-
-        # Initialize components
-        gitignore = GitignoreParser(self.paths.project_root)
-        walker = TreeWalker(self.paths.project_root, tree_config, gitignore)
-        formatter = TreeFormatter(self.paths.project_root)
-
-        # Collect all entries
-        entries: list[TreeEntry] = []
-        try:
-            for entry in walker.walk():
-                entries.append(entry)
-        except Exception as e:
-            logger.error(f"Error walking project tree: {e}")
-            return ""
-
-        if not entries:
-            logger.debug("No entries found in project tree")
-            return ""
-
-        # Format as XML with budget enforcement
-        return formatter.format_tree(entries, budget)
+        project_root = self.paths.project_root.resolve()
+        with _snapshots_lock:
+            snapshot = _snapshots.get(project_root)
+            if snapshot is None or not snapshot.is_valid():
+                # Budget only bounds formatting; the walk itself is shared
+                tree_config = ProjectTreeConfig(tree_budget=budget)
+                gitignore = GitignoreParser(project_root)
+                walker = TreeWalker(project_root, tree_config, gitignore)
+                snapshot = _TreeSnapshot(walker)
+                _snapshots[project_root] = snapshot
+
+        formatter = TreeFormatter(project_root)
+
+        # Stream entries into the formatter; the walk stops once the budget
+        # is spent and resumes from there if a later call needs more
+        with snapshot.lock:
+            try:
+                result = formatter.format_tree(snapshot.iter_entries(), budget)
+            except Exception as e:
+                logger.error(f"Error walking project tree: {e}")
+                with _snapshots_lock:
+                    if _snapshots.get(project_root) is snapshot:
+                        del _snapshots[project_root]
+                return ""
+
+            if not snapshot.entries:
+                logger.debug("No entries found in project tree")
+                return ""
+
+        return result
 
     def is_enabled(self, workflow_name: str | None = None) -> bool:
         """Check if project tree is enabled for the given workflow.
@@ -47,12 +47,18 @@ class RealFilesystem:
     """Real filesystem implementation using os module."""
 
     def scandir(self, path: Path) -> Generator[os.DirEntry[str], None, None]:
-        """Scan directory using os.scandir with follow_symlinks=False."""
+        """Scan directory using os.scandir with follow_symlinks=False.
+
+        The listing is read completely before the first entry is yielded, so
+        a suspended walk (e.g. a memoized tree snapshot) holds no open fd.
+        """
         try:
             with os.scandir(path) as it:
-                yield from it
+                entries = list(it)
         except (PermissionError, OSError) as e:
             logger.warning(f"Cannot scan directory {path}: {e}")
+            return
+        yield from entries
 
     def lstat(self, path: Path) -> os.stat_result:
         """Get file stats without following symlinks."""
@@ -86,6 +92,9 @@ class TreeWalker:
         self.config = config
         self.gitignore = gitignore
         self.filesystem = filesystem if filesystem is not None else RealFilesystem()
+        # Directory mtimes (st_mtime_ns) captured just before each scan, so
+        # callers can tell whether a partial or complete walk is still current
+        self.scanned_dirs: dict[Path, int] = {}
 
     def walk(self) -> Generator[TreeEntry, None, None]:
         """Walk the project tree using iterative BFS.
@@ -124,6 +133,18 @@ class TreeWalker:
                 continue
             visited.add(real_path)
 
+            try:
+                self.scanned_dirs[dir_path] = self.filesystem.lstat(dir_path).st_mtime_ns
+            except OSError:
+                self.scanned_dirs[dir_path] = 0
+
+            # Relative path of this directory for the gitignore fast path
+            # (None if it is not a plain descendant of the project root)
+            try:
+                rel_dir: Path | None = dir_path.relative_to(self.project_root)
+            except ValueError:
+                rel_dir = None
+
             # Collect entries for this directory
             entries: list[tuple[os.DirEntry[str], float, bool]] = []
             dirs_to_queue: list[tuple[Path, int]] = []
@@ -133,9 +154,17 @@ class TreeWalker:
                     try:
                         # Get entry path
                         entry_abs_path = Path(entry.path)
+                        is_dir = entry.is_dir(follow_symlinks=False)
 
-                        # Check if ignored
-                        if self.gitignore.is_ignored(entry_abs_path):
+                        # Check if ignored. Plain entries use the memoized spec
+                        # stack without resolving; symlinks take the full check
+                        # so links escaping the project root stay excluded.
+                        # Ignored directories are pruned here, never scanned.
+                        if rel_dir is not None and not entry.is_symlink():
+                            ignored = self.gitignore.is_ignored_entry(rel_dir / entry.name, is_dir)
+                        else:
+                            ignored = self.gitignore.is_ignored(entry_abs_path)
+                        if ignored:
                             continue
 
                         # Get stats without following symlinks
@@ -145,8 +174,6 @@ class TreeWalker:
                         except OSError:
                             mtime = 0.0
 
-                        is_dir = entry.is_dir(follow_symlinks=False)
-
                         if is_dir:
                             # Queue directory for later traversal
                             dirs_to_queue.append((entry_abs_path, depth + 1))
@@ -0,0 +1,134 @@
+"""Streaming report extraction for validator and reviewer invocations.
+
+Validators and reviewers write their report between markers (see
+core.extraction). Extracting it only after invoke() returns means waiting
+for the LLM's closing commentary and for the CLI to exit. ReportStream
+feeds each invocation's response text to a StreamingReportExtractor while
+it streams. When the end marker arrives the report is final: the provider
+is asked to end the session (see BaseProvider.invoke()'s text_callback)
+and downstream parsing starts on a worker thread right away.
+
+After the invocation returns, the caller still extracts the report from
+stdout and asks for the parsed result of that report. A precomputed
+result is only reused when the streamed report matches, so retries,
+fallbacks and hedged backups (which are not streamed) fall back to
+parsing the final output.
+
+Public API:
+    ReportStream: Streaming extraction and early parsing for one call
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, Generic, TypeVar
+
+from bmad_assist.core.extraction import ReportMarkers, StreamingReportExtractor
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ReportStream(Generic[T]):
+    """Streams one validator/reviewer call into a report extractor.
+
+    Each call of a wrapped invoke function gets a fresh
+    StreamingReportExtractor, so timeout retries and fallback invocations
+    do not mix their text.
+
+    Args:
+        markers: Report markers to extract.
+        parse: Optional downstream parser run on a worker thread as soon as
+            a report is complete (e.g., deterministic metrics collection).
+
+    Example:
+        >>> stream = ReportStream(VALIDATION_MARKERS, parse=collect_metrics)
+        >>> result = stream.wrap(provider.invoke)(prompt, model="opus")
+        >>> report = extract_validation_report(result.stdout)
+        >>> metrics = stream.parsed(report) or collect_metrics(report)
+
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        markers: ReportMarkers,
+        parse: Callable[[str], T] | None = None,
+    ) -> None:
+        self.markers = markers
+        self._parse = parse
+        self._lock = threading.Lock()
+        self._report: str | None = None
+        self._parsed: Future[T] | None = None
+
+    @property
+    def report(self) -> str | None:
+        """Most recent report completed while streaming, if any."""
+        with self._lock:
+            return self._report
+
+    def wrap(self, invoke_fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a provider invoke function to stream its response text.
+
+        Args:
+            invoke_fn: Provider invoke() (or a compatible callable).
+
+        Returns:
+            Callable with the same arguments that passes a text_callback
+            feeding a new extractor on every call.
+
+        """
+
+        def invoke(*args: Any, **kwargs: Any) -> Any:
+            extractor = StreamingReportExtractor(self.markers, on_complete=self._complete)
+            return invoke_fn(*args, text_callback=extractor.feed, **kwargs)
+
+        return invoke
+
+    def parsed(self, report: str, timeout: float | None = None) -> T | None:
+        """Get the downstream result computed while the call was streaming.
+
+        Args:
+            report: Report extracted from the final output.
+            timeout: Seconds to wait for a parse still in progress.
+
+        Returns:
+            The parser's result if report matches the streamed report, or
+            None if it was not streamed, differs, or has no parser.
+
+        Raises:
+            Exception: Whatever the parser raised.
+
+        """
+        with self._lock:
+            if report != self._report or self._parsed is None:
+                return None
+            future = self._parsed
+        return future.result(timeout=timeout)
+
+    def _complete(self, report: str) -> None:
+        """Record a completed report and start parsing it (reader thread)."""
+        future: Future[T] | None = None
+        if self._parse is not None:
+            future = Future()
+            threading.Thread(
+                target=self._run_parse,
+                args=(self._parse, report, future),
+                name="report-parse",
+                daemon=True,
+            ).start()
+        with self._lock:
+            self._report = report
+            self._parsed = future
+        logger.info(
+            "%s report complete while streaming (%d chars)", self.markers.name, len(report)
+        )
+
+    @staticmethod
+    def _run_parse(parse: Callable[[str], T], report: str, future: "Future[T]") -> None:
+        """Run parse and settle future with its result or exception."""
+        try:
+            future.set_result(parse(report))
+        except Exception as e:
+            future.set_exception(e)
@@ -6,12 +6,16 @@ multi-LLM phases. Handles ProviderTimeoutError with configurable retry count.
 Story: Per-phase timeout retry configuration.
 """
 
+import functools
 import logging
 from collections.abc import Callable
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from bmad_assist.core.exceptions import ProviderTimeoutError
 
+if TYPE_CHECKING:
+    from bmad_assist.core.hedging import HedgePlan
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -24,6 +28,7 @@ def invoke_with_timeout_retry(
     phase_name: str,
     fallback_invoke_fn: Callable[..., T] | None = None,
     fallback_timeout_retries: int | None = None,
+    hedge: "HedgePlan | None" = None,
     **kwargs: Any,
 ) -> T:
     """Invoke provider function with timeout retry logic.
@@ -42,6 +47,8 @@ def invoke_with_timeout_retry(
         fallback_invoke_fn: Optional fallback callable (e.g., subprocess provider).
             If primary fails after retries, fallback is invoked with reset retry count.
         fallback_timeout_retries: Retry count for fallback (defaults to timeout_retries).
+        hedge: Optional HedgePlan. Each primary attempt launches a backup
+            invocation once it exceeds the hedge delay (see core.hedging).
         **kwargs: Arguments to pass to invoke_fn and fallback_invoke_fn.
 
     Returns:
@@ -67,10 +74,16 @@ def invoke_with_timeout_retry(
         ... )
 
     """
+    attempt_fn: Callable[..., T] = invoke_fn
+    if hedge is not None:
+        from bmad_assist.core.hedging import invoke_hedged
+
+        attempt_fn = functools.partial(invoke_hedged, invoke_fn, hedge, phase_name=phase_name)
+
     # Check if retry is configured
     if timeout_retries is None:
         # No retry - invoke once and let timeout propagate
-        return invoke_fn(**kwargs)
+        return attempt_fn(**kwargs)
 
     # Retry is configured
     timeout_attempt = 0
@@ -79,7 +92,7 @@ def invoke_with_timeout_retry(
         timeout_attempt += 1
 
         try:
-            return invoke_fn(**kwargs)
+            return attempt_fn(**kwargs)
         except ProviderTimeoutError as e:
             # Check retry limit
             if timeout_retries != 0 and timeout_attempt > timeout_retries:
@@ -15,13 +15,21 @@ async def sse_output(request: Request) -> Response:
 
     Returns Server-Sent Events stream with:
     - output: bmad-assist stdout/stderr lines
+    - output_batch: Several output lines coalesced into one frame
     - status: General status updates
     - heartbeat: Keep-alive pings
+
+    Messages newer than the Last-Event-ID header (or the last_event_id query
+    parameter, for clients that reconnect with a new EventSource) are
+    replayed first.
     """
     server = request.app.state.server
+    last_event_id = request.headers.get("last-event-id") or request.query_params.get(
+        "last_event_id"
+    )
 
     async def event_generator() -> AsyncGenerator[str, None]:
-        async for message in server.sse_broadcaster.subscribe():
+        async for message in server.sse_broadcaster.subscribe(last_event_id=last_event_id):
             yield message
 
     return StreamingResponse(
@@ -36,12 +36,16 @@ from bmad_assist.core.loop.dashboard_events import DASHBOARD_EVENT_MARKER
 
 if TYPE_CHECKING:
     from bmad_assist.dashboard.loop_controller import LoopController
+    from bmad_assist.dashboard.warm_worker import WarmWorker
 from bmad_assist.core.state import State, get_state_path, load_state
 from bmad_assist.dashboard.routes import API_ROUTES
 from bmad_assist.dashboard.sse import SSEBroadcaster
 
 logger = logging.getLogger(__name__)
 
+# Seconds the SSE broadcaster waits to batch consecutive output lines
+SSE_COALESCE_WINDOW = 0.05
+
 
 def is_port_available(port: int, host: str = "127.0.0.1") -> bool:
     """Check if port is available for binding.
@@ -198,7 +202,8 @@ class DashboardServer:
                     f"Create an epic file in docs/epics/ first."
                 )
 
-        self.sse_broadcaster = SSEBroadcaster()
+        # Coalesce chatty workflow output into batched frames
+        self.sse_broadcaster = SSEBroadcaster(coalesce_window=SSE_COALESCE_WINDOW)
         self._app: Starlette | None = None
         self._server: Any = None
         self._shutdown_event = asyncio.Event()
@@ -225,6 +230,14 @@ class DashboardServer:
             "true",
             "yes",
         )
+        # Warm worker: run workflows in one long-lived `bmad-assist worker`
+        # process instead of spawning `bmad-assist run` per workflow
+        self._use_warm_worker = os.environ.get("BMAD_WARM_WORKER", "").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        self._warm_worker: WarmWorker | None = None
 
     def _ensure_paths_initialized(self) -> None:
         """Initialize paths singleton if not already done.
@@ -581,72 +594,20 @@ class DashboardServer:
         Each iteration runs `bmad-assist run` which processes one workflow
         from sprint-status.yaml. After each workflow completes, check if
         pause/stop was requested before starting the next one.
+
+        When BMAD_WARM_WORKER=1, workflows run in one long-lived
+        `bmad-assist worker` process instead of a fresh process each.
         """
         while self._loop_running and not self._pause_requested and not self._stop_requested:
             await self.sse_broadcaster.broadcast_output(
                 "📋 Starting workflow...", provider="dashboard"
             )
 
-            # Use installed CLI command (works in both dev and installed modes)
-            cmd = [
-                "bmad-assist",
-                "run",
-                "--project",
-                str(self.project_root),
-                "--no-interactive",
-            ]
-
-            # Set BMAD_DASHBOARD_MODE to enable dashboard event emission in subprocess
-            # Set BMAD_ORIGINAL_CWD to preserve original working directory for patch/cache lookup
-            import os
-
-            subprocess_env = os.environ.copy()
-            subprocess_env["BMAD_DASHBOARD_MODE"] = "1"
-            subprocess_env["BMAD_ORIGINAL_CWD"] = str(Path.cwd())
-            # Enable ANSI color output in subprocess (libraries detect PIPE as non-TTY)
-            subprocess_env["FORCE_COLOR"] = "1"
-            subprocess_env["TERM"] = "xterm-256color"
-            subprocess_env["COLORTERM"] = "truecolor"
-            # Disable Python output buffering for immediate log visibility
-            subprocess_env["PYTHONUNBUFFERED"] = "1"
-            # Pass initial log level to subprocess
-            subprocess_env["BMAD_LOG_LEVEL"] = self._log_level.upper()
-
-            self._current_process = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=self.project_root,
-                env=subprocess_env,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,  # Merge stderr into stdout
-                start_new_session=True,  # Own process group for safe termination
-            )
-
             try:
-                if self._current_process.stdout is not None:
-                    async for line in self._current_process.stdout:
-                        if self._stop_requested:
-                            await self._cancel_process()
-                            break
-
-                        text = line.decode(errors="replace").rstrip()
-
-                        # Story 22.9: Parse dashboard event markers from stdout
-                        if text.startswith(DASHBOARD_EVENT_MARKER):
-                            await self._handle_dashboard_event(text)
-                            continue
-
-                        await self.sse_broadcaster.broadcast_output(text, provider="workflow")
-
-                # Story 22.11 Task 1: Stdout EOF reached - subprocess has closed stdout
-                # Log EOF event for observability before waiting for process exit
-                logger.info("Subprocess stdout EOF - waiting for process exit")
-
-                # Now wait for process to fully exit
-                await self._current_process.wait()
-
-                # Story 22.11: Log subprocess exit details
-                returncode = self._current_process.returncode
-                logger.info("Subprocess exited with code %d", returncode)
+                if self._use_warm_worker:
+                    returncode = await self._run_workflow_warm()
+                else:
+                    returncode = await self._run_workflow_subprocess()
 
                 if returncode != 0:
                     await self.sse_broadcaster.broadcast_output(
@@ -674,6 +635,7 @@ class DashboardServer:
                 break
 
         # Loop ended
+        await self._close_warm_worker()
         self._loop_running = False
         self._pause_requested = False
         self._stop_requested = False
@@ -691,6 +653,135 @@ class DashboardServer:
         """Run workflow loop (deprecated, use _run_workflow_loop instead)."""
         await self._run_workflow_loop()
 
+    def _workflow_env(self) -> dict[str, str]:
+        """Build the environment for workflow processes."""
+        subprocess_env = os.environ.copy()
+        # Set BMAD_DASHBOARD_MODE to enable dashboard event emission in subprocess
+        # Set BMAD_ORIGINAL_CWD to preserve original working directory for patch/cache lookup
+        subprocess_env["BMAD_DASHBOARD_MODE"] = "1"
+        subprocess_env["BMAD_ORIGINAL_CWD"] = str(Path.cwd())
+        # Enable ANSI color output in subprocess (libraries detect PIPE as non-TTY)
+        subprocess_env["FORCE_COLOR"] = "1"
+        subprocess_env["TERM"] = "xterm-256color"
+        subprocess_env["COLORTERM"] = "truecolor"
+        # Disable Python output buffering for immediate log visibility
+        subprocess_env["PYTHONUNBUFFERED"] = "1"
+        # Pass initial log level to subprocess
+        subprocess_env["BMAD_LOG_LEVEL"] = self._log_level.upper()
+        return subprocess_env
+
+    async def _handle_workflow_line(self, text: str) -> None:
+        """Route one line of workflow stdout to SSE clients."""
+        # Story 22.9: Parse dashboard event markers from stdout
+        if text.startswith(DASHBOARD_EVENT_MARKER):
+            await self._handle_dashboard_event(text)
+            return
+
+        await self.sse_broadcaster.broadcast_output(text, provider="workflow")
+
+    async def _run_workflow_subprocess(self) -> int:
+        """Run one workflow in a fresh `bmad-assist run` process.
+
+        Returns:
+            Process exit code.
+
+        """
+        # Use installed CLI command (works in both dev and installed modes)
+        cmd = [
+            "bmad-assist",
+            "run",
+            "--project",
+            str(self.project_root),
+            "--no-interactive",
+        ]
+
+        self._current_process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=self.project_root,
+            env=self._workflow_env(),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,  # Merge stderr into stdout
+            start_new_session=True,  # Own process group for safe termination
+        )
+
+        if self._current_process.stdout is not None:
+            async for line in self._current_process.stdout:
+                if self._stop_requested:
+                    await self._cancel_process()
+                    break
+
+                await self._handle_workflow_line(line.decode(errors="replace").rstrip())
+
+        # Story 22.11 Task 1: Stdout EOF reached - subprocess has closed stdout
+        # Log EOF event for observability before waiting for process exit
+        logger.info("Subprocess stdout EOF - waiting for process exit")
+
+        # Now wait for process to fully exit
+        returncode = await self._current_process.wait()
+
+        # Story 22.11: Log subprocess exit details
+        logger.info("Subprocess exited with code %d", returncode)
+        return returncode
+
+    async def _run_workflow_warm(self) -> int:
+        """Run one workflow in the warm worker, starting it if needed.
+
+        The worker is discarded after a failed workflow or when it dies, so
+        the next loop starts from a fresh process.
+
+        Returns:
+            Workflow exit code.
+
+        """
+        from bmad_assist.dashboard.warm_worker import WarmWorker
+        from bmad_assist.ipc.protocol import IPCError
+
+        if self._warm_worker is None or not self._warm_worker.is_alive:
+            await self._close_warm_worker()
+            worker = WarmWorker(self.project_root, self._workflow_env(), self._on_worker_line)
+            self._warm_worker = worker
+            try:
+                await worker.start()
+            except IPCError as e:
+                logger.warning("Warm worker failed to start: %s", e)
+                await self.sse_broadcaster.broadcast_output(
+                    f"⚠️ Warm worker failed to start: {e}", provider="dashboard"
+                )
+                await self._close_warm_worker()
+                return 1
+            self._current_process = worker.process
+            await self.sse_broadcaster.broadcast_output(
+                f"🔥 Warm worker ready in {worker.startup_ms / 1000:.1f}s", provider="dashboard"
+            )
+        else:
+            saved_ms = self._warm_worker.startup_ms + self._warm_worker.config_load_ms
+            await self.sse_broadcaster.broadcast_output(
+                f"♻️ Reusing warm worker (saves ~{saved_ms / 1000:.1f}s of process startup "
+                "and config loading while config is unchanged)",
+                provider="dashboard",
+            )
+
+        returncode = await self._warm_worker.run_workflow(self._log_level.upper())
+        if returncode != 0:
+            await self._close_warm_worker()
+        return returncode
+
+    async def _on_worker_line(self, text: str) -> None:
+        """Handle a warm worker stdout line, honoring stop requests."""
+        if self._stop_requested:
+            await self._cancel_process()
+            return
+        await self._handle_workflow_line(text)
+
+    async def _close_warm_worker(self) -> None:
+        """Shut down the warm worker, if any."""
+        worker, self._warm_worker = self._warm_worker, None
+        if worker is None:
+            return
+        await worker.close()
+        if self._current_process is worker.process:
+            self._current_process = None
+
     async def _cancel_process(self) -> None:
         """Gracefully terminate current subprocess with SIGKILL fallback.
 
@@ -955,6 +1046,7 @@ class DashboardServer:
         # Cancel any running subprocess (redundant if loop task handled it, but safe)
         if self._current_process is not None:
             await self._cancel_process()
+        await self._close_warm_worker()
 
         from bmad_assist.dashboard import set_output_hook, unregister_output_bridge
 
@@ -1513,8 +1605,9 @@ class DashboardServer:
     def get_epic_metrics(self, epic_id: int | str) -> dict[str, Any] | None:
         """Get aggregated benchmark metrics for an epic.
 
-        Scans benchmarks directory for all evaluation files matching this epic
-        and aggregates timing and workflow statistics.
+        Served from the benchmark metrics store (benchmarks/metrics.sqlite),
+        which is kept in sync by save_evaluation_record() and backfilled from
+        existing evaluation files on first use.
 
         Args:
             epic_id: Epic identifier (numeric or string like 'testarch').
@@ -1523,91 +1616,14 @@ class DashboardServer:
             Dictionary with aggregated metrics or None if no benchmarks found.
 
         """
-        import yaml
-
+        from bmad_assist.benchmarking.metrics_store import MetricsStore
         from bmad_assist.core.paths import get_paths
 
         benchmarks_dir = get_paths().benchmarks_dir
         if not benchmarks_dir.exists():
             return None
 
-        epic_id_str = str(epic_id)
-        metrics: dict[str, Any] = {
-            "epic_id": epic_id,
-            "total_duration_ms": 0,
-            "story_count": 0,
-            "workflow_breakdown": {},
-            "stories": {},
-        }
-
-        # Scan all subdirectories (YYYY-MM format)
-        for month_dir in benchmarks_dir.iterdir():
-            if not month_dir.is_dir():
-                continue
-
-            # Pattern: eval-{epic}-{story}-{role}-{timestamp}.yaml
-            for eval_file in month_dir.glob(f"eval-{epic_id_str}-*.yaml"):
-                try:
-                    data = yaml.safe_load(eval_file.read_text(encoding="utf-8"))
-                    if not data:
-                        continue
-
-                    story_num = data.get("story", {}).get("story_num")
-                    workflow_id = data.get("workflow", {}).get("id", "unknown")
-                    duration_ms = data.get("execution", {}).get("duration_ms", 0)
-                    role = data.get("evaluator", {}).get("role", "unknown")
-
-                    # Aggregate totals
-                    metrics["total_duration_ms"] += duration_ms
-
-                    # Per-workflow breakdown
-                    if workflow_id not in metrics["workflow_breakdown"]:
-                        metrics["workflow_breakdown"][workflow_id] = {
-                            "count": 0,
-                            "total_duration_ms": 0,
-                        }
-                    metrics["workflow_breakdown"][workflow_id]["count"] += 1
-                    metrics["workflow_breakdown"][workflow_id]["total_duration_ms"] += duration_ms
-
-                    # Per-story tracking
-                    story_key = str(story_num)
-                    if story_key not in metrics["stories"]:
-                        metrics["stories"][story_key] = {
-                            "story_num": story_num,
-                            "title": data.get("story", {}).get("title", f"Story {story_num}"),
-                            "total_duration_ms": 0,
-                            "workflows": {},
-                        }
-                    metrics["stories"][story_key]["total_duration_ms"] += duration_ms
-
-                    # Per-story workflow tracking
-                    if workflow_id not in metrics["stories"][story_key]["workflows"]:
-                        metrics["stories"][story_key]["workflows"][workflow_id] = {
-                            "duration_ms": 0,
-                            "roles": [],
-                        }
-                    wf = metrics["stories"][story_key]["workflows"][workflow_id]
-                    wf["duration_ms"] += duration_ms
-                    if role not in wf["roles"]:
-                        wf["roles"].append(role)
-
-                except Exception as e:
-                    logger.warning("Failed to parse benchmark file %s: %s", eval_file, e)
-                    continue
-
-        metrics["story_count"] = len(metrics["stories"])
-
-        # Return None if no benchmarks found
-        if metrics["story_count"] == 0:
-            return None
-
-        # Convert stories dict to sorted list
-        metrics["stories"] = sorted(
-            metrics["stories"].values(),
-            key=lambda s: (s.get("story_num") or 0),
-        )
-
-        return metrics
+        return MetricsStore(benchmarks_dir).epic_metrics(epic_id)
 
     def _get_sprint_status_from_file(self) -> dict[str, Any]:
         """Read sprint-status.yaml directly when epic files don't exist.
@@ -3,6 +3,9 @@
 This module implements SSE broadcasting for real-time updates:
 - Live bmad-assist output streaming
 - Connection management with automatic cleanup
+- Optional coalescing of output lines into batched frames
+- Bounded per-client buffers that drop the oldest messages for stalled clients
+- A replay window so reconnecting clients resume after their Last-Event-ID
 
 Public API:
     SSEBroadcaster: Main broadcaster class for managing SSE connections
@@ -13,6 +16,8 @@ import asyncio
 import json
 import logging
 import time
+import uuid
+from collections import deque
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from enum import Enum
@@ -20,11 +25,21 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Messages buffered per client before the oldest are dropped
+DEFAULT_CLIENT_BUFFER_SIZE = 2000
+
+# Recent messages kept for Last-Event-ID replay
+DEFAULT_REPLAY_SIZE = 2000
+
+# Maximum output lines merged into one output_batch frame
+DEFAULT_MAX_BATCH_LINES = 256
+
 
 class EventType(Enum):
     """SSE event types."""
 
     OUTPUT = "output"  # bmad-assist stdout/stderr
+    OUTPUT_BATCH = "output_batch"  # Several coalesced output lines
     STATUS = "status"  # General status update
     HEARTBEAT = "heartbeat"  # Keep-alive ping
     MODEL_STARTED = "model_started"  # New model invocation tab
@@ -79,21 +94,52 @@ class SSEBroadcaster:
     Async-safe broadcaster (single event loop) that maintains a set of active
     connections and broadcasts messages to all connected clients.
 
+    Each client gets a bounded queue; when a client falls behind, its oldest
+    queued messages are dropped and the client is told how many were lost.
+    Recent messages are kept in a replay window so a client reconnecting
+    with Last-Event-ID receives what it missed instead of resyncing.
+
+    With a coalesce window, output lines that arrive close together are sent
+    as one output_batch frame ({"lines": [...]}) instead of one frame each.
+
     Attributes:
         connection_count: Number of active connections.
+        dropped_count: Messages dropped for slow clients since startup.
 
     """
 
-    def __init__(self, heartbeat_interval: float = 30.0) -> None:
+    def __init__(
+        self,
+        heartbeat_interval: float = 30.0,
+        coalesce_window: float = 0.0,
+        max_batch_lines: int = DEFAULT_MAX_BATCH_LINES,
+        client_buffer_size: int = DEFAULT_CLIENT_BUFFER_SIZE,
+        replay_size: int = DEFAULT_REPLAY_SIZE,
+    ) -> None:
         """Initialize broadcaster.
 
         Args:
             heartbeat_interval: Seconds between heartbeat messages.
+            coalesce_window: Seconds to wait for more output lines before
+                sending a batch (0 sends each line as its own frame).
+            max_batch_lines: Maximum lines in one output_batch frame.
+            client_buffer_size: Messages buffered per client before the
+                oldest are dropped.
+            replay_size: Recent messages kept for Last-Event-ID replay.
 
         """
         self._queues: set[asyncio.Queue[SSEMessage | None]] = set()
         self._heartbeat_interval = heartbeat_interval
+        self._coalesce_window = coalesce_window
+        self._max_batch_lines = max(1, max_batch_lines)
+        self._client_buffer_size = client_buffer_size
+        self._replay: deque[SSEMessage] = deque(maxlen=replay_size)
+        self._dropped: dict[asyncio.Queue[SSEMessage | None], int] = {}
+        self._dropped_total = 0
         self._message_counter = 0
+        # Event IDs are "<epoch>-<counter>"; the epoch changes on every boot,
+        # so an ID from a previous server process never matches this one
+        self._epoch = uuid.uuid4().hex[:8]
         self._lock = asyncio.Lock()
 
     @property
@@ -101,77 +147,204 @@ class SSEBroadcaster:
         """Get number of active connections."""
         return len(self._queues)
 
-    async def subscribe(self) -> AsyncGenerator[str, None]:
+    @property
+    def dropped_count(self) -> int:
+        """Get number of messages dropped for slow clients."""
+        return self._dropped_total
+
+    async def subscribe(self, last_event_id: str | None = None) -> AsyncGenerator[str, None]:
         """Subscribe to SSE stream.
 
+        Args:
+            last_event_id: ID of the last message the client received
+                (Last-Event-ID); newer messages still in the replay window
+                are sent first.
+
         Yields:
             Formatted SSE messages as strings.
 
         """
-        queue: asyncio.Queue[SSEMessage | None] = asyncio.Queue()
+        queue: asyncio.Queue[SSEMessage | None] = asyncio.Queue(maxsize=self._client_buffer_size)
 
         async with self._lock:
             self._queues.add(queue)
+            replay, complete = self._replay_since(last_event_id)
             logger.info("SSE client connected (total: %d)", len(self._queues))
 
+        # Messages taken from the queue (or replay) but not yet sent
+        pending: deque[SSEMessage] = deque(replay)
+
         try:
             # Send initial connection message
             yield SSEMessage(
                 event=EventType.STATUS.value,
-                data={"connected": True, "timestamp": time.time()},
+                data={
+                    "connected": True,
+                    "timestamp": time.time(),
+                    "replayed": len(replay),
+                    # Client must refetch state unless replay covered the gap
+                    "resync": not complete,
+                },
                 retry=3000,
             ).format()
 
             while True:
-                try:
-                    # Wait for message with heartbeat timeout
-                    message = await asyncio.wait_for(queue.get(), timeout=self._heartbeat_interval)
+                if not pending:
+                    try:
+                        # Wait for message with heartbeat timeout
+                        message = await asyncio.wait_for(
+                            queue.get(), timeout=self._heartbeat_interval
+                        )
+                    except TimeoutError:
+                        # Send heartbeat
+                        yield SSEMessage(
+                            event=EventType.HEARTBEAT.value,
+                            data={"timestamp": time.time()},
+                        ).format()
+                        continue
 
                     if message is None:
                         # Shutdown signal
                         break
+                    pending.append(message)
 
-                    yield message.format()
-
-                except TimeoutError:
-                    # Send heartbeat
+                dropped = self._dropped.pop(queue, 0)
+                if dropped:
                     yield SSEMessage(
-                        event=EventType.HEARTBEAT.value,
-                        data={"timestamp": time.time()},
+                        event=EventType.STATUS.value,
+                        data={"dropped": dropped, "timestamp": time.time()},
                     ).format()
 
+                message = pending.popleft()
+                if message.event == EventType.OUTPUT.value and self._coalesce_window > 0:
+                    batch = await self._collect_batch(message, pending, queue)
+                    if batch is None:
+                        break
+                    yield batch.format()
+                else:
+                    yield message.format()
+
         finally:
             async with self._lock:
                 self._queues.discard(queue)
+                self._dropped.pop(queue, None)
                 logger.info("SSE client disconnected (remaining: %d)", len(self._queues))
 
-    async def broadcast(self, event: EventType, data: Any) -> int:
-        """Broadcast message to all connected clients.
+    def _replay_since(self, last_event_id: str | None) -> tuple[list[SSEMessage], bool]:
+        """Messages newer than last_event_id, and whether they close the gap.
 
-        Args:
-            event: Event type.
-            data: Message payload.
+        Must be called with the lock held so no broadcast lands in both the
+        replay and the new client's queue. An ID from another epoch (a
+        previous server process) or a malformed ID is never complete.
+        """
+        last = self._sequence(last_event_id)
+        if last is None or last > self._message_counter:
+            return [], False
+        replay = [m for m in self._replay if (self._sequence(m.id) or 0) > last]
+        oldest = (
+            (self._sequence(self._replay[0].id) or 0)
+            if self._replay
+            else self._message_counter + 1
+        )
+        # Complete when nothing between last and the window start was evicted
+        complete = last >= oldest - 1
+        return replay, complete
+
+    def _sequence(self, event_id: str | None) -> int | None:
+        """Counter part of an event ID from this epoch, or None."""
+        if event_id is None:
+            return None
+        epoch, _, counter = event_id.partition("-")
+        if epoch != self._epoch:
+            return None
+        try:
+            return int(counter)
+        except ValueError:
+            return None
 
-        Returns:
-            Number of clients message was sent to.
+    def _next_id(self) -> str:
+        """Allocate the next event ID."""
+        self._message_counter += 1
+        return f"{self._epoch}-{self._message_counter}"
 
+    async def _collect_batch(
+        self,
+        first: SSEMessage,
+        pending: deque[SSEMessage],
+        queue: asyncio.Queue[SSEMessage | None],
+    ) -> SSEMessage | None:
+        """Merge output lines arriving within the coalesce window into one frame.
+
+        A non-output message ends the batch and stays pending so ordering is
+        preserved. Returns None if the shutdown signal arrives.
         """
-        self._message_counter += 1
-        message = SSEMessage(
-            event=event.value,
-            data=data,
-            id=str(self._message_counter),
+        lines = [first]
+        deadline = time.monotonic() + self._coalesce_window
+        while len(lines) < self._max_batch_lines:
+            if pending:
+                message = pending.popleft()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    queued = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except TimeoutError:
+                    break
+                if queued is None:
+                    return None
+                message = queued
+            if message.event != EventType.OUTPUT.value:
+                pending.appendleft(message)
+                break
+            lines.append(message)
+
+        if len(lines) == 1:
+            return first
+        return SSEMessage(
+            event=EventType.OUTPUT_BATCH.value,
+            data={"lines": [m.data for m in lines]},
+            id=lines[-1].id,
         )
 
+    async def _publish(self, message: SSEMessage) -> int:
+        """Record a message for replay and queue it for every client."""
         async with self._lock:
+            self._replay.append(message)
             for queue in self._queues:
                 try:
                     queue.put_nowait(message)
                 except asyncio.QueueFull:
-                    logger.warning("SSE queue full, dropping message for slow client")
+                    # Ring buffer: drop the oldest message, keep the newest
+                    queue.get_nowait()
+                    queue.put_nowait(message)
+                    self._dropped_total += 1
+                    dropped = self._dropped.get(queue, 0) + 1
+                    self._dropped[queue] = dropped
+                    if dropped == 1:
+                        logger.warning("SSE queue full, dropping oldest messages for slow client")
 
             return len(self._queues)
 
+    async def broadcast(self, event: EventType, data: Any) -> int:
+        """Broadcast message to all connected clients.
+
+        Args:
+            event: Event type.
+            data: Message payload.
+
+        Returns:
+            Number of clients message was sent to.
+
+        """
+        return await self._publish(
+            SSEMessage(
+                event=event.value,
+                data=data,
+                id=self._next_id(),
+            )
+        )
+
     async def broadcast_output(
         self,
         line: str,
@@ -241,27 +414,21 @@ class SSEBroadcaster:
             Number of clients message was sent to.
 
         """
-        self._message_counter += 1
-        message = SSEMessage(
-            event=event_name,
-            data=data,
-            id=str(self._message_counter),
+        return await self._publish(
+            SSEMessage(
+                event=event_name,
+                data=data,
+                id=self._next_id(),
+            )
         )
 
-        async with self._lock:
-            for queue in self._queues:
-                try:
-                    queue.put_nowait(message)
-                except asyncio.QueueFull:
-                    logger.warning("SSE queue full, dropping message for slow client")
-
-            return len(self._queues)
-
     async def shutdown(self) -> None:
         """Shutdown broadcaster and disconnect all clients."""
         async with self._lock:
             for queue in self._queues:
-                await queue.put(None)  # Send shutdown signal
+                if queue.full():
+                    queue.get_nowait()  # Make room; the client is going away anyway
+                queue.put_nowait(None)  # Send shutdown signal
 
             logger.info("SSE broadcaster shutdown, disconnected %d clients", len(self._queues))
             self._queues.clear()
@@ -20,6 +20,8 @@ window.sseConnectionComponent = function() {
         // Reconnect state
         _sseReconnectDelay: 1000,
         _wasConnected: false,
+        _sseReconnecting: false,
+        _sseLastEventId: null,
 
         // Self-reload timestamp for detecting external vs self-initiated config reloads (Story 17.9)
         SELF_RELOAD_WINDOW_MS: 2000,
@@ -32,18 +34,20 @@ window.sseConnectionComponent = function() {
                 this.eventSource.close();
             }
 
-            this.eventSource = new EventSource('/sse/output');
+            // Resume after the last seen output so the server can replay what was missed
+            const url = this._sseLastEventId
+                ? `/sse/output?last_event_id=${encodeURIComponent(this._sseLastEventId)}`
+                : '/sse/output';
+            this.eventSource = new EventSource(url);
 
             this.eventSource.onopen = () => {
                 this.connected = true;
                 // Story 22.9: Reset reconnect delay on successful connection
                 this._sseReconnectDelay = 1000;
                 console.log('SSE connected');
-                // Story 22.9: Resync state after reconnect (fetch fresh tree data)
-                if (this._wasConnected) {
-                    console.log('SSE reconnected, resyncing state...');
-                    this.fetchStories();
-                }
+                // Story 22.9: Resync after reconnect happens on the status event,
+                // which says whether the server replay covered the gap
+                this._sseReconnecting = this._wasConnected;
                 this._wasConnected = true;
             };
 
@@ -73,15 +77,41 @@ window.sseConnectionComponent = function() {
 
             // Output event - terminal lines
             this.eventSource.addEventListener('output', (e) => {
+                if (e.lastEventId) this._sseLastEventId = e.lastEventId;
                 const data = JSON.parse(e.data);
                 this.addOutput(data);
             });
 
+            // Output batch event - several terminal lines coalesced by the server
+            this.eventSource.addEventListener('output_batch', (e) => {
+                if (e.lastEventId) this._sseLastEventId = e.lastEventId;
+                const data = JSON.parse(e.data);
+                for (const line of data.lines) {
+                    this.addOutput(line);
+                }
+            });
+
             // Status event - connection status
             this.eventSource.addEventListener('status', (e) => {
                 const data = JSON.parse(e.data);
                 if (data.connected) {
                     this.connected = true;
+                    // Story 22.9: Resync state after reconnect unless the replay covered the gap
+                    if (this._sseReconnecting) {
+                        this._sseReconnecting = false;
+                        if (data.resync !== false) {
+                            console.log('SSE reconnected, resyncing state...');
+                            this.fetchStories();
+                        }
+                    }
+                }
+                if (data.dropped) {
+                    // Server dropped output for this tab while it was stalled
+                    this.addOutput({
+                        line: `⚠️ ${data.dropped} messages skipped (connection too slow)`,
+                        provider: 'dashboard',
+                        timestamp: data.timestamp,
+                    });
                 }
             });
 
@@ -0,0 +1,206 @@
+"""Dashboard handle for a warm workflow worker process.
+
+Spawns `bmad-assist worker` once, connects to its socket with the regular
+SocketClient, and runs workflows through it (see ipc/worker.py). The
+worker's stdout is pumped for its whole lifetime so the pipe never fills
+between workflows; lines are handed to a callback, and the worker's
+end-of-job marker tells run_workflow() that a job's output is complete.
+
+Startup cost (spawn until the first ping answers) is measured once, and the
+worker reports how long each job spent loading config, paths and handlers,
+so the dashboard can report how much each reused workflow saved: process
+startup always, plus the config load while the worker could reuse it.
+
+Public API:
+    WarmWorker: Spawn, drive and shut down one worker process
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from bmad_assist.ipc.client import IPCConnectionError, SocketClient
+from bmad_assist.ipc.protocol import IPCError
+from bmad_assist.ipc.worker import WORKER_JOB_DONE_MARKER, get_worker_socket_path
+
+logger = logging.getLogger(__name__)
+
+# Polling interval while waiting for the worker socket to appear
+_CONNECT_POLL_INTERVAL = 0.1
+
+
+class WarmWorker:
+    """One `bmad-assist worker` process driven over its IPC socket.
+
+    Args:
+        project_root: Project the worker runs workflows for.
+        env: Environment for the worker process.
+        on_line: Async callback for each stdout line (markers excluded).
+        startup_timeout: Seconds to wait for the worker socket to answer.
+
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        project_root: Path,
+        env: dict[str, str],
+        on_line: Callable[[str], Awaitable[None]],
+        startup_timeout: float = 60.0,
+    ) -> None:
+        self._project_root = project_root
+        self._env = env
+        self._on_line = on_line
+        self._startup_timeout = startup_timeout
+        self._socket_path = get_worker_socket_path(project_root)
+
+        self.process: asyncio.subprocess.Process | None = None
+        self.startup_ms: float = 0.0
+        # Last full config/paths/handlers load measured inside the worker
+        self.config_load_ms: float = 0.0
+        self.saved_ms: float = 0.0
+        self.jobs_run = 0
+        self._client: SocketClient | None = None
+        self._pump_task: asyncio.Task[None] | None = None
+        self._job_done = asyncio.Event()
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the worker process is running and connected."""
+        return (
+            self.process is not None
+            and self.process.returncode is None
+            and self._client is not None
+            and self._client.is_connected
+        )
+
+    async def start(self) -> None:
+        """Spawn the worker and wait until its socket answers a ping.
+
+        Raises:
+            IPCConnectionError: If the worker exits or does not answer in time.
+
+        """
+        started = time.perf_counter()
+        self.process = await asyncio.create_subprocess_exec(
+            "bmad-assist",
+            "worker",
+            "--project",
+            str(self._project_root),
+            cwd=self._project_root,
+            env=self._env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,  # Merge stderr into stdout
+            start_new_session=True,  # Own process group for safe termination
+        )
+        self._pump_task = asyncio.create_task(self._pump(self.process))
+
+        deadline = started + self._startup_timeout
+        while True:
+            if self.process.returncode is not None or self._pump_task.done():
+                raise IPCConnectionError(
+                    f"Worker exited during startup with code {self.process.returncode}"
+                )
+            client = SocketClient(self._socket_path, client_id="dashboard", auto_reconnect=False)
+            try:
+                await client.connect(timeout=1.0)
+            except IPCConnectionError:
+                if time.perf_counter() >= deadline:
+                    raise
+                await asyncio.sleep(_CONNECT_POLL_INTERVAL)
+                continue
+            self._client = client
+            break
+
+        self.startup_ms = (time.perf_counter() - started) * 1000
+        logger.info("Warm worker ready in %.0f ms (pid %d)", self.startup_ms, self.process.pid)
+
+    async def run_workflow(self, log_level: str) -> int:
+        """Run one workflow in the worker and wait for its output to drain.
+
+        Args:
+            log_level: Log level for the workflow (BMAD_LOG_LEVEL).
+
+        Returns:
+            Workflow exit code; the process exit code if the worker died.
+
+        """
+        if self._client is None or self.process is None:
+            raise IPCConnectionError("Worker not started")
+
+        self._job_done.clear()
+        try:
+            result = await self._client.send_command(
+                "run_workflow", {"log_level": log_level}, timeout=None
+            )
+        except IPCError as e:
+            # Worker was terminated or crashed mid-job; drain what it printed
+            logger.info("Warm worker lost during workflow: %s", e)
+            if self._pump_task is not None:
+                await self._pump_task
+            return await self.process.wait()
+
+        await self._job_done.wait()
+        self._record_savings(result)
+        self.jobs_run += 1
+        return int(result.get("exit_code", 1))
+
+    def _record_savings(self, result: dict[str, Any]) -> None:
+        """Add what a fresh `bmad-assist run` process would have spent on setup."""
+        if result.get("config_reused"):
+            self.saved_ms += self.startup_ms + self.config_load_ms
+            return
+        if self.jobs_run > 0:
+            self.saved_ms += self.startup_ms
+        setup_ms = float(result.get("setup_ms", 0))
+        if setup_ms > 0:
+            self.config_load_ms = setup_ms
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        if self._client is not None and self._client.is_connected:
+            with contextlib.suppress(IPCError):
+                await self._client.send_command("shutdown", timeout=timeout)
+        elif self.process is not None and self.process.returncode is None:
+            # Still starting up (or lost its socket): nothing to ask politely
+            with contextlib.suppress(ProcessLookupError):
+                self.process.terminate()
+        if self._client is not None:
+            await self._client.disconnect()
+            self._client = None
+
+        if self.process is not None and self.process.returncode is None:
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=timeout)
+            except TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+
+        if self._pump_task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._pump_task
+            self._pump_task = None
+
+        if self.jobs_run > 1:
+            logger.info(
+                "Warm worker ran %d workflows, saving ~%.1fs of startup and config loading",
+                self.jobs_run,
+                self.saved_ms / 1000,
+            )
+
+    async def _pump(self, process: asyncio.subprocess.Process) -> None:
+        """Forward worker stdout lines until EOF, tracking end-of-job markers."""
+        try:
+            if process.stdout is not None:
+                async for line in process.stdout:
+                    text = line.decode(errors="replace").rstrip()
+                    if text.startswith(WORKER_JOB_DONE_MARKER):
+                        self._job_done.set()
+                        continue
+                    await self._on_line(text)
+        finally:
+            # Never leave run_workflow() waiting on a marker that cannot come
+            self._job_done.set()
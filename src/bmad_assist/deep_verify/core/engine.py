@@ -9,7 +9,6 @@ verification workflow.
 from __future__ import annotations
 
 import asyncio
-import difflib
 import json
 import logging
 import random
@@ -17,6 +16,7 @@ from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from bmad_assist.core.dedup import FuzzyMatchIndex
 from bmad_assist.core.exceptions import ProviderError, ProviderTimeoutError
 from bmad_assist.deep_verify.core.domain_detector import DomainDetector
 from bmad_assist.deep_verify.core.exceptions import (
@@ -870,7 +870,8 @@ class DeepVerifyEngine:
 
         Compares findings by:
         1. Pattern ID match (if both have pattern_id)
-        2. Evidence quote similarity (>80% match via difflib.SequenceMatcher)
+        2. Evidence quote similarity (>80% match via difflib.SequenceMatcher,
+           candidates pruned by FuzzyMatchIndex)
 
         Keeps the highest severity duplicate when matches are found.
 
@@ -893,40 +894,33 @@ class DeepVerifyEngine:
         }
 
         unique: list[Finding] = []
+        # Positions in unique by pattern ID, and first evidence quotes by position
+        pattern_slots: dict[str, set[int]] = {}
+        quotes = FuzzyMatchIndex(0.8, inclusive=False)
 
         for finding in findings:
-            is_duplicate = False
-            for existing in unique:
-                # Check pattern_id match
-                if finding.pattern_id and finding.pattern_id == existing.pattern_id:
-                    is_duplicate = True
-                    # Keep higher severity
-                    if severity_priority.get(finding.severity, 0) > severity_priority.get(
-                        existing.severity, 0
-                    ):
-                        idx = unique.index(existing)
-                        unique[idx] = finding
-                    break
-
-                # Check evidence quote similarity (>80%)
-                if finding.evidence and existing.evidence:
-                    # Compare first evidence quote
-                    f_quote = finding.evidence[0].quote if finding.evidence else ""
-                    e_quote = existing.evidence[0].quote if existing.evidence else ""
-                    if f_quote and e_quote:
-                        similarity = difflib.SequenceMatcher(None, f_quote, e_quote).ratio()
-                        if similarity > 0.8:
-                            is_duplicate = True
-                            # Keep higher severity
-                            if severity_priority.get(finding.severity, 0) > severity_priority.get(
-                                existing.severity, 0
-                            ):
-                                idx = unique.index(existing)
-                                unique[idx] = finding
-                            break
-
-            if not is_duplicate:
-                unique.append(finding)
+            # First kept finding (in order) sharing the pattern ID or a >80% similar quote
+            match: int | None = None
+            if finding.pattern_id and pattern_slots.get(finding.pattern_id):
+                match = min(pattern_slots[finding.pattern_id])
+            f_quote = finding.evidence[0].quote if finding.evidence else ""
+            if f_quote:
+                quote_match = quotes.find(f_quote, before=match)
+                if quote_match is not None:
+                    match = quote_match
+
+            if match is None:
+                self._keep_finding(unique, len(unique), finding, pattern_slots, quotes)
+                continue
+
+            # Keep higher severity
+            existing = unique[match]
+            if severity_priority.get(finding.severity, 0) > severity_priority.get(
+                existing.severity, 0
+            ):
+                if existing.pattern_id:
+                    pattern_slots[existing.pattern_id].discard(match)
+                self._keep_finding(unique, match, finding, pattern_slots, quotes)
 
         if len(unique) < len(findings):
             logger.debug(
@@ -937,6 +931,27 @@ class DeepVerifyEngine:
 
         return unique
 
+    @staticmethod
+    def _keep_finding(
+        unique: list[Finding],
+        position: int,
+        finding: Finding,
+        pattern_slots: dict[str, set[int]],
+        quotes: FuzzyMatchIndex,
+    ) -> None:
+        """Store a finding in unique at position and index its dedup keys."""
+        if position == len(unique):
+            unique.append(finding)
+        else:
+            unique[position] = finding
+        if finding.pattern_id:
+            pattern_slots.setdefault(finding.pattern_id, set()).add(position)
+        quote = finding.evidence[0].quote if finding.evidence else ""
+        if quote:
+            quotes.set(position, quote)
+        else:
+            quotes.discard(position)
+
     def _apply_finding_limits(self, findings: list[Finding]) -> list[Finding]:
         """Enforce max findings per method and max total findings.
 
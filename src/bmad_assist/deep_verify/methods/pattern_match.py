@@ -151,7 +151,9 @@ class PatternMatchMethod(BaseVerificationMethod):
                 return []
 
             # Create matcher and run pattern matching
-            matcher = PatternMatcher(patterns, threshold=self._threshold)
+            matcher = PatternMatcher(
+                patterns, threshold=self._threshold, library=self._library
+            )
             match_results = matcher.match(artifact_text)
 
             logger.debug(
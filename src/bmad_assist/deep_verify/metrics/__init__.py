@@ -5,6 +5,7 @@ This module provides the infrastructure for:
 - Metrics collection (precision, recall, F1, false positive rates)
 - Benchmark execution and reporting
 - CI integration with threshold checking
+- Pattern matcher throughput measurement
 """
 
 from bmad_assist.deep_verify.metrics.collector import (
@@ -25,6 +26,10 @@ from bmad_assist.deep_verify.metrics.corpus_loader import (
 )
 from bmad_assist.deep_verify.metrics.report import ReportFormatter
 from bmad_assist.deep_verify.metrics.threshold import ThresholdChecker
+from bmad_assist.deep_verify.metrics.throughput import (
+    MatcherThroughput,
+    measure_matcher_throughput,
+)
 
 __all__ = [
     # Collector types
@@ -44,4 +49,7 @@ __all__ = [
     # Report and threshold
     "ReportFormatter",
     "ThresholdChecker",
+    # Matcher throughput
+    "MatcherThroughput",
+    "measure_matcher_throughput",
 ]
@@ -22,12 +22,16 @@ Examples:
     # Regenerate manifest
     python -m bmad_assist.deep_verify.metrics --regenerate-manifest
 
+    # Measure pattern matcher throughput over the corpus
+    python -m bmad_assist.deep_verify.metrics --matcher-throughput
+
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import json
 import logging
 import sys
 from collections.abc import Callable
@@ -39,6 +43,7 @@ from bmad_assist.deep_verify.metrics.collector import MetricsCollector
 from bmad_assist.deep_verify.metrics.corpus_loader import CorpusLoader
 from bmad_assist.deep_verify.metrics.report import ReportFormatter
 from bmad_assist.deep_verify.metrics.threshold import ThresholdChecker
+from bmad_assist.deep_verify.metrics.throughput import measure_matcher_throughput
 
 # Configure logging
 logging.basicConfig(
@@ -142,6 +147,26 @@ async def run_benchmark(args: argparse.Namespace) -> int:
         print(f"  Domains: {manifest.domain_breakdown}")
         return 0
 
+    # Matcher throughput mode
+    if args.matcher_throughput:
+        filter_predicate = parse_filter(args.filter)
+        labels = [
+            label
+            for label in loader.load_all_labels()
+            if filter_predicate is None or filter_predicate(label)
+        ]
+        if not labels:
+            logger.error("No artifacts found!")
+            return 1
+
+        texts = [loader.load_artifact_content(label) for label in labels]
+        throughput = measure_matcher_throughput(texts)
+        if args.format == "text":
+            print(throughput.format())
+        else:
+            print(json.dumps(throughput.to_dict(), indent=2))
+        return 0
+
     # Golden-only mode
     if args.golden_only:
         logger.info("Running golden test suite...")
@@ -305,6 +330,11 @@ def main() -> int:
         action="store_true",
         help="Check results against thresholds",
     )
+    parser.add_argument(
+        "--matcher-throughput",
+        action="store_true",
+        help="Measure pattern matcher throughput over the corpus",
+    )
     parser.add_argument(
         "--regenerate-manifest",
         action="store_true",
@@ -0,0 +1,146 @@
+"""Pattern matcher throughput benchmark for Deep Verify.
+
+Measures how fast the PatternMatcher scans artifacts against a pattern
+library, separately from the accuracy metrics collected by MetricsCollector.
+Index construction (once per pattern set) is timed apart from scanning
+(once per artifact), so regressions in either show up on their own.
+
+Usage:
+    python -m bmad_assist.deep_verify.metrics --matcher-throughput
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from bmad_assist.deep_verify.patterns.library import PatternLibrary, get_default_pattern_library
+from bmad_assist.deep_verify.patterns.matcher import PatternMatcher, SignalIndex
+
+
+@dataclass(frozen=True, slots=True)
+class MatcherThroughput:
+    """Result of a matcher throughput run.
+
+    Attributes:
+        artifact_count: Number of artifacts scanned per iteration.
+        total_chars: Characters scanned per iteration.
+        iterations: Number of passes over all artifacts.
+        pattern_count: Patterns matched against.
+        exact_signal_count: Distinct exact signals in the index.
+        regex_signal_count: Distinct regex signals in the index.
+        index_build_seconds: Time to build the signal index.
+        match_seconds: Total time spent in PatternMatcher.match().
+
+    """
+
+    artifact_count: int
+    total_chars: int
+    iterations: int
+    pattern_count: int
+    exact_signal_count: int
+    regex_signal_count: int
+    index_build_seconds: float
+    match_seconds: float
+
+    @property
+    def chars_per_second(self) -> float:
+        """Characters matched per second."""
+        if self.match_seconds <= 0:
+            return 0.0
+        return self.total_chars * self.iterations / self.match_seconds
+
+    @property
+    def artifacts_per_second(self) -> float:
+        """Artifacts matched per second."""
+        if self.match_seconds <= 0:
+            return 0.0
+        return self.artifact_count * self.iterations / self.match_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to dictionary."""
+        return {
+            "artifact_count": self.artifact_count,
+            "total_chars": self.total_chars,
+            "iterations": self.iterations,
+            "pattern_count": self.pattern_count,
+            "exact_signal_count": self.exact_signal_count,
+            "regex_signal_count": self.regex_signal_count,
+            "index_build_seconds": round(self.index_build_seconds, 6),
+            "match_seconds": round(self.match_seconds, 6),
+            "chars_per_second": round(self.chars_per_second, 1),
+            "artifacts_per_second": round(self.artifacts_per_second, 2),
+        }
+
+    def format(self) -> str:
+        """Format as a human-readable summary."""
+        return "\n".join(
+            [
+                "Pattern Matcher Throughput",
+                "=" * 40,
+                f"Artifacts:        {self.artifact_count} x {self.iterations} iterations",
+                f"Characters:       {self.total_chars:,} per iteration",
+                f"Patterns:         {self.pattern_count}",
+                f"Signals:          {self.exact_signal_count} exact, "
+                f"{self.regex_signal_count} regex (distinct)",
+                f"Index build:      {self.index_build_seconds * 1000:.2f} ms",
+                f"Match time:       {self.match_seconds * 1000:.2f} ms",
+                f"Throughput:       {self.chars_per_second / 1_000_000:.2f} MB/s, "
+                f"{self.artifacts_per_second:.1f} artifacts/s",
+            ]
+        )
+
+
+def measure_matcher_throughput(
+    texts: Sequence[str],
+    library: PatternLibrary | None = None,
+    language: str | None = None,
+    iterations: int = 3,
+) -> MatcherThroughput:
+    """Measure PatternMatcher throughput over a set of artifacts.
+
+    Args:
+        texts: Artifact contents to match.
+        library: Pattern library (default: the built-in library).
+        language: Optional language filter for code patterns.
+        iterations: Number of passes over all artifacts.
+
+    Returns:
+        MatcherThroughput with timings.
+
+    Raises:
+        ValueError: If iterations is less than 1.
+
+    """
+    if iterations < 1:
+        raise ValueError(f"iterations must be >= 1, got {iterations}")
+
+    library = library or get_default_pattern_library()
+    patterns = library.get_patterns(language=language)
+
+    started = time.perf_counter()
+    index = SignalIndex(patterns, library)
+    index_build_seconds = time.perf_counter() - started
+
+    # Threshold 0 so result assembly for every pattern is part of the measurement
+    matcher = PatternMatcher(patterns, threshold=0.0, library=library)
+    library.get_signal_index(patterns)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for text in texts:
+            matcher.match(text)
+    match_seconds = time.perf_counter() - started
+
+    return MatcherThroughput(
+        artifact_count=len(texts),
+        total_chars=sum(len(text) for text in texts),
+        iterations=iterations,
+        pattern_count=len(patterns),
+        exact_signal_count=len(index.exact_literals),
+        regex_signal_count=len(index.regexes),
+        index_build_seconds=index_build_seconds,
+        match_seconds=match_seconds,
+    )
@@ -48,7 +48,7 @@ from bmad_assist.deep_verify.patterns.library import (
     PatternLibrary,
     get_default_pattern_library,
 )
-from bmad_assist.deep_verify.patterns.matcher import PatternMatcher
+from bmad_assist.deep_verify.patterns.matcher import PatternMatcher, SignalIndex
 from bmad_assist.deep_verify.patterns.types import (
     MatchedSignal,
     PatternMatchResult,
@@ -58,6 +58,7 @@ __all__ = [
     "PatternLibrary",
     "PatternMatcher",
     "PatternMatchResult",
+    "SignalIndex",
     "MatchedSignal",
     "get_default_pattern_library",
 ]
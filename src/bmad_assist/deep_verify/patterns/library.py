@@ -8,9 +8,11 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+from collections.abc import Sequence
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
@@ -23,6 +25,9 @@ from bmad_assist.deep_verify.core.types import (
     Signal,
 )
 
+if TYPE_CHECKING:
+    from bmad_assist.deep_verify.patterns.matcher import SignalIndex
+
 logger = logging.getLogger(__name__)
 
 # Pattern ID format: XX-NNN or XXX-NNN (e.g., "CC-001", "SEC-004", "DB-005")
@@ -79,6 +84,7 @@ class PatternLibrary:
     Attributes:
         _patterns: Dictionary mapping pattern IDs to Pattern objects.
         _compiled_regexes: Dictionary mapping (pattern_id, signal_idx) to compiled regex.
+        _signal_indexes: Signal indexes built for pattern sets, keyed by pattern IDs.
 
     """
 
@@ -87,6 +93,8 @@ class PatternLibrary:
         self._patterns: dict[PatternId, Pattern] = {}
         self._compiled_regexes: dict[tuple[PatternId, int], re.Pattern[str]] = {}
         self._pattern_sources: dict[PatternId, Path] = {}
+        self._signal_indexes: dict[tuple[PatternId, ...], SignalIndex] = {}
+        self._signal_indexes_lock = threading.Lock()
 
     def __len__(self) -> int:
         """Return the number of patterns in the library."""
@@ -450,6 +458,33 @@ class PatternLibrary:
         """
         return self._compiled_regexes.get((pattern_id, signal_idx))
 
+    def get_signal_index(self, patterns: Sequence[Pattern]) -> SignalIndex:
+        """Get the signal index for a set of patterns, building it once.
+
+        Matchers are created per verification run with the same filtered
+        pattern sets, so indexes are cached for the lifetime of the library.
+
+        Args:
+            patterns: Patterns to index (e.g., a get_patterns() result).
+
+        Returns:
+            SignalIndex over the patterns' signals.
+
+        """
+        from bmad_assist.deep_verify.patterns.matcher import SignalIndex
+
+        key = tuple(p.id for p in patterns)
+        with self._signal_indexes_lock:
+            index = self._signal_indexes.get(key)
+        # Patterns outside the library may reuse IDs; only trust an identical set
+        if index is not None and all(a is b for a, b in zip(index.patterns, patterns, strict=True)):
+            return index
+
+        index = SignalIndex(patterns, self)
+        with self._signal_indexes_lock:
+            self._signal_indexes[key] = index
+        return index
+
 
 @lru_cache(maxsize=1)
 def get_default_pattern_library() -> PatternLibrary:
@@ -2,13 +2,22 @@
 
 This module provides the PatternMatcher class for matching patterns
 against text with signal detection and confidence scoring.
+
+Signals are not evaluated one by one. A SignalIndex compiled once per
+pattern set deduplicates signals shared between patterns and scans an
+artifact in a single pass: the text is lowercased once for all exact
+signals, and every distinct regex runs once under a single timeout handler.
 """
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import re
 import signal
+import threading
+from bisect import bisect_right
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -57,16 +66,47 @@ def match_with_timeout(pattern: re.Pattern[str], text: str, timeout_seconds: flo
         TimeoutError: If matching exceeds timeout.
 
     """
-    if not _SIGALRM_AVAILABLE:
-        # Fallback: no timeout protection on non-Unix systems
-        return pattern.search(text)
+    with _regex_timeout_scope(timeout_seconds) as search:
+        return search(pattern, text)
+
+
+def _timeouts_supported() -> bool:
+    """Check whether SIGALRM timeouts can be used from the current thread.
+
+    Signal handlers can only be installed from the main thread, so Deep
+    Verify running in worker threads falls back to unprotected matching.
+    """
+    return _SIGALRM_AVAILABLE and threading.current_thread() is threading.main_thread()
+
+
+@contextlib.contextmanager
+def _regex_timeout_scope(
+    timeout_seconds: float,
+) -> Iterator[Callable[[re.Pattern[str], str], re.Match[str] | None]]:
+    """Install the SIGALRM handler once for a batch of regex searches.
+
+    Yields:
+        Search function arming a fresh alarm for each call.
+
+    """
+    if not _timeouts_supported():
+        # Fallback: no timeout protection on non-Unix systems or worker threads
+        yield lambda pattern, text: pattern.search(text)
+        return
+
+    def search(pattern: re.Pattern[str], text: str) -> re.Match[str] | None:
+        signal.alarm(int(timeout_seconds))
+        try:
+            return pattern.search(text)
+        finally:
+            signal.alarm(0)
 
     # Set up timeout handler
     old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
-    old_alarm = signal.alarm(int(timeout_seconds))
+    old_alarm = signal.alarm(0)
 
     try:
-        return pattern.search(text)
+        yield search
     finally:
         # Restore previous handler and alarm
         signal.signal(signal.SIGALRM, old_handler)
@@ -117,10 +157,7 @@ class MatchContext:
             1-based line number (clamped to valid range).
 
         """
-        for i, offset in enumerate(reversed(self.line_offsets)):
-            if position >= offset:
-                return len(self.line_offsets) - i
-        return 1
+        return max(bisect_right(self.line_offsets, position), 1)
 
     def get_line_content(self, line_number: int) -> str:
         """Get the content of a specific line.
@@ -138,6 +175,122 @@ class MatchContext:
         return ""
 
 
+# Signal key: ("exact", lowercased literal) or ("regex", regex source)
+SignalKey = tuple[str, str]
+
+# Signal hit: (position, matched text)
+SignalHit = tuple[int, str]
+
+
+def _signal_key(sig: Signal) -> SignalKey:
+    """Key under which equivalent signals share a single scan."""
+    if sig.type == "regex":
+        return ("regex", sig.pattern)
+    return ("exact", sig.pattern.lower())
+
+
+class SignalIndex:
+    """Precompiled, deduplicated signals of a pattern set.
+
+    Built once per pattern set (see PatternLibrary.get_signal_index()) and
+    reused for every artifact. scan() finds the first occurrence of every
+    distinct signal in one pass over the artifact.
+
+    Attributes:
+        patterns: Patterns the index was built for.
+        exact_literals: Distinct lowercased exact literals.
+        regexes: Distinct regex sources mapped to compiled regexes.
+
+    """
+
+    def __init__(self, patterns: Sequence[Pattern], library: PatternLibrary | None = None) -> None:
+        """Compile the signals of a pattern set.
+
+        Args:
+            patterns: Patterns to index.
+            library: Optional PatternLibrary for pre-compiled regexes.
+
+        """
+        self.patterns = tuple(patterns)
+        exact: dict[str, None] = {}
+        self.regexes: dict[str, re.Pattern[str]] = {}
+        invalid: set[str] = set()
+
+        for pattern in self.patterns:
+            for idx, sig in enumerate(pattern.signals):
+                if sig.type != "regex":
+                    exact[sig.pattern.lower()] = None
+                    continue
+                if sig.pattern in self.regexes or sig.pattern in invalid:
+                    continue
+                compiled = library.get_compiled_regex(pattern.id, idx) if library else None
+                if compiled is None or compiled.pattern != sig.pattern:
+                    try:
+                        # Use DOTALL so . matches newlines for multiline code matching
+                        compiled = re.compile(sig.pattern, re.IGNORECASE | re.DOTALL)
+                    except re.error as e:
+                        logger.warning(
+                            "Invalid regex pattern '%s' in pattern '%s': %s",
+                            sig.pattern,
+                            pattern.id,
+                            e,
+                        )
+                        invalid.add(sig.pattern)
+                        continue
+                self.regexes[sig.pattern] = compiled
+
+        self.exact_literals = tuple(exact)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the index."""
+        return (
+            f"SignalIndex(patterns={len(self.patterns)}, "
+            f"exact={len(self.exact_literals)}, regex={len(self.regexes)})"
+        )
+
+    def scan(
+        self, text: str, regex_timeout: float = DEFAULT_REGEX_TIMEOUT
+    ) -> dict[SignalKey, SignalHit]:
+        """Find the first occurrence of every indexed signal.
+
+        Args:
+            text: The text to scan.
+            regex_timeout: Timeout for each regex search in seconds.
+
+        Returns:
+            Mapping of signal key to (position, matched_text) for signals
+            found in the text.
+
+        """
+        hits: dict[SignalKey, SignalHit] = {}
+
+        text_lower = text.lower()
+        for literal in self.exact_literals:
+            idx = text_lower.find(literal)
+            if idx != -1:
+                # Capture ACTUAL text from input to preserve case and context
+                hits[("exact", literal)] = (idx, text[idx : idx + len(literal)])
+
+        if not self.regexes:
+            return hits
+
+        with _regex_timeout_scope(regex_timeout) as search:
+            for source, compiled in self.regexes.items():
+                try:
+                    match = search(compiled, text)
+                except TimeoutError:
+                    logger.error(
+                        "Regex timeout for signal '%s' after %.1fs",
+                        source[:50],
+                        regex_timeout,
+                    )
+                    continue
+                if match:
+                    hits[("regex", source)] = (match.start(), match.group(0))
+
+        return hits
+
+
 class PatternMatcher:
     """Matcher for detecting patterns in text.
 
@@ -148,6 +301,7 @@ class PatternMatcher:
         _patterns: List of patterns to match against.
         _threshold: Minimum confidence threshold for matches.
         _regex_timeout: Timeout for regex matching in seconds.
+        _index: Signal index for _patterns, built on first use.
 
     """
 
@@ -165,7 +319,8 @@ class PatternMatcher:
         Args:
             patterns: List of patterns to match against.
             threshold: Minimum confidence threshold (0.0-1.0).
-            library: Optional PatternLibrary for pre-compiled regexes.
+            library: Optional PatternLibrary for pre-compiled regexes and
+                cached signal indexes.
             regex_timeout: Timeout for regex pattern matching in seconds.
 
         """
@@ -173,6 +328,7 @@ class PatternMatcher:
         self._threshold = threshold
         self._library = library
         self._regex_timeout = regex_timeout
+        self._index: SignalIndex | None = None
 
     def __repr__(self) -> str:
         """Return a string representation of the matcher."""
@@ -193,10 +349,11 @@ class PatternMatcher:
             return []
 
         context = MatchContext.from_text(text)
+        hits = self._get_index().scan(text, self._regex_timeout)
         results: list[PatternMatchResult] = []
 
         for pattern in self._patterns:
-            result = self._match_single(pattern, context)
+            result = self._match_single(pattern, context, hits)
             if result and result.confidence >= self._threshold:
                 results.append(result)
 
@@ -220,19 +377,35 @@ class PatternMatcher:
             return None
 
         context = MatchContext.from_text(text)
-        result = self._match_single(pattern, context)
+        hits = SignalIndex([pattern], self._library).scan(text, self._regex_timeout)
+        result = self._match_single(pattern, context, hits)
 
         # Apply threshold filter for consistency with match() behavior
         if result and result.confidence < self._threshold:
             return None
         return result
 
-    def _match_single(self, pattern: Pattern, context: MatchContext) -> PatternMatchResult | None:
-        """Match a single pattern against the context.
+    def _get_index(self) -> SignalIndex:
+        """Get the signal index for the matcher's patterns."""
+        if self._index is None:
+            if self._library is not None:
+                self._index = self._library.get_signal_index(self._patterns)
+            else:
+                self._index = SignalIndex(self._patterns)
+        return self._index
+
+    def _match_single(
+        self,
+        pattern: Pattern,
+        context: MatchContext,
+        hits: dict[SignalKey, SignalHit],
+    ) -> PatternMatchResult | None:
+        """Match a single pattern against scanned signal hits.
 
         Args:
             pattern: The pattern to match.
             context: The match context.
+            hits: Signal hits from SignalIndex.scan().
 
         Returns:
             PatternMatchResult if the pattern matches, None otherwise.
@@ -242,12 +415,13 @@ class PatternMatcher:
         unmatched_signals: list[Signal] = []
 
         for sig in pattern.signals:
-            matched, line_number, matched_text = self._match_signal(sig, context, pattern)
-            if matched:
+            hit = hits.get(_signal_key(sig))
+            if hit is not None:
+                position, matched_text = hit
                 matched_signals.append(
                     MatchedSignal(
                         signal=sig,
-                        line_number=line_number,
+                        line_number=context.get_line_number(position),
                         matched_text=matched_text,
                     )
                 )
@@ -263,111 +437,6 @@ class PatternMatcher:
             unmatched_signals=unmatched_signals,
         )
 
-    def _match_signal(
-        self,
-        signal: Signal,
-        context: MatchContext,
-        pattern: Pattern,
-    ) -> tuple[bool, int, str]:
-        """Match a single signal against the context.
-
-        Args:
-            signal: The signal to match.
-            context: The match context.
-            pattern: The parent pattern (for library lookup).
-
-        Returns:
-            Tuple of (matched, line_number, matched_text).
-
-        """
-        if signal.type == "regex":
-            return self._match_regex_signal(signal, context, pattern)
-        else:
-            return self._match_exact_signal(signal, context)
-
-    def _match_exact_signal(self, signal: Signal, context: MatchContext) -> tuple[bool, int, str]:
-        """Match an exact string signal.
-
-        Args:
-            signal: The exact signal to match.
-            context: The match context.
-
-        Returns:
-            Tuple of (matched, line_number, matched_text).
-
-        """
-        pattern_lower = signal.pattern.lower()
-        text_lower = context.text.lower()
-
-        idx = text_lower.find(pattern_lower)
-        if idx == -1:
-            return False, 0, ""
-
-        line_number = context.get_line_number(idx)
-        # Capture ACTUAL text from input to preserve case and context
-        matched_text = context.text[idx : idx + len(signal.pattern)]
-        return True, line_number, matched_text
-
-    def _match_regex_signal(
-        self,
-        signal: Signal,
-        context: MatchContext,
-        pattern: Pattern,
-    ) -> tuple[bool, int, str]:
-        """Match a regex signal with timeout protection.
-
-        Args:
-            signal: The regex signal to match.
-            context: The match context.
-            pattern: The parent pattern.
-
-        Returns:
-            Tuple of (matched, line_number, matched_text).
-
-        """
-        # Try to get pre-compiled regex from library
-        compiled_regex = None
-        if self._library:
-            # Find the signal index in the pattern
-            try:
-                signal_idx = pattern.signals.index(signal)
-                compiled_regex = self._library.get_compiled_regex(pattern.id, signal_idx)
-            except ValueError:
-                pass
-
-        # Compile on the fly if not found in library
-        if compiled_regex is None:
-            try:
-                # Use DOTALL so . matches newlines for multiline code matching
-                compiled_regex = re.compile(signal.pattern, re.IGNORECASE | re.DOTALL)
-            except re.error as e:
-                logger.warning(
-                    "Invalid regex pattern '%s' in pattern '%s': %s",
-                    signal.pattern,
-                    pattern.id,
-                    e,
-                )
-                return False, 0, ""
-
-        try:
-            # Use timeout-protected matching
-            match = match_with_timeout(compiled_regex, context.text, self._regex_timeout)
-        except TimeoutError:
-            logger.error(
-                "Regex timeout for pattern '%s' signal '%s' after %.1fs",
-                pattern.id,
-                signal.pattern[:50],
-                self._regex_timeout,
-            )
-            return False, 0, ""
-
-        if not match:
-            return False, 0, ""
-
-        line_number = context.get_line_number(match.start())
-        matched_text = match.group(0)
-        return True, line_number, matched_text
-
     def _calculate_confidence(
         self, pattern: Pattern, matched_signals: list[MatchedSignal]
     ) -> float:
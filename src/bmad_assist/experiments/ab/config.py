@@ -64,6 +64,9 @@ class ABTestConfig(BaseModel):
         variant_a: Configuration for variant A.
         variant_b: Configuration for variant B.
         scorecard: Whether to run scorecard after completion.
+        parallel: Run both variants at once, each in its own process.
+        max_llm_sessions: With parallel, cap on phases (LLM sessions) running
+            at once across both variants; None means no cap.
 
     """
 
@@ -77,6 +80,8 @@ class ABTestConfig(BaseModel):
     variant_b: ABVariantConfig
     scorecard: bool = Field(default=False)
     analysis: bool = Field(default=False)
+    parallel: bool = Field(default=False)
+    max_llm_sessions: int | None = Field(default=None, ge=1)
 
     @field_validator("phases", mode="after")
     @classmethod
@@ -2,16 +2,28 @@
 
 Runs the same set of stories through two different configurations (variants)
 using git worktree isolation, then produces a comparison report.
+
+Variants run one after the other in this process by default. With
+``parallel: true`` each variant runs in its own spawned interpreter (config,
+paths and handler registries are process-global, so separate processes are
+what makes concurrent variants safe). Worker log records are streamed back
+to this process's handlers, and ``max_llm_sessions`` caps how many phases
+run at once across both variants.
 """
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import multiprocessing
 import os
 import shutil
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Any
 
 import yaml
 
@@ -73,6 +85,11 @@ def _reset_all_singletons() -> None:
     _reset_loop_config()
 
 
+# Start method for parallel variant processes. "spawn" gives each variant a
+# fresh interpreter with no config/paths/handler state inherited from here.
+_VARIANT_MP_CONTEXT = "spawn"
+
+
 @dataclass(frozen=True)
 class ABVariantResult:
     """Result of executing one variant of an A/B test."""
@@ -132,6 +149,8 @@ class ABTestRunner:
         self._config_registry: ConfigRegistry | None = None
         self._patchset_registry: PatchSetRegistry | None = None
         self._fixture_manager: FixtureManager | None = None
+        # Shared LLM session slots when running variants in parallel
+        self._llm_slots: contextlib.AbstractContextManager[Any] | None = None
 
     def _ensure_registries(self) -> None:
         """Lazily initialize registries."""
@@ -192,47 +211,14 @@ class ABTestRunner:
             register_signal_handlers()
 
             try:
-                # Run variant A
-                logger.info("=" * 60)
-                logger.info("Running variant A: %s", config.variant_a.label)
-                logger.info("=" * 60)
-
-                variant_a_result = self._run_variant(
-                    config=config,
-                    variant_config=config.variant_a,
-                    worktree=worktree_a,
-                    result_dir=result_dir / "variant-a",
-                    variant_label="A",
-                )
-
-                _reset_all_singletons()
-
-                # Run variant B (unless cancelled)
-                if not shutdown_requested():
-                    logger.info("=" * 60)
-                    logger.info("Running variant B: %s", config.variant_b.label)
-                    logger.info("=" * 60)
-
-                    variant_b_result = self._run_variant(
-                        config=config,
-                        variant_config=config.variant_b,
-                        worktree=worktree_b,
-                        result_dir=result_dir / "variant-b",
-                        variant_label="B",
+                if config.parallel:
+                    variant_a_result, variant_b_result = self._run_variants_parallel(
+                        config, worktree_a, worktree_b, result_dir
                     )
                 else:
-                    variant_b_result = ABVariantResult(
-                        label=config.variant_b.label,
-                        status=ExperimentStatus.CANCELLED,
-                        stories_attempted=0,
-                        stories_completed=0,
-                        stories_failed=0,
-                        duration_seconds=0.0,
-                        worktree_path=worktree_b.path,
-                        result_dir=result_dir / "variant-b",
-                        error="Cancelled before variant B started",
+                    variant_a_result, variant_b_result = self._run_variants_sequential(
+                        config, worktree_a, worktree_b, result_dir
                     )
-
             finally:
                 unregister_signal_handlers()
                 _reset_all_singletons()
@@ -294,6 +280,146 @@ class ABTestRunner:
         finally:
             cleanup_ab_worktrees(fixture_path, worktree_a, worktree_b, base_dir)
 
+    def _run_variants_sequential(
+        self,
+        config: ABTestConfig,
+        worktree_a: WorktreeInfo,
+        worktree_b: WorktreeInfo,
+        result_dir: Path,
+    ) -> tuple[ABVariantResult, ABVariantResult]:
+        """Run variant A, then variant B, in this process."""
+        # Run variant A
+        logger.info("=" * 60)
+        logger.info("Running variant A: %s", config.variant_a.label)
+        logger.info("=" * 60)
+
+        variant_a_result = self._run_variant(
+            config=config,
+            variant_config=config.variant_a,
+            worktree=worktree_a,
+            result_dir=result_dir / "variant-a",
+            variant_label="A",
+        )
+
+        _reset_all_singletons()
+
+        # Run variant B (unless cancelled)
+        if not shutdown_requested():
+            logger.info("=" * 60)
+            logger.info("Running variant B: %s", config.variant_b.label)
+            logger.info("=" * 60)
+
+            variant_b_result = self._run_variant(
+                config=config,
+                variant_config=config.variant_b,
+                worktree=worktree_b,
+                result_dir=result_dir / "variant-b",
+                variant_label="B",
+            )
+        else:
+            variant_b_result = ABVariantResult(
+                label=config.variant_b.label,
+                status=ExperimentStatus.CANCELLED,
+                stories_attempted=0,
+                stories_completed=0,
+                stories_failed=0,
+                duration_seconds=0.0,
+                worktree_path=worktree_b.path,
+                result_dir=result_dir / "variant-b",
+                error="Cancelled before variant B started",
+            )
+
+        return variant_a_result, variant_b_result
+
+    def _run_variants_parallel(
+        self,
+        config: ABTestConfig,
+        worktree_a: WorktreeInfo,
+        worktree_b: WorktreeInfo,
+        result_dir: Path,
+    ) -> tuple[ABVariantResult, ABVariantResult]:
+        """Run both variants at once, each in its own worker process.
+
+        Worker log records are re-emitted through this process's root
+        handlers as they arrive. A worker that dies without returning a
+        result yields a FAILED variant result.
+        """
+        logger.info("=" * 60)
+        logger.info(
+            "Running variants in parallel: A=%s, B=%s%s",
+            config.variant_a.label,
+            config.variant_b.label,
+            f" (max {config.max_llm_sessions} concurrent LLM sessions)"
+            if config.max_llm_sessions
+            else "",
+        )
+        logger.info("=" * 60)
+
+        ctx = multiprocessing.get_context(_VARIANT_MP_CONTEXT)
+        root = logging.getLogger()
+        jobs = [
+            ("A", config.variant_a, worktree_a, result_dir / "variant-a"),
+            ("B", config.variant_b, worktree_b, result_dir / "variant-b"),
+        ]
+
+        with ctx.Manager() as manager:
+            log_queue = manager.Queue()
+            llm_slots = (
+                manager.BoundedSemaphore(config.max_llm_sessions)
+                if config.max_llm_sessions
+                else None
+            )
+            listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+            listener.start()
+            try:
+                with ProcessPoolExecutor(max_workers=len(jobs), mp_context=ctx) as pool:
+                    futures: list[Future[ABVariantResult]] = [
+                        pool.submit(
+                            _run_variant_process,
+                            self._experiments_dir,
+                            self._project_root,
+                            config,
+                            label,
+                            worktree,
+                            variant_dir,
+                            log_queue,
+                            root.getEffectiveLevel(),
+                            llm_slots,
+                        )
+                        for label, _, worktree, variant_dir in jobs
+                    ]
+                    results: list[ABVariantResult] = []
+                    for future, (label, variant, worktree, variant_dir) in zip(
+                        futures, jobs, strict=True
+                    ):
+                        try:
+                            results.append(future.result())
+                        except Exception as e:
+                            logger.error("[%s] Variant process failed: %s", label, e)
+                            results.append(
+                                ABVariantResult(
+                                    label=variant.label,
+                                    status=ExperimentStatus.FAILED,
+                                    stories_attempted=0,
+                                    stories_completed=0,
+                                    stories_failed=0,
+                                    duration_seconds=0.0,
+                                    worktree_path=worktree.path,
+                                    result_dir=variant_dir,
+                                    error=f"Variant process failed: {e}",
+                                )
+                            )
+            finally:
+                listener.stop()
+
+        return results[0], results[1]
+
+    def _llm_session(self) -> contextlib.AbstractContextManager[Any]:
+        """Hold one shared LLM session slot, if running with a session cap."""
+        if self._llm_slots is None:
+            return contextlib.nullcontext()
+        return self._llm_slots
+
     def _validate_inputs(self, config: ABTestConfig) -> None:
         """Validate all referenced resources exist."""
         assert self._fixture_manager is not None
@@ -528,7 +654,8 @@ class ABTestRunner:
                         self._apply_patches(workflow, patchset_manifest, worktree_path)
 
                         # Execute phase
-                        result = execute_phase(state)
+                        with self._llm_session():
+                            result = execute_phase(state)
 
                         if not result.success:
                             story_failed = True
@@ -850,3 +977,42 @@ class ABTestRunner:
             if temp_path.exists():
                 temp_path.unlink()
             raise
+
+
+def _run_variant_process(
+    experiments_dir: Path,
+    project_root: Path | None,
+    config: ABTestConfig,
+    variant_label: str,
+    worktree: WorktreeInfo,
+    result_dir: Path,
+    log_queue: Any,
+    log_level: int,
+    llm_slots: contextlib.AbstractContextManager[Any] | None,
+) -> ABVariantResult:
+    """Worker process entry point: run one variant and return its result.
+
+    Logging is routed to the parent through log_queue; signal handlers are
+    installed as for a sequential run.
+    """
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(log_level)
+
+    reset_shutdown()
+    register_signal_handlers()
+
+    runner = ABTestRunner(experiments_dir, project_root)
+    runner._ensure_registries()
+    runner._llm_slots = llm_slots
+    variant_config = config.variant_a if variant_label == "A" else config.variant_b
+    try:
+        return runner._run_variant(
+            config=config,
+            variant_config=variant_config,
+            worktree=worktree,
+            result_dir=result_dir,
+            variant_label=variant_label,
+        )
+    finally:
+        unregister_signal_handlers()
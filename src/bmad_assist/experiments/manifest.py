@@ -126,6 +126,9 @@ class ResolvedFixture(BaseModel):
         name: Fixture name from registry.
         source: Original fixture path.
         snapshot: Relative path to snapshot in run dir.
+        isolation_method: Backend(s) that created the snapshot (tar, reflink,
+            copy).
+        isolation_timings: Seconds spent per isolation step.
 
     """
 
@@ -134,6 +137,13 @@ class ResolvedFixture(BaseModel):
     name: str = Field(..., description="Fixture name from registry")
     source: str = Field(..., description="Original fixture path")
     snapshot: str = Field(..., description="Relative path to snapshot in run dir")
+    isolation_method: str | None = Field(
+        None, description="Backend(s) that created the snapshot"
+    )
+    isolation_timings: dict[str, float] = Field(
+        default_factory=dict,
+        description="Seconds spent per isolation step",
+    )
 
 
 class ResolvedConfig(BaseModel):
@@ -724,6 +734,11 @@ def build_resolved_fixture(
         name=entry.id,
         source=str(isolation_result.source_path),
         snapshot=f"./{snapshot_rel}",
+        isolation_method=isolation_result.method,
+        isolation_timings={
+            **isolation_result.timings,
+            "total_seconds": round(isolation_result.duration_seconds, 3),
+        },
     )
 
 
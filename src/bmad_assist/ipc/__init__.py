@@ -3,7 +3,8 @@
 Public API re-exported from protocol.py (wire format, constants, socket paths),
 types.py (Pydantic message models), server.py (socket server + thread bridge),
 client.py (async/sync socket clients), cleanup.py (stale socket management),
-and discovery.py (instance discovery and state probing).
+discovery.py (instance discovery and state probing), and worker.py (warm
+workflow worker for dashboard loops).
 """
 
 from bmad_assist.ipc.cleanup import (
@@ -106,6 +107,11 @@ from bmad_assist.ipc.types import (
     StopResult,
     get_event_priority,
 )
+from bmad_assist.ipc.worker import (
+    WORKER_JOB_DONE_MARKER,
+    WorkflowWorker,
+    get_worker_socket_path,
+)
 
 __all__ = [
     # protocol.py - Error codes
@@ -209,4 +215,8 @@ __all__ = [
     "discover_instances",
     "discover_instances_async",
     "probe_instance",
+    # worker.py - Warm workflow worker
+    "WorkflowWorker",
+    "WORKER_JOB_DONE_MARKER",
+    "get_worker_socket_path",
 ]
@@ -582,14 +582,15 @@ class SocketClient:
         self,
         method: str,
         params: dict[str, Any] | None = None,
-        timeout: float = 30.0,
+        timeout: float | None = 30.0,
     ) -> dict[str, Any]:
         """Send a JSON-RPC request and wait for the matching response.
 
         Args:
             method: RPC method name (e.g., "ping", "get_state").
             params: Optional method parameters dict.
-            timeout: Maximum seconds to wait for response.
+            timeout: Maximum seconds to wait for response (None waits
+                indefinitely).
 
         Returns:
             Result dict from the JSON-RPC response.
@@ -901,14 +902,14 @@ class SyncSocketClient:
         self,
         method: str,
         params: dict[str, Any] | None = None,
-        timeout: float = 30.0,
+        timeout: float | None = 30.0,
     ) -> dict[str, Any]:
         """Send a JSON-RPC command and block until response.
 
         Args:
             method: RPC method name.
             params: Optional method parameters.
-            timeout: Maximum seconds to wait.
+            timeout: Maximum seconds to wait (None waits indefinitely).
 
         Returns:
             Result dict from the JSON-RPC response.
@@ -926,7 +927,7 @@ class SyncSocketClient:
             self._inner.send_command(method, params, timeout=timeout),
             self._loop,
         )
-        return future.result(timeout=timeout + 2.0)
+        return future.result(timeout=None if timeout is None else timeout + 2.0)
 
     def subscribe(self, callback: Callable[[dict[str, Any]], Awaitable[None] | None]) -> None:
         """Register an event callback. Thread-safe.
@@ -0,0 +1,443 @@
+"""Warm workflow worker for dashboard-driven loops.
+
+The dashboard runs one workflow per `bmad-assist run` process, so every
+workflow pays interpreter startup, CLI and provider imports, and handler
+registration again. A WorkflowWorker is started once per dashboard loop and
+runs workflows on request instead, keeping imported modules, compiled
+patterns and other process-level caches warm between workflows.
+
+The loaded Config, ProjectPaths, loop config and phase handlers are kept as
+well: each job calls run_loop() directly with them and only re-reads the
+project state, which the previous workflow changed. They are reloaded when
+the size or mtime of any config file (global, CWD or project bmad-assist.yaml,
+or a parent-directory loop config) changes.
+
+The worker speaks the same length-prefixed JSON-RPC 2.0 framing as the
+runner socket (see protocol.py), on a separate per-project socket so
+discovery and stale-socket cleanup (which glob ``*.sock``) never see it.
+The socket is served from a daemon thread; workflows run on the main
+thread because run_loop() installs signal handlers. A job falls back to the
+regular `run` command when sprint-status.yaml is missing, so it can be
+generated exactly as a fresh process would.
+
+Workflow output goes to the worker's stdout as before. After each job the
+worker prints WORKER_JOB_DONE_MARKER so the reader of stdout knows the job's
+output is complete before the JSON-RPC response is processed.
+
+Methods:
+    ping: Health check (same result as the runner socket).
+    run_workflow: Run one `bmad-assist run --no-interactive` worth of loop for
+        the project.
+    shutdown: Exit after the current job.
+
+Cancellation is unchanged: the dashboard starts the worker in its own
+process group and terminates it; run_loop()'s signal handlers hard-kill the
+process as they do for a standalone run.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bmad_assist.ipc.protocol import (
+    ErrorCode,
+    IPCError,
+    compute_project_hash,
+    deserialize,
+    get_socket_dir,
+    make_error_response,
+    make_success_response,
+    read_message,
+    validate_socket_path_length,
+    write_message,
+)
+from bmad_assist.ipc.types import PingResult
+
+if TYPE_CHECKING:
+    from bmad_assist.core.config import Config
+    from bmad_assist.core.paths import ProjectPaths
+
+logger = logging.getLogger(__name__)
+
+WORKER_JOB_DONE_MARKER = "BMAD_WORKER_JOB_DONE:"
+
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
+def get_worker_socket_path(project_root: Path) -> Path:
+    """Get the warm worker socket path for a project.
+
+    Args:
+        project_root: Path to the project root directory.
+
+    Returns:
+        Path to the socket file (e.g., ``~/.bmad-assist/sockets/<hash>.worker``).
+
+    """
+    return get_socket_dir() / f"{compute_project_hash(project_root)}.worker"
+
+
+# (mtime_ns, size) per watched config file, None if missing
+_ConfigSignature = tuple[tuple[int, int] | None, ...]
+
+
+@dataclass
+class _WarmSetup:
+    """Config-derived state reused across jobs while config files are unchanged."""
+
+    config: Config
+    paths: ProjectPaths
+    signature: _ConfigSignature
+    workflows_skipped: bool
+
+
+def _watched_config_files(project_root: Path) -> list[Path]:
+    """Every file load_config_with_project() or load_loop_config() may read."""
+    from bmad_assist.core.config import (
+        GLOBAL_CONFIG_PATH,
+        MAX_LOOP_CONFIG_PARENT_DEPTH,
+        PROJECT_CONFIG_NAME,
+    )
+    from bmad_assist.core.io import get_original_cwd
+
+    files = [GLOBAL_CONFIG_PATH, get_original_cwd() / PROJECT_CONFIG_NAME]
+    current = project_root
+    for _ in range(MAX_LOOP_CONFIG_PARENT_DEPTH + 1):
+        files.append(current / PROJECT_CONFIG_NAME)
+        if current == current.parent:
+            break
+        current = current.parent
+    return files
+
+
+def _config_signature(files: list[Path]) -> _ConfigSignature:
+    """Stat each config file so a changed or new file forces a reload."""
+    signature: list[tuple[int, int] | None] = []
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append(None)
+            continue
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class WorkflowWorker:
+    """Long-lived process that runs dashboard workflows on request.
+
+    Args:
+        project_root: Project the workflows run against.
+        socket_path: Socket to listen on (default: get_worker_socket_path()).
+
+    """
+
+    def __init__(self, project_root: Path, socket_path: Path | None = None) -> None:  # noqa: D107
+        self._project_root = project_root.resolve()
+        self._socket_path = socket_path or get_worker_socket_path(self._project_root)
+        # Jobs handed from the socket thread to the main thread; None means exit
+        self._jobs: queue.Queue[tuple[dict[str, Any], Future[dict[str, Any]]] | None] = (
+            queue.Queue()
+        )
+        self._busy = threading.Lock()
+        self._jobs_run = 0
+        self._ready = threading.Event()
+        self._start_error: BaseException | None = None
+        self._setup: _WarmSetup | None = None
+        self._config_files = _watched_config_files(self._project_root)
+
+    @property
+    def socket_path(self) -> Path:
+        """Socket the worker listens on."""
+        return self._socket_path
+
+    def serve(self) -> int:
+        """Serve workflow requests until shutdown or client disconnect.
+
+        Must be called from the main thread.
+
+        Returns:
+            Number of workflows run.
+
+        Raises:
+            IPCError: If the socket cannot be created.
+
+        """
+        validate_socket_path_length(self._socket_path)
+        self._socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self._socket_path.unlink(missing_ok=True)
+
+        self._preload()
+
+        thread = threading.Thread(target=self._run_socket_loop, name="worker-ipc", daemon=True)
+        thread.start()
+        self._ready.wait()
+        if self._start_error is not None:
+            raise IPCError(f"Worker socket failed to start: {self._start_error}")
+
+        logger.info("Workflow worker listening on %s", self._socket_path)
+        try:
+            while (item := self._jobs.get()) is not None:
+                params, future = item
+                future.set_result(self._run_job(params))
+        finally:
+            self._socket_path.unlink(missing_ok=True)
+        return self._jobs_run
+
+    def _preload(self) -> None:
+        """Import the CLI and loop modules up front so the first job is warm too."""
+        import bmad_assist.cli  # noqa: F401
+        import bmad_assist.core.loop.runner  # noqa: F401
+
+    def _run_job(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Run one workflow on the main thread and print the end-of-job marker."""
+        import typer
+
+        from bmad_assist.cli_utils import EXIT_CONFIG_ERROR, _error, _setup_logging
+        from bmad_assist.core.exceptions import ConfigError
+        from bmad_assist.core.loop.interactive import set_non_interactive
+        from bmad_assist.providers.base import set_stream_mode
+
+        level = str(params.get("log_level", "")).upper()
+        if level in _LOG_LEVELS:
+            os.environ["BMAD_LOG_LEVEL"] = level
+        # Same settings as `run --no-interactive`
+        _setup_logging(verbose=False, quiet=False)
+        set_stream_mode(enabled=False, full=False)
+        set_non_interactive(True)
+
+        self._jobs_run += 1
+        started = time.perf_counter()
+        config_reused = False
+        setup_ms = 0
+        try:
+            setup_started = time.perf_counter()
+            config_reused = self._prepare()
+            setup_ms = int((time.perf_counter() - setup_started) * 1000)
+            exit_code = self._run_warm()
+            # A job that fell back to the `run` command reloaded everything
+            config_reused = config_reused and self._setup is not None
+        except typer.Exit as e:
+            exit_code = e.exit_code
+        except ConfigError as e:
+            _error(str(e))
+            exit_code = EXIT_CONFIG_ERROR
+        except Exception:
+            logger.exception("Workflow job %d failed", self._jobs_run)
+            exit_code = 1
+        if exit_code != 0:
+            # Start the next job from freshly loaded config
+            self._setup = None
+        duration_ms = int((time.perf_counter() - started) * 1000)
+
+        for stream in (sys.stderr, sys.stdout):
+            with contextlib.suppress(Exception):
+                stream.flush()
+        print(f"{WORKER_JOB_DONE_MARKER}{self._jobs_run}", flush=True)
+
+        return {
+            "exit_code": exit_code,
+            "duration_ms": duration_ms,
+            "job": self._jobs_run,
+            "config_reused": config_reused,
+            "setup_ms": setup_ms,
+        }
+
+    def _prepare(self) -> bool:
+        """Load config, paths and handlers unless no config file changed.
+
+        Mirrors the setup done by the `run` command for a non-interactive run.
+
+        Returns:
+            True if the previous job's setup was reused.
+
+        """
+        signature = _config_signature(self._config_files)
+        if self._setup is not None and self._setup.signature == signature:
+            return True
+
+        from bmad_assist.cli import _init_project_paths
+        from bmad_assist.cli_utils import _warning, console
+        from bmad_assist.core.config import (
+            load_config_with_project,
+            load_loop_config,
+            set_loop_config,
+        )
+        from bmad_assist.core.loop.dispatch import init_handlers
+        from bmad_assist.core.project_setup import check_gitignore_warning, ensure_project_setup
+        from bmad_assist.notifications.dispatcher import init_dispatcher
+
+        self._setup = None
+        config = load_config_with_project(project_path=self._project_root)
+        paths = _init_project_paths(config, self._project_root)
+
+        setup_result = ensure_project_setup(
+            self._project_root, include_gitignore=False, force=True, console=console
+        )
+        check_gitignore_warning(self._project_root, config, console)
+        if setup_result.has_skipped:
+            skipped_count = len(setup_result.workflows_skipped)
+            _warning(f"{skipped_count} workflow(s) skipped (local differs from bundled)")
+
+        init_dispatcher(config.notifications)
+        set_loop_config(load_loop_config(self._project_root))
+        init_handlers(config, self._project_root)
+
+        self._setup = _WarmSetup(config, paths, signature, setup_result.has_skipped)
+        logger.info("Worker loaded config and handlers for %s", self._project_root)
+        return False
+
+    def _run_warm(self) -> int:
+        """Run the loop with the prepared setup; falls back to `run` when needed."""
+        from bmad_assist.cli import _finish_run, _load_epic_data
+        from bmad_assist.cli_utils import EXIT_ERROR, EXIT_SUCCESS, _error
+        from bmad_assist.core.loop import run_loop
+
+        setup = self._setup
+        assert setup is not None
+        if setup.paths.find_sprint_status() is None:
+            # The `run` command generates sprint-status.yaml from epic files
+            self._setup = None
+            return self._run_cli()
+
+        # Project state changes with every workflow, so it is read per job
+        try:
+            epic_list, stories_by_epic = _load_epic_data(setup.config, self._project_root)
+        except FileNotFoundError as e:
+            _error(f"BMAD documentation not found: {e}")
+            return EXIT_ERROR
+
+        exit_reason = run_loop(
+            setup.config,
+            self._project_root,
+            epic_list,
+            lambda epic: stories_by_epic.get(epic, []),
+            handlers_ready=True,
+        )
+        _finish_run(exit_reason, workflows_skipped=setup.workflows_skipped)
+        return EXIT_SUCCESS
+
+    def _run_cli(self) -> int:
+        """Run one workflow through the regular `run` command."""
+        from bmad_assist.cli import app
+
+        args = ["run", "--project", str(self._project_root), "--no-interactive"]
+        try:
+            result = app(args, prog_name="bmad-assist", standalone_mode=False)
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 1
+        return result if isinstance(result, int) else 0
+
+    def _run_socket_loop(self) -> None:
+        """Socket thread entry point with its own event loop."""
+        try:
+            asyncio.run(self._serve_socket())
+        except BaseException as e:  # noqa: BLE001
+            self._start_error = e
+            self._ready.set()
+            self._jobs.put(None)
+
+    async def _serve_socket(self) -> None:
+        """Accept a single client and serve it until it disconnects."""
+        claimed = False
+        finished = asyncio.Event()
+
+        async def on_connect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            nonlocal claimed
+            if claimed:
+                writer.close()
+                return
+            claimed = True
+            try:
+                await self._handle_client(reader, writer)
+            finally:
+                writer.close()
+                with contextlib.suppress(OSError, ConnectionError):
+                    await writer.wait_closed()
+                finished.set()
+
+        server = await asyncio.start_unix_server(on_connect, path=str(self._socket_path))
+        os.chmod(self._socket_path, 0o600)
+        self._ready.set()
+        try:
+            await finished.wait()
+        finally:
+            server.close()
+            self._jobs.put(None)
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Read requests until EOF; jobs run concurrently with pings."""
+        tasks: set[asyncio.Task[None]] = set()
+        write_lock = asyncio.Lock()
+
+        async def respond(message: dict[str, Any]) -> None:
+            response = await self._dispatch(message)
+            if response is not None:
+                async with write_lock:
+                    with contextlib.suppress(OSError, ConnectionError):
+                        await write_message(writer, response)
+
+        while True:
+            try:
+                message = deserialize(await read_message(reader))
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            except IPCError as e:
+                logger.warning("Dropping worker client after bad message: %s", e)
+                break
+            task = asyncio.create_task(respond(message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            if message.get("method") == "shutdown":
+                break
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _dispatch(self, message: dict[str, Any]) -> dict[str, Any] | None:
+        """Route one JSON-RPC request."""
+        method = message.get("method")
+        request_id = message.get("id")
+        params = message.get("params") or {}
+        if request_id is None:
+            return None
+
+        if method == "ping":
+            result = PingResult(pong=True, server_time=datetime.now(UTC).isoformat())
+            return make_success_response(request_id, result.model_dump())
+        if method == "shutdown":
+            return make_success_response(request_id, {"jobs_run": self._jobs_run})
+        if method != "run_workflow":
+            return make_error_response(
+                request_id, ErrorCode.METHOD_NOT_FOUND, data={"method": method}
+            )
+        if not isinstance(params, dict):
+            return make_error_response(
+                request_id, ErrorCode.INVALID_PARAMS, data={"reason": "params must be an object"}
+            )
+        if not self._busy.acquire(blocking=False):
+            return make_error_response(
+                request_id, ErrorCode.RUNNER_BUSY, data={"reason": "a workflow is running"}
+            )
+        try:
+            future: Future[dict[str, Any]] = Future()
+            self._jobs.put((params, future))
+            job_result = await asyncio.wrap_future(future)
+        finally:
+            self._busy.release()
+        return make_success_response(request_id, job_result)
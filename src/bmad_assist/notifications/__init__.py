@@ -8,6 +8,7 @@ This module provides the notification infrastructure including:
 - DiscordProvider for sending notifications via Discord webhook embeds
 - NotificationConfig for YAML configuration of notifications
 - EventDispatcher for routing events to configured providers
+- NotificationWorker for background delivery with event digests
 - Global accessor functions (init_dispatcher, get_dispatcher, reset_dispatcher)
 - format_duration for human-readable time formatting
 - Workflow label resolution (get_workflow_icon, get_workflow_label, etc.)
@@ -60,6 +61,7 @@ from .events import (
 from .formatter import format_notification
 from .telegram import TelegramProvider
 from .time_format import format_duration
+from .worker import NotificationWorker
 from .workflow_labels import (
     WorkflowNotificationConfig,
     clear_workflow_label_cache,
@@ -103,6 +105,7 @@ __all__ = [
     "init_dispatcher",
     "get_dispatcher",
     "reset_dispatcher",
+    "NotificationWorker",
     # Time formatting
     "format_duration",
     # Workflow labels
@@ -50,6 +50,10 @@ class NotificationProvider(ABC):
 
     This design ensures notification failures don't interrupt the main
     development loop workflow.
+
+    Providers may also override:
+        - send_batch(): Deliver several events as one digest message
+        - aclose(): Release long-lived resources (e.g., pooled HTTP clients)
     """
 
     @property
@@ -82,3 +86,25 @@ class NotificationProvider(ABC):
 
         """
         ...
+
+    async def send_batch(self, items: list[tuple[EventType, EventPayload]]) -> bool:
+        """Send several events as a digest. Returns True if all were delivered.
+
+        The default sends each event on its own; providers whose backend
+        accepts multiple messages per request override this.
+
+        MUST NOT raise exceptions - all errors logged internally.
+
+        Args:
+            items: (event, payload) pairs in the order they occurred.
+
+        Returns:
+            True if every notification was sent successfully.
+
+        """
+        results = [await self.send(event, payload) for event, payload in items]
+        return all(results)
+
+    async def aclose(self) -> None:
+        """Release resources held between sends. Default: nothing to release."""
+        return None
@@ -28,6 +28,7 @@ import httpx
 from .base import NotificationProvider
 from .events import EventPayload, EventType, is_high_priority
 from .formatter import format_notification
+from .http import PooledHTTPClient
 from .masking import mask_url
 
 logger = logging.getLogger(__name__)
@@ -121,6 +122,7 @@ class DiscordProvider(NotificationProvider):
     TIMEOUT_SECONDS = 10.0
     MAX_RETRIES = 2
     BASE_RETRY_DELAY = 1.0  # seconds
+    MAX_EMBEDS_PER_MESSAGE = 10  # Discord webhook limit
 
     def __init__(self, webhook_url: str | None = None) -> None:
         """Initialize Discord provider with credentials.
@@ -134,6 +136,7 @@ class DiscordProvider(NotificationProvider):
 
         """
         self._webhook_url = webhook_url or ""
+        self._http = PooledHTTPClient(timeout=self.TIMEOUT_SECONDS)
 
         if not self._credentials_valid:
             logger.warning(
@@ -154,61 +157,61 @@ class DiscordProvider(NotificationProvider):
         """Return string representation with masked webhook URL."""
         return f"DiscordProvider(webhook_url={mask_url(self._webhook_url)})"
 
-    async def _send_with_retry(self, embed: dict[str, object]) -> bool:
-        """Send embed with retry on transient failures.
+    async def _send_with_retry(self, embeds: list[dict[str, object]]) -> bool:
+        """Send embeds in one webhook message with retry on transient failures.
 
         Args:
-            embed: Discord embed dict to send.
+            embeds: Discord embed dicts to send (at most MAX_EMBEDS_PER_MESSAGE).
 
         Returns:
             True if message sent successfully, False otherwise.
 
         """
-        request_payload = {"embeds": [embed]}
+        request_payload = {"embeds": embeds}
 
         last_error: Exception | None = None
 
-        async with httpx.AsyncClient(timeout=self.TIMEOUT_SECONDS) as client:
-            for attempt in range(self.MAX_RETRIES + 1):
-                try:
-                    response = await client.post(self._webhook_url, json=request_payload)
-
-                    # Discord returns 204 No Content on success
-                    if 200 <= response.status_code < 300:
-                        return True
-
-                    # Non-retryable client error
-                    if not _is_retryable_error(response.status_code, None):
-                        logger.error(
-                            "Discord API error: status=%s",
-                            response.status_code,
-                        )
-                        logger.debug(
-                            "Discord API response body: %s",
-                            response.text[:200] if response.text else "(empty)",
-                        )
-                        return False
-
-                    # Retryable server error - store for logging
-                    last_error = httpx.HTTPStatusError(
-                        f"HTTP {response.status_code}",
-                        request=response.request,
-                        response=response,
-                    )
+        client = self._http.get()
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                response = await client.post(self._webhook_url, json=request_payload)
 
-                except (httpx.TimeoutException, httpx.RequestError) as e:
-                    last_error = e
+                # Discord returns 204 No Content on success
+                if 200 <= response.status_code < 300:
+                    return True
 
-                # Exponential backoff before retry
-                if attempt < self.MAX_RETRIES:
-                    delay = self.BASE_RETRY_DELAY * (2**attempt)
+                # Non-retryable client error
+                if not _is_retryable_error(response.status_code, None):
+                    logger.error(
+                        "Discord API error: status=%s",
+                        response.status_code,
+                    )
                     logger.debug(
-                        "Discord request failed, retrying in %.1fs (attempt %d/%d)",
-                        delay,
-                        attempt + 1,
-                        self.MAX_RETRIES + 1,
+                        "Discord API response body: %s",
+                        response.text[:200] if response.text else "(empty)",
                     )
-                    await asyncio.sleep(delay)
+                    return False
+
+                # Retryable server error - store for logging
+                last_error = httpx.HTTPStatusError(
+                    f"HTTP {response.status_code}",
+                    request=response.request,
+                    response=response,
+                )
+
+            except (httpx.TimeoutException, httpx.RequestError) as e:
+                last_error = e
+
+            # Exponential backoff before retry
+            if attempt < self.MAX_RETRIES:
+                delay = self.BASE_RETRY_DELAY * (2**attempt)
+                logger.debug(
+                    "Discord request failed, retrying in %.1fs (attempt %d/%d)",
+                    delay,
+                    attempt + 1,
+                    self.MAX_RETRIES + 1,
+                )
+                await asyncio.sleep(delay)
 
         # All retries exhausted
         logger.error(
@@ -237,7 +240,7 @@ class DiscordProvider(NotificationProvider):
 
         try:
             embed = _format_embed(event, payload)
-            return await self._send_with_retry(embed)
+            return await self._send_with_retry([embed])
         except Exception as e:
             logger.error(
                 "Notification failed: event=%s, provider=%s, error_type=%s",
@@ -246,3 +249,38 @@ class DiscordProvider(NotificationProvider):
                 type(e).__name__,  # F1 FIX: Only log type, not str(e)
             )
             return False
+
+    async def send_batch(self, items: list[tuple[EventType, EventPayload]]) -> bool:
+        """Send several events as embeds of as few webhook messages as possible.
+
+        MUST NOT raise exceptions - all errors logged internally.
+
+        Args:
+            items: (event, payload) pairs in the order they occurred.
+
+        Returns:
+            True if every message was sent successfully.
+
+        """
+        if not self._credentials_valid:
+            logger.debug("Discord webhook not configured, skipping notification")
+            return False
+
+        try:
+            embeds = [_format_embed(event, payload) for event, payload in items]
+            ok = True
+            for start in range(0, len(embeds), self.MAX_EMBEDS_PER_MESSAGE):
+                chunk = embeds[start : start + self.MAX_EMBEDS_PER_MESSAGE]
+                ok = await self._send_with_retry(chunk) and ok
+            return ok
+        except Exception as e:
+            logger.error(
+                "Notification failed: event=digest, provider=%s, error_type=%s",
+                self.provider_name,
+                type(e).__name__,
+            )
+            return False
+
+    async def aclose(self) -> None:
+        """Close the pooled webhook client."""
+        await self._http.aclose()
@@ -12,20 +12,22 @@ Example:
     >>> dispatcher = get_dispatcher()
     >>> await dispatcher.dispatch(EventType.STORY_STARTED, payload)
 
+Synchronous callers (the loop runner, standalone TEA workflows) use
+dispatcher.submit() instead, which hands the event to a background
+NotificationWorker and returns immediately.
+
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+import threading
 
 from .base import NotificationProvider
 from .config import NotificationConfig, ProviderConfigItem
 from .events import EventPayload, EventType
-
-if TYPE_CHECKING:
-    pass
+from .worker import DEFAULT_SHUTDOWN_TIMEOUT, NotificationWorker
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +57,8 @@ class EventDispatcher:
         self._config = config
         self._providers: list[NotificationProvider] = []
         self._enabled_events = config.enabled_events
+        self._worker: NotificationWorker | None = None
+        self._worker_lock = threading.Lock()
 
         # Lazy instantiation - only create providers if enabled
         if config.enabled:
@@ -182,6 +186,41 @@ class EventDispatcher:
                     event.value,
                 )
 
+    def submit(self, event: EventType, payload: EventPayload) -> bool:
+        """Queue event for background delivery without blocking the caller.
+
+        Starts the background worker on first use. Fire-and-forget: never raises.
+
+        Args:
+            event: Event type to dispatch.
+            payload: Event payload.
+
+        Returns:
+            True if the event was queued for delivery.
+
+        """
+        if not self._should_dispatch(event):
+            return False
+
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = NotificationWorker(self._providers)
+                self._worker.start()
+            worker = self._worker
+        return worker.submit(event, payload)
+
+    def shutdown(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT) -> None:
+        """Deliver queued events and stop the background worker, if started.
+
+        Args:
+            timeout: Seconds to wait for queued events to be delivered.
+
+        """
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.shutdown(timeout)
+
 
 # Global dispatcher instance
 _dispatcher: EventDispatcher | None = None
@@ -201,6 +240,7 @@ def init_dispatcher(config: NotificationConfig | None) -> None:
 
     if _dispatcher is not None:
         logger.warning("Notification dispatcher already initialized, re-initializing")
+        _dispatcher.shutdown()
 
     if config is None or not config.enabled:
         _dispatcher = None
@@ -223,4 +263,6 @@ def get_dispatcher() -> EventDispatcher | None:
 def reset_dispatcher() -> None:
     """Reset global dispatcher (for testing)."""
     global _dispatcher
+    if _dispatcher is not None:
+        _dispatcher.shutdown()
     _dispatcher = None
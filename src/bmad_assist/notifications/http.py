@@ -0,0 +1,67 @@
+"""Long-lived HTTP client shared by notification providers.
+
+Providers used to open a new httpx.AsyncClient per notification, paying a
+TCP connect and TLS handshake for every event. PooledHTTPClient keeps one
+client (and its connection pool) per provider for as long as the event loop
+that created it is alive.
+
+httpx clients are bound to the event loop they first ran on, so get()
+transparently replaces the client when called from a different loop (e.g.
+a provider reused across asyncio.run() calls in tests). The stale client is
+dropped rather than closed, since its loop is no longer available.
+
+Example:
+    >>> http = PooledHTTPClient(timeout=10.0)
+    >>> response = await http.get().post(url, json=body)
+    >>> await http.aclose()
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class PooledHTTPClient:
+    """Lazily created httpx.AsyncClient reused across sends on one event loop.
+
+    Args:
+        timeout: Request timeout in seconds.
+
+    """
+
+    def __init__(self, timeout: float) -> None:  # noqa: D107
+        self._timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running event loop, creating it if needed.
+
+        Must be called from a coroutine.
+
+        Returns:
+            Open httpx.AsyncClient bound to the current event loop.
+
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                logger.debug("Event loop changed, replacing pooled HTTP client")
+            self._client = httpx.AsyncClient(timeout=self._timeout)
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the client if it belongs to the running event loop."""
+        client, self._client = self._client, None
+        if client is None or client.is_closed:
+            return
+        if self._loop is asyncio.get_running_loop():
+            await client.aclose()
+        self._loop = None
@@ -28,6 +28,7 @@ import httpx
 from .base import NotificationProvider
 from .events import EventPayload, EventType
 from .formatter import format_notification
+from .http import PooledHTTPClient
 from .masking import mask_token
 
 logger = logging.getLogger(__name__)
@@ -130,6 +131,7 @@ class TelegramProvider(NotificationProvider):
     TIMEOUT_SECONDS = 10.0
     MAX_RETRIES = 2
     BASE_RETRY_DELAY = 1.0  # seconds
+    MAX_MESSAGE_LENGTH = 4096  # sendMessage text limit
 
     def __init__(
         self,
@@ -149,6 +151,7 @@ class TelegramProvider(NotificationProvider):
         """
         self._bot_token = bot_token or ""
         self._chat_id = chat_id or ""
+        self._http = PooledHTTPClient(timeout=self.TIMEOUT_SECONDS)
 
         if not self._credentials_valid:
             logger.warning(
@@ -198,46 +201,46 @@ class TelegramProvider(NotificationProvider):
 
         last_error: Exception | None = None
 
-        async with httpx.AsyncClient(timeout=self.TIMEOUT_SECONDS) as client:
-            for attempt in range(self.MAX_RETRIES + 1):
-                try:
-                    response = await client.post(url, json=request_payload)
-
-                    if response.status_code == 200:
-                        return True
-
-                    # Non-retryable client error
-                    if not _is_retryable_error(response.status_code, None):
-                        logger.error(
-                            "Telegram API error: status=%s",
-                            response.status_code,
-                        )
-                        logger.debug(
-                            "Telegram API response body: %s",
-                            response.text[:200] if response.text else "(empty)",
-                        )
-                        return False
-
-                    # Retryable server error - store for logging
-                    last_error = httpx.HTTPStatusError(
-                        f"HTTP {response.status_code}",
-                        request=response.request,
-                        response=response,
-                    )
+        client = self._http.get()
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                response = await client.post(url, json=request_payload)
 
-                except (httpx.TimeoutException, httpx.RequestError) as e:
-                    last_error = e
+                if response.status_code == 200:
+                    return True
 
-                # Exponential backoff before retry
-                if attempt < self.MAX_RETRIES:
-                    delay = self.BASE_RETRY_DELAY * (2**attempt)
+                # Non-retryable client error
+                if not _is_retryable_error(response.status_code, None):
+                    logger.error(
+                        "Telegram API error: status=%s",
+                        response.status_code,
+                    )
                     logger.debug(
-                        "Telegram request failed, retrying in %.1fs (attempt %d/%d)",
-                        delay,
-                        attempt + 1,
-                        self.MAX_RETRIES + 1,
+                        "Telegram API response body: %s",
+                        response.text[:200] if response.text else "(empty)",
                     )
-                    await asyncio.sleep(delay)
+                    return False
+
+                # Retryable server error - store for logging
+                last_error = httpx.HTTPStatusError(
+                    f"HTTP {response.status_code}",
+                    request=response.request,
+                    response=response,
+                )
+
+            except (httpx.TimeoutException, httpx.RequestError) as e:
+                last_error = e
+
+            # Exponential backoff before retry
+            if attempt < self.MAX_RETRIES:
+                delay = self.BASE_RETRY_DELAY * (2**attempt)
+                logger.debug(
+                    "Telegram request failed, retrying in %.1fs (attempt %d/%d)",
+                    delay,
+                    attempt + 1,
+                    self.MAX_RETRIES + 1,
+                )
+                await asyncio.sleep(delay)
 
         # All retries exhausted
         logger.error(
@@ -274,3 +277,45 @@ class TelegramProvider(NotificationProvider):
                 type(e).__name__,  # F1 FIX: Only log type, not str(e)
             )
             return False
+
+    async def send_batch(self, items: list[tuple[EventType, EventPayload]]) -> bool:
+        """Send several events joined into as few Telegram messages as possible.
+
+        Messages are separated by a blank line and split so that no combined
+        message exceeds MAX_MESSAGE_LENGTH.
+
+        MUST NOT raise exceptions - all errors logged internally.
+
+        Args:
+            items: (event, payload) pairs in the order they occurred.
+
+        Returns:
+            True if every message was sent successfully.
+
+        """
+        if not self._credentials_valid:
+            logger.debug("Telegram credentials not configured, skipping notification")
+            return False
+
+        try:
+            chunks: list[str] = []
+            for event, payload in items:
+                message = _format_message(event, payload)
+                if chunks and len(chunks[-1]) + 2 + len(message) <= self.MAX_MESSAGE_LENGTH:
+                    chunks[-1] = f"{chunks[-1]}\n\n{message}"
+                else:
+                    chunks.append(message)
+            ok = True
+            for chunk in chunks:
+                ok = await self._send_with_retry(chunk) and ok
+            return ok
+        except Exception as e:
+            logger.error(
+                "Telegram notification failed: event=digest, error_type=%s",
+                type(e).__name__,
+            )
+            return False
+
+    async def aclose(self) -> None:
+        """Close the pooled Bot API client."""
+        await self._http.aclose()
@@ -0,0 +1,288 @@
+"""Background notification worker.
+
+Dispatching used to run ``asyncio.run(dispatcher.dispatch(...))`` on the
+loop thread for every event, so each story/phase notification paid event
+loop creation, a TLS handshake and any retry backoff inline with the
+orchestrator. NotificationWorker moves delivery to one daemon thread with
+a persistent event loop:
+
+- submit() only enqueues and returns immediately. The queue is bounded;
+  when it is full new events are dropped and counted, never blocking the
+  caller.
+- Events are delivered one at a time, in order, through the providers'
+  long-lived pooled HTTP clients (see http.py).
+- Low-priority events arriving within ``digest_window`` seconds of each
+  other are coalesced into one digest (provider.send_batch()). High-priority
+  events (is_high_priority()) flush any pending digest and go out at once.
+- shutdown() delivers everything still queued, closes provider clients and
+  stops the thread. It is registered with atexit when the worker starts,
+  so short-lived commands do not lose their last notifications.
+
+Example:
+    >>> worker = NotificationWorker(providers)
+    >>> worker.start()
+    >>> worker.submit(EventType.STORY_STARTED, payload)
+    True
+    >>> worker.shutdown()
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import threading
+from typing import Final, cast
+
+from .base import NotificationProvider
+from .events import EventPayload, EventType, is_high_priority
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING: Final[int] = 256
+DEFAULT_DIGEST_WINDOW: Final[float] = 2.0  # seconds
+DEFAULT_MAX_DIGEST_SIZE: Final[int] = 20
+DEFAULT_SHUTDOWN_TIMEOUT: Final[float] = 10.0  # seconds
+
+# Queue sentinel: deliver what is pending, then stop the consumer
+_STOP: Final = object()
+
+_Item = tuple[EventType, EventPayload]
+
+
+class NotificationWorker:
+    """Delivers notifications from a background thread.
+
+    Args:
+        providers: Providers to deliver every event to.
+        max_pending: Maximum events waiting in the queue; extra events are dropped.
+        digest_window: Seconds to collect low-priority events into one digest.
+            0 disables coalescing.
+        max_digest_size: Send a digest early once it holds this many events.
+
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        providers: list[NotificationProvider],
+        max_pending: int = DEFAULT_MAX_PENDING,
+        digest_window: float = DEFAULT_DIGEST_WINDOW,
+        max_digest_size: int = DEFAULT_MAX_DIGEST_SIZE,
+    ) -> None:
+        self._providers = providers
+        self._max_pending = max_pending
+        self._digest_window = digest_window
+        self._max_digest_size = max_digest_size
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._dropped = 0
+        self._sent = 0
+        self._closed = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[_Item | threading.Event | object] | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def dropped_count(self) -> int:
+        """Events dropped because the queue was full."""
+        return self._dropped
+
+    @property
+    def sent_count(self) -> int:
+        """Events handed to providers (digests count each event)."""
+        return self._sent
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker thread is accepting events."""
+        return self._thread is not None and self._thread.is_alive() and not self._closed
+
+    def start(self) -> None:
+        """Start the worker thread; repeated calls are no-ops."""
+        with self._lock:
+            if self._thread is not None or self._closed:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._queue = asyncio.Queue()
+            ready = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(ready,), name="notification-worker", daemon=True
+            )
+            self._thread.start()
+        ready.wait()
+        atexit.register(self.shutdown)
+
+    def submit(self, event: EventType, payload: EventPayload) -> bool:
+        """Queue an event for delivery without waiting for it.
+
+        Args:
+            event: Event type to deliver.
+            payload: Event payload.
+
+        Returns:
+            True if queued, False if the worker is stopped or the queue is full.
+
+        """
+        with self._lock:
+            if self._closed or self._loop is None:
+                return False
+            if self._pending >= self._max_pending:
+                self._dropped += 1
+                if self._dropped == 1:
+                    logger.warning(
+                        "Notification queue full (%d pending), dropping events",
+                        self._pending,
+                    )
+                return False
+            self._pending += 1
+        self._put((event, payload))
+        return True
+
+    def flush(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT) -> bool:
+        """Deliver everything queued so far, including a pending digest.
+
+        Args:
+            timeout: Seconds to wait for delivery.
+
+        Returns:
+            True if delivery finished within the timeout.
+
+        """
+        if not self.is_running:
+            return True
+        done = threading.Event()
+        self._put(done)
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT) -> None:
+        """Deliver queued events, close provider clients and stop the thread.
+
+        Args:
+            timeout: Seconds to wait for the worker to finish.
+
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        atexit.unregister(self.shutdown)
+        if self._thread is None:
+            return
+
+        self._put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(
+                "Notification worker did not finish within %.1fs, %d events undelivered",
+                timeout,
+                self._pending,
+            )
+        if self._dropped:
+            logger.info("Notification worker dropped %d events (queue full)", self._dropped)
+
+    def _put(self, item: _Item | threading.Event | object) -> None:
+        """Hand an item to the worker loop from any thread."""
+        assert self._loop is not None and self._queue is not None
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError:
+            # Loop already closed (worker finished); nothing left to deliver to
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _run(self, ready: threading.Event) -> None:
+        """Thread entry point: run the consumer, then close provider clients."""
+        assert self._loop is not None
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(ready.set)
+        try:
+            self._loop.run_until_complete(self._consume())
+            self._loop.run_until_complete(self._close_providers())
+        except Exception:
+            logger.exception("Notification worker crashed")
+        finally:
+            self._loop.close()
+
+    async def _consume(self) -> None:
+        """Deliver queued events in order, coalescing low-priority ones."""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        digest: list[_Item] = []
+        deadline = 0.0
+
+        while True:
+            timeout = max(deadline - loop.time(), 0.0) if digest else None
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except TimeoutError:
+                await self._deliver(digest)
+                digest = []
+                continue
+
+            if item is _STOP:
+                await self._deliver(digest)
+                return
+            if isinstance(item, threading.Event):
+                await self._deliver(digest)
+                digest = []
+                item.set()
+                continue
+
+            # Anything else on the queue is an event tuple put by submit()
+            event, payload = cast(_Item, item)
+            with self._lock:
+                self._pending -= 1
+            if is_high_priority(event) or self._digest_window <= 0:
+                await self._deliver(digest)
+                digest = []
+                await self._deliver([(event, payload)])
+                continue
+
+            if not digest:
+                deadline = loop.time() + self._digest_window
+            digest.append((event, payload))
+            if len(digest) >= self._max_digest_size:
+                await self._deliver(digest)
+                digest = []
+
+    async def _deliver(self, items: list[_Item]) -> None:
+        """Send one event or a digest to all providers concurrently."""
+        if not items:
+            return
+        if len(items) == 1:
+            event, payload = items[0]
+            coros = [provider.send(event, payload) for provider in self._providers]
+            label = event.value
+        else:
+            coros = [provider.send_batch(items) for provider in self._providers]
+            label = f"digest of {len(items)}"
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        self._sent += len(items)
+
+        success_count = sum(1 for r in results if r is True)
+        logger.info(
+            "Dispatched event=%s to %d/%d providers",
+            label,
+            success_count,
+            len(self._providers),
+        )
+        for provider, result in zip(self._providers, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Provider %s raised exception: %s", provider.provider_name, str(result)
+                )
+            elif result is False:
+                logger.warning(
+                    "Provider %s failed to send event %s", provider.provider_name, label
+                )
+
+    async def _close_providers(self) -> None:
+        """Close long-lived provider resources on the worker loop."""
+        for provider in self._providers:
+            try:
+                await provider.aclose()
+            except Exception as e:
+                logger.debug("Failed to close provider %s: %s", provider.provider_name, e)
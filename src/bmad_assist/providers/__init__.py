@@ -56,10 +56,13 @@ from .base import (
     BaseProvider,
     ExitStatus,
     ProviderResult,
+    StreamCapture,
+    StreamReader,
     calculate_retry_delay,
     is_transient_error,
     read_stream_lines,
     resolve_settings_file,
+    start_stream_reader,
     start_stream_reader_threads,
     validate_settings_file,
 )
@@ -119,6 +122,10 @@ __all__ = [
     "is_transient_error",
     "read_stream_lines",
     "start_stream_reader_threads",
+    # Shared stream multiplexer and output capture (all subprocess providers)
+    "StreamCapture",
+    "StreamReader",
+    "start_stream_reader",
 ]
 
 # Lazy loading for heavy provider imports
@@ -10,9 +10,13 @@ Providers only know how to invoke CLI tools and parse their output. They have
 no knowledge of the main loop or state management.
 
 Output Capture:
-    All providers use subprocess.run() with capture_output=True to capture
-    stdout and stderr as separate strings. Memory handling is delegated to
-    subprocess.run() which uses internal buffering via communicate().
+    Subprocess providers stream stdout and stderr through the shared stream
+    multiplexer and accumulate decoded response text and stderr in
+    StreamCapture buffers. A capture keeps at most CAPTURE_MEMORY_LIMIT
+    characters in memory and spills the rest to an anonymous temp file, so
+    multi-hour sessions with huge tool outputs stay bounded per provider.
+    The raw JSON stream itself is not retained (the debug JSON logger
+    records it when DEBUG logging is enabled).
 
     Typical output sizes for LLM CLI tools:
     - Code reviews: ~10KB-100KB
@@ -20,9 +24,8 @@ Output Capture:
     - Large outputs: ~1MB-10MB
     - Extreme edge cases: >10MB (rare, may be slow but will complete)
 
-    No artificial truncation or streaming is implemented. Python's subprocess
-    module handles memory allocation internally. For the bmad-assist use case,
-    LLM outputs are bounded by context windows and rarely exceed 10MB.
+    No artificial truncation is applied: ProviderResult.stdout holds the
+    complete response text, built once from the capture.
 
 Example:
     >>> from bmad_assist.providers import BaseProvider, ProviderResult
@@ -39,17 +42,24 @@ Example:
 
 """
 
+import codecs
 import contextlib
+import io
+import json
 import logging
+import mmap
 import os
+import selectors
 import signal
+import sys
+import tempfile
 import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from bmad_assist.providers.tool_guard import ToolCallGuard
@@ -223,8 +233,9 @@ def read_stream_lines(
 ) -> None:
     """Read lines from stream, accumulating in chunks and optionally calling callback.
 
-    Generic stream reader for concurrent stdout/stderr processing.
-    Thread-safe when used with separate chunk lists per stream.
+    Blocking reader for streams that cannot be multiplexed (see
+    start_stream_reader()). Thread-safe when used with separate chunk lists
+    per stream.
 
     Args:
         stream: File-like object with readline() method (e.g., process.stdout).
@@ -239,42 +250,556 @@ def read_stream_lines(
     stream.close()
 
 
+# =============================================================================
+# Output Capture (bounded-memory accumulation of provider output)
+# =============================================================================
+
+# Characters buffered in memory before a capture spills to its temp file
+CAPTURE_MEMORY_LIMIT = 1024 * 1024
+
+
+class StreamCapture:
+    """Append-only text buffer that spills to an anonymous temp file.
+
+    Replaces the ``list[str]`` + ``"".join()`` accumulators providers used
+    for response text and stderr. Up to ``memory_limit`` characters are held
+    in memory; past that, buffered text is written to a temporary file
+    (unlinked on creation) and later appends are buffered and flushed the
+    same way, so a long session holds at most one buffer per stream.
+    getvalue() decodes the spill file through mmap, avoiding an extra
+    bytes copy of the whole output.
+
+    Appends may come from a reader thread while the invoking thread reads
+    a partial value (e.g., on timeout), so all operations are locked.
+
+    Args:
+        separator: Inserted between appended parts (like ``separator.join()``).
+        memory_limit: Characters buffered in memory before spilling.
+        on_append: Optional observer called with each appended piece of text,
+            separator included, so the observed stream matches getvalue()
+            (see BaseProvider.invoke()'s text_callback). Returning False
+            makes append() return False.
+
+    Example:
+        >>> capture = StreamCapture(separator=", ")
+        >>> capture.append("first")
+        >>> capture.append("second")
+        >>> capture.getvalue()
+        'first, second'
+
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        separator: str = "",
+        memory_limit: int = CAPTURE_MEMORY_LIMIT,
+        on_append: Callable[[str], bool | None] | None = None,
+    ) -> None:
+        self.separator = separator
+        self.memory_limit = memory_limit
+        self.on_append = on_append
+        self._parts: list[str] = []
+        self._buffered = 0
+        self._count = 0
+        self._file: IO[bytes] | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of parts appended (so ``not capture`` means nothing captured)."""
+        return self._count
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the capture has been written to its temp file."""
+        return self._file is not None
+
+    def append(self, text: str) -> bool:
+        """Append one part, spilling to disk when the memory limit is exceeded.
+
+        Args:
+            text: Text to append.
+
+        Returns:
+            False if on_append asked to stop the stream, True otherwise.
+
+        """
+        observed = text
+        with self._lock:
+            if self._count and self.separator:
+                self._parts.append(self.separator)
+                self._buffered += len(self.separator)
+                observed = self.separator + text
+            self._parts.append(text)
+            self._buffered += len(text)
+            self._count += 1
+            if self._buffered > self.memory_limit:
+                self._flush()
+        return self.on_append is None or self.on_append(observed) is not False
+
+    def getvalue(self) -> str:
+        """Return everything captured so far.
+
+        Returns:
+            The concatenated text, as ``separator.join(parts)`` would give.
+
+        """
+        with self._lock:
+            if self._file is None:
+                return "".join(self._parts)
+            self._flush()
+            self._file.flush()
+            if self._file.tell() == 0:
+                return ""
+            with (
+                mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                return str(view, "utf-8", "surrogatepass")
+
+    def close(self) -> None:
+        """Release the buffer and spill file. Later appends start a new capture."""
+        with self._lock:
+            self._parts.clear()
+            self._buffered = 0
+            self._count = 0
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "StreamCapture":  # noqa: D105
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:  # noqa: D105
+        self.close()
+
+    def _flush(self) -> None:
+        """Move buffered parts to the spill file (lock must be held)."""
+        if not self._parts:
+            return
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(  # noqa: SIM115 - closed in close()
+                prefix="bmad-capture-"
+            )
+            logger.debug("Output capture exceeded %d chars, spilling to disk", self.memory_limit)
+        self._file.write("".join(self._parts).encode("utf-8", "surrogatepass"))
+        self._parts.clear()
+        self._buffered = 0
+
+
+# =============================================================================
+# Stream Multiplexing (one selector thread reads every provider pipe)
+# =============================================================================
+
+# Called with each line read from a stream (newline included, as readline()
+# returns it). Returning False stops reading: the stream is closed and its
+# reader finishes. Handlers run on the shared reader thread and must not block.
+LineHandler = Callable[[str], bool | None]
+
+# Bytes requested per os.read() on a ready pipe
+STREAM_READ_SIZE = 64 * 1024
+
+
+class StreamReader:
+    """Handle for one stream read by the stream multiplexer.
+
+    Offers the parts of threading.Thread that providers use (join() and
+    is_alive()), so waiting for a reader looks the same as waiting for a
+    reader thread did.
+
+    Attributes:
+        stream: Stream being read.
+
+    """
+
+    def __init__(self, stream: Any, handler: LineHandler) -> None:  # noqa: D107
+        self.stream = stream
+        self._handler = handler
+        # write_progress() attributes dashboard output to the thread's active
+        # provider; carry the caller's over to the reader thread
+        self._provider = get_active_provider()
+        self._done = threading.Event()
+        self._decoder: codecs.IncrementalDecoder | None = None
+        self._partial = ""
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait until the stream hits EOF or its handler stops reading.
+
+        Args:
+            timeout: Seconds to wait; None waits indefinitely.
+
+        """
+        self._done.wait(timeout)
+
+    def is_alive(self) -> bool:
+        """Whether the stream is still being read."""
+        return not self._done.is_set()
+
+    def _deliver(self, lines: list[str]) -> bool:
+        """Pass lines to the handler; False if reading should stop."""
+        set_active_provider(self._provider)
+        try:
+            handler = self._handler
+            return all(handler(line) is not False for line in lines)
+        except Exception:
+            logger.exception("Stream line handler failed, stopping reader")
+            return False
+        finally:
+            set_active_provider(None)
+
+    def _feed(self, data: bytes) -> bool:
+        r"""Decode a chunk read from the pipe and deliver complete lines.
+
+        Newlines are translated like a text-mode readline() (\r\n and \r
+        become \n). An empty chunk means EOF: the trailing partial line is
+        delivered without a newline.
+
+        Returns:
+            False if the handler stopped reading.
+
+        """
+        if self._decoder is None:
+            encoding = getattr(self.stream, "encoding", None) or "utf-8"
+            errors = getattr(self.stream, "errors", None) or "strict"
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+        final = not data
+        text = self._partial + self._decoder.decode(data, final)
+        self._partial = ""
+        if not final and text.endswith("\r"):
+            # Might be the first half of \r\n split across reads
+            text, self._partial = text[:-1], "\r"
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        lines = text.split("\n")
+        self._partial = lines.pop() + self._partial
+        lines = [line + "\n" for line in lines]
+        if final and self._partial:
+            lines.append(self._partial)
+            self._partial = ""
+        return not lines or self._deliver(lines)
+
+    def _read_blocking(self) -> None:
+        """Fallback: read the stream with readline() on a dedicated thread."""
+        try:
+            for line in iter(self.stream.readline, ""):
+                if not self._deliver([line]):
+                    break
+        except (OSError, ValueError) as e:
+            logger.debug("Stream reader stopped: %s", e)
+        finally:
+            self._finish()
+
+    def _finish(self) -> None:
+        """Close the stream and release join()ers."""
+        with contextlib.suppress(Exception):
+            self.stream.close()
+        self._done.set()
+
+
+def _selectable_fd(stream: Any) -> int | None:
+    """Return the pipe file descriptor behind a text stream, if it can be selected.
+
+    Only real text-mode pipes (subprocess PIPE with text=True) qualify; other
+    objects, such as test doubles, fall back to a blocking reader thread.
+    """
+    if sys.platform == "win32" or not isinstance(stream, io.TextIOBase):
+        return None
+    try:
+        fd = stream.fileno()
+    except (OSError, ValueError, io.UnsupportedOperation):
+        return None
+    return fd if isinstance(fd, int) else None
+
+
+class StreamMultiplexer:
+    """Reads provider subprocess pipes from a single selector thread.
+
+    Each provider used to start two reader threads per subprocess. With several
+    validators, Deep Verify and benchmarking running in parallel that was
+    dozens of threads contending for the GIL. The multiplexer instead puts
+    every pipe in one selector: a daemon thread reads whichever pipes are
+    ready in STREAM_READ_SIZE chunks, splits them into lines and calls each
+    stream's LineHandler.
+
+    Streams must be registered before anything reads from them, since the
+    pipe is read below the text wrapper. Streams without a selectable file
+    descriptor are read by a blocking readline() thread instead.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        self._lock = threading.Lock()
+        self._selector: selectors.BaseSelector | None = None
+        self._wake_r = -1
+        self._wake_w = -1
+        self._thread: threading.Thread | None = None
+        self._pending: list[tuple[int, StreamReader]] = []
+
+    def add(self, stream: Any, handler: LineHandler) -> StreamReader:
+        """Start reading a stream.
+
+        Args:
+            stream: Text stream to read, usually process.stdout or process.stderr.
+            handler: Called with every line; return False to stop reading.
+
+        Returns:
+            StreamReader to join() once the process has exited.
+
+        """
+        reader = StreamReader(stream, handler)
+        fd = _selectable_fd(stream)
+        if fd is None:
+            threading.Thread(target=reader._read_blocking, daemon=True).start()
+            return reader
+
+        os.set_blocking(fd, False)
+        with self._lock:
+            self._ensure_started()
+            self._pending.append((fd, reader))
+            wake_w = self._wake_w
+        with contextlib.suppress(BlockingIOError):
+            os.write(wake_w, b"\0")
+        return reader
+
+    def reset(self) -> None:
+        """Forget all state (after fork: the reader thread does not survive)."""
+        self._lock = threading.Lock()
+        self._selector = None
+        self._thread = None
+        self._pending = []
+
+    def _ensure_started(self) -> None:
+        """Create the selector, wake-up pipe and thread on first use (lock held)."""
+        if self._thread is not None:
+            return
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._thread = threading.Thread(
+            target=self._run, args=(self._selector,), name="provider-streams", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, selector: selectors.BaseSelector) -> None:
+        """Reader loop: wait for ready pipes and feed their readers.
+
+        An error while serving one stream finishes that stream only. If the
+        loop itself fails, its streams are finished so join() returns, and
+        the multiplexer forgets the thread so the next add() starts a new one.
+        """
+        try:
+            while True:
+                for key, _ in selector.select():
+                    if key.data is None:
+                        self._register_pending(selector)
+                        continue
+                    try:
+                        self._service(selector, key)
+                    except Exception:
+                        logger.exception("Stream reader failed, dropping stream")
+                        with contextlib.suppress(KeyError, ValueError):
+                            selector.unregister(key.fd)
+                        key.data._finish()
+        except Exception:
+            logger.exception("Stream multiplexer loop failed")
+        finally:
+            self._stop(selector)
+
+    def _service(self, selector: selectors.BaseSelector, key: selectors.SelectorKey) -> None:
+        """Read one ready pipe and feed its reader, finishing it at EOF."""
+        reader: StreamReader = key.data
+        try:
+            data = os.read(key.fd, STREAM_READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logger.debug("Stream read failed: %s", e)
+            data = b""
+        if not reader._feed(data) or not data:
+            selector.unregister(key.fd)
+            reader._finish()
+
+    def _stop(self, selector: selectors.BaseSelector) -> None:
+        """Tear down an exited reader loop and restart it for queued streams."""
+        with self._lock:
+            if self._selector is not selector:
+                return  # Reset after fork; nothing here belongs to us
+            wake_r, wake_w = self._wake_r, self._wake_w
+            self._selector = None
+            self._thread = None
+            if self._pending:
+                # Streams added while the loop was dying
+                self._ensure_started()
+                with contextlib.suppress(BlockingIOError):
+                    os.write(self._wake_w, b"\0")
+        for key in list(selector.get_map().values()):
+            if key.data is not None:
+                key.data._finish()
+        selector.close()
+        for fd in (wake_r, wake_w):
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+    def _register_pending(self, selector: selectors.BaseSelector) -> None:
+        """Add streams queued by add() to the selector."""
+        with contextlib.suppress(BlockingIOError):
+            while os.read(self._wake_r, 4096):
+                pass
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for fd, reader in pending:
+            try:
+                stale = selector.get_key(fd)
+            except KeyError:
+                stale = None
+            if stale is not None:
+                # A stream closed by someone else, whose fd number was reused
+                selector.unregister(fd)
+                stale.data._finish()
+            try:
+                selector.register(fd, selectors.EVENT_READ, reader)
+            except (OSError, ValueError) as e:
+                logger.debug("Cannot select stream, reading it on a thread: %s", e)
+                threading.Thread(target=reader._read_blocking, daemon=True).start()
+
+
+_stream_multiplexer = StreamMultiplexer()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_stream_multiplexer.reset)
+
+
+def start_stream_reader(stream: Any, handler: LineHandler) -> StreamReader:
+    """Read a provider subprocess stream on the shared stream multiplexer.
+
+    Args:
+        stream: Text stream to read, usually process.stdout or process.stderr.
+        handler: Called with every line; return False to stop reading.
+
+    Returns:
+        StreamReader to join() once the process has exited.
+
+    """
+    return _stream_multiplexer.add(stream, handler)
+
+
+def json_line_handler(
+    on_message: Callable[[dict[str, Any]], bool | None],
+    color_idx: int | None,
+    log_line: Callable[[str], None] | None = None,
+) -> LineHandler:
+    """Build the LineHandler for a provider's JSONL stdout.
+
+    Blank lines are skipped. Every other line is passed to log_line (the
+    debug JSON logger), parsed and handed to on_message, which decodes the
+    provider-specific events. Lines that are not JSON objects are shown as
+    RAW progress. Raw lines are not kept in memory; the debug JSON logger
+    is their record.
+
+    Args:
+        on_message: Provider decoder; return False to stop reading.
+        color_idx: Color index for progress tags.
+        log_line: Optional callback receiving each stripped non-blank line.
+
+    Returns:
+        LineHandler for start_stream_reader().
+
+    """
+
+    def handle(line: str) -> bool | None:
+        stripped = line.strip()
+        if not stripped:
+            return True
+
+        # Log raw JSON immediately (survives crashes)
+        if log_line is not None:
+            log_line(stripped)
+
+        try:
+            msg = json.loads(stripped)
+        except json.JSONDecodeError:
+            msg = None
+        if not isinstance(msg, dict):
+            if should_print_progress():
+                tag = format_tag("RAW", color_idx)
+                write_progress(f"{tag} {stripped}")
+            return True
+        return on_message(msg)
+
+    return handle
+
+
+def stderr_line_handler(
+    chunks: StreamCapture | list[str],
+    color_idx: int | None,
+    skip_prefixes: tuple[str, ...] = (),
+) -> LineHandler:
+    """Build the LineHandler for a provider's stderr.
+
+    Args:
+        chunks: Capture (or list) collecting every stderr line.
+        color_idx: Color index for progress tags.
+        skip_prefixes: Informational line prefixes not shown as ERR progress.
+
+    Returns:
+        LineHandler for start_stream_reader().
+
+    """
+
+    def handle(line: str) -> bool:
+        chunks.append(line)
+        if should_print_progress():
+            stripped = line.rstrip()
+            if not stripped.startswith(skip_prefixes):
+                tag = format_tag("ERR", color_idx)
+                write_progress(f"{tag} {stripped}")
+        return True
+
+    return handle
+
+
+def _collecting_handler(
+    chunks: StreamCapture | list[str], callback: Callable[[str], None] | None
+) -> LineHandler:
+    """LineHandler that appends each line to chunks and calls callback."""
+
+    def handle(line: str) -> bool:
+        chunks.append(line)
+        if callback is not None:
+            callback(line)
+        return True
+
+    return handle
+
+
 def start_stream_reader_threads(
     process: Any,
-    stdout_chunks: list[str],
-    stderr_chunks: list[str],
+    stdout_chunks: StreamCapture | list[str],
+    stderr_chunks: StreamCapture | list[str],
     stdout_callback: Callable[[str], None] | None = None,
     stderr_callback: Callable[[str], None] | None = None,
-) -> tuple[threading.Thread, threading.Thread]:
-    """Start threads for concurrent stdout/stderr reading.
+) -> tuple[StreamReader, StreamReader]:
+    """Start concurrent stdout/stderr reading.
 
-    Creates and starts two daemon threads that read from process.stdout
-    and process.stderr respectively, accumulating lines into the provided
-    chunk lists.
+    Both pipes are read by the shared stream multiplexer (see
+    start_stream_reader()), accumulating lines into the provided chunk lists.
 
     Args:
         process: Popen process with stdout and stderr pipes.
-        stdout_chunks: List to accumulate stdout lines.
-        stderr_chunks: List to accumulate stderr lines.
+        stdout_chunks: Capture (or list) accumulating stdout lines.
+        stderr_chunks: Capture (or list) accumulating stderr lines.
         stdout_callback: Optional callback for each stdout line.
         stderr_callback: Optional callback for each stderr line.
 
     Returns:
-        Tuple of (stdout_thread, stderr_thread). Caller should join() these
+        Tuple of (stdout_reader, stderr_reader). Caller should join() these
         after process.wait() completes.
 
     """
-    stdout_thread = threading.Thread(
-        target=read_stream_lines,
-        args=(process.stdout, stdout_chunks, stdout_callback),
-    )
-    stderr_thread = threading.Thread(
-        target=read_stream_lines,
-        args=(process.stderr, stderr_chunks, stderr_callback),
+    return (
+        start_stream_reader(process.stdout, _collecting_handler(stdout_chunks, stdout_callback)),
+        start_stream_reader(process.stderr, _collecting_handler(stderr_chunks, stderr_callback)),
     )
-    stdout_thread.start()
-    stderr_thread.start()
-    return stdout_thread, stderr_thread
 
 
 def format_tag(tag: str, color_index: int | None) -> str:
@@ -811,6 +1336,7 @@ class BaseProvider(ABC):
         cancel_token: threading.Event | None = None,
         reasoning_effort: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> ProviderResult:
         """Execute LLM provider with the given prompt.
 
@@ -850,6 +1376,14 @@ class BaseProvider(ABC):
                 Valid values: minimal, low, medium, high, xhigh. Currently
                 only codex provider supports this via -c model_reasoning_effort.
                 Other providers should ignore.
+            text_callback: Optional observer of the response text as it streams,
+                called with each new piece (concatenated, the pieces equal
+                stdout) from a reader thread; it must not block. Returning
+                False asks the provider to end the session early and return
+                the text so far with exit code 0 (e.g., once a streaming report
+                extractor saw its end marker). Providers without early
+                termination keep running; providers without streaming text
+                ignore the callback.
 
         Returns:
             ProviderResult containing stdout, stderr, exit code, and timing.
@@ -17,12 +17,13 @@ Example:
 """
 
 import contextlib
-import json
+import functools
 import logging
 import os
 import signal
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from subprocess import PIPE, Popen, TimeoutExpired
 from typing import TYPE_CHECKING, Any
@@ -40,11 +41,15 @@ from bmad_assist.providers.base import (
     BaseProvider,
     ExitStatus,
     ProviderResult,
+    StreamCapture,
     extract_tool_details,
     format_tag,
     is_full_stream,
+    json_line_handler,
     register_child_pgid,
     should_print_progress,
+    start_stream_reader,
+    stderr_line_handler,
     unregister_child_pgid,
     validate_settings_file,
     write_progress,
@@ -266,6 +271,7 @@ class ClaudeSubprocessProvider(BaseProvider):
         cancel_token: threading.Event | None = None,
         reasoning_effort: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> ProviderResult:
         """Execute Claude Code CLI with the given prompt.
 
@@ -313,6 +319,8 @@ class ClaudeSubprocessProvider(BaseProvider):
             cancel_token: Optional threading.Event for cancellation.
                 When set, the subprocess is terminated using SIGTERM→SIGKILL
                 escalation. Returns partial result with exit_code=-15.
+            text_callback: Observer of streamed response text. Returning False
+                ends the session early, as a detected end marker does.
 
         Returns:
             ProviderResult containing stdout, stderr, exit code, and timing.
@@ -431,9 +439,8 @@ class ClaudeSubprocessProvider(BaseProvider):
         debug_json_logger = DebugJsonLogger()
 
         # Accumulators for stream-json parsing
-        response_text_parts: list[str] = []
-        stderr_chunks: list[str] = []
-        raw_stdout_lines: list[str] = []
+        response_capture = StreamCapture(on_append=text_callback)
+        stderr_capture = StreamCapture()
         child_pgid: int | None = None
 
         try:
@@ -466,207 +473,172 @@ class ClaudeSubprocessProvider(BaseProvider):
                 process.stdin.write(prompt)
                 process.stdin.close()
 
-            def process_json_stream(
-                stream: Any,
-                text_parts: list[str],
-                raw_lines: list[str],
-                json_logger: DebugJsonLogger,
+            # Early termination markers (common end markers from extraction.py + others)
+            end_markers = [
+                "<!-- VALIDATION_REPORT_END -->",
+                "<!-- CODE_REVIEW_REPORT_END -->",
+                "<!-- CODE_REVIEW_SYNTHESIS_END -->",
+                "<!-- VALIDATION_SYNTHESIS_END -->",
+                "<!-- RETROSPECTIVE_REPORT_END -->",
+                "<!-- SECURITY_REPORT_END -->",
+                "<!-- QA_PLAN_END -->",
+                "<!-- REMEDIATE_ESCALATIONS_END -->",
+                "BMAD Method Quality Competition v1.0",
+            ]
+
+            # Completion phrases that indicate task is done
+            completion_phrases = [
+                "successfully completed",
+                "task is done",
+                "task is complete",
+                "synthesis complete",
+                "review complete",
+                "validation complete",
+            ]
+
+            def decode_message(
+                msg: dict[str, Any],
+                text_parts: StreamCapture,
                 color_idx: int | None,
                 term_event: threading.Event | None = None,
-            ) -> None:
-                """Process stream-json output, extracting text and showing progress.
+            ) -> bool:
+                """Decode one stream-json event, extracting text and showing progress.
 
                 Early Termination Detection:
                     Detects common output markers and completion phrases to terminate
-                    the stream early, preventing timeout when LLM doesn't close stream
+                    reading early, preventing timeout when LLM doesn't close stream
                     (known issue with GLM-4.7 and similar models via Claude CLI).
 
                     Termination triggers:
                     - End markers: <!-- *_END --> (VALIDATION_REPORT_END, etc.)
                     - Completion phrases: "successfully completed", "task is done"
                     - After final assistant summary following tool use
+                    - text_callback returning False (report complete across blocks)
                 """
-                # Early termination markers (common end markers from extraction.py + others)
-                end_markers = [
-                    "<!-- VALIDATION_REPORT_END -->",
-                    "<!-- CODE_REVIEW_REPORT_END -->",
-                    "<!-- CODE_REVIEW_SYNTHESIS_END -->",
-                    "<!-- VALIDATION_SYNTHESIS_END -->",
-                    "<!-- RETROSPECTIVE_REPORT_END -->",
-                    "<!-- SECURITY_REPORT_END -->",
-                    "<!-- QA_PLAN_END -->",
-                    "<!-- REMEDIATE_ESCALATIONS_END -->",
-                    "BMAD Method Quality Competition v1.0",
-                ]
-
-                # Completion phrases that indicate task is done
-                completion_phrases = [
-                    "successfully completed",
-                    "task is done",
-                    "task is complete",
-                    "synthesis complete",
-                    "review complete",
-                    "validation complete",
-                ]
-
-                for line in iter(stream.readline, ""):
-                    raw_lines.append(line)
-                    stripped = line.strip()
-                    if not stripped:
-                        continue
-
-                    # Log raw JSON immediately (survives crashes)
-                    json_logger.append(stripped)
-
-                    try:
-                        msg = json.loads(stripped)
-                        msg_type = msg.get("type", "")
-
-                        if msg_type == "system" and msg.get("subtype") == "init":
-                            # Session started
-                            session_id = msg.get("session_id", "?")
+                msg_type = msg.get("type", "")
+
+                if msg_type == "system" and msg.get("subtype") == "init":
+                    # Session started
+                    session_id = msg.get("session_id", "?")
+                    if should_print_progress():
+                        tag = format_tag("INIT", color_idx)
+                        write_progress(f"{tag} Session: {session_id}")
+
+                elif msg_type == "assistant":
+                    # Assistant message with content
+                    message = msg.get("message", {})
+                    for block in message.get("content", []):
+                        if block.get("type") == "text":
+                            text = block.get("text", "")
+                            # text_callback (e.g., a streaming report extractor)
+                            # returns False once it has what it needs
+                            should_terminate = not text_parts.append(text)
+                            if should_terminate:
+                                logger.info("Early termination: requested by text callback")
+
+                            # Check for early termination markers/phrases
+                            text_lower = text.lower()
+
+                            # Check end markers
+                            for marker in end_markers:
+                                if marker in text:
+                                    logger.info("Early termination: detected end marker %s", marker)
+                                    should_terminate = True
+                                    break
+
+                            # Check completion phrases
+                            if not should_terminate:
+                                for phrase in completion_phrases:
+                                    if phrase in text_lower:
+                                        logger.info(
+                                            "Early termination: detected completion phrase '%s'",
+                                            phrase,
+                                        )
+                                        should_terminate = True
+                                        break
+
                             if should_print_progress():
-                                tag = format_tag("INIT", color_idx)
-                                write_progress(f"{tag} Session: {session_id}")
-
-                        elif msg_type == "assistant":
-                            # Assistant message with content
-                            message = msg.get("message", {})
-                            for block in message.get("content", []):
-                                if block.get("type") == "text":
-                                    text = block.get("text", "")
-                                    text_parts.append(text)
-
-                                    # Check for early termination markers/phrases
-                                    text_lower = text.lower()
-                                    should_terminate = False
-
-                                    # Check end markers
-                                    for marker in end_markers:
-                                        if marker in text:
-                                            logger.info(
-                                                "Early termination: detected end marker %s", marker
-                                            )
-                                            should_terminate = True
-                                            break
-
-                                    # Check completion phrases
-                                    if not should_terminate:
-                                        for phrase in completion_phrases:
-                                            if phrase in text_lower:
-                                                logger.info(
-                                                    "Early termination: detected completion phrase '%s'",
-                                                    phrase,
-                                                )
-                                                should_terminate = True
-                                                break
-
-                                    if should_print_progress():
-                                        if is_full_stream():
-                                            tag = format_tag("ASSISTANT", color_idx)
-                                            write_progress(f"{tag} {text}")
-                                        else:
-                                            preview = text[:100].replace("\n", " ")
-                                            if len(text) > 100:
-                                                preview += "..."
-                                            tag = format_tag("ASSISTANT", color_idx)
-                                            write_progress(f"{tag} {preview}")
-
-                                    # Terminate stream if marker/phrase detected
-                                    if should_terminate:
-                                        if should_print_progress():
-                                            tag = format_tag("TERM", color_idx)
-                                            write_progress(f"{tag} Stream terminated early")
-                                        if term_event is not None:
-                                            term_event.set()
-                                        stream.close()
-                                        return
-                                elif block.get("type") == "tool_use":
-                                    tool_name = block.get("name", "?")
-                                    tool_input = block.get("input", {})
-                                    # Guard check
-                                    if guard is not None:
-                                        verdict = guard.check(tool_name, tool_input)
-                                        if not verdict.allowed:
-                                            logger.warning(
-                                                "ToolCallGuard triggered: %s",
-                                                verdict.reason,
-                                            )
-                                            guard_triggered_event.set()
-                                            stream.close()
-                                            return
-                                    if should_print_progress():
-                                        if is_full_stream():
-                                            import json as _json
-
-                                            tag = format_tag(f"TOOL {tool_name}", color_idx)
-                                            write_progress(
-                                                f"{tag} {_json.dumps(tool_input, indent=2)}"
-                                            )
-                                        else:
-                                            details = extract_tool_details(tool_name, tool_input)
-                                            tag = format_tag(f"TOOL {tool_name}", color_idx)
-                                            if details:
-                                                write_progress(f"{tag} {details}")
-                                            else:
-                                                write_progress(f"{tag}")
-
-                        elif msg_type == "result":
-                            # Final result with stats
+                                if is_full_stream():
+                                    tag = format_tag("ASSISTANT", color_idx)
+                                    write_progress(f"{tag} {text}")
+                                else:
+                                    preview = text[:100].replace("\n", " ")
+                                    if len(text) > 100:
+                                        preview += "..."
+                                    tag = format_tag("ASSISTANT", color_idx)
+                                    write_progress(f"{tag} {preview}")
+
+                            # Terminate stream if marker/phrase detected
+                            if should_terminate:
+                                if should_print_progress():
+                                    tag = format_tag("TERM", color_idx)
+                                    write_progress(f"{tag} Stream terminated early")
+                                if term_event is not None:
+                                    term_event.set()
+                                return False
+                        elif block.get("type") == "tool_use":
+                            tool_name = block.get("name", "?")
+                            tool_input = block.get("input", {})
+                            # Guard check
+                            if guard is not None:
+                                verdict = guard.check(tool_name, tool_input)
+                                if not verdict.allowed:
+                                    logger.warning(
+                                        "ToolCallGuard triggered: %s",
+                                        verdict.reason,
+                                    )
+                                    guard_triggered_event.set()
+                                    return False
                             if should_print_progress():
-                                cost = msg.get("total_cost_usd", 0)
-                                duration = msg.get("duration_ms", 0)
-                                turns = msg.get("num_turns", 0)
-                                tag = format_tag("RESULT", color_idx)
-                                write_progress(f"{tag} ${cost:.4f} | {duration}ms | {turns} turns")
-                            # Extract final result text if present
-                            if "result" in msg:
-                                text_parts.append(msg["result"])
-
-                    except json.JSONDecodeError:
-                        # Non-JSON line, just accumulate
-                        if should_print_progress():
-                            tag = format_tag("RAW", color_idx)
-                            write_progress(f"{tag} {stripped}")
-
-                stream.close()
-
-            def read_stderr(
-                stream: Any,
-                chunks: list[str],
-                color_idx: int | None,
-            ) -> None:
-                """Read stderr stream."""
-                for line in iter(stream.readline, ""):
-                    chunks.append(line)
+                                if is_full_stream():
+                                    import json as _json
+
+                                    tag = format_tag(f"TOOL {tool_name}", color_idx)
+                                    write_progress(f"{tag} {_json.dumps(tool_input, indent=2)}")
+                                else:
+                                    details = extract_tool_details(tool_name, tool_input)
+                                    tag = format_tag(f"TOOL {tool_name}", color_idx)
+                                    if details:
+                                        write_progress(f"{tag} {details}")
+                                    else:
+                                        write_progress(f"{tag}")
+
+                elif msg_type == "result":
+                    # Final result with stats
                     if should_print_progress():
-                        tag = format_tag("ERR", color_idx)
-                        write_progress(f"{tag} {line.rstrip()}")
-                stream.close()
+                        cost = msg.get("total_cost_usd", 0)
+                        duration = msg.get("duration_ms", 0)
+                        turns = msg.get("num_turns", 0)
+                        tag = format_tag("RESULT", color_idx)
+                        write_progress(f"{tag} ${cost:.4f} | {duration}ms | {turns} turns")
+                    # Extract final result text if present
+                    if "result" in msg:
+                        text_parts.append(msg["result"])
+
+                return True
 
             # Event signaled by stdout reader on early termination
             early_term_event = threading.Event()
             # Event signaled by stdout reader when guard triggers
             guard_triggered_event = threading.Event()
 
-            # Start reader threads
-            stdout_thread = threading.Thread(
-                target=process_json_stream,
-                args=(
-                    process.stdout,
-                    response_text_parts,
-                    raw_stdout_lines,
-                    debug_json_logger,
+            # Read both pipes on the shared stream multiplexer
+            stdout_reader = start_stream_reader(
+                process.stdout,
+                json_line_handler(
+                    functools.partial(
+                        decode_message,
+                        text_parts=response_capture,
+                        color_idx=color_index,
+                        term_event=early_term_event,
+                    ),
                     color_index,
-                    early_term_event,
+                    log_line=debug_json_logger.append,
                 ),
             )
-            stderr_thread = threading.Thread(
-                target=read_stderr,
-                args=(process.stderr, stderr_chunks, color_index),
+            stderr_reader = start_stream_reader(
+                process.stderr, stderr_line_handler(stderr_capture, color_index)
             )
-            stdout_thread.start()
-            stderr_thread.start()
 
             if should_print_progress():
                 shown_model = display_model or effective_model
@@ -708,14 +680,14 @@ class ClaudeSubprocessProvider(BaseProvider):
                 # Check for timeout
                 if time.perf_counter() >= deadline:
                     process.kill()
-                    stdout_thread.join(timeout=1)
-                    stderr_thread.join(timeout=1)
+                    stdout_reader.join(timeout=1)
+                    stderr_reader.join(timeout=1)
                     duration_ms = int((time.perf_counter() - start_time) * 1000)
                     truncated = _truncate_prompt(prompt)
 
                     partial_result = ProviderResult(
-                        stdout="".join(response_text_parts),
-                        stderr="".join(stderr_chunks),
+                        stdout=response_capture.getvalue(),
+                        stderr=stderr_capture.getvalue(),
                         exit_code=-1,
                         duration_ms=duration_ms,
                         model=effective_model,
@@ -752,8 +724,8 @@ class ClaudeSubprocessProvider(BaseProvider):
                     continue
 
             # Wait for threads to finish (timeout prevents hang if reader stuck)
-            stdout_thread.join(timeout=10)
-            stderr_thread.join(timeout=10)
+            stdout_reader.join(timeout=10)
+            stderr_reader.join(timeout=10)
 
             # Clear current process and unregister from signal handler
             if child_pgid is not None:
@@ -767,7 +739,7 @@ class ClaudeSubprocessProvider(BaseProvider):
                 debug_json_logger.close()
                 logger.info("Returning cancelled result after %dms", duration_ms)
                 return ProviderResult(
-                    stdout="".join(response_text_parts),
+                    stdout=response_capture.getvalue(),
                     stderr="Cancelled by user",
                     exit_code=-15,
                     duration_ms=duration_ms,
@@ -778,8 +750,8 @@ class ClaudeSubprocessProvider(BaseProvider):
             # Store results for unified handling below
             final_returncode = returncode
             # Use extracted text parts, not raw JSON stream
-            final_stdout = "".join(response_text_parts)
-            final_stderr = "".join(stderr_chunks)
+            final_stdout = response_capture.getvalue()
+            final_stderr = stderr_capture.getvalue()
 
         except FileNotFoundError as e:
             logger.error("Claude CLI not found in PATH")
@@ -789,6 +761,10 @@ class ClaudeSubprocessProvider(BaseProvider):
                 self._current_process = None
             debug_json_logger.close()
             raise ProviderError("Claude CLI not found. Is 'claude' in PATH?") from e
+        finally:
+            # Output was copied out with getvalue(); release any spill files
+            response_capture.close()
+            stderr_capture.close()
 
         duration_ms = int((time.perf_counter() - start_time) * 1000)
 
@@ -31,7 +31,7 @@ import os
 import shutil
 import threading
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -219,6 +219,7 @@ class ClaudeSDKProvider(BaseProvider):
         color_index: int | None = None,
         display_model: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> str:
         """Execute SDK query asynchronously using ClaudeSDKClient.
 
@@ -417,9 +418,16 @@ class ClaudeSDKProvider(BaseProvider):
                             text = block.text
                             response_parts.append(text)
 
+                            # text_callback (e.g., a streaming report extractor)
+                            # returns False once it has what it needs
+                            should_terminate = (
+                                text_callback is not None and text_callback(text) is False
+                            )
+                            if should_terminate:
+                                logger.info("Early termination: requested by text callback")
+
                             # Check for early termination markers/phrases
                             text_lower = text.lower()
-                            should_terminate = False
 
                             # Check end markers
                             for marker in end_markers:
@@ -521,6 +529,7 @@ class ClaudeSDKProvider(BaseProvider):
         color_index: int | None = None,
         display_model: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> str:
         """Execute SDK query with cancel_token support.
 
@@ -550,7 +559,15 @@ class ClaudeSDKProvider(BaseProvider):
         """
         sdk_task = asyncio.create_task(
             self._invoke_async(
-                prompt, model, settings, cwd, allowed_tools, color_index, display_model, guard=guard
+                prompt,
+                model,
+                settings,
+                cwd,
+                allowed_tools,
+                color_index,
+                display_model,
+                guard=guard,
+                text_callback=text_callback,
             )
         )
 
@@ -604,6 +621,7 @@ class ClaudeSDKProvider(BaseProvider):
         cancel_token: threading.Event | None = None,
         reasoning_effort: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> ProviderResult:
         """Execute Claude Code SDK with the given prompt.
 
@@ -625,6 +643,8 @@ class ClaudeSDKProvider(BaseProvider):
                 Uses SDK's 'tools' parameter to set explicit tool list.
             no_cache: Disable caching (ignored - SDK doesn't support).
             color_index: Color index for terminal output differentiation.
+            text_callback: Observer of streamed response text. Returning False
+                ends the session early, as a detected end marker does.
 
         Returns:
             ProviderResult containing:
@@ -690,6 +710,7 @@ class ClaudeSDKProvider(BaseProvider):
                 display_model=display_model,
                 cancel_token=cancel_token,
                 guard=guard,
+                text_callback=text_callback,
             )
 
         # Ignored parameters (SDK doesn't support these)
@@ -759,6 +780,7 @@ class ClaudeSDKProvider(BaseProvider):
                         color_index,
                         display_model,
                         guard=guard,
+                        text_callback=text_callback,
                     )
                 )
             else:
@@ -773,6 +795,7 @@ class ClaudeSDKProvider(BaseProvider):
                             color_index,
                             display_model,
                             guard=guard,
+                            text_callback=text_callback,
                         ),
                         timeout=effective_timeout,
                     )
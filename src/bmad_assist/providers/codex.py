@@ -27,10 +27,11 @@ Example:
 """
 
 import contextlib
-import json
+import functools
 import logging
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from subprocess import PIPE, Popen, TimeoutExpired
 from typing import TYPE_CHECKING, Any
@@ -48,9 +49,13 @@ from bmad_assist.providers.base import (
     BaseProvider,
     ExitStatus,
     ProviderResult,
+    StreamCapture,
     format_tag,
     is_full_stream,
+    json_line_handler,
     should_print_progress,
+    start_stream_reader,
+    stderr_line_handler,
     validate_settings_file,
     write_progress,
 )
@@ -207,6 +212,7 @@ class CodexProvider(BaseProvider):
         cancel_token: threading.Event | None = None,
         reasoning_effort: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> ProviderResult:
         """Execute Codex CLI with the given prompt using JSON streaming.
 
@@ -244,6 +250,8 @@ class CodexProvider(BaseProvider):
             color_index: Color index for terminal output differentiation.
             reasoning_effort: Reasoning effort level (minimal/low/medium/high/xhigh).
                 Passed to Codex CLI as -c model_reasoning_effort="VALUE".
+            text_callback: Observer of streamed response text. Early termination
+                is not supported, so its return value is ignored.
 
         Returns:
             ProviderResult containing extracted text, stderr, exit code, and timing.
@@ -336,9 +344,8 @@ class CodexProvider(BaseProvider):
         debug_json_logger = DebugJsonLogger()
 
         # Accumulators for JSON stream parsing
-        response_text_parts: list[str] = []
-        stderr_chunks: list[str] = []
-        raw_stdout_lines: list[str] = []
+        response_capture = StreamCapture(separator="\n", on_append=text_callback)
+        stderr_capture = StreamCapture()
         thread_id: str | None = None
 
         start_time = time.perf_counter()
@@ -356,113 +363,79 @@ class CodexProvider(BaseProvider):
                 start_new_session=True,  # Own process group for safe termination
             )
 
-            def process_json_stream(
-                stream: Any,
-                text_parts: list[str],
-                raw_lines: list[str],
-                json_logger: DebugJsonLogger,
+            def decode_message(
+                msg: dict[str, Any],
+                text_parts: StreamCapture,
                 color_idx: int | None,
-            ) -> None:
-                """Process Codex --json output, extracting text and logging events."""
+            ) -> bool:
+                """Decode one Codex --json event, extracting agent message text."""
                 nonlocal thread_id
-                for line in iter(stream.readline, ""):
-                    raw_lines.append(line)
-                    stripped = line.strip()
-                    if not stripped:
-                        continue
-
-                    # Log raw JSON immediately (survives crashes)
-                    json_logger.append(stripped)
-
-                    try:
-                        msg = json.loads(stripped)
-                        msg_type = msg.get("type", "")
+                msg_type = msg.get("type", "")
 
-                        if msg_type == "thread.started":
-                            thread_id = msg.get("thread_id", "?")
-                            if should_print_progress():
-                                tag = format_tag("INIT", color_idx)
-                                write_progress(f"{tag} Thread: {thread_id}")
-
-                        elif msg_type == "item.completed":
-                            item = msg.get("item", {})
-                            item_type = item.get("type", "")
-                            if item_type == "agent_message":
-                                text = item.get("text", "")
-                                if text:
-                                    text_parts.append(text)
-                                    if should_print_progress():
-                                        tag = format_tag("MESSAGE", color_idx)
-                                        if is_full_stream():
-                                            write_progress(f"{tag} {text}")
-                                        else:
-                                            preview = text[:200]
-                                            if len(text) > 200:
-                                                preview += "..."
-                                            write_progress(f"{tag} {preview}")
-                            elif item_type == "command_execution":
-                                if should_print_progress():
-                                    cmd = item.get("command", "?")
-                                    tag = format_tag("CMD", color_idx)
-                                    if is_full_stream():
-                                        write_progress(f"{tag} {cmd}")
-                                    else:
-                                        cmd_preview = cmd[:60]
-                                        if len(cmd) > 60:
-                                            cmd_preview += "..."
-                                        write_progress(f"{tag} {cmd_preview}")
-
-                        elif msg_type == "turn.completed":
-                            if should_print_progress():
-                                usage = msg.get("usage", {})
-                                input_tokens = usage.get("input_tokens", 0)
-                                output_tokens = usage.get("output_tokens", 0)
-                                tag = format_tag("TURN", color_idx)
-                                write_progress(f"{tag} in={input_tokens} out={output_tokens}")
-
-                        elif msg_type == "error":
+                if msg_type == "thread.started":
+                    thread_id = msg.get("thread_id", "?")
+                    if should_print_progress():
+                        tag = format_tag("INIT", color_idx)
+                        write_progress(f"{tag} Thread: {thread_id}")
+
+                elif msg_type == "item.completed":
+                    item = msg.get("item", {})
+                    item_type = item.get("type", "")
+                    if item_type == "agent_message":
+                        text = item.get("text", "")
+                        if text:
+                            text_parts.append(text)
                             if should_print_progress():
-                                error_msg = msg.get("message", str(msg))
-                                tag = format_tag("ERROR", color_idx)
-                                write_progress(f"{tag} {error_msg}")
-
-                    except json.JSONDecodeError:
+                                tag = format_tag("MESSAGE", color_idx)
+                                if is_full_stream():
+                                    write_progress(f"{tag} {text}")
+                                else:
+                                    preview = text[:200]
+                                    if len(text) > 200:
+                                        preview += "..."
+                                    write_progress(f"{tag} {preview}")
+                    elif item_type == "command_execution":
                         if should_print_progress():
-                            tag = format_tag("RAW", color_idx)
-                            write_progress(f"{tag} {stripped}")
-
-                stream.close()
+                            cmd = item.get("command", "?")
+                            tag = format_tag("CMD", color_idx)
+                            if is_full_stream():
+                                write_progress(f"{tag} {cmd}")
+                            else:
+                                cmd_preview = cmd[:60]
+                                if len(cmd) > 60:
+                                    cmd_preview += "..."
+                                write_progress(f"{tag} {cmd_preview}")
+
+                elif msg_type == "turn.completed":
+                    if should_print_progress():
+                        usage = msg.get("usage", {})
+                        input_tokens = usage.get("input_tokens", 0)
+                        output_tokens = usage.get("output_tokens", 0)
+                        tag = format_tag("TURN", color_idx)
+                        write_progress(f"{tag} in={input_tokens} out={output_tokens}")
 
-            def read_stderr(
-                stream: Any,
-                chunks: list[str],
-                color_idx: int | None,
-            ) -> None:
-                """Read stderr stream."""
-                for line in iter(stream.readline, ""):
-                    chunks.append(line)
+                elif msg_type == "error":
                     if should_print_progress():
-                        tag = format_tag("ERR", color_idx)
-                        write_progress(f"{tag} {line.rstrip()}")
-                stream.close()
-
-            # Start reader threads
-            stdout_thread = threading.Thread(
-                target=process_json_stream,
-                args=(
-                    process.stdout,
-                    response_text_parts,
-                    raw_stdout_lines,
-                    debug_json_logger,
+                        error_msg = msg.get("message", str(msg))
+                        tag = format_tag("ERROR", color_idx)
+                        write_progress(f"{tag} {error_msg}")
+
+                return True
+
+            # Read both pipes on the shared stream multiplexer
+            stdout_reader = start_stream_reader(
+                process.stdout,
+                json_line_handler(
+                    functools.partial(
+                        decode_message, text_parts=response_capture, color_idx=color_index
+                    ),
                     color_index,
+                    log_line=debug_json_logger.append,
                 ),
             )
-            stderr_thread = threading.Thread(
-                target=read_stderr,
-                args=(process.stderr, stderr_chunks, color_index),
+            stderr_reader = start_stream_reader(
+                process.stderr, stderr_line_handler(stderr_capture, color_index)
             )
-            stdout_thread.start()
-            stderr_thread.start()
 
             # Write prompt to stdin in a separate thread to avoid deadlock
             # (if prompt > pipe buffer size and codex writes stdout before
@@ -492,14 +465,14 @@ class CodexProvider(BaseProvider):
             except TimeoutExpired:
                 process.kill()
                 stdin_thread.join(timeout=1)
-                stdout_thread.join(timeout=1)
-                stderr_thread.join(timeout=1)
+                stdout_reader.join(timeout=1)
+                stderr_reader.join(timeout=1)
                 duration_ms = int((time.perf_counter() - start_time) * 1000)
                 truncated = _truncate_prompt(prompt)
 
                 partial_result = ProviderResult(
-                    stdout="".join(response_text_parts),
-                    stderr="".join(stderr_chunks),
+                    stdout=response_capture.getvalue(),
+                    stderr=stderr_capture.getvalue(),
                     exit_code=-1,
                     duration_ms=duration_ms,
                     model=effective_model,
@@ -523,17 +496,23 @@ class CodexProvider(BaseProvider):
 
             # Wait for threads to finish (timeout prevents hang if reader stuck)
             stdin_thread.join(timeout=5)
-            stdout_thread.join(timeout=10)
-            stderr_thread.join(timeout=10)
+            stdout_reader.join(timeout=10)
+            stderr_reader.join(timeout=10)
+
+            # Combine extracted text parts
+            response_text = response_capture.getvalue()
+            stderr_content = stderr_capture.getvalue()
 
         except FileNotFoundError as e:
             logger.error("Codex CLI not found in PATH")
             raise ProviderError("Codex CLI not found. Is 'codex' in PATH?") from e
         finally:
             debug_json_logger.close()
+            # Release any spill files; the text was copied out above
+            response_capture.close()
+            stderr_capture.close()
 
         duration_ms = int((time.perf_counter() - start_time) * 1000)
-        stderr_content = "".join(stderr_chunks)
 
         if returncode != 0:
             exit_status = ExitStatus.from_code(returncode)
@@ -576,9 +555,6 @@ class CodexProvider(BaseProvider):
                 command=original_command,
             )
 
-        # Combine extracted text parts
-        response_text = "\n".join(response_text_parts)
-
         # Get provider session_id (thread_id for Codex)
         provider_session_id = debug_json_logger.provider_session_id
 
@@ -38,6 +38,7 @@ import logging
 import os
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from subprocess import PIPE, Popen, TimeoutExpired
 
@@ -51,6 +52,7 @@ from bmad_assist.providers.base import (
     BaseProvider,
     ExitStatus,
     ProviderResult,
+    StreamCapture,
     calculate_retry_delay,
     format_tag,
     is_full_stream,
@@ -146,6 +148,7 @@ class CopilotProvider(BaseProvider):
         cancel_token: threading.Event | None = None,
         reasoning_effort: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> ProviderResult:
         """Execute Copilot CLI with the given prompt.
 
@@ -164,6 +167,8 @@ class CopilotProvider(BaseProvider):
             no_cache: Ignored - Copilot CLI doesn't support this flag.
             color_index: Color index for terminal output differentiation.
             display_model: Display name for the model (used in logs/benchmarks).
+            text_callback: Observer of streamed response text. Early termination
+                is not supported, so its return value is ignored.
 
         Returns:
             ProviderResult containing extracted text, stderr, exit code, and timing.
@@ -237,8 +242,8 @@ class CopilotProvider(BaseProvider):
                 )
                 time.sleep(delay)
 
-            stdout_chunks: list[str] = []
-            stderr_chunks: list[str] = []
+            stdout_capture = StreamCapture(on_append=text_callback)
+            stderr_capture = StreamCapture()
             start_time = time.perf_counter()
 
             # Create callbacks for stream readers (check log level dynamically)
@@ -281,8 +286,8 @@ class CopilotProvider(BaseProvider):
                 # Start reader threads first, then write stdin
                 stdout_thread, stderr_thread = start_stream_reader_threads(
                     process,
-                    stdout_chunks,
-                    stderr_chunks,
+                    stdout_capture,
+                    stderr_capture,
                     stdout_callback=_stdout_cb,
                     stderr_callback=_stderr_cb,
                 )
@@ -320,8 +325,8 @@ class CopilotProvider(BaseProvider):
                     truncated = _truncate_prompt(prompt)
 
                     partial_result = ProviderResult(
-                        stdout="".join(stdout_chunks),
-                        stderr="".join(stderr_chunks),
+                        stdout=stdout_capture.getvalue(),
+                        stderr=stderr_capture.getvalue(),
                         exit_code=-1,
                         duration_ms=duration_ms,
                         model=effective_model,
@@ -336,14 +341,19 @@ class CopilotProvider(BaseProvider):
                 stdin_thread.join(timeout=5)
                 stdout_thread.join(timeout=10)
                 stderr_thread.join(timeout=10)
+                stdout_content = stdout_capture.getvalue()
+                stderr_content = stderr_capture.getvalue()
 
             except FileNotFoundError as e:
                 logger.error("Copilot CLI not found in PATH")
                 raise ProviderError("Copilot CLI not found. Is 'copilot' in PATH?") from e
 
+            finally:
+                # Release any spill files; the text was copied out above
+                stdout_capture.close()
+                stderr_capture.close()
+
             duration_ms = int((time.perf_counter() - start_time) * 1000)
-            stdout_content = "".join(stdout_chunks)
-            stderr_content = "".join(stderr_chunks)
 
             if returncode != 0:
                 exit_status = ExitStatus.from_code(returncode)
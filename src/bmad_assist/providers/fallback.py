@@ -7,6 +7,7 @@ primary provider encounters transient errors (e.g., rate limits, timeouts).
 
 import logging
 import threading
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -138,6 +139,7 @@ class FallbackProvider(BaseProvider):
         cancel_token: threading.Event | None = None,
         reasoning_effort: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> ProviderResult:
         """Invoke provider with fallback logic.
 
@@ -177,6 +179,7 @@ class FallbackProvider(BaseProvider):
                 cancel_token=cancel_token,
                 reasoning_effort=reasoning_effort,
                 guard=guard,
+                text_callback=text_callback,
             )
         except (ProviderTimeoutError, ProviderExitCodeError) as e:
             if not self._is_transient(e):
@@ -210,6 +213,7 @@ class FallbackProvider(BaseProvider):
                     cancel_token=cancel_token,
                     reasoning_effort=reasoning_effort,
                     guard=guard,
+                    text_callback=text_callback,
                 )
                 logger.info(
                     "Fallback provider %s succeeded (model=%s)",
@@ -22,11 +22,12 @@ Example:
 
 """
 
-import json
+import functools
 import logging
 import os
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from subprocess import PIPE, Popen, TimeoutExpired
 from typing import TYPE_CHECKING, Any
@@ -44,10 +45,14 @@ from bmad_assist.providers.base import (
     BaseProvider,
     ExitStatus,
     ProviderResult,
+    StreamCapture,
     extract_tool_details,
     format_tag,
     is_full_stream,
+    json_line_handler,
     should_print_progress,
+    start_stream_reader,
+    stderr_line_handler,
     validate_settings_file,
     write_progress,
 )
@@ -91,6 +96,14 @@ _COMMON_TOOL_NAMES: frozenset[str] = frozenset(
     {"Edit", "Write", "Bash", "Glob", "Grep", "WebFetch", "WebSearch", "Read"}
 )
 
+# Informational messages Gemini CLI writes to stderr (not shown as ERR progress)
+_STDERR_INFO_PREFIXES: tuple[str, ...] = (
+    "YOLO mode",
+    "Loaded cached",
+    "Sandbox mode",
+    "File ",  # ripgrep cache messages
+)
+
 
 def _truncate_prompt(prompt: str) -> str:
     """Truncate prompt for error messages.
@@ -229,6 +242,7 @@ class GeminiProvider(BaseProvider):
         cancel_token: threading.Event | None = None,
         reasoning_effort: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> ProviderResult:
         """Execute Gemini CLI with the given prompt using JSON streaming.
 
@@ -270,6 +284,8 @@ class GeminiProvider(BaseProvider):
             no_cache: Disable caching (ignored - Gemini CLI doesn't support).
             color_index: Color index for terminal output differentiation.
             display_model: Display name for the model (used in logs/benchmarks).
+            text_callback: Observer of streamed response text. Early termination
+                is not supported, so its return value is ignored.
 
         Returns:
             ProviderResult containing extracted text, stderr, exit code, and timing.
@@ -380,6 +396,7 @@ class GeminiProvider(BaseProvider):
 
         # Retry loop for transient failures (rate limiting, API errors)
         last_error: ProviderExitCodeError | None = None
+        response_text = ""
         for attempt in range(MAX_RETRIES):
             if attempt > 0:
                 # Exponential backoff with jitter
@@ -397,9 +414,8 @@ class GeminiProvider(BaseProvider):
             debug_json_logger = DebugJsonLogger()
 
             # Accumulators for JSON stream parsing
-            response_text_parts: list[str] = []
-            stderr_chunks: list[str] = []
-            raw_stdout_lines: list[str] = []
+            response_capture = StreamCapture(on_append=text_callback)
+            stderr_capture = StreamCapture()
             session_id: str | None = None
 
             start_time = time.perf_counter()
@@ -438,158 +454,117 @@ class GeminiProvider(BaseProvider):
                     process.stdin.write(final_prompt)
                     process.stdin.close()
 
-                def process_json_stream(
-                    stream: Any,
-                    text_parts: list[str],
-                    raw_lines: list[str],
-                    json_logger: DebugJsonLogger,
+                warned_tools: set[str] = set()  # Dedupe restricted tool warnings
+
+                def decode_message(
+                    msg: dict[str, Any],
+                    text_parts: StreamCapture,
                     color_idx: int | None,
-                ) -> None:
-                    """Process Gemini stream-json output, extracting text and logging."""
+                    warned_tools: set[str],
+                ) -> bool:
+                    """Decode one Gemini stream-json event, extracting text."""
                     nonlocal session_id
-                    warned_tools: set[str] = set()  # Dedupe restricted tool warnings
-                    for line in iter(stream.readline, ""):
-                        raw_lines.append(line)
-                        stripped = line.strip()
-                        if not stripped:
-                            continue
-
-                        # Log raw JSON immediately (survives crashes)
-                        json_logger.append(stripped)
-
-                        try:
-                            msg = json.loads(stripped)
-                            msg_type = msg.get("type", "")
-
-                            if msg_type == "init":
-                                session_id = msg.get("session_id", "?")
-                                if should_print_progress():
-                                    tag = format_tag("INIT", color_idx)
-                                    write_progress(f"{tag} Session: {session_id}")
-
-                            elif msg_type == "message":
-                                role = msg.get("role", "")
-                                if role == "assistant":
-                                    content = msg.get("content", "")
-                                    if content:
-                                        text_parts.append(content)
-                                        if should_print_progress():
-                                            tag = format_tag("ASSISTANT", color_idx)
-                                            if is_full_stream():
-                                                write_progress(f"{tag} {content}")
-                                            else:
-                                                preview = content[:200]
-                                                if len(content) > 200:
-                                                    preview += "..."
-                                                write_progress(f"{tag} {preview}")
-
-                            elif msg_type == "tool_use":
-                                tool_name = msg.get("tool_name", "?")
-                                tool_params = msg.get("parameters", {})
-                                # Guard check
-                                if guard is not None:
-                                    verdict = guard.check(tool_name, tool_params)
-                                    if not verdict.allowed:
-                                        logger.warning(
-                                            "ToolCallGuard triggered: %s",
-                                            verdict.reason,
-                                        )
-                                        if guard_kill_event is not None:  # noqa: B023
-                                            guard_kill_event.set()  # noqa: B023
-                                        stream.close()
-                                        return
-                                # Normalize tool name for restriction check
-                                # Map Gemini CLI technical names to display names
-                                normalized_tool_name = _GEMINI_TOOL_NAME_MAP.get(
-                                    tool_name, tool_name
-                                )
-                                # Log warning if restricted tools are attempted (once per tool)
-                                if (
-                                    restricted_tools
-                                    and normalized_tool_name in restricted_tools
-                                    and normalized_tool_name not in warned_tools
-                                ):
-                                    warned_tools.add(normalized_tool_name)
-                                    logger.warning(
-                                        "Gemini CLI: Restricted tool '%s' "
-                                        "(norm='%s'). May still execute.",
-                                        tool_name,
-                                        normalized_tool_name,
-                                    )
+                    msg_type = msg.get("type", "")
+
+                    if msg_type == "init":
+                        session_id = msg.get("session_id", "?")
+                        if should_print_progress():
+                            tag = format_tag("INIT", color_idx)
+                            write_progress(f"{tag} Session: {session_id}")
+
+                    elif msg_type == "message":
+                        role = msg.get("role", "")
+                        if role == "assistant":
+                            content = msg.get("content", "")
+                            if content:
+                                text_parts.append(content)
                                 if should_print_progress():
-                                    # Format like Claude: [TOOL Bash] command...
-                                    display_name = tool_name
-                                    # Normalize tool names for display
-                                    if tool_name == "run_shell_command":
-                                        display_name = "Bash"
-                                    elif tool_name == "read_file":
-                                        display_name = "Read"
-                                    elif tool_name == "list_directory":
-                                        display_name = "Glob"
-                                    tag = format_tag(f"TOOL {display_name}", color_idx)
+                                    tag = format_tag("ASSISTANT", color_idx)
                                     if is_full_stream():
-                                        import json as _json
-
-                                        write_progress(
-                                            f"{tag} {_json.dumps(tool_params, indent=2)}"
-                                        )
+                                        write_progress(f"{tag} {content}")
                                     else:
-                                        details = extract_tool_details(tool_name, tool_params)
-                                        if details:
-                                            write_progress(f"{tag} {details}")
-                                        else:
-                                            write_progress(f"{tag}")
-
-                            elif msg_type == "tool_result":
-                                # Skip tool_result display - too verbose
-                                pass
-
-                            elif msg_type == "result":
-                                if should_print_progress():
-                                    stats = msg.get("stats", {})
-                                    total_tokens = stats.get("total_tokens", 0)
-                                    duration_ms = stats.get("duration_ms", 0)
-                                    tag = format_tag("RESULT", color_idx)
-                                    write_progress(
-                                        f"{tag} tokens={total_tokens} duration={duration_ms}ms"
-                                    )
-
-                            elif msg_type == "error":
-                                if should_print_progress():
-                                    error_msg = msg.get("message", str(msg))
-                                    tag = format_tag("ERROR", color_idx)
-                                    write_progress(f"{tag} {error_msg}")
-
-                        except json.JSONDecodeError:
-                            if should_print_progress():
-                                tag = format_tag("RAW", color_idx)
-                                write_progress(f"{tag} {stripped}")
-
-                    stream.close()
-
-                def read_stderr(
-                    stream: Any,
-                    chunks: list[str],
-                    color_idx: int | None,
-                ) -> None:
-                    """Read stderr stream."""
-                    # Gemini CLI outputs informational messages to stderr
-                    info_prefixes = (
-                        "YOLO mode",
-                        "Loaded cached",
-                        "Sandbox mode",
-                        "File ",  # ripgrep cache messages
-                    )
-                    for line in iter(stream.readline, ""):
-                        chunks.append(line)
+                                        preview = content[:200]
+                                        if len(content) > 200:
+                                            preview += "..."
+                                        write_progress(f"{tag} {preview}")
+
+                    elif msg_type == "tool_use":
+                        tool_name = msg.get("tool_name", "?")
+                        tool_params = msg.get("parameters", {})
+                        # Guard check
+                        if guard is not None:
+                            verdict = guard.check(tool_name, tool_params)
+                            if not verdict.allowed:
+                                logger.warning(
+                                    "ToolCallGuard triggered: %s",
+                                    verdict.reason,
+                                )
+                                if guard_kill_event is not None:  # noqa: B023
+                                    guard_kill_event.set()  # noqa: B023
+                                return False
+                        # Normalize tool name for restriction check
+                        # Map Gemini CLI technical names to display names
+                        normalized_tool_name = _GEMINI_TOOL_NAME_MAP.get(
+                            tool_name, tool_name
+                        )
+                        # Log warning if restricted tools are attempted (once per tool)
+                        if (
+                            restricted_tools
+                            and normalized_tool_name in restricted_tools
+                            and normalized_tool_name not in warned_tools
+                        ):
+                            warned_tools.add(normalized_tool_name)
+                            logger.warning(
+                                "Gemini CLI: Restricted tool '%s' "
+                                "(norm='%s'). May still execute.",
+                                tool_name,
+                                normalized_tool_name,
+                            )
                         if should_print_progress():
-                            stripped = line.rstrip()
-                            # Skip known informational messages
-                            if any(stripped.startswith(p) for p in info_prefixes):
-                                continue
-                            tag = format_tag("ERR", color_idx)
-                            write_progress(f"{tag} {stripped}")
-                    stream.close()
+                            # Format like Claude: [TOOL Bash] command...
+                            display_name = tool_name
+                            # Normalize tool names for display
+                            if tool_name == "run_shell_command":
+                                display_name = "Bash"
+                            elif tool_name == "read_file":
+                                display_name = "Read"
+                            elif tool_name == "list_directory":
+                                display_name = "Glob"
+                            tag = format_tag(f"TOOL {display_name}", color_idx)
+                            if is_full_stream():
+                                import json as _json
+
+                                write_progress(
+                                    f"{tag} {_json.dumps(tool_params, indent=2)}"
+                                )
+                            else:
+                                details = extract_tool_details(tool_name, tool_params)
+                                if details:
+                                    write_progress(f"{tag} {details}")
+                                else:
+                                    write_progress(f"{tag}")
+
+                    elif msg_type == "tool_result":
+                        # Skip tool_result display - too verbose
+                        pass
+
+                    elif msg_type == "result":
+                        if should_print_progress():
+                            stats = msg.get("stats", {})
+                            total_tokens = stats.get("total_tokens", 0)
+                            duration_ms = stats.get("duration_ms", 0)
+                            tag = format_tag("RESULT", color_idx)
+                            write_progress(
+                                f"{tag} tokens={total_tokens} duration={duration_ms}ms"
+                            )
+
+                    elif msg_type == "error":
+                        if should_print_progress():
+                            error_msg = msg.get("message", str(msg))
+                            tag = format_tag("ERROR", color_idx)
+                            write_progress(f"{tag} {error_msg}")
+
+                    return True
 
                 # Guard monitor for blocking-wait termination
                 guard_kill_event = threading.Event() if guard is not None else None
@@ -603,23 +578,24 @@ class GeminiProvider(BaseProvider):
                     assert guard_kill_event is not None and guard_done_event is not None
                     guard_monitor = start_guard_monitor(process, guard_kill_event, guard_done_event)
 
-                # Start reader threads
-                stdout_thread = threading.Thread(
-                    target=process_json_stream,
-                    args=(
-                        process.stdout,
-                        response_text_parts,
-                        raw_stdout_lines,
-                        debug_json_logger,
+                # Read both pipes on the shared stream multiplexer
+                stdout_reader = start_stream_reader(
+                    process.stdout,
+                    json_line_handler(
+                        functools.partial(
+                            decode_message,
+                            text_parts=response_capture,
+                            color_idx=color_index,
+                            warned_tools=warned_tools,
+                        ),
                         color_index,
+                        log_line=debug_json_logger.append,
                     ),
                 )
-                stderr_thread = threading.Thread(
-                    target=read_stderr,
-                    args=(process.stderr, stderr_chunks, color_index),
+                stderr_reader = start_stream_reader(
+                    process.stderr,
+                    stderr_line_handler(stderr_capture, color_index, _STDERR_INFO_PREFIXES),
                 )
-                stdout_thread.start()
-                stderr_thread.start()
 
                 if should_print_progress():
                     shown_model = display_model or effective_model
@@ -640,14 +616,14 @@ class GeminiProvider(BaseProvider):
                         guard_done_event.set()
                     if guard_monitor is not None:
                         guard_monitor.join(timeout=1.0)
-                    stdout_thread.join(timeout=1)
-                    stderr_thread.join(timeout=1)
+                    stdout_reader.join(timeout=1)
+                    stderr_reader.join(timeout=1)
                     duration_ms = int((time.perf_counter() - start_time) * 1000)
                     truncated = _truncate_prompt(prompt)
 
                     partial_result = ProviderResult(
-                        stdout="".join(response_text_parts),
-                        stderr="".join(stderr_chunks),
+                        stdout=response_capture.getvalue(),
+                        stderr=stderr_capture.getvalue(),
                         exit_code=-1,
                         duration_ms=duration_ms,
                         model=effective_model,
@@ -676,21 +652,27 @@ class GeminiProvider(BaseProvider):
                     guard_monitor.join(timeout=1.0)
 
                 # Wait for threads to finish (timeout prevents hang if reader stuck)
-                stdout_thread.join(timeout=10)
-                stderr_thread.join(timeout=10)
+                stdout_reader.join(timeout=10)
+                stderr_reader.join(timeout=10)
 
                 # Check if guard terminated the process
                 if guard_kill_event is not None and guard_kill_event.is_set():
                     returncode = 0  # Guard termination uses exit_code=0
 
+                # Combine extracted text parts (no separator - chunks may split words)
+                response_text = response_capture.getvalue()
+                stderr_content = stderr_capture.getvalue()
+
             except FileNotFoundError as e:
                 logger.error("Gemini CLI not found in PATH")
                 raise ProviderError("Gemini CLI not found. Is 'gemini' in PATH?") from e
             finally:
                 debug_json_logger.close()
+                # Release any spill files; the text was copied out above
+                response_capture.close()
+                stderr_capture.close()
 
             duration_ms = int((time.perf_counter() - start_time) * 1000)
-            stderr_content = "".join(stderr_chunks)
 
             if returncode != 0:
                 exit_status = ExitStatus.from_code(returncode)
@@ -747,9 +729,6 @@ class GeminiProvider(BaseProvider):
             # Success - break out of retry loop
             break
 
-        # Combine extracted text parts (no separator - chunks may split words)
-        response_text = "".join(response_text_parts)
-
         # Get provider session_id
         provider_session_id = debug_json_logger.provider_session_id
 
@@ -26,15 +26,17 @@ Example:
 
 """
 
+import functools
 import json
 import logging
 import os
 import random
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from subprocess import PIPE, Popen, TimeoutExpired
-from typing import IO, TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from bmad_assist.providers.tool_guard import ToolCallGuard
@@ -52,11 +54,16 @@ from bmad_assist.providers.base import (
     BaseProvider,
     ExitStatus,
     ProviderResult,
+    StreamCapture,
+    StreamReader,
     extract_tool_details,
     format_tag,
     is_full_stream,
+    json_line_handler,
     resolve_settings_file,
     should_print_progress,
+    start_stream_reader,
+    stderr_line_handler,
     validate_settings_file,
     write_progress,
 )
@@ -395,16 +402,16 @@ class KimiProvider(BaseProvider):
     def _cleanup_process(
         self,
         process: Popen[str],
-        stdout_thread: threading.Thread,
-        stderr_thread: threading.Thread,
+        stdout_reader: StreamReader,
+        stderr_reader: StreamReader,
         timeout_occurred: bool = False,
     ) -> None:
-        """Clean up process and threads safely.
+        """Clean up process and stream readers safely.
 
         Args:
             process: The Popen process to clean up.
-            stdout_thread: Thread reading stdout.
-            stderr_thread: Thread reading stderr.
+            stdout_reader: Reader of stdout.
+            stderr_reader: Reader of stderr.
             timeout_occurred: True if cleanup is due to timeout.
 
         """
@@ -426,8 +433,8 @@ class KimiProvider(BaseProvider):
                 process.kill()
 
         # 3. Wait for stream readers to finish (with timeout)
-        stdout_thread.join(timeout=2)
-        stderr_thread.join(timeout=2)
+        stdout_reader.join(timeout=2)
+        stderr_reader.join(timeout=2)
 
         # 4. Ensure process is dead
         try:
@@ -453,6 +460,7 @@ class KimiProvider(BaseProvider):
         cancel_token: threading.Event | None = None,
         reasoning_effort: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> ProviderResult:
         """Execute kimi-cli with the given prompt using JSON streaming.
 
@@ -490,6 +498,8 @@ class KimiProvider(BaseProvider):
             display_model: Display name for the model (used in logs/benchmarks).
             thinking: Enable thinking mode (--thinking flag). If None, auto-detected
                 from model name (enabled if model contains "thinking").
+            text_callback: Observer of streamed response text. Early termination
+                is not supported, so its return value is ignored.
 
         Returns:
             ProviderResult containing extracted text, stderr, exit code, and timing.
@@ -561,7 +571,7 @@ class KimiProvider(BaseProvider):
         last_error: ProviderExitCodeError | None = None
         returncode = 0
         stderr_content = ""
-        response_text_parts: list[str] = []
+        response_text = ""
         debug_json_logger: DebugJsonLogger | None = None
         duration_ms = 0
 
@@ -581,9 +591,8 @@ class KimiProvider(BaseProvider):
             debug_json_logger = DebugJsonLogger()
 
             # Accumulators for JSON stream parsing
-            response_text_parts = []
-            stderr_chunks: list[str] = []
-            raw_stdout_lines: list[str] = []
+            response_capture = StreamCapture(on_append=text_callback)
+            stderr_capture = StreamCapture()
 
             start_time = time.perf_counter()
 
@@ -610,105 +619,72 @@ class KimiProvider(BaseProvider):
                     process.stdin.write(final_prompt)
                     process.stdin.close()
 
-                def process_json_stream(
-                    stream: IO[str],
-                    text_parts: list[str],
-                    raw_lines: list[str],
-                    json_logger: DebugJsonLogger,
+                def decode_message(
+                    msg: dict[str, Any],
+                    text_parts: StreamCapture,
                     color_idx: int | None,
-                ) -> None:
-                    """Process kimi-cli stream-json output, extracting text and logging."""
-                    for line in iter(stream.readline, ""):
-                        raw_lines.append(line)
-                        stripped = line.strip()
-                        if not stripped:
-                            continue
-
-                        # Log raw JSON immediately (survives crashes)
-                        json_logger.append(stripped)
-
-                        try:
-                            msg = json.loads(stripped)
-                            role = msg.get("role", "")
-
-                            if role == "assistant":
-                                # Extract content - handles both string and array formats
-                                content = _extract_text_from_content(msg.get("content"))
-                                if not content and "reasoning_content" in msg:
-                                    content = _extract_text_from_content(
-                                        msg.get("reasoning_content")
+                ) -> bool:
+                    """Decode one kimi-cli stream-json message, extracting text."""
+                    role = msg.get("role", "")
+
+                    if role == "assistant":
+                        # Extract content - handles both string and array formats
+                        content = _extract_text_from_content(msg.get("content"))
+                        if not content and "reasoning_content" in msg:
+                            content = _extract_text_from_content(
+                                msg.get("reasoning_content")
+                            )
+
+                        if content:
+                            text_parts.append(content)
+                            if should_print_progress():
+                                tag = format_tag("ASSISTANT", color_idx)
+                                if is_full_stream():
+                                    write_progress(f"{tag} {content}")
+                                else:
+                                    preview = content[:200]
+                                    if len(content) > 200:
+                                        preview += "..."
+                                    write_progress(f"{tag} {preview}")
+
+                        # Process tool calls if present
+                        tool_calls = msg.get("tool_calls", [])
+                        for tc in tool_calls:
+                            if not isinstance(tc, dict):
+                                continue
+                            func = tc.get("function", {})
+                            tool_name = func.get("name", "?")
+                            try:
+                                args = json.loads(func.get("arguments", "{}"))
+                            except json.JSONDecodeError:
+                                args = {}
+                            # Guard check
+                            if guard is not None:
+                                verdict = guard.check(tool_name, args)
+                                if not verdict.allowed:
+                                    logger.warning(
+                                        "ToolCallGuard triggered: %s",
+                                        verdict.reason,
                                     )
-
-                                if content:
-                                    text_parts.append(content)
-                                    if should_print_progress():
-                                        tag = format_tag("ASSISTANT", color_idx)
-                                        if is_full_stream():
-                                            write_progress(f"{tag} {content}")
-                                        else:
-                                            preview = content[:200]
-                                            if len(content) > 200:
-                                                preview += "..."
-                                            write_progress(f"{tag} {preview}")
-
-                                # Process tool calls if present
-                                tool_calls = msg.get("tool_calls", [])
-                                for tc in tool_calls:
-                                    if not isinstance(tc, dict):
-                                        continue
-                                    func = tc.get("function", {})
-                                    tool_name = func.get("name", "?")
-                                    try:
-                                        args = json.loads(func.get("arguments", "{}"))
-                                    except json.JSONDecodeError:
-                                        args = {}
-                                    # Guard check
-                                    if guard is not None:
-                                        verdict = guard.check(tool_name, args)
-                                        if not verdict.allowed:
-                                            logger.warning(
-                                                "ToolCallGuard triggered: %s",
-                                                verdict.reason,
-                                            )
-                                            if guard_kill_event is not None:  # noqa: B023
-                                                guard_kill_event.set()  # noqa: B023
-                                            stream.close()
-                                            return
-                                    if should_print_progress():
-                                        tag = format_tag(f"TOOL {tool_name}", color_idx)
-                                        if is_full_stream():
-                                            write_progress(f"{tag} {json.dumps(args, indent=2)}")
-                                        else:
-                                            details = extract_tool_details(tool_name, args)
-                                            if details:
-                                                write_progress(f"{tag} {details}")
-                                            else:
-                                                write_progress(f"{tag}")
-
-                            elif role == "tool":
-                                # Tool result - skip display (too verbose)
-                                pass
-
-                        except json.JSONDecodeError:
+                                    if guard_kill_event is not None:  # noqa: B023
+                                        guard_kill_event.set()  # noqa: B023
+                                    return False
                             if should_print_progress():
-                                tag = format_tag("RAW", color_idx)
-                                write_progress(f"{tag} {stripped}")
-
-                    stream.close()
-
-                def read_stderr(
-                    stream: IO[str],
-                    chunks: list[str],
-                    color_idx: int | None,
-                ) -> None:
-                    """Read stderr stream."""
-                    for line in iter(stream.readline, ""):
-                        chunks.append(line)
-                        if should_print_progress():
-                            stripped = line.rstrip()
-                            tag = format_tag("ERR", color_idx)
-                            write_progress(f"{tag} {stripped}")
-                    stream.close()
+                                tag = format_tag(f"TOOL {tool_name}", color_idx)
+                                if is_full_stream():
+                                    write_progress(f"{tag} {json.dumps(args, indent=2)}")
+                                else:
+                                    details = extract_tool_details(tool_name, args)
+                                    if details:
+                                        write_progress(f"{tag} {details}")
+                                    else:
+                                        write_progress(f"{tag}")
+
+                    elif role == "tool":
+                        # Tool result - skip display (too verbose)
+                        pass
+
+                    return True
 
                 # Guard monitor for blocking-wait termination
                 guard_kill_event = threading.Event() if guard is not None else None
@@ -722,23 +698,20 @@ class KimiProvider(BaseProvider):
                     assert guard_kill_event is not None and guard_done_event is not None
                     guard_monitor = start_guard_monitor(process, guard_kill_event, guard_done_event)
 
-                # Start reader threads
-                stdout_thread = threading.Thread(
-                    target=process_json_stream,
-                    args=(
-                        process.stdout,
-                        response_text_parts,
-                        raw_stdout_lines,
-                        debug_json_logger,
+                # Read both pipes on the shared stream multiplexer
+                stdout_reader = start_stream_reader(
+                    process.stdout,
+                    json_line_handler(
+                        functools.partial(
+                            decode_message, text_parts=response_capture, color_idx=color_index
+                        ),
                         color_index,
+                        log_line=debug_json_logger.append,
                     ),
                 )
-                stderr_thread = threading.Thread(
-                    target=read_stderr,
-                    args=(process.stderr, stderr_chunks, color_index),
+                stderr_reader = start_stream_reader(
+                    process.stderr, stderr_line_handler(stderr_capture, color_index)
                 )
-                stdout_thread.start()
-                stderr_thread.start()
 
                 if should_print_progress():
                     shown_model = display_model or effective_model
@@ -760,14 +733,14 @@ class KimiProvider(BaseProvider):
                     if guard_monitor is not None:
                         guard_monitor.join(timeout=1.0)
                     self._cleanup_process(
-                        process, stdout_thread, stderr_thread, timeout_occurred=True
+                        process, stdout_reader, stderr_reader, timeout_occurred=True
                     )
                     duration_ms = int((time.perf_counter() - start_time) * 1000)
                     truncated = _truncate_prompt(prompt)
 
                     partial_result = ProviderResult(
-                        stdout="".join(response_text_parts),
-                        stderr="".join(stderr_chunks),
+                        stdout=response_capture.getvalue(),
+                        stderr=stderr_capture.getvalue(),
                         exit_code=-1,
                         duration_ms=duration_ms,
                         model=effective_model,
@@ -796,22 +769,28 @@ class KimiProvider(BaseProvider):
                     guard_monitor.join(timeout=1.0)
 
                 # Wait for threads to finish (timeout prevents hang if reader stuck)
-                stdout_thread.join(timeout=10)
-                stderr_thread.join(timeout=10)
+                stdout_reader.join(timeout=10)
+                stderr_reader.join(timeout=10)
 
                 # Check if guard terminated the process
                 if guard_kill_event is not None and guard_kill_event.is_set():
                     returncode = 0  # Guard termination uses exit_code=0
 
+                # Combine extracted text parts (no separator - chunks may split words)
+                response_text = response_capture.getvalue()
+                stderr_content = stderr_capture.getvalue()
+
             except FileNotFoundError as e:
                 logger.error("Kimi CLI not found in PATH")
                 raise ProviderError("Kimi CLI not found. Is 'kimi' in PATH?") from e
             finally:
                 if debug_json_logger:
                     debug_json_logger.close()
+                # Release any spill files; the text was copied out above
+                response_capture.close()
+                stderr_capture.close()
 
             duration_ms = int((time.perf_counter() - start_time) * 1000)
-            stderr_content = "".join(stderr_chunks)
 
             if returncode != 0:
                 exit_status = ExitStatus.from_code(returncode)
@@ -867,9 +846,6 @@ class KimiProvider(BaseProvider):
             # Success - break out of retry loop
             break
 
-        # Combine extracted text parts (no separator to avoid mid-word breaks if chunks split)
-        response_text = "".join(response_text_parts)
-
         # Get provider session_id
         provider_session_id = debug_json_logger.provider_session_id if debug_json_logger else None
 
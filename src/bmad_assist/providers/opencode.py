@@ -22,11 +22,12 @@ Example:
 
 """
 
-import json
+import functools
 import logging
 import os
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from subprocess import PIPE, Popen, TimeoutExpired
 from typing import TYPE_CHECKING, Any
@@ -44,10 +45,14 @@ from bmad_assist.providers.base import (
     BaseProvider,
     ExitStatus,
     ProviderResult,
+    StreamCapture,
     extract_tool_details,
     format_tag,
     is_full_stream,
+    json_line_handler,
     should_print_progress,
+    start_stream_reader,
+    stderr_line_handler,
     validate_settings_file,
     write_progress,
 )
@@ -222,6 +227,7 @@ class OpenCodeProvider(BaseProvider):
         cancel_token: threading.Event | None = None,
         reasoning_effort: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> ProviderResult:
         """Execute OpenCode CLI with the given prompt using JSON streaming.
 
@@ -263,6 +269,8 @@ class OpenCodeProvider(BaseProvider):
             no_cache: Disable caching (ignored - OpenCode CLI doesn't support).
             color_index: Color index for terminal output differentiation.
             display_model: Display name for the model (used in logs/benchmarks).
+            text_callback: Observer of streamed response text. Early termination
+                is not supported, so its return value is ignored.
 
         Returns:
             ProviderResult containing extracted text, stderr, exit code, and timing.
@@ -372,7 +380,7 @@ class OpenCodeProvider(BaseProvider):
         returncode: int = 0
         duration_ms: int = 0
         stderr_content: str = ""
-        response_text_parts: list[str] = []
+        response_text = ""
         debug_json_logger = DebugJsonLogger()
 
         for attempt in range(MAX_RETRIES):
@@ -391,8 +399,8 @@ class OpenCodeProvider(BaseProvider):
             # Note: Previous iteration's threads are joined before we get here (either via
             # successful completion or timeout handling), so resetting logger is safe
             debug_json_logger = DebugJsonLogger()
-            response_text_parts = []
-            stderr_chunks: list[str] = []
+            response_capture = StreamCapture(on_append=text_callback)
+            stderr_capture = StreamCapture()
             session_id: str | None = None
 
             start_time = time.perf_counter()
@@ -423,126 +431,97 @@ class OpenCodeProvider(BaseProvider):
                     process.stdin.write(final_prompt)
                     process.stdin.close()
 
-                def process_json_stream(
-                    stream: Any,
-                    text_parts: list[str],
-                    json_logger: DebugJsonLogger,
+                warned_tools: set[str] = set()  # Dedupe restricted tool warnings
+
+                def decode_message(
+                    msg: dict[str, Any],
+                    text_parts: StreamCapture,
                     color_idx: int | None,
-                ) -> None:
-                    """Process OpenCode stream-json output, extracting text and logging."""
+                    warned_tools: set[str],
+                ) -> bool:
+                    """Decode one OpenCode stream-json event, extracting text."""
                     nonlocal session_id
-                    warned_tools: set[str] = set()  # Dedupe restricted tool warnings
-                    for line in iter(stream.readline, ""):
-                        stripped = line.strip()
-                        if not stripped:
-                            continue
-
-                        # Log raw JSON immediately (survives crashes)
-                        json_logger.append(stripped)
-
-                        try:
-                            msg = json.loads(stripped)
-                            msg_type = msg.get("type", "")
+                    msg_type = msg.get("type", "")
 
-                            if msg_type == "step_start":
-                                session_id = msg.get("sessionID", "?")
-                                if should_print_progress():
-                                    tag = format_tag("INIT", color_idx)
-                                    write_progress(f"{tag} Session: {session_id}")
-
-                            elif msg_type == "text":
-                                part = msg.get("part", {})
-                                if part.get("type") == "text":
-                                    text = part.get("text", "")
-                                    if text:
-                                        text_parts.append(text)
-                                        if should_print_progress():
-                                            tag = format_tag("ASSISTANT", color_idx)
-                                            if is_full_stream():
-                                                write_progress(f"{tag} {text}")
-                                            else:
-                                                preview = text[:200]
-                                                if len(text) > 200:
-                                                    preview += "..."
-                                                write_progress(f"{tag} {preview}")
-
-                            elif msg_type == "tool_use":
-                                part = msg.get("part", {})
-                                tool_name: str = part.get("tool") or "unknown"
-                                state = part.get("state", {})
-                                tool_input = state.get("input", {})
-                                # Normalize tool name for restriction check
-                                normalized_tool_name: str = _OPENCODE_TOOL_NAME_MAP.get(
-                                    tool_name.lower(), tool_name.capitalize()
-                                )
-                                # Guard check
-                                if guard is not None:
-                                    verdict = guard.check(normalized_tool_name, tool_input)
-                                    if not verdict.allowed:
-                                        logger.warning(
-                                            "ToolCallGuard triggered: %s",
-                                            verdict.reason,
-                                        )
-                                        if guard_kill_event is not None:  # noqa: B023
-                                            guard_kill_event.set()  # noqa: B023
-                                        stream.close()
-                                        return
-                                # Log warning if restricted tools are attempted (once per tool)
-                                if (
-                                    restricted_tools
-                                    and normalized_tool_name in restricted_tools
-                                    and normalized_tool_name not in warned_tools
-                                ):
-                                    warned_tools.add(normalized_tool_name)
-                                    logger.warning(
-                                        "OpenCode CLI: Restricted tool '%s' "
-                                        "(norm='%s'). May still execute.",
-                                        tool_name,
-                                        normalized_tool_name,
-                                    )
+                    if msg_type == "step_start":
+                        session_id = msg.get("sessionID", "?")
+                        if should_print_progress():
+                            tag = format_tag("INIT", color_idx)
+                            write_progress(f"{tag} Session: {session_id}")
+
+                    elif msg_type == "text":
+                        part = msg.get("part", {})
+                        if part.get("type") == "text":
+                            text = part.get("text", "")
+                            if text:
+                                text_parts.append(text)
                                 if should_print_progress():
-                                    tag = format_tag(f"TOOL {normalized_tool_name}", color_idx)
+                                    tag = format_tag("ASSISTANT", color_idx)
                                     if is_full_stream():
-                                        import json as _json
-
-                                        write_progress(f"{tag} {_json.dumps(tool_input, indent=2)}")
+                                        write_progress(f"{tag} {text}")
                                     else:
-                                        details = extract_tool_details(
-                                            normalized_tool_name, tool_input
-                                        )
-                                        if details:
-                                            write_progress(f"{tag} {details}")
-                                        else:
-                                            write_progress(f"{tag}")
-
-                            elif msg_type == "step_finish":
-                                if should_print_progress():
-                                    part = msg.get("part", {})
-                                    cost = part.get("cost", 0)
-                                    tokens = part.get("tokens", {})
-                                    tag = format_tag("RESULT", color_idx)
-                                    write_progress(f"{tag} cost={cost:.4f} tokens={tokens}")
-
-                        except json.JSONDecodeError:
-                            if should_print_progress():
-                                tag = format_tag("RAW", color_idx)
-                                write_progress(f"{tag} {stripped}")
-
-                    stream.close()
-
-                def read_stderr(
-                    stream: Any,
-                    chunks: list[str],
-                    color_idx: int | None,
-                ) -> None:
-                    """Read stderr stream."""
-                    for line in iter(stream.readline, ""):
-                        chunks.append(line)
+                                        preview = text[:200]
+                                        if len(text) > 200:
+                                            preview += "..."
+                                        write_progress(f"{tag} {preview}")
+
+                    elif msg_type == "tool_use":
+                        part = msg.get("part", {})
+                        tool_name: str = part.get("tool") or "unknown"
+                        state = part.get("state", {})
+                        tool_input = state.get("input", {})
+                        # Normalize tool name for restriction check
+                        normalized_tool_name: str = _OPENCODE_TOOL_NAME_MAP.get(
+                            tool_name.lower(), tool_name.capitalize()
+                        )
+                        # Guard check
+                        if guard is not None:
+                            verdict = guard.check(normalized_tool_name, tool_input)
+                            if not verdict.allowed:
+                                logger.warning(
+                                    "ToolCallGuard triggered: %s",
+                                    verdict.reason,
+                                )
+                                if guard_kill_event is not None:  # noqa: B023
+                                    guard_kill_event.set()  # noqa: B023
+                                return False
+                        # Log warning if restricted tools are attempted (once per tool)
+                        if (
+                            restricted_tools
+                            and normalized_tool_name in restricted_tools
+                            and normalized_tool_name not in warned_tools
+                        ):
+                            warned_tools.add(normalized_tool_name)
+                            logger.warning(
+                                "OpenCode CLI: Restricted tool '%s' "
+                                "(norm='%s'). May still execute.",
+                                tool_name,
+                                normalized_tool_name,
+                            )
+                        if should_print_progress():
+                            tag = format_tag(f"TOOL {normalized_tool_name}", color_idx)
+                            if is_full_stream():
+                                import json as _json
+
+                                write_progress(f"{tag} {_json.dumps(tool_input, indent=2)}")
+                            else:
+                                details = extract_tool_details(
+                                    normalized_tool_name, tool_input
+                                )
+                                if details:
+                                    write_progress(f"{tag} {details}")
+                                else:
+                                    write_progress(f"{tag}")
+
+                    elif msg_type == "step_finish":
                         if should_print_progress():
-                            stripped = line.rstrip()
-                            tag = format_tag("ERR", color_idx)
-                            write_progress(f"{tag} {stripped}")
-                    stream.close()
+                            part = msg.get("part", {})
+                            cost = part.get("cost", 0)
+                            tokens = part.get("tokens", {})
+                            tag = format_tag("RESULT", color_idx)
+                            write_progress(f"{tag} cost={cost:.4f} tokens={tokens}")
+
+                    return True
 
                 # Guard monitor for blocking-wait termination
                 guard_kill_event = threading.Event() if guard is not None else None
@@ -553,22 +532,23 @@ class OpenCodeProvider(BaseProvider):
                     assert guard_kill_event is not None and guard_done_event is not None
                     guard_monitor = start_guard_monitor(process, guard_kill_event, guard_done_event)
 
-                # Start reader threads
-                stdout_thread = threading.Thread(
-                    target=process_json_stream,
-                    args=(
-                        process.stdout,
-                        response_text_parts,
-                        debug_json_logger,
+                # Read both pipes on the shared stream multiplexer
+                stdout_reader = start_stream_reader(
+                    process.stdout,
+                    json_line_handler(
+                        functools.partial(
+                            decode_message,
+                            text_parts=response_capture,
+                            color_idx=color_index,
+                            warned_tools=warned_tools,
+                        ),
                         color_index,
+                        log_line=debug_json_logger.append,
                     ),
                 )
-                stderr_thread = threading.Thread(
-                    target=read_stderr,
-                    args=(process.stderr, stderr_chunks, color_index),
+                stderr_reader = start_stream_reader(
+                    process.stderr, stderr_line_handler(stderr_capture, color_index)
                 )
-                stdout_thread.start()
-                stderr_thread.start()
 
                 if should_print_progress():
                     shown_model = display_model or effective_model
@@ -585,9 +565,9 @@ class OpenCodeProvider(BaseProvider):
                 except TimeoutExpired:
                     process.kill()
                     # Join threads with timeout - should terminate quickly after kill
-                    stdout_thread.join(timeout=2)
-                    stderr_thread.join(timeout=2)
-                    if stdout_thread.is_alive() or stderr_thread.is_alive():
+                    stdout_reader.join(timeout=2)
+                    stderr_reader.join(timeout=2)
+                    if stdout_reader.is_alive() or stderr_reader.is_alive():
                         logger.warning(
                             "OpenCode CLI: Reader threads did not terminate cleanly after timeout"
                         )
@@ -599,8 +579,8 @@ class OpenCodeProvider(BaseProvider):
                     truncated = _truncate_prompt(prompt)
 
                     partial_result = ProviderResult(
-                        stdout="".join(response_text_parts),
-                        stderr="".join(stderr_chunks),
+                        stdout=response_capture.getvalue(),
+                        stderr=stderr_capture.getvalue(),
                         exit_code=-1,
                         duration_ms=duration_ms,
                         model=effective_model,
@@ -629,21 +609,27 @@ class OpenCodeProvider(BaseProvider):
                     guard_monitor.join(timeout=1.0)
 
                 # Wait for threads to finish (timeout prevents hang if reader stuck)
-                stdout_thread.join(timeout=10)
-                stderr_thread.join(timeout=10)
+                stdout_reader.join(timeout=10)
+                stderr_reader.join(timeout=10)
 
                 # Check if guard terminated the process
                 if guard_kill_event is not None and guard_kill_event.is_set():
                     returncode = 0  # Guard termination uses exit_code=0
 
+                # Combine extracted text parts (no separator - chunks may split words)
+                response_text = response_capture.getvalue()
+                stderr_content = stderr_capture.getvalue()
+
             except FileNotFoundError as e:
                 logger.error("OpenCode CLI not found in PATH")
                 raise ProviderError("OpenCode CLI not found. Is 'opencode' in PATH?") from e
             finally:
                 debug_json_logger.close()
+                # Release any spill files; the text was copied out above
+                response_capture.close()
+                stderr_capture.close()
 
             duration_ms = int((time.perf_counter() - start_time) * 1000)
-            stderr_content = "".join(stderr_chunks)
 
             if returncode != 0:
                 exit_status = ExitStatus.from_code(returncode)
@@ -699,9 +685,6 @@ class OpenCodeProvider(BaseProvider):
             # Success - break out of retry loop
             break
 
-        # Combine extracted text parts (no separator - chunks may split words)
-        response_text = "".join(response_text_parts)
-
         # Get provider session_id
         provider_session_id = debug_json_logger.provider_session_id
 
@@ -33,6 +33,7 @@ import shutil
 import socket
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from subprocess import DEVNULL, Popen
 from typing import TYPE_CHECKING, Any
@@ -929,6 +930,7 @@ class OpenCodeSDKProvider(BaseProvider):
         cancel_token: threading.Event | None = None,
         reasoning_effort: str | None = None,
         guard: "ToolCallGuard | None" = None,
+        text_callback: Callable[[str], bool | None] | None = None,
     ) -> ProviderResult:
         """Execute OpenCode SDK with the given prompt.
 
@@ -947,6 +949,7 @@ class OpenCodeSDKProvider(BaseProvider):
             cancel_token: Threading event for cancellation.
             reasoning_effort: Ignored.
             guard: Optional ToolCallGuard for runaway tool call detection.
+            text_callback: Ignored.
 
         Returns:
             ProviderResult with response text.
@@ -2,6 +2,11 @@
 
 Executes tests in configurable batches with atomic writes after each batch.
 Prevents context overflow and enables crash-safe resumption.
+
+Batches are independent LLM sessions, so with ``qa.batch_concurrency`` > 1
+they run on a bounded thread pool (and categories A and B run side by side).
+Results are still saved after every finished batch, ordered by batch_id, so
+the results file is deterministic and a crashed run can be retried as usual.
 """
 
 from __future__ import annotations
@@ -10,6 +15,8 @@ import logging
 import math
 import os
 import tempfile
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -582,6 +589,7 @@ def _execute_playwright_category(
     project_path: Path,
     epic_id: EpicId,
     tests: list[Any],
+    results_path: Path | None = None,
 ) -> ExecutionState:
     """Execute Category B tests using Playwright directly.
 
@@ -593,6 +601,7 @@ def _execute_playwright_category(
         project_path: Project root directory.
         epic_id: Epic identifier.
         tests: List of Category B test cases.
+        results_path: Where to save results (default: a new run file).
 
     Returns:
         ExecutionState with test results.
@@ -602,8 +611,9 @@ def _execute_playwright_category(
 
     run_id = f"run-{datetime.now(UTC).strftime('%Y%m%d-%H%M%S')}"
     started_at = datetime.now(UTC).isoformat()
-    qa_artifacts = get_paths().output_folder / "qa-artifacts"
-    results_path = qa_artifacts / "test-results" / f"epic-{epic_id}-{run_id}.yaml"
+    if results_path is None:
+        qa_artifacts = get_paths().output_folder / "qa-artifacts"
+        results_path = qa_artifacts / "test-results" / f"epic-{epic_id}-{run_id}.yaml"
 
     # Get Playwright config (if available)
     playwright_config = config.qa.playwright if config.qa else None
@@ -720,6 +730,101 @@ def _merge_execution_states(
     return merged
 
 
+def _resolve_concurrency(config: Config, concurrency: int | None) -> int:
+    """Return the number of batches to run in parallel (at least 1)."""
+    if concurrency is None:
+        concurrency = config.qa.batch_concurrency if config.qa else 1
+    return max(1, concurrency)
+
+
+def _iter_batch_results(
+    config: Config,
+    project_path: Path,
+    epic_id: EpicId,
+    batches: list[list[TestCase]],
+    state: ExecutionState,
+    concurrency: int,
+) -> Iterator[BatchResult]:
+    """Execute batches and yield their results as they finish.
+
+    Sequentially (concurrency 1), each batch is told how the previous ones
+    went. Concurrent batches are independent sessions without that summary;
+    they are yielded in completion order, not batch order.
+
+    Args:
+        config: Configuration instance.
+        project_path: Project root directory.
+        epic_id: Epic identifier.
+        batches: Tests for each batch, in batch order.
+        state: Execution state (read for the previous-batches summary).
+        concurrency: Maximum batches executing at once.
+
+    Yields:
+        BatchResult for each finished batch.
+
+    """
+    total_batches = len(batches)
+
+    def log_batch_start(batch_num: int, batch_tests: list[TestCase]) -> None:
+        start_idx = sum(len(b) for b in batches[: batch_num - 1])
+        logger.info(
+            "─" * 50 + "\nBATCH %d/%d (tests %d-%d)\n" + "─" * 50,
+            batch_num,
+            total_batches,
+            start_idx + 1,
+            start_idx + len(batch_tests),
+        )
+
+    if concurrency <= 1 or total_batches <= 1:
+        for batch_num, batch_tests in enumerate(batches, start=1):
+            log_batch_start(batch_num, batch_tests)
+
+            # Build previous summary for context
+            previous_summary = ""
+            if state.completed_batches:
+                previous_summary = (
+                    f"Previous batches: {len(state.completed_batches)} completed, "
+                    f"{state.total_passed} passed, {state.total_failed} failed"
+                )
+
+            yield execute_batch(
+                config,
+                project_path,
+                epic_id,
+                batch_tests,
+                batch_num,
+                total_batches,
+                previous_summary,
+            )
+        return
+
+    workers = min(concurrency, total_batches)
+    logger.info("Running %d batches with %d parallel sessions", total_batches, workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qa-batch") as pool:
+        futures: list[Future[BatchResult]] = []
+        for batch_num, batch_tests in enumerate(batches, start=1):
+            log_batch_start(batch_num, batch_tests)
+            futures.append(
+                pool.submit(
+                    execute_batch,
+                    config,
+                    project_path,
+                    epic_id,
+                    batch_tests,
+                    batch_num,
+                    total_batches,
+                )
+            )
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        except BaseException:
+            # Don't start queued batches after a failure or interrupt
+            for future in futures:
+                future.cancel()
+            raise
+
+
 def execute_tests_in_batches(
     config: Config,
     project_path: Path,
@@ -729,12 +834,16 @@ def execute_tests_in_batches(
     batch_size: int = DEFAULT_BATCH_SIZE,
     retry_info: RetryInfo | None = None,
     include_skipped: bool = False,
+    concurrency: int | None = None,
 ) -> ExecutionState:
     """Execute tests in batches with incremental saves.
 
     Main entry point for batch execution. Splits tests into batches,
     executes each batch, and saves results after each batch.
 
+    With concurrency > 1, up to that many batches run at once, and for
+    category "all" the Playwright (B) run proceeds alongside the A batches.
+
     Args:
         config: Configuration instance.
         project_path: Project root directory.
@@ -744,11 +853,14 @@ def execute_tests_in_batches(
         batch_size: Number of tests per batch.
         retry_info: If provided, only run tests that failed/errored (+ new tests).
         include_skipped: When retry_info is set, also include SKIP tests.
+        concurrency: Batches to run in parallel (default: config.qa.batch_concurrency).
 
     Returns:
         ExecutionState with all batch results.
 
     """
+    concurrency = _resolve_concurrency(config, concurrency)
+
     # Handle "all" category by splitting into A and B executions
     # This prevents mixing CLI tests with Playwright tests in same batch
     if category.lower() == "all":
@@ -782,31 +894,61 @@ def execute_tests_in_batches(
         state_a = None
         state_b = None
 
-        # Execute Category A tests (LLM batches)
-        if a_tests:
+        # With concurrency, Playwright runs alongside the LLM batches. It gets
+        # its own results file since both runs may start within the same second.
+        b_pool: ThreadPoolExecutor | None = None
+        b_future: Future[ExecutionState] | None = None
+        if b_tests and a_tests and concurrency > 1:
             logger.info(
-                "=" * 50 + "\nPHASE 1: CATEGORY A TESTS (%d tests)\n" + "=" * 50,
-                len(a_tests),
+                "=" * 50 + "\nCATEGORY B TESTS (%d tests) - running alongside category A\n"
+                + "=" * 50,
+                len(b_tests),
             )
-            # Recursive call with category="A"
-            state_a = execute_tests_in_batches(
+            b_results_path = combined_results_path.with_name(
+                f"epic-{epic_id}-{run_id}-playwright.yaml"
+            )
+            b_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qa-playwright")
+            b_future = b_pool.submit(
+                _execute_playwright_category,
                 config,
                 project_path,
                 epic_id,
-                parsed_plan,
-                category="A",
-                batch_size=batch_size,
-                retry_info=retry_info,
-                include_skipped=include_skipped,
+                b_tests,
+                b_results_path,
             )
 
-        # Execute Category B tests (Playwright)
-        if b_tests:
-            logger.info(
-                "=" * 50 + "\nPHASE 2: CATEGORY B TESTS (%d tests)\n" + "=" * 50,
-                len(b_tests),
-            )
-            state_b = _execute_playwright_category(config, project_path, epic_id, b_tests)
+        try:
+            # Execute Category A tests (LLM batches)
+            if a_tests:
+                logger.info(
+                    "=" * 50 + "\nPHASE 1: CATEGORY A TESTS (%d tests)\n" + "=" * 50,
+                    len(a_tests),
+                )
+                # Recursive call with category="A"
+                state_a = execute_tests_in_batches(
+                    config,
+                    project_path,
+                    epic_id,
+                    parsed_plan,
+                    category="A",
+                    batch_size=batch_size,
+                    retry_info=retry_info,
+                    include_skipped=include_skipped,
+                    concurrency=concurrency,
+                )
+
+            # Execute Category B tests (Playwright)
+            if b_future is not None:
+                state_b = b_future.result()
+            elif b_tests:
+                logger.info(
+                    "=" * 50 + "\nPHASE 2: CATEGORY B TESTS (%d tests)\n" + "=" * 50,
+                    len(b_tests),
+                )
+                state_b = _execute_playwright_category(config, project_path, epic_id, b_tests)
+        finally:
+            if b_pool is not None:
+                b_pool.shutdown(wait=True)
 
         # Merge results
         if state_a and state_b:
@@ -912,40 +1054,13 @@ def execute_tests_in_batches(
     )
 
     # Execute batches
-    for batch_num in range(1, total_batches + 1):
-        start_idx = (batch_num - 1) * batch_size
-        end_idx = min(start_idx + batch_size, total_tests)
-        batch_tests = tests[start_idx:end_idx]
-
-        logger.info(
-            "─" * 50 + "\nBATCH %d/%d (tests %d-%d)\n" + "─" * 50,
-            batch_num,
-            total_batches,
-            start_idx + 1,
-            end_idx,
-        )
-
-        # Build previous summary for context
-        previous_summary = ""
-        if state.completed_batches:
-            previous_summary = (
-                f"Previous batches: {len(state.completed_batches)} completed, "
-                f"{state.total_passed} passed, {state.total_failed} failed"
-            )
-
-        # Execute batch
-        batch_result = execute_batch(
-            config,
-            project_path,
-            epic_id,
-            batch_tests,
-            batch_num,
-            total_batches,
-            previous_summary,
-        )
-
-        # Add to state
+    batches = [tests[i : i + batch_size] for i in range(0, total_tests, batch_size)]
+    for batch_result in _iter_batch_results(
+        config, project_path, epic_id, batches, state, concurrency
+    ):
+        # Add to state, kept in batch order whatever order batches finish in
         state.completed_batches.append(batch_result)
+        state.completed_batches.sort(key=lambda b: b.batch_id)
 
         # Incremental save (only for new runs, not retries)
         if not is_retry:
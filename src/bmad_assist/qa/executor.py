@@ -378,6 +378,7 @@ def _execute_batch_mode(
     qa_plan_path: Path,
     retry_info: "RetryInfo | None" = None,  # noqa: UP037
     include_skipped: bool = False,
+    concurrency: int | None = None,
 ) -> QAExecuteResult:
     """Execute tests in batches with incremental saves.
 
@@ -393,6 +394,7 @@ def _execute_batch_mode(
         qa_plan_path: Path to QA plan file.
         retry_info: If retrying, info from previous run.
         include_skipped: When retrying, include SKIP tests.
+        concurrency: Batches to run in parallel (default: config.qa.batch_concurrency).
 
     Returns:
         QAExecuteResult with execution summary.
@@ -429,6 +431,7 @@ def _execute_batch_mode(
         batch_size=batch_size,
         retry_info=retry_info,
         include_skipped=include_skipped,
+        concurrency=concurrency,
     )
 
     return QAExecuteResult(
@@ -455,6 +458,7 @@ def execute_qa_plan(
     retry: bool = False,
     include_skipped: bool = False,
     retry_run: str | None = None,
+    concurrency: int | None = None,
 ) -> QAExecuteResult:
     """Execute QA plan for an epic.
 
@@ -479,6 +483,8 @@ def execute_qa_plan(
         retry: Retry failed/error tests from last run (also executes new tests).
         include_skipped: When retrying, also include SKIP tests.
         retry_run: Specific run ID to retry from (default: latest run).
+        concurrency: Batches to run in parallel in batch mode
+            (default: config.qa.batch_concurrency).
 
     Returns:
         QAExecuteResult with execution summary.
@@ -575,6 +581,7 @@ def execute_qa_plan(
                 qa_plan_path,
                 retry_info=retry_info_obj,
                 include_skipped=include_skipped,
+                concurrency=concurrency,
             )
 
         # Auto-select based on test count
@@ -599,6 +606,7 @@ def execute_qa_plan(
                 qa_plan_path,
                 retry_info=retry_info_obj,
                 include_skipped=include_skipped,
+                concurrency=concurrency,
             )
         else:
             logger.info(
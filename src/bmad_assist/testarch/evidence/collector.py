@@ -29,6 +29,7 @@ from pathlib import Path
 from threading import Lock
 from typing import TYPE_CHECKING
 
+from bmad_assist.testarch.evidence.discovery import clear_discovery_cache, find_evidence_files
 from bmad_assist.testarch.evidence.models import EvidenceContext
 
 if TYPE_CHECKING:
@@ -64,11 +65,13 @@ def clear_all_collectors() -> None:
     """Clear all singleton collectors.
 
     Removes all cached EvidenceContextCollector instances from the singleton
-    storage. Used primarily for testing to ensure test isolation.
+    storage, along with memoized evidence file discovery. Used primarily for
+    testing to ensure test isolation.
 
     """
     with _collector_lock:
         _collectors.clear()
+    clear_discovery_cache()
 
 
 class EvidenceContextCollector:
@@ -99,9 +102,12 @@ class EvidenceContextCollector:
         """Get project root path."""
         return self._project_root
 
-    def _is_cache_valid(self) -> bool:
+    def _is_cache_valid(self, config: EvidenceConfig | None = None) -> bool:
         """Check if cached evidence is still valid based on file mtimes.
 
+        Args:
+            config: Evidence configuration whose source patterns to check.
+
         Returns:
             True if cache is valid (no evidence files modified since caching).
 
@@ -110,12 +116,20 @@ class EvidenceContextCollector:
             return False
 
         # Check if source files have been modified
-        current_file_mtimes = self._get_evidence_file_mtmes()
+        current_file_mtimes = self._get_evidence_file_mtmes(config)
         return current_file_mtimes == self._cached_file_mtimes
 
-    def _get_evidence_file_mtmes(self) -> dict[str, float]:
+    def _get_evidence_file_mtmes(self, config: EvidenceConfig | None = None) -> dict[str, float]:
         """Get mtimes of all discovered evidence files.
 
+        Patterns of all sources are matched in one walk of the project, which
+        is memoized until a scanned directory changes (see discovery module).
+        The sources' collect() calls reuse the same walk.
+
+        Args:
+            config: Evidence configuration; configured source patterns are
+                checked in addition to the defaults.
+
         Returns:
             Dictionary mapping file paths to their mtimes.
 
@@ -125,20 +139,21 @@ class EvidenceContextCollector:
         from bmad_assist.testarch.evidence.sources.security import SecuritySource
         from bmad_assist.testarch.evidence.sources.test_results import TestResultsSource
 
-        mtimes: dict[str, float] = {}
-
-        # Collect mtimes from all source types
+        patterns: list[str] = []
         for source_cls in (CoverageSource, TestResultsSource, SecuritySource, PerformanceSource):
-            source = source_cls()
-            for pattern in source.default_patterns:
-                for match in self._project_root.glob(pattern):
-                    if match.is_file():
-                        try:
-                            mtimes[str(match)] = match.stat().st_mtime
-                        except OSError:
-                            continue
-
-        return mtimes
+            patterns.extend(source_cls().default_patterns)
+        if config is not None:
+            for source_config in (
+                config.coverage,
+                config.test_results,
+                config.security,
+                config.performance,
+            ):
+                if source_config is not None:
+                    patterns.extend(source_config.patterns)
+
+        mtimes = find_evidence_files(self._project_root, patterns)
+        return {str(path): mtime for path, mtime in mtimes.items()}
 
     def collect_all(
         self,
@@ -159,7 +174,7 @@ class EvidenceContextCollector:
         """
         # Check cache validity first
         with self._cache_lock:
-            if self._is_cache_valid() and self._cached_evidence is not None:
+            if self._is_cache_valid(config) and self._cached_evidence is not None:
                 logger.debug("Returning cached evidence for: %s", self._project_root)
                 return self._cached_evidence
 
@@ -177,6 +192,11 @@ class EvidenceContextCollector:
                     collected_at=collected_at,
                 )
 
+            # Discover files for every source in one walk before collecting;
+            # mtimes taken now also invalidate the cache if a file changes
+            # while the sources parse it
+            file_mtimes = self._get_evidence_file_mtmes(config)
+
             # Import sources lazily to avoid circular imports
             from bmad_assist.testarch.evidence.sources.coverage import CoverageSource
             from bmad_assist.testarch.evidence.sources.performance import PerformanceSource
@@ -230,7 +250,7 @@ class EvidenceContextCollector:
             # Update cache
             self._cached_evidence = evidence
             self._cached_at = time.time()
-            self._cached_file_mtimes = self._get_evidence_file_mtmes()
+            self._cached_file_mtimes = file_mtimes
 
             logger.debug("Evidence collection complete and cached")
             return evidence
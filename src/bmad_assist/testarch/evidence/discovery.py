@@ -0,0 +1,271 @@
+"""Single-walk discovery of evidence files for TEA workflows.
+
+Evidence sources describe their files with glob patterns relative to the
+project root (e.g., "**/junit.xml"). Globbing each pattern separately walks
+the whole tree once per pattern, including node_modules and virtualenvs.
+This module walks the project once for all patterns and classifies every
+file it sees against each of them.
+
+The walk is gitignore-aware: directories ignored by .gitignore (or by the
+project tree's default exclusions) are not entered, unless a pattern names
+the directory explicitly, as "coverage/lcov.info" names "coverage/". Files
+are never filtered by .gitignore, since evidence such as .coverage or
+junit.xml is usually a gitignored build artifact. Directories no pattern
+can match below are not entered either, and symlinked directories are not
+followed.
+
+Results are memoized per project root. A snapshot stays valid while every
+scanned directory and every loaded .gitignore keeps its mtime, so checking
+it costs one lstat per scanned directory instead of a walk. File mtimes
+are always read fresh, since rewriting a file in place does not change its
+directory's mtime.
+
+Usage:
+    from bmad_assist.testarch.evidence.discovery import find_evidence_files
+
+    files = find_evidence_files(project_root, ("**/junit.xml", ".coverage"))
+    newest = max(files, key=files.__getitem__, default=None)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from fnmatch import fnmatchcase
+from pathlib import Path, PurePosixPath
+
+from bmad_assist.core.project_tree.gitignore import GitignoreParser
+
+logger = logging.getLogger(__name__)
+
+# Walk state: (pattern index, index of the next pattern segment to match)
+_State = tuple[int, int]
+
+
+def _split_pattern(pattern: str) -> tuple[str, ...] | None:
+    """Split a glob pattern into path segments.
+
+    Returns:
+        Segments with "." and empty parts removed, or None for patterns
+        that cannot match inside the project (absolute, "..", or empty).
+
+    """
+    path = PurePosixPath(pattern.replace("\\", "/"))
+    if path.is_absolute() or ".." in path.parts:
+        return None
+    parts = tuple(part for part in path.parts if part != ".")
+    # Collapse repeated "**" segments; they match the same paths
+    collapsed: list[str] = []
+    for part in parts:
+        if not (part == "**" and collapsed and collapsed[-1] == "**"):
+            collapsed.append(part)
+    return tuple(collapsed) or None
+
+
+class _PatternSet:
+    """Glob patterns compiled into segment lists for incremental matching."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = tuple(dict.fromkeys(patterns))
+        self.segments: list[tuple[str, ...]] = []
+        self.indices: list[int] = []
+        for index, pattern in enumerate(self.patterns):
+            segments = _split_pattern(pattern)
+            if segments is None:
+                logger.debug("Ignoring evidence pattern outside project: %r", pattern)
+                continue
+            self.segments.append(segments)
+            self.indices.append(index)
+
+    def _closure(self, states: Iterable[_State]) -> frozenset[_State]:
+        """Add the states reached by letting "**" match no segments."""
+        result: set[_State] = set()
+        pending = list(states)
+        while pending:
+            state = pending.pop()
+            if state in result:
+                continue
+            result.add(state)
+            pattern, pos = state
+            segments = self.segments[pattern]
+            if pos < len(segments) - 1 and segments[pos] == "**":
+                pending.append((pattern, pos + 1))
+        return frozenset(result)
+
+    def initial(self) -> frozenset[_State]:
+        """States at the project root."""
+        return self._closure((pattern, 0) for pattern in range(len(self.segments)))
+
+    def enter(self, states: frozenset[_State], name: str) -> tuple[frozenset[_State], bool]:
+        """Advance states into a subdirectory.
+
+        Args:
+            states: States of the parent directory.
+            name: Subdirectory name.
+
+        Returns:
+            Tuple of (states inside the subdirectory, whether a pattern
+            segment other than "**" matched the name).
+
+        """
+        result: list[_State] = []
+        explicit = False
+        for pattern, pos in states:
+            segments = self.segments[pattern]
+            segment = segments[pos]
+            if segment == "**":
+                result.append((pattern, pos))
+            elif pos < len(segments) - 1 and fnmatchcase(name, segment):
+                result.append((pattern, pos + 1))
+                explicit = True
+        return self._closure(result), explicit
+
+    def match_file(self, states: frozenset[_State], name: str) -> list[int]:
+        """Get the indices of patterns matching a file in a directory.
+
+        Args:
+            states: States of the file's directory.
+            name: File name.
+
+        Returns:
+            Indices into patterns, in no particular order.
+
+        """
+        matched: list[int] = []
+        for pattern, pos in states:
+            segments = self.segments[pattern]
+            if pos == len(segments) - 1:
+                segment = segments[pos]
+                if segment == "**" or fnmatchcase(name, segment):
+                    matched.append(self.indices[pattern])
+        return matched
+
+
+class _DiscoverySnapshot:
+    """Result of one walk: candidate files per pattern and what was scanned."""
+
+    def __init__(self, project_root: Path, patterns: Iterable[str]) -> None:
+        self.pattern_set = _PatternSet(patterns)
+        self.files: list[list[Path]] = [[] for _ in self.pattern_set.patterns]
+        self.scanned_dirs: dict[str, int] = {}
+        self.gitignore = GitignoreParser(project_root)
+        self._walk(project_root)
+
+    @property
+    def patterns(self) -> tuple[str, ...]:
+        """Patterns this snapshot classified files for."""
+        return self.pattern_set.patterns
+
+    def _walk(self, project_root: Path) -> None:
+        """Scan the tree once, entering only directories a pattern can reach."""
+        initial = self.pattern_set.initial()
+        if not initial:
+            return
+        pending: list[tuple[Path, Path, frozenset[_State]]] = [(project_root, Path(), initial)]
+        while pending:
+            dir_path, rel_dir, states = pending.pop()
+            try:
+                self.scanned_dirs[str(dir_path)] = os.lstat(dir_path).st_mtime_ns
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError as e:
+                logger.debug("Skipping unreadable directory %s: %s", dir_path, e)
+                continue
+
+            subdirs: list[tuple[Path, Path, frozenset[_State]]] = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        child_states, explicit = self.pattern_set.enter(states, entry.name)
+                        if not child_states:
+                            continue
+                        rel_path = rel_dir / entry.name
+                        if not explicit and self.gitignore.is_ignored_entry(rel_path, is_dir=True):
+                            continue
+                        subdirs.append((Path(entry.path), rel_path, child_states))
+                    elif entry.is_file():
+                        for index in self.pattern_set.match_file(states, entry.name):
+                            self.files[index].append(Path(entry.path))
+                except OSError:
+                    continue
+            # Reversed so the stack pops subdirectories in name order
+            pending.extend(reversed(subdirs))
+
+    def is_valid(self) -> bool:
+        """Check that no scanned directory or loaded .gitignore has changed.
+
+        Returns:
+            True if all recorded directory and .gitignore mtimes still match.
+
+        """
+        recorded: list[tuple[str | Path, int]] = [
+            *self.scanned_dirs.items(),
+            *self.gitignore.loaded_mtimes.items(),
+        ]
+        for path, mtime_ns in recorded:
+            try:
+                if os.lstat(path).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+
+# Module-level snapshots keyed by resolved project root, shared by all
+# collectors and sources in the process
+_snapshots: dict[Path, _DiscoverySnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def clear_discovery_cache() -> None:
+    """Drop all memoized evidence discovery snapshots."""
+    with _snapshots_lock:
+        _snapshots.clear()
+
+
+def find_evidence_files(project_root: Path, patterns: Iterable[str]) -> dict[Path, float]:
+    """Find files matching any of the patterns, with their current mtimes.
+
+    Reuses the project's memoized snapshot when it is still valid and was
+    built for a superset of the patterns. Otherwise the tree is walked again
+    for the union of both pattern sets, so sources asking in turn share one
+    walk.
+
+    Args:
+        project_root: Project root directory.
+        patterns: Glob patterns relative to the project root.
+
+    Returns:
+        Dictionary mapping matched files to their mtimes, ordered by
+        pattern and then by path. Files that vanished are omitted.
+
+    """
+    root = project_root.resolve()
+    requested = tuple(dict.fromkeys(patterns))
+    with _snapshots_lock:
+        snapshot = _snapshots.get(root)
+        if (
+            snapshot is None
+            or not set(requested) <= set(snapshot.patterns)
+            or not snapshot.is_valid()
+        ):
+            known = snapshot.patterns if snapshot is not None else ()
+            snapshot = _DiscoverySnapshot(root, (*known, *requested))
+            _snapshots[root] = snapshot
+            logger.debug(
+                "Scanned %d directories for evidence in %s", len(snapshot.scanned_dirs), root
+            )
+
+    positions = {pattern: index for index, pattern in enumerate(snapshot.patterns)}
+    mtimes: dict[Path, float] = {}
+    for pattern in requested:
+        for path in snapshot.files[positions[pattern]]:
+            if path in mtimes:
+                continue
+            try:
+                mtimes[path] = path.stat().st_mtime
+            except OSError:
+                continue
+    return mtimes
@@ -24,6 +24,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from bmad_assist.testarch.evidence.discovery import find_evidence_files
+
 if TYPE_CHECKING:
     from bmad_assist.testarch.config import SourceConfigModel
     from bmad_assist.testarch.evidence.models import SourceConfig
@@ -126,3 +128,22 @@ class EvidenceSource(ABC):
         if config is None:
             return default
         return config.timeout
+
+    def _find_newest_file(self, project_root: Path, patterns: tuple[str, ...]) -> Path | None:
+        """Find the most recently modified file matching any pattern.
+
+        Uses the shared single-walk discovery, so sources collected one after
+        another reuse the same scan of the project.
+
+        Args:
+            project_root: Root directory of the project.
+            patterns: Glob patterns relative to project_root.
+
+        Returns:
+            Newest matching file (the first in pattern order on ties), or None.
+
+        """
+        mtimes = find_evidence_files(project_root, patterns)
+        if not mtimes:
+            return None
+        return max(mtimes, key=mtimes.__getitem__)
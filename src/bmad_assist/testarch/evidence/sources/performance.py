@@ -73,19 +73,7 @@ class PerformanceSource(EvidenceSource):
         patterns = self._get_patterns(config)
 
         # Find the most recently modified matching file
-        best_file: Path | None = None
-        best_mtime: float = 0.0
-
-        for pattern in patterns:
-            for match in project_root.glob(pattern):
-                if match.is_file():
-                    try:
-                        mtime = match.stat().st_mtime
-                        if mtime > best_mtime:
-                            best_mtime = mtime
-                            best_file = match
-                    except OSError:
-                        continue
+        best_file = self._find_newest_file(project_root, patterns)
 
         if best_file is None:
             logger.debug("No performance files found in %s", project_root)
@@ -88,19 +88,7 @@ class SecuritySource(EvidenceSource):
         command_str = config.command if config else None
 
         # First try to find existing audit files
-        best_file: Path | None = None
-        best_mtime: float = 0.0
-
-        for pattern in patterns:
-            for match in project_root.glob(pattern):
-                if match.is_file():
-                    try:
-                        mtime = match.stat().st_mtime
-                        if mtime > best_mtime:
-                            best_mtime = mtime
-                            best_file = match
-                    except OSError:
-                        continue
+        best_file = self._find_newest_file(project_root, patterns)
 
         if best_file is not None:
             logger.debug("Parsing security file: %s", best_file)
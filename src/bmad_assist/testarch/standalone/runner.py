@@ -8,7 +8,6 @@ Story 25.13: TEA Standalone Runner & CLI.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 import tempfile
@@ -91,8 +90,8 @@ def _dispatch_tea_notification(
             duration_ms=duration_ms,
         )
 
-        # Dispatch async in sync context
-        asyncio.run(dispatcher.dispatch(EventType.PHASE_COMPLETED, payload))
+        # Queued for the background worker; delivered at the latest on exit
+        dispatcher.submit(EventType.PHASE_COMPLETED, payload)
         logger.debug("Dispatched TEA notification for %s", workflow_id)
 
     except Exception as e:
@@ -31,7 +31,7 @@ import subprocess
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from bmad_assist import __version__
@@ -315,6 +315,7 @@ def _finalize_evaluation_record(
     story_info: StoryInfo,
     anonymized_id: str,
     sequence_position: int,
+    quorum: dict[str, Any] | None = None,
 ) -> LLMEvaluationRecord:
     """Create complete LLMEvaluationRecord from all sources.
 
@@ -329,11 +330,16 @@ def _finalize_evaluation_record(
         story_info: Story metadata.
         anonymized_id: Anonymized validator ID.
         sequence_position: Order in which validator completed.
+        quorum: Optional QuorumDecision.to_dict() when quorum mode was used.
 
     Returns:
         Complete LLMEvaluationRecord ready for storage.
 
     """
+    custom: dict[str, Any] = {"complexity_flags": extracted.to_complexity_flags()}
+    if quorum is not None:
+        custom["quorum"] = quorum
+
     evaluator = _create_evaluator_info(
         validation_output,
         role=EvaluatorRole.VALIDATOR,
@@ -365,7 +371,7 @@ def _finalize_evaluation_record(
         consensus=None,  # Populated by Story 13.6
         ground_truth=None,  # Populated by Story 13.7
         environment=environment,
-        custom={"complexity_flags": extracted.to_complexity_flags()},
+        custom=custom,
     )
 
 
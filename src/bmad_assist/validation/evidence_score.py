@@ -38,6 +38,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Literal
 
+from bmad_assist.core.dedup import FuzzyMatchIndex
 from bmad_assist.core.exceptions import BmadAssistError
 
 logger = logging.getLogger(__name__)
@@ -600,35 +601,34 @@ def _deduplicate_findings(
     deduped: list[EvidenceFinding] = []
     consensus_counts: dict[str, int] = {}
     seen_validators: dict[str, set[str]] = {}  # normalized_desc -> set of validator_ids
+    # Kept descriptions by position in deduped (same matches as _are_findings_similar)
+    index = FuzzyMatchIndex(_DEDUP_SIMILARITY_THRESHOLD)
 
     for finding in all_findings:
         norm_desc = finding.normalized_description
 
         # Check if similar to existing
-        matched = False
-        for existing in deduped:
-            if _are_findings_similar(finding, existing):
-                # Found match - track validator
-                existing_norm = existing.normalized_description
-                if finding.validator_id not in seen_validators.get(existing_norm, set()):
-                    seen_validators.setdefault(existing_norm, set()).add(finding.validator_id)
-                    consensus_counts[existing_norm] = len(seen_validators[existing_norm])
-
-                # Replace if higher severity
-                if severity_priority[finding.severity] > severity_priority[existing.severity]:
-                    idx = deduped.index(existing)
-                    deduped[idx] = finding
-                    # Fix: Update consensus tracking to use new finding's normalized_description
-                    # This ensures lookup in aggregate_evidence_scores() finds the correct count
-                    new_norm = finding.normalized_description
-                    if new_norm != existing_norm:
-                        seen_validators[new_norm] = seen_validators.pop(existing_norm)
-                        consensus_counts[new_norm] = consensus_counts.pop(existing_norm)
-                matched = True
-                break
-
-        if not matched:
+        idx = index.find(norm_desc)
+        if idx is not None:
+            existing = deduped[idx]
+            # Found match - track validator
+            existing_norm = existing.normalized_description
+            if finding.validator_id not in seen_validators.get(existing_norm, set()):
+                seen_validators.setdefault(existing_norm, set()).add(finding.validator_id)
+                consensus_counts[existing_norm] = len(seen_validators[existing_norm])
+
+            # Replace if higher severity
+            if severity_priority[finding.severity] > severity_priority[existing.severity]:
+                deduped[idx] = finding
+                index.set(idx, norm_desc)
+                # Fix: Update consensus tracking to use new finding's normalized_description
+                # This ensures lookup in aggregate_evidence_scores() finds the correct count
+                if norm_desc != existing_norm:
+                    seen_validators[norm_desc] = seen_validators.pop(existing_norm)
+                    consensus_counts[norm_desc] = consensus_counts.pop(existing_norm)
+        else:
             # New unique finding
+            index.set(len(deduped), norm_desc)
             deduped.append(finding)
             seen_validators[norm_desc] = {finding.validator_id}
             consensus_counts[norm_desc] = 1
@@ -25,6 +25,7 @@ Public API:
     ValidationError: Base exception for validation errors
     InsufficientValidationsError: Raised when fewer than minimum validations completed
     ValidationPhaseResult: Result dataclass for validation phase
+    QuorumDecision: Outcome of quorum-based early completion
     run_validation_phase: Main orchestration function
     save_validations_for_synthesis: Save validations for inter-handler passing
     load_validations_for_synthesis: Load validations from cache
@@ -34,9 +35,12 @@ import asyncio
 import json
 import logging
 import os
+import threading
+import time
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -54,7 +58,10 @@ from bmad_assist.core.config.models.providers import (
     get_phase_provider_config,
 )
 from bmad_assist.core.exceptions import BmadAssistError
+from bmad_assist.core.extraction import VALIDATION_MARKERS
+from bmad_assist.core.hedging import HedgePlan, build_hedge_plan
 from bmad_assist.core.io import get_original_cwd, save_prompt
+from bmad_assist.core.report_stream import ReportStream
 from bmad_assist.core.retry import invoke_with_timeout_retry
 
 # get_paths() NOT used - validations_dir derived from project_path directly
@@ -97,6 +104,7 @@ __all__ = [
     "ValidationError",
     "InsufficientValidationsError",
     "ValidationPhaseResult",
+    "QuorumDecision",
     "run_validation_phase",
     "save_validations_for_synthesis",
     "load_validations_for_synthesis",
@@ -151,6 +159,48 @@ class InsufficientValidationsError(ValidationError):
         )
 
 
+@dataclass
+class QuorumDecision:
+    """Outcome of quorum-based early completion (validation_quorum config).
+
+    Attributes:
+        required: Successful validators needed to proceed.
+        total: Validators launched.
+        reached: True if the quorum was met while validators were still running.
+        reached_at_ms: Phase elapsed time when the quorum was met, or None.
+        decided_at_ms: Phase elapsed time when all waiting ended.
+        cancelled_validators: Stragglers cancelled after the grace window.
+        max_saved_ms: Upper bound on wall-clock saved: the per-attempt validator
+            timeout minus decided_at_ms, when stragglers were cancelled.
+
+    """
+
+    required: int
+    total: int
+    reached: bool
+    reached_at_ms: int | None
+    decided_at_ms: int
+    cancelled_validators: list[str] = field(default_factory=list)
+    max_saved_ms: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for PhaseResult.outputs and benchmarking records.
+
+        Returns:
+            Dictionary with serializable values.
+
+        """
+        return {
+            "required": self.required,
+            "total": self.total,
+            "reached": self.reached,
+            "reached_at_ms": self.reached_at_ms,
+            "decided_at_ms": self.decided_at_ms,
+            "cancelled_validators": self.cancelled_validators,
+            "max_saved_ms": self.max_saved_ms,
+        }
+
+
 @dataclass
 class ValidationPhaseResult:
     """Result of the validation phase.
@@ -164,6 +214,7 @@ class ValidationPhaseResult:
         evaluation_records: Benchmarking records (Story 13.4), one per successful validator.
         evidence_aggregate: Pre-calculated Evidence Score aggregate (TIER 2).
         deep_verify_result: Deep Verify validation result (Story 26.16) or None.
+        quorum: Quorum decision when validation_quorum is enabled, else None.
 
     """
 
@@ -175,6 +226,7 @@ class ValidationPhaseResult:
     evaluation_records: list["LLMEvaluationRecord"] = field(default_factory=list)
     evidence_aggregate: "EvidenceScoreAggregate | None" = None
     deep_verify_result: DeepVerifyValidationResult | None = None
+    quorum: QuorumDecision | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for PhaseResult.outputs.
@@ -206,6 +258,9 @@ class ValidationPhaseResult:
                 ),
             }
 
+        if self.quorum is not None:
+            data["quorum"] = self.quorum.to_dict()
+
         return data
 
 
@@ -293,6 +348,8 @@ async def _invoke_validator(
     display_model: str | None = None,
     thinking: bool | None = None,
     reasoning_effort: str | None = None,
+    cancel_token: threading.Event | None = None,
+    hedge: HedgePlan | None = None,
 ) -> tuple[str, ValidationOutput | None, DeterministicMetrics | None, str | None]:
     """Invoke a single validator using asyncio.to_thread.
 
@@ -321,6 +378,8 @@ async def _invoke_validator(
             If None, auto-detected from model name.
         reasoning_effort: Reasoning effort level for supported providers (codex).
             Valid values: minimal, low, medium, high, xhigh.
+        cancel_token: Optional event set by quorum mode to cancel a straggler.
+        hedge: Optional HedgePlan launching a backup invocation on slow attempts.
 
     Returns:
         Tuple of (provider_id, ValidationOutput or None, DeterministicMetrics or None,
@@ -345,14 +404,38 @@ async def _invoke_validator(
             fallback_invoke_fn = ClaudeSubprocessProvider().invoke
             logger.debug("Configured subprocess fallback for %s", provider_id)
 
+        if hedge is not None:
+            # Backup invocation gets its own guard so tool-call counters stay separate
+            hedge = replace(hedge, backup_kwargs={"guard": ToolCallGuard()})
+
+        # Extract the report while the validator streams; once its end marker
+        # arrives, deterministic metrics are collected in the background
+        context = CollectorContext(
+            story_epic=epic_num,
+            story_num=story_num,
+            timestamp=validation_timestamp,
+        )
+        report_stream: ReportStream[DeterministicMetrics] = ReportStream(
+            VALIDATION_MARKERS,
+            parse=(
+                partial(collect_deterministic_metrics, context=context)
+                if benchmarking_enabled
+                else None
+            ),
+        )
+        invoke_fn = report_stream.wrap(provider.invoke)
+        if fallback_invoke_fn is not None:
+            fallback_invoke_fn = report_stream.wrap(fallback_invoke_fn)
+
         # Use asyncio.to_thread with timeout retry wrapper
         # invoke_with_timeout_retry handles ProviderTimeoutError with configurable retry
         result = await asyncio.to_thread(
             invoke_with_timeout_retry,
-            provider.invoke,
+            invoke_fn,
             timeout_retries=timeout_retries,
             phase_name="validate_story",
             fallback_invoke_fn=fallback_invoke_fn,
+            hedge=hedge,
             prompt=prompt,
             model=model,
             timeout=timeout,
@@ -364,13 +447,17 @@ async def _invoke_validator(
             thinking=thinking,
             reasoning_effort=reasoning_effort,
             guard=guard,
+            cancel_token=cancel_token,
         )
 
         # Retry once if validator's guard fired
         from bmad_assist.providers.tool_guard import GUARD_TERMINATION_PREFIX
 
-        if result.termination_reason and result.termination_reason.startswith(
-            GUARD_TERMINATION_PREFIX
+        cancelled = cancel_token is not None and cancel_token.is_set()
+        if (
+            not cancelled
+            and result.termination_reason
+            and result.termination_reason.startswith(GUARD_TERMINATION_PREFIX)
         ):
             logger.warning(
                 "ToolCallGuard triggered for validator %s: %s — retrying once",
@@ -380,10 +467,11 @@ async def _invoke_validator(
             guard.reset_for_retry()
             result = await asyncio.to_thread(
                 invoke_with_timeout_retry,
-                provider.invoke,
+                invoke_fn,
                 timeout_retries=timeout_retries,
                 phase_name="validate_story",
                 fallback_invoke_fn=fallback_invoke_fn,
+                hedge=hedge,
                 prompt=prompt,
                 model=model,
                 timeout=timeout,
@@ -395,6 +483,7 @@ async def _invoke_validator(
                 thinking=thinking,
                 reasoning_effort=reasoning_effort,
                 guard=guard,
+                cancel_token=cancel_token,
             )
             if result.termination_reason and result.termination_reason.startswith(
                 GUARD_TERMINATION_PREFIX
@@ -406,6 +495,11 @@ async def _invoke_validator(
 
         duration_ms = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
 
+        if cancel_token is not None and cancel_token.is_set() and result.exit_code != 0:
+            error_msg = f"Validator {provider_id} cancelled after quorum was reached"
+            logger.info(error_msg)
+            return provider_id, None, None, error_msg
+
         if result.exit_code != 0:
             error_msg = result.stderr or f"Provider exited with code {result.exit_code}"
             logger.warning(
@@ -446,12 +540,9 @@ async def _invoke_validator(
         deterministic: DeterministicMetrics | None = None
         if benchmarking_enabled:
             try:
-                context = CollectorContext(
-                    story_epic=epic_num,
-                    story_num=story_num,
-                    timestamp=validation_timestamp,
-                )
-                deterministic = collect_deterministic_metrics(extracted_content, context)
+                deterministic = report_stream.parsed(extracted_content)
+                if deterministic is None:
+                    deterministic = collect_deterministic_metrics(extracted_content, context)
                 logger.debug("Collected deterministic metrics for %s", provider_id)
             except Exception as e:
                 logger.warning(
@@ -509,6 +600,121 @@ def _compile_validation_prompt(
     return compiled.context
 
 
+def _is_successful_validator(task: "asyncio.Task[_GatherResult]") -> bool:
+    """Check whether a finished task is a validator that produced output."""
+    if task.cancelled() or task.exception() is not None:
+        return False
+    result = task.result()
+    return not isinstance(result, DeepVerifyValidationResult) and result[1] is not None
+
+
+async def _gather_with_quorum(
+    tasks: "list[asyncio.Task[_GatherResult]]",
+    validator_ids: list[str | None],
+    cancel_tokens: list[threading.Event | None],
+    providers: list[BaseProvider | None],
+    required: int,
+    grace_period: float,
+    cancel_wait: float,
+    timeout: int,
+) -> tuple[list[_GatherResult | BaseException], QuorumDecision]:
+    """Wait for validators until a quorum succeeded, then cancel stragglers.
+
+    Once `required` validators have produced output, the remaining ones get
+    `grace_period` seconds to finish. Any still running are cancelled via
+    their cancel token (and provider.cancel()); those that do not stop within
+    `cancel_wait` seconds are abandoned. Non-validator tasks (Deep Verify) are
+    never cancelled and are always awaited.
+
+    Args:
+        tasks: All phase tasks, validators and Deep Verify.
+        validator_ids: Provider ID per task, or None for non-validator tasks.
+        cancel_tokens: Cancel token per task, or None for non-validator tasks.
+        providers: Provider instance per task, or None for non-validator tasks.
+        required: Successful validators needed to proceed.
+        grace_period: Seconds stragglers may still finish after quorum.
+        cancel_wait: Seconds to wait for cancelled stragglers to stop.
+        timeout: Per-attempt validator timeout in seconds (for savings estimate).
+
+    Returns:
+        Tuple of (results in task order, QuorumDecision). Abandoned
+        stragglers are reported as failed validator results.
+
+    """
+    start = time.monotonic()
+    validator_tasks = {t for t, vid in zip(tasks, validator_ids, strict=True) if vid is not None}
+    pending: set[asyncio.Task[_GatherResult]] = set(tasks)
+    succeeded = 0
+    reached_at_ms: int | None = None
+
+    while pending & validator_tasks:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        succeeded += sum(1 for t in done if t in validator_tasks and _is_successful_validator(t))
+        if succeeded >= required and pending & validator_tasks:
+            reached_at_ms = int((time.monotonic() - start) * 1000)
+            break
+
+    cancelled: list[str] = []
+    if reached_at_ms is not None:
+        logger.info(
+            "Validation quorum reached (%d/%d succeeded) - allowing %.0fs grace for stragglers",
+            succeeded,
+            len(validator_tasks),
+            grace_period,
+        )
+        stragglers = pending & validator_tasks
+        if grace_period > 0:
+            await asyncio.wait(stragglers, timeout=grace_period)
+        stragglers = {t for t in stragglers if not t.done()}
+
+        for idx, task in enumerate(tasks):
+            if task not in stragglers:
+                continue
+            token, provider = cancel_tokens[idx], providers[idx]
+            if token is not None:
+                token.set()
+            if provider is not None:
+                try:
+                    provider.cancel()
+                except Exception as e:
+                    logger.debug("provider.cancel() failed for %s: %s", validator_ids[idx], e)
+            cancelled.append(validator_ids[idx] or "")
+            logger.info("Cancelling straggler validator %s after quorum", validator_ids[idx])
+
+        if stragglers:
+            _, still_running = await asyncio.wait(stragglers, timeout=cancel_wait)
+            for task in still_running:
+                # Provider ignored the cancel token; stop waiting for its thread
+                task.cancel()
+
+    results: list[_GatherResult | BaseException] = list(
+        await asyncio.gather(*tasks, return_exceptions=True)
+    )
+    for idx, result in enumerate(results):
+        if isinstance(result, asyncio.CancelledError) and validator_ids[idx] is not None:
+            provider_id = validator_ids[idx] or ""
+            error_msg = f"Validator {provider_id} abandoned after quorum"
+            results[idx] = (provider_id, None, None, error_msg)
+
+    decided_at_ms = int((time.monotonic() - start) * 1000)
+    # A straggler may still have finished successfully while being cancelled
+    cancelled = [
+        vid
+        for vid, result in zip(validator_ids, results, strict=True)
+        if vid in cancelled and isinstance(result, tuple) and result[1] is None
+    ]
+    decision = QuorumDecision(
+        required=required,
+        total=len(validator_tasks),
+        reached=reached_at_ms is not None,
+        reached_at_ms=reached_at_ms,
+        decided_at_ms=decided_at_ms,
+        cancelled_validators=cancelled,
+        max_saved_ms=max(0, timeout * 1000 - decided_at_ms) if cancelled else 0,
+    )
+    return results, decision
+
+
 async def run_validation_phase(
     config: Config,
     project_path: Path,
@@ -572,6 +778,11 @@ async def run_validation_phase(
 
     # Type now includes DeterministicMetrics as 3rd element (AC1)
     tasks: list[asyncio.Task[_ValidatorResult]] = []
+    # Parallel to tasks: provider ID, cancel token and provider per validator
+    # (None for Deep Verify) so quorum mode can cancel stragglers
+    task_validator_ids: list[str | None] = []
+    cancel_tokens: list[threading.Event | None] = []
+    validator_providers: list[BaseProvider | None] = []
 
     # Add multi providers (from phase_models if configured, else global providers.multi)
     # Restrict tools to prevent file modification (only TodoWrite allowed)
@@ -594,6 +805,7 @@ async def run_validation_phase(
         provider = get_provider(multi_config.provider)
         # Use display_model (model_name if set) for logging, model for CLI invocation
         provider_id = f"{multi_config.provider}-{multi_config.display_model}"
+        cancel_token = threading.Event()
         # Staggered start: each task waits idx * delay before starting
         # Parse delay at runtime for each task (randomization per-call if range configured)
         delay = parse_parallel_delay(config.parallel_delay) * idx
@@ -616,9 +828,22 @@ async def run_validation_phase(
             display_model=multi_config.display_model,
             thinking=multi_config.thinking,
             reasoning_effort=multi_config.reasoning_effort,
+            cancel_token=cancel_token,
+            hedge=build_hedge_plan(
+                config,
+                project_path,
+                "validate_story",
+                provider,
+                multi_config.provider,
+                multi_config.model,
+                timeout,
+            ),
         )
         task = asyncio.create_task(delayed_invoke(delay, coro))
         tasks.append(task)
+        task_validator_ids.append(provider_id)
+        cancel_tokens.append(cancel_token)
+        validator_providers.append(provider)
 
     # Add master as validator ONLY when using global providers.multi fallback
     # When phase_models.validate_story is defined, user has full control - no auto-add
@@ -626,6 +851,7 @@ async def run_validation_phase(
     if not phase_has_override:
         master_provider = get_provider(config.providers.master.provider)
         master_id = f"master-{config.providers.master.display_model}"
+        master_cancel_token = threading.Event()
         master_color_index = len(multi_configs)
         # Staggered start for master: uses next index after all multi configs
         master_delay = parse_parallel_delay(config.parallel_delay) * master_color_index
@@ -646,9 +872,22 @@ async def run_validation_phase(
             color_index=master_color_index,
             cwd=project_path,
             display_model=config.providers.master.display_model,
+            cancel_token=master_cancel_token,
+            hedge=build_hedge_plan(
+                config,
+                project_path,
+                "validate_story",
+                master_provider,
+                config.providers.master.provider,
+                config.providers.master.model,
+                timeout,
+            ),
         )
         master_task = asyncio.create_task(delayed_invoke(master_delay, master_coro))
         tasks.append(master_task)
+        task_validator_ids.append(master_id)
+        cancel_tokens.append(master_cancel_token)
+        validator_providers.append(master_provider)
     else:
         logger.debug("phase_models.validate_story defined - master NOT auto-added")
 
@@ -668,6 +907,9 @@ async def run_validation_phase(
         )
         dv_task = asyncio.create_task(delayed_invoke(dv_delay, dv_coro))
         tasks.append(dv_task)
+        task_validator_ids.append(None)
+        cancel_tokens.append(None)
+        validator_providers.append(None)
         logger.info("Deep Verify enabled - will run in parallel with validators")
 
     validator_count = len(tasks) - (1 if dv_enabled else 0)
@@ -714,7 +956,29 @@ async def run_validation_phase(
     ]
 
     logger.debug("GATHER_DEBUG: Waiting for %d tasks: %s", len(tracked_tasks), task_names)
-    results = await asyncio.gather(*tracked_tasks, return_exceptions=True)
+    quorum_config = config.validation_quorum
+    quorum_required = min(max(quorum_config.min_validators, _MIN_VALIDATORS), validator_count)
+    quorum_decision: QuorumDecision | None = None
+    if quorum_config.enabled and quorum_required < validator_count:
+        # Quorum mode: proceed once enough validators succeeded, cancel stragglers
+        results, quorum_decision = await _gather_with_quorum(
+            [asyncio.ensure_future(t) for t in tracked_tasks],
+            task_validator_ids,
+            cancel_tokens,
+            validator_providers,
+            required=quorum_required,
+            grace_period=quorum_config.grace_period,
+            cancel_wait=quorum_config.cancel_wait,
+            timeout=timeout,
+        )
+        logger.info(
+            "Validation quorum decision: reached=%s, cancelled=%s, max_saved=%dms",
+            quorum_decision.reached,
+            quorum_decision.cancelled_validators,
+            quorum_decision.max_saved_ms,
+        )
+    else:
+        results = await asyncio.gather(*tracked_tasks, return_exceptions=True)
     logger.debug("GATHER_DEBUG: All tasks completed")
 
     # Step 4: Collect successful results (now includes deterministic metrics)
@@ -921,6 +1185,7 @@ async def run_validation_phase(
                     story_info=story_info,
                     anonymized_id=anonymized_id,
                     sequence_position=idx,
+                    quorum=quorum_decision.to_dict() if quorum_decision else None,
                 )
                 evaluation_records.append(record)
 
@@ -967,6 +1232,7 @@ async def run_validation_phase(
         evaluation_records=evaluation_records,
         evidence_aggregate=evidence_aggregate,
         deep_verify_result=dv_result,
+        quorum=quorum_decision,
     )
     logger.debug("HANG_DEBUG: ValidationPhaseResult created, returning from run_validation_phase")
     return phase_result
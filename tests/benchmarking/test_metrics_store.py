@@ -0,0 +1,164 @@
+"""Tests for the benchmark metrics store."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+import yaml
+
+from bmad_assist.benchmarking.metrics_store import METRICS_DB_FILENAME, MetricsStore
+from bmad_assist.benchmarking.schema import (
+    EnvironmentInfo,
+    EvaluatorInfo,
+    EvaluatorRole,
+    ExecutionTelemetry,
+    LLMEvaluationRecord,
+    OutputAnalysis,
+    PatchInfo,
+    StoryInfo,
+    WorkflowInfo,
+)
+from bmad_assist.benchmarking.storage import save_evaluation_record
+
+
+def _record(
+    record_id: str,
+    story_num: int,
+    workflow_id: str,
+    duration_ms: int,
+    role: EvaluatorRole = EvaluatorRole.VALIDATOR,
+    epic_num: int = 13,
+    minute: int = 0,
+) -> LLMEvaluationRecord:
+    created = datetime(2025, 12, 19, 14, minute, 0, tzinfo=UTC)
+    return LLMEvaluationRecord(
+        record_id=record_id,
+        created_at=created,
+        workflow=WorkflowInfo(
+            id=workflow_id,
+            version="1.0.0",
+            variant="default",
+            patch=PatchInfo(applied=False),
+        ),
+        story=StoryInfo(
+            epic_num=epic_num,
+            story_num=story_num,
+            title=f"Story {epic_num}.{story_num} title",
+            complexity_flags={},
+        ),
+        evaluator=EvaluatorInfo(
+            provider="claude",
+            model="opus",
+            role=role,
+            role_id="a" if role == EvaluatorRole.VALIDATOR else None,
+            session_id="session",
+        ),
+        execution=ExecutionTelemetry(
+            start_time=created,
+            end_time=created,
+            duration_ms=duration_ms,
+            input_tokens=0,
+            output_tokens=0,
+            retries=0,
+            sequence_position=0,
+        ),
+        output=OutputAnalysis(
+            char_count=1,
+            heading_count=0,
+            list_depth_max=0,
+            code_block_count=0,
+            sections_detected=[],
+        ),
+        environment=EnvironmentInfo(
+            bmad_assist_version="0.1.0",
+            python_version="3.11.0",
+            platform="linux",
+            git_commit_hash=None,
+        ),
+    )
+
+
+@pytest.fixture
+def base_dir(tmp_path: Path) -> Path:
+    """Base directory with three saved records for epic 13 and one for epic 14."""
+    base = tmp_path / "artifacts"
+    save_evaluation_record(_record("r1", 1, "validate-story", 1000, minute=1), base)
+    save_evaluation_record(_record("r2", 1, "code-review", 3000, minute=2), base)
+    save_evaluation_record(
+        _record("r3", 2, "code-review", 5000, role=EvaluatorRole.SYNTHESIZER, minute=3), base
+    )
+    save_evaluation_record(_record("r4", 1, "validate-story", 7000, epic_num=14, minute=4), base)
+    return base
+
+
+class TestMetricsStore:
+    """Tests for MetricsStore."""
+
+    def test_save_populates_store(self, base_dir: Path) -> None:
+        """save_evaluation_record() writes rows as records are saved."""
+        assert (base_dir / "benchmarks" / METRICS_DB_FILENAME).exists()
+
+    def test_epic_metrics(self, base_dir: Path) -> None:
+        """Epic metrics aggregate totals, workflows and stories."""
+        metrics = MetricsStore(base_dir / "benchmarks").epic_metrics("13")
+
+        assert metrics is not None
+        assert metrics["total_duration_ms"] == 9000
+        assert metrics["story_count"] == 2
+        assert metrics["workflow_breakdown"] == {
+            "validate-story": {"count": 1, "total_duration_ms": 1000},
+            "code-review": {"count": 2, "total_duration_ms": 8000},
+        }
+        assert [s["story_num"] for s in metrics["stories"]] == [1, 2]
+        assert metrics["stories"][0]["title"] == "Story 13.1 title"
+        assert metrics["stories"][1]["workflows"]["code-review"] == {
+            "duration_ms": 5000,
+            "roles": ["synthesizer"],
+        }
+
+    def test_epic_without_records(self, base_dir: Path) -> None:
+        """Unknown epics return None."""
+        assert MetricsStore(base_dir / "benchmarks").epic_metrics(99) is None
+
+    def test_duration_summary_by_workflow(self, base_dir: Path) -> None:
+        """Per-workflow aggregation, optionally restricted to an epic."""
+        store = MetricsStore(base_dir / "benchmarks")
+
+        rows = {r["workflow_id"]: r for r in store.duration_summary("workflow", epic_id=13)}
+
+        assert rows["code-review"]["count"] == 2
+        assert rows["code-review"]["avg_duration_ms"] == 4000
+        assert rows["code-review"]["max_duration_ms"] == 5000
+        assert rows["validate-story"]["total_duration_ms"] == 1000
+
+    def test_duration_summary_by_role(self, base_dir: Path) -> None:
+        """Per-role aggregation across all epics."""
+        rows = MetricsStore(base_dir / "benchmarks").duration_summary("role")
+
+        assert {r["role"]: r["count"] for r in rows} == {"synthesizer": 1, "validator": 3}
+
+    def test_backfill_existing_records(self, base_dir: Path) -> None:
+        """Records written before the store existed are backfilled on first query."""
+        benchmarks_dir = base_dir / "benchmarks"
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{benchmarks_dir / METRICS_DB_FILENAME}{suffix}").unlink(missing_ok=True)
+
+        store = MetricsStore(benchmarks_dir)
+        metrics = store.epic_metrics(13)
+
+        assert metrics is not None
+        assert metrics["total_duration_ms"] == 9000
+        assert store.backfill() == 0
+
+    def test_backfill_picks_up_new_files(self, base_dir: Path) -> None:
+        """Explicit backfill adds eval files the store has not seen."""
+        store = MetricsStore(base_dir / "benchmarks")
+        store.ensure_backfilled()
+        month_dir = next(p for p in (base_dir / "benchmarks").iterdir() if p.is_dir())
+        data = _record("r5", 3, "dev-story", 2000).model_dump(mode="json")
+        (month_dir / "eval-13-3-master-manual.yaml").write_text(yaml.dump(data))
+
+        assert store.backfill() == 1
+        metrics = store.epic_metrics(13)
+        assert metrics is not None
+        assert metrics["workflow_breakdown"]["dev-story"]["total_duration_ms"] == 2000
@@ -3,8 +3,14 @@
 Tests storage layer for saving, loading, and querying LLM evaluation records.
 """
 
+import fcntl
+import json
+import multiprocessing
+import os
+import time
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -113,6 +119,14 @@ def temp_base_dir(tmp_path: Path) -> Path:
     return tmp_path / "docs" / "sprint-artifacts"
 
 
+def _save_in_child(record: LLMEvaluationRecord, base_dir: Path, go: Any) -> None:
+    """Save a record from a separate process once signalled (compaction race test)."""
+    from bmad_assist.benchmarking.storage import save_evaluation_record
+
+    if go.wait(timeout=10):
+        save_evaluation_record(record, base_dir)
+
+
 # =============================================================================
 # Task 1 Tests: Module Structure and Dataclasses
 # =============================================================================
@@ -391,21 +405,25 @@ class TestSaveEvaluationRecord:
 class TestIndexFileManagement:
     """Test AC8: Index file auto-update."""
 
+    @staticmethod
+    def _read_index(index_path: Path) -> list[dict[str, Any]]:
+        return [json.loads(line) for line in index_path.read_text().splitlines() if line]
+
     def test_save_creates_index_file(
         self, sample_record: LLMEvaluationRecord, temp_base_dir: Path
     ) -> None:
-        """Test save creates index.yaml in month directory."""
+        """Test save creates index.jsonl in month directory."""
         from bmad_assist.benchmarking.storage import save_evaluation_record
 
         save_evaluation_record(sample_record, temp_base_dir)
 
-        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.yaml"
+        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.jsonl"
         assert index_path.exists()
 
     def test_save_updates_existing_index(
         self, sample_record: LLMEvaluationRecord, temp_base_dir: Path
     ) -> None:
-        """Test save appends to existing index.yaml."""
+        """Test save appends to existing index.jsonl."""
         from bmad_assist.benchmarking.storage import save_evaluation_record
 
         # Save first record
@@ -431,11 +449,10 @@ class TestIndexFileManagement:
         save_evaluation_record(second_record, temp_base_dir)
 
         # Verify index contains both records
-        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.yaml"
-        with open(index_path) as f:
-            index_data = yaml.safe_load(f)
+        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.jsonl"
+        entries = self._read_index(index_path)
 
-        assert len(index_data["records"]) == 2
+        assert [e["record_id"] for e in entries] == ["test-uuid-1234", "test-uuid-5678"]
 
     def test_index_contains_required_fields(
         self, sample_record: LLMEvaluationRecord, temp_base_dir: Path
@@ -445,11 +462,8 @@ class TestIndexFileManagement:
 
         save_evaluation_record(sample_record, temp_base_dir)
 
-        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.yaml"
-        with open(index_path) as f:
-            index_data = yaml.safe_load(f)
-
-        record_entry = index_data["records"][0]
+        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.jsonl"
+        record_entry = self._read_index(index_path)[0]
         assert "record_id" in record_entry
         assert "path" in record_entry
         assert "epic" in record_entry
@@ -464,37 +478,144 @@ class TestIndexFileManagement:
         assert record_entry["story"] == 1
         assert record_entry["role_id"] == "a"
         assert record_entry["provider"] == "claude"
+        assert record_entry["model"] == sample_record.evaluator.model
+        assert record_entry["duration_ms"] == sample_record.execution.duration_ms
 
-    def test_index_has_updated_at_timestamp(
+    def test_index_skips_duplicate_record_id(
         self, sample_record: LLMEvaluationRecord, temp_base_dir: Path
     ) -> None:
-        """Test index has updated_at timestamp."""
-        from bmad_assist.benchmarking.storage import save_evaluation_record
+        """Test readers skip duplicate entries by record_id."""
+        from bmad_assist.benchmarking.storage import (
+            list_evaluation_records,
+            save_evaluation_record,
+        )
 
+        # Save same record twice
+        save_evaluation_record(sample_record, temp_base_dir)
         save_evaluation_record(sample_record, temp_base_dir)
 
-        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.yaml"
-        with open(index_path) as f:
-            index_data = yaml.safe_load(f)
+        # Should only list one entry
+        assert len(list_evaluation_records(temp_base_dir)) == 1
 
-        assert "updated_at" in index_data
+    def test_compact_index_drops_duplicates_and_corrupt_lines(
+        self, sample_record: LLMEvaluationRecord, temp_base_dir: Path
+    ) -> None:
+        """Test compaction rewrites the index with unique valid entries."""
+        from bmad_assist.benchmarking.storage import compact_index, save_evaluation_record
 
-    def test_index_skips_duplicate_record_id(
+        save_evaluation_record(sample_record, temp_base_dir)
+        save_evaluation_record(sample_record, temp_base_dir)
+        month_dir = temp_base_dir / "benchmarks" / "2025-12"
+        with open(month_dir / "index.jsonl", "a") as f:
+            f.write("{truncated\n")
+
+        assert compact_index(month_dir) == 2
+        assert len(self._read_index(month_dir / "index.jsonl")) == 1
+        assert compact_index(month_dir) == 0
+
+    def test_append_waiting_on_compaction_lands_in_new_index(
         self, sample_record: LLMEvaluationRecord, temp_base_dir: Path
     ) -> None:
-        """Test index skips duplicate entries by record_id."""
+        """Test a save blocked by compaction appends to the replacement index."""
         from bmad_assist.benchmarking.storage import save_evaluation_record
 
-        # Save same record twice
         save_evaluation_record(sample_record, temp_base_dir)
+        month_dir = temp_base_dir / "benchmarks" / "2025-12"
+        index_path = month_dir / "index.jsonl"
+        other = sample_record.model_copy(update={"record_id": "other-record"})
+
+        ctx = multiprocessing.get_context("fork")
+        go = ctx.Event()
+        # Fork before locking so the child does not inherit the locked descriptor
+        child = ctx.Process(target=_save_in_child, args=(other, temp_base_dir, go))
+        child.start()
+        # Hold the lock like compact_index() does while the child tries to append
+        with open(index_path, "a+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            go.set()
+            time.sleep(0.5)  # let the child open the old index and block on it
+            temp_path = index_path.with_suffix(".jsonl.tmp")
+            temp_path.write_text(index_path.read_text())
+            os.replace(temp_path, index_path)
+        child.join(timeout=30)
+
+        assert child.exitcode == 0
+        entries = self._read_index(index_path)
+        assert [e["record_id"] for e in entries] == ["test-uuid-1234", "other-record"]
+
+    def test_unterminated_last_line_is_skipped(
+        self, sample_record: LLMEvaluationRecord, temp_base_dir: Path
+    ) -> None:
+        """Test a partially written final line is not treated as corruption."""
+        from bmad_assist.benchmarking.storage import (
+            _iter_index_entries,
+            save_evaluation_record,
+        )
+
+        save_evaluation_record(sample_record, temp_base_dir)
+        month_dir = temp_base_dir / "benchmarks" / "2025-12"
+        with open(month_dir / "index.jsonl", "a") as f:
+            f.write('{"record_id": "in-progr')
+
+        assert [e["record_id"] for e in _iter_index_entries(month_dir)] == ["test-uuid-1234"]
+
+    def test_failed_compaction_does_not_fail_reads(
+        self, sample_record: LLMEvaluationRecord, temp_base_dir: Path
+    ) -> None:
+        """Test an OSError from opportunistic compaction is logged, not raised."""
+        from bmad_assist.benchmarking.storage import (
+            _COMPACTION_MIN_DUPLICATES,
+            _iter_index_entries,
+            save_evaluation_record,
+        )
+
         save_evaluation_record(sample_record, temp_base_dir)
+        month_dir = temp_base_dir / "benchmarks" / "2025-12"
+        line = (month_dir / "index.jsonl").read_text()
+        with open(month_dir / "index.jsonl", "a") as f:
+            f.write(line * _COMPACTION_MIN_DUPLICATES)
+
+        with patch(
+            "bmad_assist.benchmarking.storage.compact_index",
+            side_effect=PermissionError("read-only"),
+        ) as compact:
+            entries = list(_iter_index_entries(month_dir))
 
-        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.yaml"
-        with open(index_path) as f:
-            index_data = yaml.safe_load(f)
+        compact.assert_called_once_with(month_dir)
+        assert [e["record_id"] for e in entries] == ["test-uuid-1234"]
+
+    def test_legacy_index_is_read_and_migrated(
+        self, sample_record: LLMEvaluationRecord, temp_base_dir: Path
+    ) -> None:
+        """Test index.yaml entries are listed and moved into index.jsonl on save."""
+        from bmad_assist.benchmarking.storage import (
+            list_evaluation_records,
+            save_evaluation_record,
+        )
+
+        month_dir = temp_base_dir / "benchmarks" / "2025-12"
+        month_dir.mkdir(parents=True)
+        legacy_entry = {
+            "record_id": "legacy-1",
+            "path": "eval-13-1-b-legacy.yaml",
+            "epic": 13,
+            "story": 1,
+            "role_id": "b",
+            "provider": "gemini",
+            "created_at": "2025-12-01T10:00:00+00:00",
+        }
+        with open(month_dir / "index.yaml", "w") as f:
+            yaml.dump({"records": [legacy_entry], "updated_at": None}, f)
+
+        assert [r.record_id for r in list_evaluation_records(temp_base_dir)] == ["legacy-1"]
+
+        save_evaluation_record(sample_record, temp_base_dir)
 
-        # Should only have one entry
-        assert len(index_data["records"]) == 1
+        assert not (month_dir / "index.yaml").exists()
+        assert (month_dir / "index.yaml.migrated").exists()
+        entries = self._read_index(month_dir / "index.jsonl")
+        assert [e["record_id"] for e in entries] == ["legacy-1", "test-uuid-1234"]
+        assert len(list_evaluation_records(temp_base_dir)) == 2
 
 
 # =============================================================================
@@ -780,7 +901,7 @@ class TestListEvaluationRecords:
     def test_list_uses_index_when_available(
         self, sample_record: LLMEvaluationRecord, temp_base_dir: Path
     ) -> None:
-        """Test list uses index.yaml for fast lookup."""
+        """Test list uses index.jsonl for fast lookup."""
         from bmad_assist.benchmarking.storage import (
             list_evaluation_records,
             save_evaluation_record,
@@ -789,7 +910,7 @@ class TestListEvaluationRecords:
         save_evaluation_record(sample_record, temp_base_dir)
 
         # Verify index exists
-        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.yaml"
+        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.jsonl"
         assert index_path.exists()
 
         # List should work using index
@@ -808,7 +929,7 @@ class TestListEvaluationRecords:
         save_evaluation_record(sample_record, temp_base_dir)
 
         # Remove index file
-        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.yaml"
+        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.jsonl"
         index_path.unlink()
 
         # List should still work using glob
@@ -827,8 +948,8 @@ class TestListEvaluationRecords:
         save_evaluation_record(sample_record, temp_base_dir)
 
         # Corrupt index file
-        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.yaml"
-        index_path.write_text("{ invalid: yaml: content")
+        index_path = temp_base_dir / "benchmarks" / "2025-12" / "index.jsonl"
+        index_path.write_text("{ invalid json content\n")
 
         # List should still work using glob fallback
         results = list_evaluation_records(temp_base_dir)
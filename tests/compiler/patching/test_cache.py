@@ -2,6 +2,9 @@
 
 import hashlib
 import os
+import threading
+import time
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
@@ -10,14 +13,28 @@ import pytest
 import yaml
 
 from bmad_assist import __version__
+from bmad_assist.compiler.patching import cache as cache_module
+from bmad_assist.compiler.patching import compiler as compiler_module
 from bmad_assist.compiler.patching.cache import (
+    HASH_MEMO_FILENAME,
     CacheMeta,
     TemplateCache,
+    cached_file_hash,
+    clear_hash_memo,
     compute_file_hash,
 )
+from bmad_assist.compiler.patching.compiler import warm_template_caches
 from bmad_assist.core.exceptions import PatchError
 
 
+@pytest.fixture(autouse=True)
+def _clean_hash_memo() -> Iterator[None]:
+    """Keep memoized hashes and validity from leaking between tests."""
+    clear_hash_memo()
+    yield
+    clear_hash_memo()
+
+
 class TestComputeFileHash:
     """Tests for file hash computation."""
 
@@ -568,3 +585,174 @@ class TestTemplateCache:
             patch_path=patch_file,
         )
         assert result is True
+
+
+def _age(*paths: Path) -> None:
+    """Backdate mtimes past the racy window so stat memos apply."""
+    old = time.time() - 60
+    for path in paths:
+        os.utime(path, (old, old))
+
+
+def _valid_cache(tmp_path: Path) -> tuple[Path, Path]:
+    """Create an aged source file, patch file and matching project cache."""
+    source_file = tmp_path / "workflow.yaml"
+    source_file.write_text("source content")
+    patch_file = tmp_path / "patch.yaml"
+    patch_file.write_text("patch content")
+
+    cache_dir = tmp_path / ".bmad-assist" / "cache"
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "create-story.tpl.xml").write_text("<compiled/>")
+    meta = {
+        "compiled_at": "2025-01-01T12:00:00Z",
+        "bmad_version": "0.1.0",
+        "source_hashes": {"workflow.yaml": compute_file_hash(source_file)},
+        "patch_hash": compute_file_hash(patch_file),
+    }
+    (cache_dir / "create-story.tpl.xml.meta.yaml").write_text(yaml.dump(meta))
+    _age(source_file, patch_file, *cache_dir.iterdir())
+    return source_file, patch_file
+
+
+class TestStatMemo:
+    """Tests for stat-keyed hash and validity memos."""
+
+    def test_cached_hash_reused_until_stat_changes(self, tmp_path: Path) -> None:
+        """The file is re-read only after its size/mtime/inode changed."""
+        path = tmp_path / "a.txt"
+        path.write_text("one")
+        _age(path)
+
+        with patch.object(cache_module, "compute_file_hash", wraps=compute_file_hash) as hasher:
+            first = cached_file_hash(path)
+            assert cached_file_hash(path) == first
+            path.write_text("two!")
+            _age(path)
+            second = cached_file_hash(path)
+
+        assert hasher.call_count == 2
+        assert second == compute_file_hash(path) != first
+
+    def test_recently_modified_file_always_hashed(self, tmp_path: Path) -> None:
+        """Files inside the racy window are never served from the memo."""
+        path = tmp_path / "a.txt"
+        path.write_text("fresh")
+
+        with patch.object(cache_module, "compute_file_hash", wraps=compute_file_hash) as hasher:
+            cached_file_hash(path)
+            cached_file_hash(path)
+
+        assert hasher.call_count == 2
+
+    def test_is_valid_fast_path_skips_meta_and_hashing(self, tmp_path: Path) -> None:
+        """A second validation with unchanged files touches neither YAML nor hashes."""
+        source_file, patch_file = _valid_cache(tmp_path)
+        cache = TemplateCache()
+        kwargs = {"source_files": {"workflow.yaml": source_file}, "patch_path": patch_file}
+
+        assert cache.is_valid("create-story", tmp_path, **kwargs)
+        with (
+            patch.object(cache_module.yaml, "safe_load") as load,
+            patch.object(cache_module, "compute_file_hash") as hasher,
+        ):
+            assert cache.is_valid("create-story", tmp_path, **kwargs)
+        load.assert_not_called()
+        hasher.assert_not_called()
+
+        # A changed source invalidates the fast path and the hash check fails
+        source_file.write_text("edited content")
+        _age(source_file)
+        assert not cache.is_valid("create-story", tmp_path, **kwargs)
+
+    def test_hash_memo_persisted_for_new_processes(self, tmp_path: Path) -> None:
+        """Digests saved next to the cache are reused after the process memo is gone."""
+        source_file, patch_file = _valid_cache(tmp_path)
+        cache = TemplateCache()
+        kwargs = {"source_files": {"workflow.yaml": source_file}, "patch_path": patch_file}
+
+        assert cache.is_valid("create-story", tmp_path, **kwargs)
+        assert (tmp_path / ".bmad-assist" / "cache" / HASH_MEMO_FILENAME).exists()
+
+        clear_hash_memo()  # simulate a fresh process
+        with patch.object(cache_module, "compute_file_hash") as hasher:
+            assert cache.is_valid("create-story", tmp_path, **kwargs)
+        hasher.assert_not_called()
+
+    def test_concurrent_memo_saves_keep_every_entry(self, tmp_path: Path) -> None:
+        """Threads saving to one cache directory (as in warm-up) lose no digests."""
+        cache_dir = tmp_path / "cache"
+        files = []
+        for i in range(40):
+            path = tmp_path / f"source-{i}.yaml"
+            path.write_text(f"content {i}")
+            files.append(path)
+        _age(*files)
+        for path in files:
+            cached_file_hash(path)
+
+        barrier = threading.Barrier(len(files), timeout=5)
+
+        def save(path: Path) -> None:
+            barrier.wait()
+            cache_module._save_hash_memo(cache_dir, [path])
+
+        threads = [threading.Thread(target=save, args=(path,)) for path in files]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        data = yaml.safe_load((cache_dir / HASH_MEMO_FILENAME).read_text())
+        assert set(data["entries"]) == {str(path.absolute()) for path in files}
+        assert list(cache_dir.glob("*.tmp")) == []
+
+
+class TestWarmTemplateCaches:
+    """Tests for warm_template_caches()."""
+
+    def test_validates_patched_workflows_in_parallel(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Workflows with patches are validated concurrently; others are skipped."""
+        barrier = threading.Barrier(2, timeout=5)
+        validated: list[str] = []
+
+        def fake_discover(
+            workflow: str, project_root: Path, cwd: Path | None = None
+        ) -> Path | None:
+            return None if workflow == "custom" else tmp_path / f"{workflow}.patch.yaml"
+
+        def fake_find(
+            workflow: str, project_root: Path, cwd: Path | None, patch_path: Path
+        ) -> Path:
+            barrier.wait()  # deadlocks (and times out) unless both run at once
+            validated.append(workflow)
+            return tmp_path / f"{workflow}.tpl.xml"
+
+        monkeypatch.setattr(compiler_module, "discover_patch", fake_discover)
+        monkeypatch.setattr(compiler_module, "_find_valid_template", fake_find)
+
+        results = warm_template_caches(
+            tmp_path, workflows=["create-story", "dev-story", "custom"]
+        )
+
+        assert results == {"create-story": True, "dev-story": True}
+        assert sorted(validated) == ["create-story", "dev-story"]
+
+    def test_failures_reported_not_raised(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Missing workflow files mark the workflow invalid instead of raising."""
+        monkeypatch.setattr(
+            compiler_module, "discover_patch", lambda *a, **k: tmp_path / "x.patch.yaml"
+        )
+
+        def broken(*args: object) -> Path:
+            raise compiler_module.CompilerError("workflow files not found")
+
+        monkeypatch.setattr(compiler_module, "_find_valid_template", broken)
+
+        assert warm_template_caches(tmp_path, workflows=["create-story"]) == {
+            "create-story": False
+        }
@@ -1,12 +1,19 @@
 """Tests for git intelligence extraction."""
 
+import subprocess
+import threading
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from bmad_assist.compiler.patching import git_intelligence
 from bmad_assist.compiler.patching.git_intelligence import (
+    _cache_key_part,
     _substitute_variables,
+    clear_git_cache,
     extract_git_intelligence,
     is_git_repo,
     run_git_command,
@@ -14,6 +21,14 @@ from bmad_assist.compiler.patching.git_intelligence import (
 from bmad_assist.compiler.patching.types import GitCommand, GitIntelligence
 
 
+@pytest.fixture(autouse=True)
+def _clean_git_cache() -> Iterator[None]:
+    """Keep memoized git outputs from leaking between tests."""
+    clear_git_cache()
+    yield
+    clear_git_cache()
+
+
 class TestIsGitRepo:
     """Tests for is_git_repo function."""
 
@@ -262,3 +277,130 @@ class TestExtractGitIntelligence:
         assert call_args[0][0] == "git log --grep='{{epic}}'"
         assert call_args[0][1] == tmp_path
         assert call_args[0][2] == {"epic": 6}
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """Real git repository with one commit."""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "a.txt").write_text("a")
+    _git(tmp_path, "add", "a.txt")
+    _git(tmp_path, "commit", "-q", "-m", "first")
+    return tmp_path
+
+
+class TestCacheKeyPart:
+    """Tests for _cache_key_part command classification."""
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "git log --oneline -5",
+            "git log --oneline -3 -- docs/architecture.md",
+            "git ls-tree -r --name-only HEAD -- tests/ 2>/dev/null | head -20",
+            "git log --grep='6\\.' --oneline -5 2>/dev/null || echo '(no related commits)'",
+        ],
+    )
+    def test_history_commands_keyed_by_head_only(self, command: str) -> None:
+        """History-only commands ignore the index."""
+        assert _cache_key_part(command, 123) == 0
+
+    def test_cached_diff_keyed_by_index(self) -> None:
+        """The git diff --cached command depends on the index."""
+        assert _cache_key_part("git diff --cached --stat", 123) == 123
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "git status --short",
+            "git diff --stat",
+            "git diff --stat HEAD~10 -- src/ 2>/dev/null | head -20",
+            "git log --all --oneline",
+            "git log --oneline $(git merge-base HEAD main)..",
+            "echo hi",
+        ],
+    )
+    def test_working_tree_commands_not_cached(self, command: str) -> None:
+        """Commands reading the working tree or other refs always run."""
+        assert _cache_key_part(command, 123) is None
+
+
+class TestConcurrentExtraction:
+    """Tests for concurrent execution and memoization in extract_git_intelligence."""
+
+    def test_commands_run_concurrently_in_config_order(self, tmp_path: Path) -> None:
+        """Commands overlap, but sections keep the configured order."""
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def slow_run(command: str, cwd: Path, variables: object = None) -> str:
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return f"out:{command}"
+
+        config = GitIntelligence(
+            enabled=True,
+            commands=[GitCommand(name=f"c{i}", command=f"git status {i}") for i in range(4)],
+        )
+
+        with (
+            patch.object(git_intelligence, "is_git_repo", return_value=True),
+            patch.object(git_intelligence, "run_git_command", side_effect=slow_run),
+        ):
+            result = extract_git_intelligence(config, tmp_path)
+
+        assert max_running > 1
+        positions = [result.index(f"out:git status {i}") for i in range(4)]
+        assert positions == sorted(positions)
+
+    def test_history_output_reused_on_same_commit(self, git_repo: Path) -> None:
+        """A second compilation on the same HEAD reuses git log, reruns status."""
+        config = GitIntelligence(
+            enabled=True,
+            commands=[
+                GitCommand(name="Log", command="git log --oneline -5"),
+                GitCommand(name="Status", command="git status --short"),
+            ],
+        )
+        real_run = git_intelligence.run_git_command
+
+        with patch.object(git_intelligence, "run_git_command", wraps=real_run) as run:
+            first = extract_git_intelligence(config, git_repo)
+            (git_repo / "b.txt").write_text("b")
+            second = extract_git_intelligence(config, git_repo)
+
+        commands = [c.args[0] for c in run.call_args_list]
+        assert commands.count("git log --oneline -5") == 1
+        assert commands.count("git status --short") == 2
+        assert "first" in first and "first" in second
+        assert "b.txt" in second
+
+    def test_new_commit_invalidates_cache(self, git_repo: Path) -> None:
+        """Moving HEAD reruns history commands."""
+        config = GitIntelligence(
+            enabled=True,
+            commands=[GitCommand(name="Log", command="git log --oneline -5")],
+        )
+
+        extract_git_intelligence(config, git_repo)
+        (git_repo / "b.txt").write_text("b")
+        _git(git_repo, "add", "b.txt")
+        _git(git_repo, "commit", "-q", "-m", "second")
+        result = extract_git_intelligence(config, git_repo)
+
+        assert "second" in result
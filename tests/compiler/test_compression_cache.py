@@ -0,0 +1,136 @@
+"""Tests for the helper-LLM compression cache."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bmad_assist.compiler.compression_cache import (
+    COMPRESSION_CACHE_SUBDIR,
+    INDEX_FILENAME,
+    CompressionCache,
+    get_compression_cache_stats,
+    reset_compression_cache_stats,
+)
+from bmad_assist.compiler.patching.cache import CACHE_DIR_NAME
+from bmad_assist.compiler.strategic_context import _compress_or_truncate
+
+MODEL = "claude/haiku"
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats() -> None:
+    reset_compression_cache_stats()
+
+
+def _cache_dir(project: Path) -> Path:
+    return project / CACHE_DIR_NAME / COMPRESSION_CACHE_SUBDIR
+
+
+class TestCompressionCache:
+    """CompressionCache lookups, bounds and index handling."""
+
+    def test_entries_for_different_targets_coexist(self, tmp_path: Path) -> None:
+        """Saving one budget no longer evicts another budget for the same doc."""
+        cache = CompressionCache(tmp_path)
+        cache.put("prd", "h1", 1000, MODEL, "short", 5000, 900)
+        cache.put("prd", "h1", 2000, MODEL, "longer", 5000, 1900)
+        cache.put("prd", "h2", 1000, MODEL, "other branch", 6000, 950)
+
+        assert cache.get("h1", 1000, MODEL) == ("short", 900)
+        assert cache.get("h1", 2000, MODEL) == ("longer", 1900)
+        assert cache.get("h2", 1000, MODEL) == ("other branch", 950)
+        assert cache.get("h1", 1000, "claude/sonnet") is None
+        stats = get_compression_cache_stats()
+        assert (stats.hits, stats.misses) == (3, 1)
+        # One index file instead of per-entry YAML sidecars
+        assert not list(_cache_dir(tmp_path).glob("*.yaml"))
+        index = json.loads((_cache_dir(tmp_path) / INDEX_FILENAME).read_text())
+        assert len(index["entries"]) == 3
+
+    def test_fallback_reuses_fitting_compression(self, tmp_path: Path) -> None:
+        """A larger budget can reuse a smaller compression of the same document."""
+        cache = CompressionCache(tmp_path)
+        cache.put("prd", "h1", 1000, MODEL, "small", 5000, 900)
+        cache.put("prd", "h1", 3000, MODEL, "medium", 5000, 2800)
+
+        assert cache.get("h1", 2000, MODEL, max_tokens=2200) == ("small", 900)
+        assert cache.get("h1", 500, MODEL, max_tokens=550) is None
+
+    def test_least_recently_used_entry_is_evicted(self, tmp_path: Path) -> None:
+        """Past max_entries the entry unused for longest goes first."""
+        cache = CompressionCache(tmp_path, max_entries=2)
+        with patch("bmad_assist.compiler.compression_cache.time.time") as clock:
+            clock.return_value = 1.0
+            cache.put("prd", "a", 1000, MODEL, "a", 10, 1)
+            clock.return_value = 2.0
+            cache.put("prd", "b", 1000, MODEL, "b", 10, 1)
+            clock.return_value = 3.0
+            assert cache.get("a", 1000, MODEL) is not None
+            clock.return_value = 4.0
+            cache.put("prd", "c", 1000, MODEL, "c", 10, 1)
+
+        assert cache.get("b", 1000, MODEL) is None
+        assert cache.get("a", 1000, MODEL) == ("a", 1)
+        assert cache.get("c", 1000, MODEL) == ("c", 1)
+        assert get_compression_cache_stats().evictions == 1
+        assert len(list(_cache_dir(tmp_path).glob("*.md"))) == 2
+
+    def test_byte_bound_evicts(self, tmp_path: Path) -> None:
+        """Total entry size stays within max_bytes; the newest entry is kept."""
+        cache = CompressionCache(tmp_path, max_bytes=10)
+        cache.put("prd", "a", 1000, MODEL, "x" * 8, 10, 2)
+        cache.put("prd", "b", 1000, MODEL, "y" * 8, 10, 2)
+
+        assert cache.get("a", 1000, MODEL) is None
+        assert cache.get("b", 1000, MODEL) == ("y" * 8, 2)
+
+    def test_missing_entry_file_is_a_miss(self, tmp_path: Path) -> None:
+        """An index entry whose file vanished is dropped and counted as a miss."""
+        cache = CompressionCache(tmp_path)
+        cache.put("prd", "a", 1000, MODEL, "text", 10, 1)
+        for path in _cache_dir(tmp_path).glob("*.md"):
+            path.unlink()
+
+        assert cache.get("a", 1000, MODEL) is None
+        index = json.loads((_cache_dir(tmp_path) / INDEX_FILENAME).read_text())
+        assert index["entries"] == {}
+
+    def test_legacy_sidecars_are_removed(self, tmp_path: Path) -> None:
+        """Entries from the old per-doc_type layout are cleared on first use."""
+        cache_dir = _cache_dir(tmp_path)
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "prd-0123456789abcdef.md").write_text("old")
+        (cache_dir / "prd-0123456789abcdef.meta.yaml").write_text("content_hash: x\n")
+
+        cache = CompressionCache(tmp_path)
+        cache.put("prd", "a", 1000, MODEL, "new", 10, 1)
+
+        assert sorted(p.suffix for p in cache_dir.iterdir()) == [".json", ".md"]
+
+
+class TestCompressOrTruncateCaching:
+    """_compress_or_truncate() reuses the cache instead of calling the helper."""
+
+    def test_alternating_targets_call_helper_once_each(self, tmp_path: Path) -> None:
+        """Switching between two budgets only pays for each compression once."""
+        provider = MagicMock()
+        provider.parse_output.side_effect = lambda result: "compressed " * 50
+        config = SimpleNamespace(
+            providers=SimpleNamespace(helper=SimpleNamespace(provider="claude", model="haiku"))
+        )
+        content = "word " * 20000
+
+        with (
+            patch("bmad_assist.core.config.loaders.get_config", return_value=config),
+            patch("bmad_assist.providers.registry.get_provider", return_value=provider),
+        ):
+            for target in (3000, 5000, 3000, 5000):
+                _compress_or_truncate(content, target, "prd", tmp_path)
+
+        assert provider.invoke.call_count == 1
+        # The first compression already fits the larger budget
+        stats = get_compression_cache_stats()
+        assert (stats.hits, stats.misses) == (3, 1)
@@ -0,0 +1,299 @@
+"""Tests for the persistent compiled-prompt cache."""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bmad_assist.compiler import prompt_cache
+from bmad_assist.compiler.prompt_cache import (
+    compile_workflow_cached,
+    get_prompt_cache_stats,
+    reset_prompt_cache_stats,
+)
+from bmad_assist.compiler.types import CompiledWorkflow, CompilerContext
+from bmad_assist.core.project_tree.service import ProjectTreeService, _snapshots
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats() -> None:
+    reset_prompt_cache_stats()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a project with one planning document."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "prd.md").write_text("# PRD\n")
+    return tmp_path
+
+
+def _context(project: Path, story_num: int = 1) -> CompilerContext:
+    return CompilerContext(
+        project_root=project,
+        output_folder=project / "_bmad-output",
+        resolved_variables={"epic_num": 1, "story_num": story_num},
+    )
+
+
+def _fake_compile(workflow_name: str, context: CompilerContext) -> CompiledWorkflow:
+    """Compile stand-in that reads and lists project inputs."""
+    docs = context.project_root / "docs"
+    prd = (docs / "prd.md").read_text()
+    names = sorted(p.name for p in docs.iterdir())
+    return CompiledWorkflow(
+        workflow_name=workflow_name,
+        mission="mission",
+        context=f"<prd>{prd}</prd><files>{','.join(names)}</files>",
+        variables=dict(context.resolved_variables),
+        instructions="",
+        output_template="",
+        token_estimate=42,
+    )
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestCompileWorkflowCached:
+    """Test cases for compile_workflow_cached."""
+
+    def test_second_compile_is_served_from_cache(self, project: Path) -> None:
+        """Test unchanged inputs reuse the stored CompiledWorkflow."""
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=_fake_compile) as mock:
+            first = compile_workflow_cached("dev-story", _context(project))
+            second = compile_workflow_cached("dev-story", _context(project))
+
+        assert mock.call_count == 1
+        assert second == first
+        stats = get_prompt_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert list((project / ".bmad-assist" / "cache" / "compiled").glob("dev-story-*.json"))
+
+    def test_modified_input_file_invalidates(self, project: Path) -> None:
+        """Test editing a file read during compilation forces recompilation."""
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=_fake_compile) as mock:
+            compile_workflow_cached("dev-story", _context(project))
+            prd = project / "docs" / "prd.md"
+            prd.write_text("# PRD v2\n")
+            _bump_mtime(prd)
+            result = compile_workflow_cached("dev-story", _context(project))
+
+        assert mock.call_count == 2
+        assert "PRD v2" in result.context
+
+    def test_new_file_in_listed_directory_invalidates(self, project: Path) -> None:
+        """Test adding a file to a directory listed during compilation."""
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=_fake_compile) as mock:
+            compile_workflow_cached("dev-story", _context(project))
+            (project / "docs" / "architecture.md").write_text("# Arch\n")
+            _bump_mtime(project / "docs")
+            result = compile_workflow_cached("dev-story", _context(project))
+
+        assert mock.call_count == 2
+        assert "architecture.md" in result.context
+
+    def test_different_variables_use_different_entries(self, project: Path) -> None:
+        """Test resolved variables are part of the cache key."""
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=_fake_compile) as mock:
+            compile_workflow_cached("dev-story", _context(project, story_num=1))
+            result = compile_workflow_cached("dev-story", _context(project, story_num=2))
+
+        assert mock.call_count == 2
+        assert result.variables["story_num"] == 2
+
+    def test_disabled_by_environment(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test BMAD_PROMPT_CACHE=0 bypasses lookup and store."""
+        monkeypatch.setenv("BMAD_PROMPT_CACHE", "0")
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=_fake_compile) as mock:
+            compile_workflow_cached("dev-story", _context(project))
+            compile_workflow_cached("dev-story", _context(project))
+
+        assert mock.call_count == 2
+        assert not (project / ".bmad-assist" / "cache" / "compiled").exists()
+        stats = get_prompt_cache_stats()
+        assert (stats.hits, stats.misses) == (0, 0)
+
+    def test_corrupt_entry_is_ignored(self, project: Path) -> None:
+        """Test an unreadable entry falls back to compilation."""
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=_fake_compile) as mock:
+            compile_workflow_cached("dev-story", _context(project))
+            for entry in (project / ".bmad-assist" / "cache" / "compiled").glob("*.json"):
+                entry.write_text("{not json")
+            compile_workflow_cached("dev-story", _context(project))
+
+        assert mock.call_count == 2
+
+    def test_unserializable_result_is_not_stored(self, project: Path) -> None:
+        """Test a non-dataclass result is returned but never cached."""
+        compiled = MagicMock()
+        with patch("bmad_assist.compiler.compile_workflow", return_value=compiled) as mock:
+            assert compile_workflow_cached("dev-story", _context(project)) is compiled
+            compile_workflow_cached("dev-story", _context(project))
+
+        assert mock.call_count == 2
+
+    def test_existence_probe_input_invalidates(self, project: Path) -> None:
+        """Test a file the compiler only probes for (never opens) is an input."""
+
+        def probing_compile(workflow_name: str, context: CompilerContext) -> CompiledWorkflow:
+            compiled = _fake_compile(workflow_name, context)
+            has_arch = (context.project_root / "docs" / "architecture.md").exists()
+            return CompiledWorkflow(**{**compiled.__dict__, "mission": f"arch={has_arch}"})
+
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=probing_compile) as mock:
+            compile_workflow_cached("dev-story", _context(project))
+            (project / "docs" / "architecture.md").write_text("# Arch\n")
+            result = compile_workflow_cached("dev-story", _context(project))
+
+        assert mock.call_count == 2
+        assert result.mission == "arch=True"
+
+    def test_input_read_on_worker_thread_invalidates(self, project: Path) -> None:
+        """Test reads made on executor threads are covered by the fingerprint."""
+
+        def threaded_compile(workflow_name: str, context: CompilerContext) -> CompiledWorkflow:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                return pool.submit(_fake_compile, workflow_name, context).result()
+
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=threaded_compile) as mock:
+            compile_workflow_cached("dev-story", _context(project))
+            prd = project / "docs" / "prd.md"
+            prd.write_text("# PRD, edited on disk\n")
+            _bump_mtime(prd)
+            result = compile_workflow_cached("dev-story", _context(project))
+
+        assert mock.call_count == 2
+        assert "edited on disk" in result.context
+
+    def test_gitignored_and_runtime_files_are_not_inputs(self, project: Path) -> None:
+        """Test ignored build output and saved prompts do not invalidate entries."""
+        (project / ".gitignore").write_text("build/\n")
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=_fake_compile) as mock:
+            compile_workflow_cached("dev-story", _context(project))
+            (project / "build").mkdir()
+            (project / "build" / "out.js").write_text("x")
+            (project / ".bmad-assist" / "prompts").mkdir(parents=True)
+            (project / ".bmad-assist" / "prompts" / "dev-story.md").write_text("x")
+            compile_workflow_cached("dev-story", _context(project))
+
+        assert mock.call_count == 1
+
+    def test_hit_refreshes_compile_time_timestamp(self, project: Path) -> None:
+        """Test a cached prompt gets a new timestamp wherever the old one appeared."""
+        stale = "20200101_0000"
+
+        def timestamped_compile(workflow_name: str, context: CompilerContext) -> CompiledWorkflow:
+            compiled = _fake_compile(workflow_name, context)
+            output = f"validation-{stale}.md"
+            return CompiledWorkflow(
+                **{
+                    **compiled.__dict__,
+                    "variables": {"timestamp": stale, "output_file": output},
+                    "instructions": f"Write {output}",
+                }
+            )
+
+        with patch(
+            "bmad_assist.compiler.compile_workflow", side_effect=timestamped_compile
+        ) as mock:
+            compile_workflow_cached("validate-story", _context(project))
+            result = compile_workflow_cached("validate-story", _context(project))
+
+        assert mock.call_count == 1
+        fresh = result.variables["timestamp"]
+        assert fresh != stale and re.fullmatch(r"\d{8}_\d{4}", fresh)
+        assert result.variables["output_file"] == f"validation-{fresh}.md"
+        assert result.instructions == f"Write validation-{fresh}.md"
+
+    def test_reused_tree_snapshot_does_not_hide_tree_changes(self, project: Path) -> None:
+        """Test a tree listed from a memoized snapshot still invalidates on change."""
+        config = MagicMock()
+        config.compiler.strategic_context.tree_budget = 5000
+        config.compiler.strategic_context.get_workflow_config.return_value = (
+            ("project-tree",),
+            True,
+        )
+        paths = MagicMock(project_root=project)
+
+        def tree_compile(workflow_name: str, context: CompilerContext) -> CompiledWorkflow:
+            compiled = _fake_compile(workflow_name, context)
+            tree = ProjectTreeService(config, paths).generate_tree(workflow_name)
+            return CompiledWorkflow(**{**compiled.__dict__, "context": tree})
+
+        (project / "src").mkdir()
+        # Warm the snapshot so the cached compile replays it without scanning
+        ProjectTreeService(config, paths).generate_tree("dev-story")
+        try:
+            with patch("bmad_assist.compiler.compile_workflow", side_effect=tree_compile) as mock:
+                compile_workflow_cached("dev-story", _context(project))
+                (project / "src" / "main.py").write_text("x")
+                _bump_mtime(project / "src")
+                result = compile_workflow_cached("dev-story", _context(project))
+        finally:
+            _snapshots.pop(project.resolve(), None)
+
+        assert mock.call_count == 2
+        assert "main.py" in result.context
+
+    def test_entries_from_other_dates_are_pruned(self, project: Path) -> None:
+        """Test storing an entry removes entries keyed for another day."""
+        cache_dir = project / ".bmad-assist" / "cache" / "compiled"
+        cache_dir.mkdir(parents=True)
+        stale = cache_dir / "dev-story-20200101-0123456789abcdef.json"
+        stale.write_text("{}")
+        legacy = cache_dir / "dev-story-0123456789abcdef.json"
+        legacy.write_text("{}")
+
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=_fake_compile):
+            compile_workflow_cached("dev-story", _context(project))
+
+        remaining = list(cache_dir.glob("*.json"))
+        assert len(remaining) == 1
+        assert remaining[0] not in (stale, legacy)
+
+    def test_hit_marks_entry_recently_used(self, project: Path) -> None:
+        """Test a cache hit refreshes the entry's mtime used for LRU eviction."""
+        with patch("bmad_assist.compiler.compile_workflow", side_effect=_fake_compile):
+            compile_workflow_cached("dev-story", _context(project))
+            (entry,) = (project / ".bmad-assist" / "cache" / "compiled").glob("*.json")
+            os.utime(entry, (1_000_000, 1_000_000))
+            compile_workflow_cached("dev-story", _context(project))
+
+        assert entry.stat().st_mtime > 1_000_000
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path) -> None:
+        """Test eviction drops the oldest entries but never the one just written."""
+        today = date.today()
+        stamp = f"{today:%Y%m%d}"
+        paths = []
+        for i, mtime in enumerate((3_000_000, 1_000_000, 2_000_000, 500_000)):
+            path = tmp_path / f"dev-story-{stamp}-{i:016x}.json"
+            path.write_text("{}")
+            os.utime(path, (mtime, mtime))
+            paths.append(path)
+
+        prompt_cache._evict_entries(tmp_path, keep=paths[3], today=today, max_entries=2)
+
+        assert set(tmp_path.glob("*.json")) == {paths[0], paths[3]}
+
+    def test_entries_over_byte_budget_are_evicted(self, tmp_path: Path) -> None:
+        """Test total entry size is bounded as well as the entry count."""
+        today = date.today()
+        stamp = f"{today:%Y%m%d}"
+        old = tmp_path / f"dev-story-{stamp}-{0:016x}.json"
+        old.write_text("x" * 100)
+        os.utime(old, (1_000_000, 1_000_000))
+        new = tmp_path / f"dev-story-{stamp}-{1:016x}.json"
+        new.write_text("x" * 100)
+
+        prompt_cache._evict_entries(tmp_path, keep=new, today=today, max_bytes=150)
+
+        assert list(tmp_path.glob("*.json")) == [new]
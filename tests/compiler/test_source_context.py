@@ -4,18 +4,24 @@ Tests the SourceContextService class and utility functions for
 configurable source file collection in workflow compilers.
 """
 
+import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from bmad_assist.compiler.source_context import (
     GitDiffFile,
     ScoredFile,
+    SourceContentStore,
     SourceContextService,
     _extract_file_list_section,
+    _parse_unified_diff,
     extract_file_paths_from_section,
     extract_file_paths_from_story,
     get_git_diff_files,
+    get_hunk_ranges_for_file,
+    get_hunk_ranges_for_files,
     is_binary_file,
     safe_read_file,
 )
@@ -445,3 +451,224 @@ class TestTruncation:
         content = list(result.values())[0]
         assert len(content) < len(large_content)
         assert "truncated" in content.lower()
+
+
+class TestSourceContentStore:
+    """Tests for the read-once content store."""
+
+    def test_second_read_is_cache_hit(self, tmp_path: Path) -> None:
+        """Unchanged files are read from disk only once."""
+        f = tmp_path / "a.py"
+        f.write_text("print('a')\n")
+        store = SourceContentStore()
+
+        assert store.read(f) == "print('a')\n"
+        assert store.read(f) == "print('a')\n"
+        assert (store.reads, store.hits) == (1, 1)
+
+    def test_changed_file_is_reread(self, tmp_path: Path) -> None:
+        """A size/mtime change invalidates the cached entry."""
+        f = tmp_path / "a.py"
+        f.write_text("one\n")
+        store = SourceContentStore()
+        store.read(f)
+
+        f.write_text("one\ntwo\n")
+
+        assert store.read(f) == "one\ntwo\n"
+        assert store.reads == 2
+
+    def test_read_head_limits(self, tmp_path: Path) -> None:
+        """read_head stops at the line or char limit."""
+        f = tmp_path / "a.txt"
+        f.write_text("".join(f"line {i}\n" for i in range(100)))
+        store = SourceContentStore()
+
+        assert store.read_head(f, max_lines=2) == "line 0\nline 1\n"
+        assert store.read_head(f, max_chars=3) == "lin"
+        assert store.reads == 0
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Missing files yield None."""
+        store = SourceContentStore()
+
+        assert store.read(tmp_path / "nope.py") is None
+        assert store.stat(tmp_path) is None
+
+
+class TestReadOnce:
+    """Tests for shared reads between scoring and extraction."""
+
+    def test_scoring_and_extraction_share_reads(self, tmp_project: Path) -> None:
+        """Each selected file is read from disk exactly once."""
+        src = tmp_project / "src"
+        (src / "a.py").write_text("# a\n")
+        (src / "b.py").write_text("# b\n")
+
+        service = SourceContextService(create_test_context(tmp_project), "dev_story")
+        result = service.collect_files(["src/a.py", "src/b.py"], None)
+
+        assert len(result) == 2
+        assert service.content_store.reads == 2
+        assert service.content_store.hits == 2
+
+    def test_huge_file_scored_from_stat(self, tmp_project: Path) -> None:
+        """Files far beyond the budget are never read in full."""
+        src = tmp_project / "src"
+        huge = "x = 1\n" * 200_000
+        (src / "gen.py").write_text(huge)
+
+        service = SourceContextService(create_test_context(tmp_project), "code_review")
+        with patch.object(
+            SourceContentStore, "read", side_effect=AssertionError("full read")
+        ):
+            result = service.collect_files(["src/gen.py"], None)
+
+        content = list(result.values())[0]
+        assert len(content) <= service.budget * 4 + 200
+        assert "truncated" in content.lower()
+
+    def test_huge_file_hunks_match_full_read(self, tmp_project: Path) -> None:
+        """Head-only reads produce the same hunks as a full read."""
+        src = tmp_project / "src"
+        (src / "gen.py").write_text("".join(f"v{i} = {i}\n" for i in range(100_000)))
+        (src / "small.py").write_text("# small\n")
+        sf = ScoredFile(path="src/gen.py", hunk_ranges=[(50, 52)], size_only=True)
+
+        service = SourceContextService(create_test_context(tmp_project), "code_review")
+        head = service._read_for_extraction(src / "gen.py", sf, service.budget)
+        full = (src / "gen.py").read_text()
+
+        assert head is not None
+        assert len(head) < len(full)
+        assert service._extract_hunks(head, sf) == service._extract_hunks(full, sf)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+@pytest.fixture
+def git_project(tmp_path: Path) -> Path:
+    """Create a git repo with three committed files."""
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@test.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    src = tmp_path / "src"
+    src.mkdir()
+    for name in ("a.py", "b.py", "c.py"):
+        (src / name).write_text("".join(f"line {i}\n" for i in range(1, 21)))
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "init")
+    return tmp_path
+
+
+class TestParseUnifiedDiff:
+    """Tests for splitting -U0 diff output into per-file hunks."""
+
+    def test_splits_hunks_per_file(self) -> None:
+        """Each +++ header starts a new file's hunk list."""
+        diff = [
+            "diff --git a/src/a.py b/src/a.py\n",
+            "--- a/src/a.py\n",
+            "+++ b/src/a.py\n",
+            "@@ -3 +3,2 @@\n",
+            "-old\n",
+            "+new\n",
+            "+new2\n",
+            "@@ -10,2 +11,0 @@\n",
+            "-gone\n",
+            "-gone2\n",
+            "diff --git a/src/b.py b/src/b.py\n",
+            "--- a/src/b.py\n",
+            "+++ b/src/b.py\n",
+            "@@ -1 +1 @@\n",
+            "-x\n",
+            "+y\n",
+        ]
+
+        result = _parse_unified_diff(diff)
+
+        assert result == {"src/a.py": [(3, 4)], "src/b.py": [(1, 1)]}
+
+    def test_header_like_content_is_not_misparsed(self) -> None:
+        """Added lines looking like headers are consumed as hunk body."""
+        diff = [
+            "diff --git a/a.txt b/a.txt\n",
+            "--- a/a.txt\n",
+            "+++ b/a.txt\n",
+            "@@ -0,0 +1,2 @@\n",
+            "+++ b/fake.txt\n",
+            "+@@ -1 +99,5 @@\n",
+        ]
+
+        result = _parse_unified_diff(diff)
+
+        assert result == {"a.txt": [(1, 2)]}
+
+    def test_deleted_and_quoted_paths(self) -> None:
+        """/dev/null targets are skipped and C-quoted paths are decoded."""
+        diff = [
+            "diff --git a/gone.py b/gone.py\n",
+            "--- a/gone.py\n",
+            "+++ /dev/null\n",
+            "@@ -1 +0,0 @@\n",
+            "-bye\n",
+            'diff --git "a/sp\\tace.py" "b/sp\\tace.py"\n',
+            '--- "a/sp\\tace.py"\n',
+            '+++ "b/sp\\tace.py"\n',
+            "@@ -2 +2 @@\n",
+            "-a\n",
+            "+b\n",
+        ]
+
+        result = _parse_unified_diff(diff)
+
+        assert result == {"sp\tace.py": [(2, 2)]}
+
+
+class TestBatchedHunkRanges:
+    """Tests for single-pass batched git hunk collection."""
+
+    def test_collects_ranges_for_all_files(self, git_project: Path) -> None:
+        """Ranges for every changed file come from one git diff run."""
+        a = git_project / "src" / "a.py"
+        a.write_text(a.read_text().replace("line 5\n", "changed 5\n"))
+        c = git_project / "src" / "c.py"
+        c.write_text(c.read_text() + "extra 1\nextra 2\n")
+
+        with patch(
+            "bmad_assist.compiler.source_context.subprocess.Popen",
+            wraps=subprocess.Popen,
+        ) as popen:
+            result = get_hunk_ranges_for_files(
+                git_project, ["src/a.py", "src/b.py", "src/c.py"]
+            )
+
+        assert popen.call_count == 1
+        assert result == {"src/a.py": [(5, 5)], "src/c.py": [(21, 22)]}
+
+    def test_matches_single_file_helper(self, git_project: Path) -> None:
+        """Single-file wrapper returns the same ranges as the batch."""
+        b = git_project / "src" / "b.py"
+        b.write_text("top\n" + b.read_text())
+
+        assert get_hunk_ranges_for_file(git_project, "src/b.py") == [(1, 1)]
+        assert get_hunk_ranges_for_file(git_project, "src/a.py") == []
+
+    def test_get_git_diff_files_uses_batched_ranges(self, git_project: Path) -> None:
+        """Stat entries are joined with batched hunk ranges."""
+        a = git_project / "src" / "a.py"
+        a.write_text(a.read_text().replace("line 2\n", "changed 2\n"))
+        stat = " src/a.py | 2 +-\n src/b.py | 0\n 2 files changed\n"
+
+        result = get_git_diff_files(git_project, stat)
+
+        assert [(f.path, f.hunk_ranges) for f in result] == [
+            ("src/a.py", [(2, 2)]),
+            ("src/b.py", []),
+        ]
+
+    def test_non_git_directory_returns_empty(self, tmp_path: Path) -> None:
+        """Git failures yield no ranges instead of raising."""
+        assert get_hunk_ranges_for_files(tmp_path, ["x.py"]) == {}
@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
+import yaml
 
 from bmad_assist.core.loop.run_tracking import (
     MAX_ARG_LENGTH,
@@ -210,6 +211,27 @@ class TestSaveRunLog:
             assert "run_id" in csv_content  # Header
             assert "csv12345" in csv_content  # Data
 
+    def test_prompt_cache_stats_saved(self) -> None:
+        """Prompt and compression cache counters should appear in YAML and CSV header."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_path = Path(tmpdir)
+            log = RunLog(
+                run_id="cache001",
+                prompt_cache_hits=3,
+                prompt_cache_misses=2,
+                compression_cache_hits=4,
+                compression_cache_misses=1,
+            )
+
+            yaml_path = save_run_log(log, project_path, as_csv=True)
+
+            data = yaml.safe_load(yaml_path.read_text())
+            assert data["prompt_cache_hits"] == 3
+            assert data["prompt_cache_misses"] == 2
+            csv_content = yaml_path.with_suffix(".csv").read_text()
+            assert "# Prompt cache: 3 hits, 2 misses" in csv_content
+            assert "# Compression cache: 4 hits, 1 misses" in csv_content
+
     def test_detects_symlink_attack(self) -> None:
         """save_run_log should refuse to write through symlinks."""
         with tempfile.TemporaryDirectory() as tmpdir:
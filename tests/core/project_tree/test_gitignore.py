@@ -135,3 +135,62 @@ class TestGitignoreParser:
 
         outside_path = Path("/etc/passwd")
         assert parser.is_ignored(outside_path)
+
+    def test_is_ignored_entry_matches_is_ignored(self, tmp_path: Path) -> None:
+        """Test fast-path entry check agrees with the full is_ignored check."""
+        (tmp_path / ".gitignore").write_text("*.log\nbuild/\n")
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / ".gitignore").write_text("!keep.log\ncache/\n")
+        (sub / "cache").mkdir()
+        (tmp_path / "build").mkdir()
+
+        parser = GitignoreParser(tmp_path)
+
+        cases = [
+            (Path("app.log"), False),
+            (Path("build"), True),
+            (Path("sub/keep.log"), False),
+            (Path("sub/other.log"), False),
+            (Path("sub/cache"), True),
+            (Path("sub/main.py"), False),
+        ]
+        for rel_path, is_dir in cases:
+            assert parser.is_ignored_entry(rel_path, is_dir) == parser.is_ignored(
+                tmp_path / rel_path
+            ), rel_path
+
+    def test_directory_own_gitignore_applies_to_itself(self, tmp_path: Path) -> None:
+        """Test a directory's own .gitignore is considered when checking it."""
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / ".gitignore").write_text("*\n")
+
+        parser = GitignoreParser(tmp_path)
+
+        assert parser.is_ignored_entry(Path("sub"), is_dir=True)
+        assert parser.is_ignored(sub)
+
+    def test_chain_spec_shared_without_own_gitignore(self, tmp_path: Path) -> None:
+        """Test directories without .gitignore reuse their parent's compiled spec."""
+        (tmp_path / ".gitignore").write_text("*.tmp\n")
+        (tmp_path / "a" / "b").mkdir(parents=True)
+
+        parser = GitignoreParser(tmp_path)
+
+        root_spec = parser._chain_spec(Path("."))
+        assert parser._chain_spec(Path("a")) is root_spec
+        assert parser._chain_spec(Path("a/b")) is root_spec
+        assert parser.is_ignored_entry(Path("a/b/x.tmp"), is_dir=False)
+
+    def test_chain_spec_compiled_once(self, tmp_path: Path) -> None:
+        """Test per-directory spec stacks are memoized across lookups."""
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / ".gitignore").write_text("*.tmp\n")
+
+        parser = GitignoreParser(tmp_path)
+
+        first = parser._chain_spec(Path("sub"))
+        assert parser._chain_spec(Path("sub")) is first
+        assert parser._chain_spec(Path(".")) is not first
@@ -1,11 +1,13 @@
 """Integration tests for project tree service."""
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from bmad_assist.core.project_tree.service import ProjectTreeService
+from bmad_assist.core.project_tree.service import ProjectTreeService, _snapshots
+from bmad_assist.core.project_tree.walker import RealFilesystem
 
 
 class MockConfig:
@@ -149,3 +151,86 @@ class TestProjectTreeService:
 
         # Should complete without error
         assert "<project-tree>" in result
+
+
+class TestProjectTreeSnapshot:
+    """Test cases for budget-aware streaming and snapshot reuse."""
+
+    def _make_tree(self, root: Path) -> None:
+        for d in range(10):
+            dir_path = root / f"dir{d}"
+            dir_path.mkdir()
+            for f in range(10):
+                (dir_path / f"file{f}.txt").write_text("content")
+
+    def test_walk_stops_when_budget_spent(self, tmp_path: Path) -> None:
+        """Test that a small budget does not walk the whole tree."""
+        self._make_tree(tmp_path)
+        service = ProjectTreeService(MockConfig(tree_budget=30), MockPaths(tmp_path))
+
+        with patch.object(RealFilesystem, "scandir", autospec=True) as scandir:
+            scandir.side_effect = lambda fs, p: iter(list(os.scandir(p)))
+            result = service.generate_tree("dev_story")
+
+        assert "[truncated]" in result
+        # Budget ran out inside the first subdirectory; the rest were never scanned
+        assert scandir.call_count == 2
+        assert len(_snapshots[tmp_path.resolve()].entries) < 110
+
+    def test_snapshot_reused_when_unchanged(self, tmp_path: Path) -> None:
+        """Test repeated generations replay the snapshot without rescanning."""
+        self._make_tree(tmp_path)
+        service = ProjectTreeService(MockConfig(tree_budget=5000), MockPaths(tmp_path))
+        first = service.generate_tree("dev_story")
+
+        with patch.object(RealFilesystem, "scandir", autospec=True) as scandir:
+            second = ProjectTreeService(
+                MockConfig(tree_budget=5000), MockPaths(tmp_path)
+            ).generate_tree("dev_story")
+
+        assert second == first
+        scandir.assert_not_called()
+
+    def test_larger_budget_resumes_walk(self, tmp_path: Path) -> None:
+        """Test a larger budget extends a truncated snapshot."""
+        self._make_tree(tmp_path)
+        small = ProjectTreeService(MockConfig(tree_budget=30), MockPaths(tmp_path))
+        assert "[truncated]" in small.generate_tree("dev_story")
+        snapshot = _snapshots[tmp_path.resolve()]
+
+        large = ProjectTreeService(MockConfig(tree_budget=5000), MockPaths(tmp_path))
+        result = large.generate_tree("dev_story")
+
+        assert _snapshots[tmp_path.resolve()] is snapshot
+        assert "[truncated]" not in result
+        assert "file9.txt" in result
+
+    def test_snapshot_invalidated_by_directory_change(self, tmp_path: Path) -> None:
+        """Test adding a file invalidates the snapshot."""
+        self._make_tree(tmp_path)
+        service = ProjectTreeService(MockConfig(tree_budget=5000), MockPaths(tmp_path))
+        service.generate_tree("dev_story")
+        snapshot = _snapshots[tmp_path.resolve()]
+
+        new_file = tmp_path / "dir3" / "added.py"
+        new_file.write_text("new")
+        os.utime(tmp_path / "dir3", ns=(0, snapshot.walker.scanned_dirs[tmp_path / "dir3"] + 1))
+
+        result = service.generate_tree("dev_story")
+
+        assert _snapshots[tmp_path.resolve()] is not snapshot
+        assert "added.py" in result
+
+    def test_snapshot_invalidated_by_gitignore_edit(self, tmp_path: Path) -> None:
+        """Test editing a .gitignore in place invalidates the snapshot."""
+        self._make_tree(tmp_path)
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("*.log\n")
+        service = ProjectTreeService(MockConfig(tree_budget=5000), MockPaths(tmp_path))
+        assert "dir0/" in service.generate_tree("dev_story")
+
+        mtime_ns = gitignore.stat().st_mtime_ns
+        gitignore.write_text("dir0/\n")
+        os.utime(gitignore, ns=(0, mtime_ns + 1))
+
+        assert "dir0/" not in service.generate_tree("dev_story")
@@ -2,14 +2,14 @@
 
 import os
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from bmad_assist.core.project_tree.config import ProjectTreeConfig
 from bmad_assist.core.project_tree.gitignore import GitignoreParser
 from bmad_assist.core.project_tree.types import TreeEntry
-from bmad_assist.core.project_tree.walker import TreeWalker
+from bmad_assist.core.project_tree.walker import RealFilesystem, TreeWalker
 
 
 class TestTreeWalker:
@@ -184,3 +184,112 @@ class TestTreeWalker:
         names = [e.name for e in entries]
         assert "A" in names
         assert "B" in names
+
+    def test_ignored_directories_are_not_scanned(self, tmp_path: Path) -> None:
+        """Test ignored directories are pruned before being scanned."""
+        (tmp_path / ".gitignore").write_text("build/\n")
+        (tmp_path / "build" / "deep").mkdir(parents=True)
+        (tmp_path / "build" / "deep" / "out.o").write_text("o")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("main")
+
+        scanned: list[Path] = []
+        real_fs = RealFilesystem()
+        filesystem = MagicMock()
+        filesystem.scandir.side_effect = lambda p: scanned.append(p) or real_fs.scandir(p)
+
+        config = ProjectTreeConfig(tree_budget=1000)
+        gitignore = GitignoreParser(tmp_path)
+        walker = TreeWalker(tmp_path, config, gitignore, filesystem=filesystem)
+
+        names = [e.name for e in walker.walk()]
+
+        assert "main.py" in names
+        assert "build" not in names
+        assert "node_modules" not in names
+        scanned_names = {p.name for p in scanned}
+        assert "build" not in scanned_names
+        assert "deep" not in scanned_names
+        assert "node_modules" not in scanned_names
+
+    def test_paused_walk_holds_no_directory_handle(self, tmp_path: Path) -> None:
+        """Test a suspended walk has already closed its scandir iterator."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "one.py").write_text("1")
+        (tmp_path / "b.py").write_text("b")
+
+        handles: list[MagicMock] = []
+        real_scandir = os.scandir
+
+        def tracking_scandir(path: Path) -> MagicMock:
+            entries = list(real_scandir(path))
+            handle = MagicMock()
+            handle.__enter__.return_value = iter(entries)
+            handles.append(handle)
+            return handle
+
+        config = ProjectTreeConfig(tree_budget=1000)
+        gitignore = GitignoreParser(tmp_path)
+        walker = TreeWalker(tmp_path, config, gitignore)
+
+        with patch("bmad_assist.core.project_tree.walker.os.scandir", tracking_scandir):
+            walk = walker.walk()
+            next(walk)
+
+            assert handles
+            assert all(handle.__exit__.called for handle in handles)
+            walk.close()
+
+
+def _legacy_is_ignored(parser: GitignoreParser, path: Path) -> bool:
+    """Uncached reference matcher: rebuild the combined spec for every path."""
+    from pathspec import GitIgnoreSpec
+
+    resolved_path = path.resolve()
+    rel_path = resolved_path.relative_to(parser.project_root)
+    specs = parser._collect_specs_for_path(rel_path)
+    is_dir = resolved_path.is_dir()
+    if is_dir:
+        dir_spec = parser.load_gitignore_for_dir(resolved_path)
+        if dir_spec:
+            specs.append(dir_spec)
+    patterns = [p for spec in specs for p in spec.patterns]
+    combined = GitIgnoreSpec.from_lines(patterns)
+    path_str = rel_path.as_posix()
+    if is_dir and combined.match_file(path_str + "/"):
+        return True
+    return combined.match_file(path_str)
+
+
+@pytest.mark.slow
+def test_walk_compiles_each_gitignore_stack_once(tmp_path: Path) -> None:
+    """Memoized matcher agrees with per-entry rebuild and compiles once per stack."""
+    from pathspec import GitIgnoreSpec
+
+    (tmp_path / ".gitignore").write_text("*.log\nbuild/\ndist/\n*.tmp\n")
+    for i in range(20):
+        pkg = tmp_path / f"pkg{i}"
+        (pkg / "src").mkdir(parents=True)
+        (pkg / ".gitignore").write_text("*.cache\n")
+        for j in range(50):
+            (pkg / "src" / f"mod{j}.py").write_text("")
+        (pkg / "build").mkdir()
+
+    config = ProjectTreeConfig(tree_budget=100000, max_files_per_dir=1000)
+
+    legacy_parser = GitignoreParser(tmp_path)
+    legacy_parser.is_ignored = lambda p: _legacy_is_ignored(legacy_parser, p)  # type: ignore[method-assign]
+    legacy_parser.is_ignored_entry = (  # type: ignore[method-assign]
+        lambda rel, _is_dir: _legacy_is_ignored(legacy_parser, tmp_path / rel)
+    )
+    legacy_entries = list(TreeWalker(tmp_path, config, legacy_parser).walk())
+
+    with patch.object(GitIgnoreSpec, "from_lines", wraps=GitIgnoreSpec.from_lines) as compiles:
+        entries = list(TreeWalker(tmp_path, config, GitignoreParser(tmp_path)).walk())
+
+    assert [e.path for e in entries] == [e.path for e in legacy_entries]
+    # Defaults and root stack, then one load and one stacked compile per package
+    # .gitignore, instead of a rebuild for each of the 1000+ entries
+    assert len(entries) > 1000
+    assert compiles.call_count <= 4 + 20 * 2
@@ -6,11 +6,14 @@ of raw JSON messages from provider communication.
 
 import json
 import logging
+import os
+import time
 from pathlib import Path
 
 import pytest
 
-from bmad_assist.core.debug_logger import DebugJsonLogger, save_prompt
+from bmad_assist.core import debug_logger
+from bmad_assist.core.debug_logger import DebugJsonLogger, DebugLogDurability, save_prompt
 
 # Use real DebugJsonLogger in this module (not the global mock)
 pytestmark = pytest.mark.real_debug_logger
@@ -299,6 +302,116 @@ class TestDebugJsonLoggerEdgeCases:
         logger.close()
 
 
+class TestDebugJsonLoggerDurability:
+    """Tests for fsync policy and group commit."""
+
+    @staticmethod
+    def _count_fsyncs(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+        calls: list[int] = []
+        real_fsync = os.fsync
+
+        def counting_fsync(fd: int) -> None:
+            calls.append(fd)
+            real_fsync(fd)
+
+        monkeypatch.setattr("bmad_assist.core.debug_logger.os.fsync", counting_fsync)
+        return calls
+
+    def test_always_fsyncs_every_line(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Legacy durability: one fsync per appended line."""
+        fsyncs = self._count_fsyncs(monkeypatch)
+        logger = DebugJsonLogger(debug_dir=tmp_path, enabled=True, durability="always")
+
+        logger.append(json.dumps({"type": "system", "subtype": "init", "session_id": "test"}))
+        for i in range(4):
+            logger.append(json.dumps({"type": "data", "index": i}))
+        logger.close()
+
+        assert len(fsyncs) == 5
+
+    def test_group_batches_fsyncs_and_commits_on_close(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Group durability fsyncs once per batch; close() commits the rest."""
+        monkeypatch.setattr(debug_logger, "FSYNC_INTERVAL", 60.0)
+        fsyncs = self._count_fsyncs(monkeypatch)
+        logger = DebugJsonLogger(debug_dir=tmp_path, enabled=True, durability="group")
+
+        logger.append(json.dumps({"type": "system", "subtype": "init", "session_id": "test"}))
+        for i in range(200):
+            logger.append(json.dumps({"type": "data", "index": i}))
+
+        # Lines are readable before any fsync
+        assert logger.file_path is not None
+        assert len(logger.file_path.read_text().splitlines()) == 201
+        logger.close()
+
+        assert 1 <= len(fsyncs) <= 2
+        logger.sync()  # Nothing left to commit once closed
+        assert len(fsyncs) <= 2
+
+    def test_group_commits_early_past_batch_size(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The committer wakes before the interval once enough bytes are pending."""
+        monkeypatch.setattr(debug_logger, "FSYNC_INTERVAL", 60.0)
+        monkeypatch.setattr(debug_logger, "FSYNC_BATCH_BYTES", 100)
+        fsyncs = self._count_fsyncs(monkeypatch)
+        logger = DebugJsonLogger(debug_dir=tmp_path, enabled=True, durability="group")
+
+        logger.append(json.dumps({"type": "system", "subtype": "init", "session_id": "test"}))
+        logger.append(json.dumps({"type": "data", "payload": "x" * 200}))
+
+        deadline = time.monotonic() + 5
+        while not fsyncs and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert fsyncs
+        logger.close()
+
+    def test_none_never_fsyncs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Durability none leaves write-back to the OS."""
+        fsyncs = self._count_fsyncs(monkeypatch)
+        logger = DebugJsonLogger(debug_dir=tmp_path, enabled=True, durability="none")
+
+        logger.append(json.dumps({"type": "system", "subtype": "init", "session_id": "test"}))
+        logger.close()
+
+        assert fsyncs == []
+        assert logger.file_path is not None and logger.file_path.read_text()
+
+    def test_durability_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """BMAD_DEBUG_LOG_DURABILITY picks the default; invalid values fall back."""
+        monkeypatch.setenv("BMAD_DEBUG_LOG_DURABILITY", "Always")
+        assert DebugJsonLogger(enabled=False).durability == "always"
+
+        monkeypatch.setenv("BMAD_DEBUG_LOG_DURABILITY", "sometimes")
+        assert DebugJsonLogger(enabled=False).durability == "group"
+
+    @pytest.mark.slow
+    def test_benchmark_lines_per_second(self, tmp_path: Path) -> None:
+        """Group commit sustains a far higher line rate than fsync per line."""
+        line = json.dumps({"type": "assistant", "message": {"content": "x" * 200}})
+
+        def lines_per_second(durability: DebugLogDurability, count: int) -> float:
+            logger = DebugJsonLogger(
+                debug_dir=tmp_path / durability, enabled=True, durability=durability
+            )
+            logger.append(json.dumps({"type": "init", "session_id": durability}))
+            started = time.perf_counter()
+            for _ in range(count):
+                logger.append(line)
+            logger.close()
+            return count / (time.perf_counter() - started)
+
+        always = lines_per_second("always", 500)
+        group = lines_per_second("group", 20000)
+
+        print(f"\nalways: {always:,.0f} lines/s, group: {group:,.0f} lines/s")
+        assert group > always
+
+
 class TestSavePrompt:
     """Tests for save_prompt function."""
 
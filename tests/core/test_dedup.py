@@ -0,0 +1,162 @@
+"""Tests for the fuzzy finding deduplication index."""
+
+import difflib
+import random
+import time
+
+import pytest
+
+from bmad_assist.core.dedup import FuzzyMatchIndex
+from bmad_assist.validation.evidence_score import (
+    EvidenceFinding,
+    Severity,
+    _are_findings_similar,
+    _deduplicate_findings,
+)
+
+_WORDS = [
+    "missing", "null", "check", "race", "condition", "in", "handler", "unbounded", "retry", "loop",
+    "sql", "injection", "via", "query", "string", "acceptance", "criteria", "unclear", "token",
+    "leak", "error", "swallowed", "silently", "cache", "never", "invalidated", "off", "by", "one",
+    "in", "pagination",
+]
+
+
+def _reference_find(texts: list[str], query: str, threshold: float, inclusive: bool) -> int | None:
+    """All-pairs scan the index must agree with."""
+    for slot, text in enumerate(texts):
+        ratio = difflib.SequenceMatcher(None, query, text).ratio()
+        if ratio >= threshold if inclusive else ratio > threshold:
+            return slot
+    return None
+
+
+def _reference_dedup(
+    all_findings: list[EvidenceFinding],
+) -> tuple[list[EvidenceFinding], dict[str, int]]:
+    """Pairwise deduplication as implemented before FuzzyMatchIndex."""
+    severity_priority = {Severity.CRITICAL: 3, Severity.IMPORTANT: 2, Severity.MINOR: 1}
+    deduped: list[EvidenceFinding] = []
+    consensus_counts: dict[str, int] = {}
+    seen_validators: dict[str, set[str]] = {}
+    for finding in all_findings:
+        for existing in deduped:
+            if _are_findings_similar(finding, existing):
+                existing_norm = existing.normalized_description
+                if finding.validator_id not in seen_validators.get(existing_norm, set()):
+                    seen_validators.setdefault(existing_norm, set()).add(finding.validator_id)
+                    consensus_counts[existing_norm] = len(seen_validators[existing_norm])
+                if severity_priority[finding.severity] > severity_priority[existing.severity]:
+                    deduped[deduped.index(existing)] = finding
+                    new_norm = finding.normalized_description
+                    if new_norm != existing_norm:
+                        seen_validators[new_norm] = seen_validators.pop(existing_norm)
+                        consensus_counts[new_norm] = consensus_counts.pop(existing_norm)
+                break
+        else:
+            deduped.append(finding)
+            seen_validators[finding.normalized_description] = {finding.validator_id}
+            consensus_counts[finding.normalized_description] = 1
+    return deduped, consensus_counts
+
+
+def _random_findings(
+    rng: random.Random, validators: int, per_validator: int
+) -> list[EvidenceFinding]:
+    """Findings drawn from a shared pool of issues with small wording changes."""
+    issues = [" ".join(rng.choices(_WORDS, k=rng.randint(4, 14))) for _ in range(per_validator)]
+    findings = []
+    for v in range(validators):
+        for issue in rng.sample(issues, k=per_validator * 3 // 4):
+            words = issue.split()
+            if rng.random() < 0.5:
+                words[rng.randrange(len(words))] = rng.choice(_WORDS)
+            findings.append(
+                EvidenceFinding(
+                    severity=rng.choice(list(Severity)),
+                    score=1.0,
+                    description=" ".join(words),
+                    source="file.py:1",
+                    validator_id=f"Validator {chr(65 + v)}",
+                )
+            )
+    return findings
+
+
+class TestFuzzyMatchIndex:
+    """Tests for FuzzyMatchIndex."""
+
+    def test_exact_and_fuzzy_matches(self) -> None:
+        """Identical and near-identical texts match the earliest slot."""
+        index = FuzzyMatchIndex(0.85)
+        index.set(0, "unrelated finding about logging")
+        index.set(1, "missing null check in handler")
+        index.set(2, "missing null check in handler")
+
+        assert index.find("missing null check in handler") == 1
+        assert index.find("missing null check in handlers") == 1
+        assert index.find("sql injection") is None
+
+    def test_before_limits_slots(self) -> None:
+        """Only slots lower than `before` are considered."""
+        index = FuzzyMatchIndex(0.85)
+        index.set(0, "other")
+        index.set(3, "missing null check")
+
+        assert index.find("missing null check", before=3) is None
+        assert index.find("missing null check", before=4) == 3
+
+    def test_set_replaces_and_discard_removes(self) -> None:
+        """Re-setting a slot drops its previous text."""
+        index = FuzzyMatchIndex(0.85)
+        index.set(0, "first text")
+        index.set(0, "second text entirely")
+        assert index.find("first text") is None
+        assert index.find("second text entirely") == 0
+
+        index.discard(0)
+        assert len(index) == 0
+        assert index.find("second text entirely") is None
+
+    @pytest.mark.parametrize(("threshold", "inclusive"), [(0.85, True), (0.8, False), (0.5, True)])
+    def test_matches_all_pairs_scan(self, threshold: float, inclusive: bool) -> None:
+        """Pruning never changes which slot is found."""
+        rng = random.Random(7)
+        texts = [" ".join(rng.choices(_WORDS, k=rng.randint(1, 12))) for _ in range(40)]
+        index = FuzzyMatchIndex(threshold, inclusive=inclusive)
+        for slot, text in enumerate(texts):
+            index.set(slot, text)
+
+        for _ in range(60):
+            query = " ".join(rng.choices(_WORDS, k=rng.randint(1, 12)))
+            assert index.find(query) == _reference_find(texts, query, threshold, inclusive)
+
+
+class TestDeduplicateFindingsEquivalence:
+    """_deduplicate_findings() against the previous pairwise implementation."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_same_findings_and_consensus(self, seed: int) -> None:
+        """Kept findings, order, severity promotion and consensus are unchanged."""
+        findings = _random_findings(random.Random(seed), validators=6, per_validator=15)
+
+        assert _deduplicate_findings(findings) == _reference_dedup(findings)
+
+    @pytest.mark.slow
+    def test_benchmark_against_pairwise(self) -> None:
+        """Indexed dedup is faster than the pairwise scan for 6 x 40 findings."""
+        findings = _random_findings(random.Random(0), validators=6, per_validator=40)
+
+        started = time.perf_counter()
+        for _ in range(5):
+            expected = _reference_dedup(findings)
+        pairwise = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(5):
+            actual = _deduplicate_findings(findings)
+        indexed = time.perf_counter() - started
+
+        print(f"\npairwise: {pairwise / 5 * 1000:.1f} ms, indexed: {indexed / 5 * 1000:.1f} ms")
+        assert actual == expected
+        assert indexed < pairwise
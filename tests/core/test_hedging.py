@@ -0,0 +1,241 @@
+"""Tests for hedged provider invocations."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+from bmad_assist.core.config import (
+    Config,
+    HedgingConfig,
+    MasterProviderConfig,
+    ProviderConfig,
+)
+from bmad_assist.core.hedging import (
+    HedgePlan,
+    build_hedge_plan,
+    clear_latency_cache,
+    invoke_hedged,
+    learned_latency_ms,
+)
+from bmad_assist.core.retry import invoke_with_timeout_retry
+from bmad_assist.providers.base import ProviderResult
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    clear_latency_cache()
+
+
+def _result(stdout: str, exit_code: int = 0) -> ProviderResult:
+    return ProviderResult(
+        stdout=stdout,
+        stderr="",
+        exit_code=exit_code,
+        duration_ms=1,
+        model="test-model",
+        command=("test",),
+    )
+
+
+def _slow_invoke(stdout: str) -> Any:
+    """Invoke stand-in that runs until its cancel token is set."""
+
+    def invoke(**kwargs: Any) -> ProviderResult:
+        cancelled = kwargs["cancel_token"].wait(10)
+        return _result(stdout, exit_code=-1 if cancelled else 0)
+
+    return invoke
+
+
+def _write_index(base_dir: Path, durations: list[int], model: str = "opus") -> None:
+    month_dir = base_dir / "benchmarks" / "2026-01"
+    month_dir.mkdir(parents=True)
+    records = [
+        {
+            "record_id": f"rec-{i}",
+            "path": f"eval-{i}.yaml",
+            "epic": 1,
+            "story": 1,
+            "role": "validator",
+            "role_id": "a",
+            "provider": "claude",
+            "created_at": f"2026-01-01T00:00:{i:02d}+00:00",
+            "workflow_id": "validate-story",
+            "model": model,
+            "duration_ms": duration,
+        }
+        for i, duration in enumerate(durations)
+    ]
+    (month_dir / "index.yaml").write_text(yaml.dump({"records": records}))
+
+
+class TestInvokeHedged:
+    """Tests for invoke_hedged."""
+
+    def test_fast_primary_does_not_launch_backup(self) -> None:
+        """Backup is never started when the primary beats the hedge delay."""
+        backup = MagicMock(return_value=_result("backup"))
+        plan = HedgePlan(delay=5, backup_invoke_fn=backup, backup_name="backup")
+
+        result = invoke_hedged(lambda **kw: _result("primary"), plan, phase_name="test")
+
+        assert result.stdout == "primary"
+        backup.assert_not_called()
+
+    def test_backup_wins_and_primary_is_cancelled(self) -> None:
+        """Slow primary is cancelled via its token when the backup succeeds."""
+        primary_cancel = MagicMock()
+        plan = HedgePlan(
+            delay=0.05,
+            backup_invoke_fn=lambda **kw: _result("backup"),
+            backup_name="backup",
+            primary_cancel_fn=primary_cancel,
+        )
+        started = time.monotonic()
+
+        result = invoke_hedged(_slow_invoke("primary"), plan, phase_name="test", prompt="p")
+
+        assert result.stdout == "backup"
+        assert time.monotonic() - started < 5
+        primary_cancel.assert_called_once()
+
+    def test_failed_backup_falls_back_to_primary(self) -> None:
+        """A failing backup does not win over a primary that later succeeds."""
+
+        def primary(**kwargs: Any) -> ProviderResult:
+            time.sleep(0.2)
+            return _result("primary")
+
+        plan = HedgePlan(
+            delay=0.05,
+            backup_invoke_fn=lambda **kw: _result("", exit_code=1),
+            backup_name="backup",
+        )
+
+        assert invoke_hedged(primary, plan, phase_name="test").stdout == "primary"
+
+    def test_backup_receives_override_kwargs(self) -> None:
+        """backup_kwargs replace the primary's arguments for the backup only."""
+        seen: dict[str, Any] = {}
+
+        def backup(**kwargs: Any) -> ProviderResult:
+            seen.update(kwargs)
+            return _result("backup")
+
+        plan = HedgePlan(
+            delay=0.05,
+            backup_invoke_fn=backup,
+            backup_name="backup",
+            backup_kwargs={"guard": "backup-guard"},
+        )
+
+        invoke_hedged(_slow_invoke("primary"), plan, phase_name="test", guard="primary-guard")
+
+        assert seen["guard"] == "backup-guard"
+
+    def test_caller_cancel_token_is_forwarded(self) -> None:
+        """Setting the caller's token cancels the running invocation."""
+        parent = threading.Event()
+        plan = HedgePlan(delay=5, backup_invoke_fn=MagicMock(), backup_name="backup")
+        threading.Timer(0.1, parent.set).start()
+
+        result = invoke_hedged(
+            _slow_invoke("primary"), plan, phase_name="test", cancel_token=parent
+        )
+
+        assert result.exit_code == -1
+
+    def test_retry_wrapper_uses_hedge(self) -> None:
+        """invoke_with_timeout_retry routes attempts through the hedge plan."""
+        plan = HedgePlan(
+            delay=0.05,
+            backup_invoke_fn=lambda **kw: _result("backup"),
+            backup_name="backup",
+        )
+
+        result = invoke_with_timeout_retry(
+            _slow_invoke("primary"),
+            timeout_retries=None,
+            phase_name="validate_story",
+            hedge=plan,
+            prompt="p",
+        )
+
+        assert result.stdout == "backup"
+
+
+class TestLearnedLatency:
+    """Tests for learned_latency_ms."""
+
+    def test_percentile_from_index(self, tmp_path: Path) -> None:
+        """Nearest-rank percentile is computed from indexed durations."""
+        _write_index(tmp_path, [1000 * i for i in range(1, 11)])
+
+        p90 = learned_latency_ms(tmp_path, "claude", "opus", "validate-story", 90, 5, 100)
+
+        assert p90 == 9000
+
+    def test_too_few_samples(self, tmp_path: Path) -> None:
+        """No latency is learned below min_samples."""
+        _write_index(tmp_path, [1000, 2000])
+
+        assert learned_latency_ms(tmp_path, "claude", "opus", "validate-story", 90, 5, 100) is None
+
+    def test_model_filter(self, tmp_path: Path) -> None:
+        """Records for other models are ignored."""
+        _write_index(tmp_path, [1000] * 10, model="sonnet")
+
+        assert learned_latency_ms(tmp_path, "claude", "opus", "validate-story", 90, 1, 100) is None
+
+
+class TestBuildHedgePlan:
+    """Tests for build_hedge_plan."""
+
+    @staticmethod
+    def _config(hedging: HedgingConfig) -> Config:
+        return Config(
+            providers=ProviderConfig(
+                master=MasterProviderConfig(provider="claude", model="opus"),
+            ),
+            hedging=hedging,
+        )
+
+    def test_disabled_returns_none(self, tmp_path: Path) -> None:
+        """Hedging is off by default."""
+        config = self._config(HedgingConfig())
+
+        plan = build_hedge_plan(
+            config, tmp_path, "validate_story", MagicMock(), "claude", "opus", 600
+        )
+
+        assert plan is None
+
+    def test_phase_not_configured_returns_none(self, tmp_path: Path) -> None:
+        """Phases outside hedging.phases are never hedged."""
+        config = self._config(HedgingConfig(enabled=True, phases=["code_review"]))
+
+        plan = build_hedge_plan(
+            config, tmp_path, "validate_story", MagicMock(), "claude", "opus", 600
+        )
+
+        assert plan is None
+
+    def test_plan_uses_learned_delay(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Delay is the learned percentile, bounded below by min_delay."""
+        _write_index(tmp_path, [30_000] * 10)
+        monkeypatch.setattr(
+            "bmad_assist.benchmarking.storage.get_benchmark_base_dir", lambda _: tmp_path
+        )
+        config = self._config(HedgingConfig(enabled=True, min_samples=5, min_delay=10))
+        primary = MagicMock()
+
+        plan = build_hedge_plan(config, tmp_path, "validate_story", primary, "claude", "opus", 600)
+
+        assert plan is not None
+        assert plan.delay == 30
+        assert plan.primary_cancel_fn is primary.cancel
@@ -0,0 +1,148 @@
+"""Tests for streaming report extraction (core/extraction.py, core/report_stream.py)."""
+
+import random
+import threading
+from typing import Any
+
+import pytest
+
+from bmad_assist.core.extraction import (
+    VALIDATION_MARKERS,
+    StreamingReportExtractor,
+    _extract_by_markers,
+)
+from bmad_assist.core.report_stream import ReportStream
+
+START = VALIDATION_MARKERS.start_marker
+END = VALIDATION_MARKERS.end_marker
+
+OUTPUT = (
+    "Let me read the story first...\n"
+    f"{START}\n"
+    "```markdown\n"
+    "# Story Validation Report\n\n"
+    "- Issue: missing AC for errors\n"
+    "```\n"
+    f"{END}\n"
+    "That concludes the validation."
+)
+
+
+def _chunks(text: str, rng: random.Random) -> list[str]:
+    chunks = []
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, 40)
+        chunks.append(text[pos : pos + size])
+        pos += size
+    return chunks
+
+
+class TestStreamingReportExtractor:
+    """StreamingReportExtractor matches batch extraction for any chunking."""
+
+    def test_random_chunking_matches_batch_extraction(self) -> None:
+        """Markers split across chunks are still found."""
+        expected = _extract_by_markers(OUTPUT, VALIDATION_MARKERS)
+        rng = random.Random(7)
+        for _ in range(50):
+            extractor = StreamingReportExtractor(VALIDATION_MARKERS)
+            for chunk in _chunks(OUTPUT, rng):
+                extractor.feed(chunk)
+            assert extractor.complete
+            assert extractor.report == expected
+
+    def test_char_by_char(self) -> None:
+        """Feeding one character at a time completes exactly at the end marker."""
+        extractor = StreamingReportExtractor(VALIDATION_MARKERS)
+        end = OUTPUT.index(END) + len(END)
+        results = [extractor.feed(char) for char in OUTPUT[:end]]
+
+        assert results[:-1] == [True] * (end - 1)
+        assert results[-1] is False
+        assert extractor.report == _extract_by_markers(OUTPUT, VALIDATION_MARKERS)
+
+    def test_on_complete_called_once(self) -> None:
+        """Text after the end marker is ignored."""
+        reports: list[str] = []
+        extractor = StreamingReportExtractor(VALIDATION_MARKERS, on_complete=reports.append)
+
+        extractor.feed(OUTPUT)
+        assert extractor.feed(f"{START}\nsecond\n{END}") is False
+
+        assert reports == ["# Story Validation Report\n\n- Issue: missing AC for errors"]
+
+    def test_incomplete_stream(self) -> None:
+        """Without an end marker there is no report."""
+        extractor = StreamingReportExtractor(VALIDATION_MARKERS)
+
+        assert extractor.feed(OUTPUT[: OUTPUT.index(END) + 5]) is True
+        assert not extractor.complete
+        assert extractor.report is None
+
+
+class TestReportStream:
+    """ReportStream wrapping and reuse of early parse results."""
+
+    def test_each_call_gets_a_fresh_extractor(self) -> None:
+        """A retry streams into a new extractor; the latest report wins."""
+        callbacks: list[Any] = []
+
+        def invoke(prompt: str, text_callback: Any = None) -> str:
+            callbacks.append(text_callback)
+            text_callback(OUTPUT.replace("errors", prompt))
+            return prompt
+
+        stream: ReportStream[str] = ReportStream(VALIDATION_MARKERS, parse=str.upper)
+        wrapped = stream.wrap(invoke)
+
+        assert wrapped("first") == "first"
+        assert wrapped("second") == "second"
+        assert callbacks[0] is not callbacks[1]
+        assert stream.report is not None and stream.report.endswith("second")
+        assert stream.parsed(stream.report, timeout=5) == stream.report.upper()
+
+    def test_parse_reused_only_for_matching_report(self) -> None:
+        """A report that was not streamed (e.g., from a hedged backup) is not reused."""
+        stream: ReportStream[str] = ReportStream(VALIDATION_MARKERS, parse=str.upper)
+        stream.wrap(lambda text_callback: text_callback(OUTPUT))()
+
+        assert stream.parsed("some other report") is None
+        assert stream.parsed(_extract_by_markers(OUTPUT, VALIDATION_MARKERS), timeout=5)
+
+    def test_parse_runs_while_invocation_continues(self) -> None:
+        """Parsing starts on completion, before the invoke function returns."""
+        parsed = threading.Event()
+
+        def parse(report: str) -> int:
+            parsed.set()
+            return len(report)
+
+        def invoke(text_callback: Any) -> bool:
+            text_callback(OUTPUT)
+            return parsed.wait(timeout=5)
+
+        stream: ReportStream[int] = ReportStream(VALIDATION_MARKERS, parse=parse)
+
+        assert stream.wrap(invoke)() is True
+
+    def test_parse_errors_are_raised(self) -> None:
+        """Errors from the parser surface from parsed()."""
+
+        def parse(report: str) -> str:
+            raise ValueError("bad report")
+
+        stream: ReportStream[str] = ReportStream(VALIDATION_MARKERS, parse=parse)
+        stream.wrap(lambda text_callback: text_callback(OUTPUT))()
+
+        assert stream.report is not None
+        with pytest.raises(ValueError, match="bad report"):
+            stream.parsed(stream.report, timeout=5)
+
+    def test_without_parser(self) -> None:
+        """Without a parser only the report is recorded."""
+        stream: ReportStream[str] = ReportStream(VALIDATION_MARKERS)
+        stream.wrap(lambda text_callback: text_callback(OUTPUT))()
+
+        assert stream.report is not None
+        assert stream.parsed(stream.report) is None
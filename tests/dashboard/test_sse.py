@@ -423,15 +423,16 @@ class TestSSEBroadcasterBroadcast:
 
         await asyncio.wait_for(task, timeout=2.0)
 
-        # THEN: IDs increment
+        # THEN: IDs increment within one epoch
         # Extract IDs from messages 1-3 (skip initial status)
         ids = []
         for msg in received[1:]:
             if "id: " in msg:
                 id_line = [line for line in msg.split("\n") if line.startswith("id: ")][0]
-                ids.append(int(id_line.split(": ")[1]))
+                ids.append(id_line.split(": ")[1].split("-"))
 
-        assert ids == [1, 2, 3]
+        assert len({epoch for epoch, _ in ids}) == 1
+        assert [int(counter) for _, counter in ids] == [1, 2, 3]
 
 
 # =============================================================================
@@ -762,3 +763,163 @@ class TestSSEFullLifecycle1610:
         # After disconnect, count should be 0
         await asyncio.sleep(0.05)  # Give time for cleanup
         assert broadcaster.connection_count == 0
+
+
+# =============================================================================
+# Coalescing, bounded client buffers and Last-Event-ID replay
+# =============================================================================
+
+
+def _parse(frame: str) -> tuple[str, str | None, dict]:
+    """Split an SSE frame into (event, id, data)."""
+    fields = dict(line.split(": ", 1) for line in frame.strip().split("\n"))
+    return fields["event"], fields.get("id"), json.loads(fields["data"])
+
+
+def _event_id(broadcaster: SSEBroadcaster, counter: int) -> str:
+    """Event ID the broadcaster assigned (or will assign) to its nth message."""
+    return f"{broadcaster._epoch}-{counter}"
+
+
+class TestSSECoalescing:
+    """Tests for output_batch coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_consecutive_lines_sent_as_one_batch(self) -> None:
+        """Lines within the window arrive as one output_batch frame."""
+        broadcaster = SSEBroadcaster(heartbeat_interval=60, coalesce_window=0.05)
+        stream = broadcaster.subscribe()
+        await stream.__anext__()  # Initial status
+
+        for i in range(3):
+            await broadcaster.broadcast_output(f"line {i}", "workflow")
+        event, event_id, data = _parse(await asyncio.wait_for(stream.__anext__(), 1.0))
+        await stream.aclose()
+
+        assert event == "output_batch"
+        assert event_id == _event_id(broadcaster, 3)
+        assert [line["line"] for line in data["lines"]] == ["line 0", "line 1", "line 2"]
+
+    @pytest.mark.asyncio
+    async def test_other_events_end_batch_in_order(self) -> None:
+        """A non-output event is delivered after the lines before it."""
+        broadcaster = SSEBroadcaster(heartbeat_interval=60, coalesce_window=0.05)
+        stream = broadcaster.subscribe()
+        await stream.__anext__()
+
+        await broadcaster.broadcast_output("a", None)
+        await broadcaster.broadcast_event("loop_status", {"running": False})
+        await broadcaster.broadcast_output("b", None)
+        frames = [_parse(await asyncio.wait_for(stream.__anext__(), 1.0)) for _ in range(3)]
+        await stream.aclose()
+
+        assert [(event, event_id) for event, event_id, _ in frames] == [
+            ("output", _event_id(broadcaster, 1)),
+            ("loop_status", _event_id(broadcaster, 2)),
+            ("output", _event_id(broadcaster, 3)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_is_capped(self) -> None:
+        """No batch exceeds max_batch_lines."""
+        broadcaster = SSEBroadcaster(heartbeat_interval=60, coalesce_window=0.05, max_batch_lines=2)
+        stream = broadcaster.subscribe()
+        await stream.__anext__()
+
+        for i in range(3):
+            await broadcaster.broadcast_output(str(i), None)
+        first = _parse(await asyncio.wait_for(stream.__anext__(), 1.0))
+        second = _parse(await asyncio.wait_for(stream.__anext__(), 1.0))
+        await stream.aclose()
+
+        assert first[0] == "output_batch" and len(first[2]["lines"]) == 2
+        assert second[0] == "output" and second[2]["line"] == "2"
+
+
+class TestSSEBoundedBuffers:
+    """Tests for per-client ring buffers."""
+
+    @pytest.mark.asyncio
+    async def test_stalled_client_drops_oldest_and_is_told(self) -> None:
+        """A full client buffer keeps the newest messages and reports drops."""
+        broadcaster = SSEBroadcaster(heartbeat_interval=60, client_buffer_size=2)
+        stream = broadcaster.subscribe()
+        await stream.__anext__()
+
+        for i in range(5):
+            await broadcaster.broadcast_output(f"line {i}", None)
+        frames = [_parse(await asyncio.wait_for(stream.__anext__(), 1.0)) for _ in range(3)]
+        await stream.aclose()
+
+        assert frames[0][0] == "status" and frames[0][2]["dropped"] == 3
+        assert [data["line"] for _, _, data in frames[1:]] == ["line 3", "line 4"]
+        assert broadcaster.dropped_count == 3
+
+
+class TestSSEReplay:
+    """Tests for Last-Event-ID replay."""
+
+    @pytest.mark.asyncio
+    async def test_reconnect_replays_missed_messages(self) -> None:
+        """Messages after last_event_id are replayed and no resync is needed."""
+        broadcaster = SSEBroadcaster(heartbeat_interval=60)
+        for i in range(3):
+            await broadcaster.broadcast_output(f"line {i}", None)
+
+        stream = broadcaster.subscribe(last_event_id=_event_id(broadcaster, 1))
+        _, _, status = _parse(await stream.__anext__())
+        replayed = [_parse(await stream.__anext__()) for _ in range(2)]
+        await stream.aclose()
+
+        assert status["replayed"] == 2
+        assert status["resync"] is False
+        assert [event_id for _, event_id, _ in replayed] == [
+            _event_id(broadcaster, 2),
+            _event_id(broadcaster, 3),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_gap_beyond_window_requests_resync(self) -> None:
+        """If the window no longer reaches last_event_id, the client must resync."""
+        broadcaster = SSEBroadcaster(heartbeat_interval=60, replay_size=2)
+        for i in range(5):
+            await broadcaster.broadcast_output(f"line {i}", None)
+
+        stream = broadcaster.subscribe(last_event_id=_event_id(broadcaster, 1))
+        _, _, status = _parse(await stream.__anext__())
+        await stream.aclose()
+
+        assert status["replayed"] == 2
+        assert status["resync"] is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("last_event_id", [None, "1", "not-a-number", "{epoch}-99", "{epoch}-x"])
+    async def test_unknown_last_event_id_requests_resync(self, last_event_id: str | None) -> None:
+        """No, unprefixed, malformed or future IDs replay nothing and request resync."""
+        broadcaster = SSEBroadcaster(heartbeat_interval=60)
+        await broadcaster.broadcast_output("line", None)
+        if last_event_id is not None:
+            last_event_id = last_event_id.format(epoch=broadcaster._epoch)
+
+        stream = broadcaster.subscribe(last_event_id=last_event_id)
+        _, _, status = _parse(await stream.__anext__())
+        await stream.aclose()
+
+        assert status["replayed"] == 0
+        assert status["resync"] is True
+
+    @pytest.mark.asyncio
+    async def test_id_from_previous_boot_requests_resync(self) -> None:
+        """An ID from an earlier server process is not replayed from, even if in range."""
+        previous = SSEBroadcaster(heartbeat_interval=60)
+        await previous.broadcast_output("old line", None)
+        broadcaster = SSEBroadcaster(heartbeat_interval=60)
+        for i in range(3):
+            await broadcaster.broadcast_output(f"line {i}", None)
+
+        stream = broadcaster.subscribe(last_event_id=_event_id(previous, 1))
+        _, _, status = _parse(await stream.__anext__())
+        await stream.aclose()
+
+        assert status["replayed"] == 0
+        assert status["resync"] is True
@@ -0,0 +1,117 @@
+"""Tests for running dashboard workflows in a warm worker (BMAD_WARM_WORKER)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from bmad_assist.dashboard.server import DashboardServer
+
+
+class _FakeWarmWorker:
+    """Stands in for WarmWorker; replays scripted exit codes."""
+
+    instances: list[_FakeWarmWorker] = []
+    exit_codes: list[int] = []
+
+    def __init__(self, project_root: Path, env: dict[str, str], on_line: AsyncMock) -> None:
+        self.env = env
+        self.on_line = on_line
+        self.process = MagicMock(returncode=None)
+        self.startup_ms = 1500.0
+        self.config_load_ms = 500.0
+        self.saved_ms = 0.0
+        self.is_alive = False
+        self.jobs: list[str] = []
+        self.closed = False
+        _FakeWarmWorker.instances.append(self)
+
+    async def start(self) -> None:
+        self.is_alive = True
+
+    async def run_workflow(self, log_level: str) -> int:
+        self.jobs.append(log_level)
+        await self.on_line(f"workflow {len(self.jobs)} output")
+        return _FakeWarmWorker.exit_codes.pop(0)
+
+    async def close(self) -> None:
+        self.closed = True
+        self.is_alive = False
+
+
+@pytest.fixture
+def warm_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> DashboardServer:
+    """DashboardServer in warm worker mode with WarmWorker faked out."""
+    monkeypatch.setenv("BMAD_WARM_WORKER", "1")
+    _FakeWarmWorker.instances = []
+    monkeypatch.setattr("bmad_assist.dashboard.warm_worker.WarmWorker", _FakeWarmWorker)
+    server = DashboardServer(project_root=tmp_path)
+    server.sse_broadcaster.broadcast_output = AsyncMock()  # type: ignore[method-assign]
+    server._loop_running = True
+    return server
+
+
+def _outputs(server: DashboardServer) -> list[str]:
+    mock = server.sse_broadcaster.broadcast_output
+    return [call.args[0] for call in mock.call_args_list]  # type: ignore[attr-defined]
+
+
+class TestWarmWorkerLoop:
+    """_run_workflow_loop() with BMAD_WARM_WORKER=1."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_one_worker_until_failure(self, warm_server: DashboardServer) -> None:
+        """Workflows share one worker; a failed workflow ends the loop and the worker."""
+        _FakeWarmWorker.exit_codes = [0, 0, 1]
+
+        with patch("asyncio.create_subprocess_exec") as spawn:
+            await warm_server._run_workflow_loop()
+
+        spawn.assert_not_called()
+        assert len(_FakeWarmWorker.instances) == 1
+        worker = _FakeWarmWorker.instances[0]
+        assert worker.jobs == ["INFO", "INFO", "INFO"]
+        assert worker.closed
+        assert worker.env["BMAD_DASHBOARD_MODE"] == "1"
+        assert warm_server._warm_worker is None
+
+        outputs = _outputs(warm_server)
+        assert sum("Reusing warm worker (saves ~2.0s" in text for text in outputs) == 2
+        assert "workflow 3 output" in outputs
+        assert "❌ Workflow exited with code 1" in outputs
+
+    @pytest.mark.asyncio
+    async def test_stop_request_cancels_worker(self, warm_server: DashboardServer) -> None:
+        """Worker output after a stop request terminates the worker instead."""
+        warm_server._stop_requested = True
+        warm_server._cancel_process = AsyncMock()  # type: ignore[method-assign]
+
+        await warm_server._on_worker_line("late output")
+
+        warm_server._cancel_process.assert_awaited_once()
+        assert _outputs(warm_server) == []
+
+
+class TestWarmWorkerSavings:
+    """WarmWorker._record_savings() accounting."""
+
+    def test_counts_startup_and_reused_config_load(self, tmp_path: Path) -> None:
+        """Reused jobs save startup plus config load; reloads save startup only."""
+        from bmad_assist.dashboard.warm_worker import WarmWorker
+
+        worker = WarmWorker(tmp_path, {}, AsyncMock())
+        worker.startup_ms = 1000.0
+
+        for result in (
+            {"config_reused": False, "setup_ms": 400},
+            {"config_reused": True, "setup_ms": 0},
+            {"config_reused": False, "setup_ms": 600},
+            {"config_reused": True, "setup_ms": 0},
+        ):
+            worker._record_savings(result)
+            worker.jobs_run += 1
+
+        assert worker.config_load_ms == 600.0
+        assert worker.saved_ms == 1400.0 + 1000.0 + 1600.0
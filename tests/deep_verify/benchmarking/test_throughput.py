@@ -0,0 +1,54 @@
+"""Tests for the Deep Verify pattern matcher throughput benchmark."""
+
+from __future__ import annotations
+
+import pytest
+
+from bmad_assist.deep_verify.core.types import (
+    ArtifactDomain,
+    Pattern,
+    PatternId,
+    Severity,
+    Signal,
+)
+from bmad_assist.deep_verify.metrics.throughput import measure_matcher_throughput
+from bmad_assist.deep_verify.patterns.library import PatternLibrary
+
+
+@pytest.fixture
+def library() -> PatternLibrary:
+    """Create a small in-memory pattern library."""
+    library = PatternLibrary()
+    pattern = Pattern(
+        id=PatternId("CC-001"),
+        domain=ArtifactDomain.CONCURRENCY,
+        signals=[
+            Signal(type="exact", pattern="race condition"),
+            Signal(type="regex", pattern=r"\bmutex\b"),
+        ],
+        severity=Severity.CRITICAL,
+    )
+    library._patterns = {pattern.id: pattern}
+    return library
+
+
+class TestMeasureMatcherThroughput:
+    """Tests for measure_matcher_throughput."""
+
+    def test_counts_and_rates(self, library: PatternLibrary) -> None:
+        """Test artifact, character and signal counts are reported."""
+        texts = ["a race condition", "mutex held\nrelease"]
+        result = measure_matcher_throughput(texts, library=library, iterations=2)
+
+        assert result.artifact_count == 2
+        assert result.total_chars == sum(len(t) for t in texts)
+        assert result.pattern_count == 1
+        assert (result.exact_signal_count, result.regex_signal_count) == (1, 1)
+        assert result.chars_per_second > 0
+        assert result.to_dict()["iterations"] == 2
+        assert "Throughput" in result.format()
+
+    def test_invalid_iterations(self, library: PatternLibrary) -> None:
+        """Test iterations must be positive."""
+        with pytest.raises(ValueError, match="iterations"):
+            measure_matcher_throughput(["text"], library=library, iterations=0)
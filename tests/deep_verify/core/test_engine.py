@@ -531,6 +531,35 @@ class TestFindingAggregation:
         assert len(findings) == 1
         assert findings[0].severity == Severity.CRITICAL
 
+    def test_replacement_updates_dedup_keys(self, project_root: Path) -> None:
+        """Test a replaced finding is matched by its own pattern and quote."""
+        engine = DeepVerifyEngine(project_root=project_root)
+
+        def finding(fid: str, severity: Severity, pattern_id: str, quote: str) -> Finding:
+            return Finding(
+                id=fid,
+                severity=severity,
+                title=fid,
+                description="Test",
+                method_id=MethodId("#153"),
+                pattern_id=pattern_id,
+                evidence=[Evidence(quote=quote)],
+            )
+
+        findings = engine._deduplicate_findings(
+            [
+                finding("a", Severity.WARNING, "CC-001", "lock.acquire() without release"),
+                # Same quote, higher severity: replaces "a" and brings SEC-001
+                finding("b", Severity.ERROR, "SEC-001", "lock.acquire() without release"),
+                # CC-001 no longer kept: a new finding
+                finding("c", Severity.INFO, "CC-001", "unrelated quote entirely"),
+                # Matches "b" through its pattern ID
+                finding("d", Severity.INFO, "SEC-001", "something else"),
+            ]
+        )
+
+        assert [f.id for f in findings] == ["b", "c"]
+
     def test_reassign_finding_ids_sequentially(self, project_root: Path) -> None:
         """Test that finding IDs are reassigned sequentially (F1, F2, F3...)."""
         engine = DeepVerifyEngine(project_root=project_root)
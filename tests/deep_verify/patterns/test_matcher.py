@@ -1,6 +1,7 @@
 """Tests for PatternMatcher class."""
 
 import re
+import threading
 
 import pytest
 
@@ -11,9 +12,11 @@ from bmad_assist.deep_verify.core.types import (
     Severity,
     Signal,
 )
+from bmad_assist.deep_verify.patterns.library import PatternLibrary
 from bmad_assist.deep_verify.patterns.matcher import (
     MatchContext,
     PatternMatcher,
+    SignalIndex,
 )
 from bmad_assist.deep_verify.patterns.types import MatchedSignal
 
@@ -619,3 +622,73 @@ class TestPatternMatcherWithRealPatterns:
         code = "if recordExists(id) { insertRecord(id, data) }"
         results = matcher.match(code)
         assert len(results) >= 1  # May match multiple signals
+
+
+class TestSignalIndex:
+    """Tests for the shared single-pass signal index."""
+
+    @pytest.fixture
+    def patterns(self) -> list[Pattern]:
+        """Create two patterns sharing signals."""
+        return [
+            Pattern(
+                id=PatternId("CC-001"),
+                domain=ArtifactDomain.CONCURRENCY,
+                signals=[
+                    Signal(type="exact", pattern="Race Condition"),
+                    Signal(type="regex", pattern=r"\bgo\s+func\b"),
+                ],
+                severity=Severity.CRITICAL,
+            ),
+            Pattern(
+                id=PatternId("CC-002"),
+                domain=ArtifactDomain.CONCURRENCY,
+                signals=[
+                    Signal(type="exact", pattern="race condition"),
+                    Signal(type="regex", pattern=r"\bgo\s+func\b"),
+                    Signal(type="regex", pattern=r"[unclosed"),
+                ],
+                severity=Severity.ERROR,
+            ),
+        ]
+
+    def test_signals_are_deduplicated(self, patterns: list[Pattern]) -> None:
+        """Test equivalent signals across patterns are scanned once."""
+        index = SignalIndex(patterns)
+        assert index.exact_literals == ("race condition",)
+        assert list(index.regexes) == [r"\bgo\s+func\b"]
+
+    def test_scan_reports_first_occurrence(self, patterns: list[Pattern]) -> None:
+        """Test scan returns position and original-case text per signal."""
+        text = "intro\nA RACE CONDITION here\ngo func() {}"
+        hits = SignalIndex(patterns).scan(text)
+        assert hits[("exact", "race condition")] == (8, "RACE CONDITION")
+        assert hits[("regex", r"\bgo\s+func\b")][1] == "go func"
+
+    def test_shared_signals_match_every_pattern(self, patterns: list[Pattern]) -> None:
+        """Test one hit satisfies the signal in each pattern using it."""
+        matcher = PatternMatcher(patterns, threshold=0.0)
+        results = {r.pattern.id: r for r in matcher.match("race condition\ngo func() {}")}
+        assert results[PatternId("CC-001")].confidence == 1.0
+        assert len(results[PatternId("CC-002")].matched_signals) == 2
+        assert results[PatternId("CC-002")].matched_signals[1].line_number == 2
+
+    def test_library_caches_index(self, patterns: list[Pattern]) -> None:
+        """Test the library builds one index per pattern set."""
+        library = PatternLibrary()
+        assert library.get_signal_index(patterns) is library.get_signal_index(patterns)
+        other = [patterns[0]]
+        assert library.get_signal_index(other).patterns == (patterns[0],)
+
+    def test_match_from_worker_thread(self, patterns: list[Pattern]) -> None:
+        """Test regex signals match outside the main thread (no SIGALRM)."""
+        results: list[int] = []
+
+        def run() -> None:
+            matcher = PatternMatcher(patterns, threshold=0.0)
+            results.append(len(matcher.match("go func() {}")[0].matched_signals))
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        assert results == [1]
@@ -8,10 +8,13 @@ Tests cover:
 - ABTestRunner.run orchestration (mocked execute_phase)
 - Signal cancellation between variants
 - _write_ab_manifest output
+- Parallel variant execution in worker processes
 """
 
+import logging
 import os
 import subprocess
+import time
 from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -28,6 +31,7 @@ from bmad_assist.experiments.ab.runner import (
     _normalize_phase_to_workflow,
     _reset_all_singletons,
 )
+from bmad_assist.experiments.ab.worktree import WorktreeInfo
 from bmad_assist.experiments.runner import ExperimentStatus
 
 
@@ -716,3 +720,95 @@ class TestABTestRunnerRun:
         assert result.variant_b.status == ExperimentStatus.CANCELLED
         assert result.variant_b.error is not None
         assert "Cancelled" in result.variant_b.error
+
+
+def _fake_run_variant(
+    self: ABTestRunner,
+    config: ABTestConfig,
+    variant_config: ABVariantConfig,
+    worktree: WorktreeInfo,
+    result_dir: Path,
+    variant_label: str,
+) -> ABVariantResult:
+    """Stand-in for _run_variant: one 0.3s "phase" holding an LLM session slot."""
+    if variant_config.label == "explodes":
+        raise RuntimeError("worker blew up")
+    logging.getLogger("bmad_assist.experiments.ab.runner").info(
+        "[%s] fake variant running", variant_label
+    )
+    with self._llm_session():
+        started = time.monotonic()
+        time.sleep(0.3)
+        finished = time.monotonic()
+    return ABVariantResult(
+        label=variant_config.label,
+        status=ExperimentStatus.COMPLETED,
+        stories_attempted=1,
+        stories_completed=1,
+        stories_failed=0,
+        duration_seconds=finished - started,
+        worktree_path=worktree.path,
+        result_dir=result_dir,
+        error=f"{started} {finished}",  # smuggle the phase span back for assertions
+    )
+
+
+def _span(result: ABVariantResult) -> tuple[float, float]:
+    assert result.error is not None
+    started, finished = result.error.split()
+    return float(started), float(finished)
+
+
+class TestABTestRunnerParallel:
+    """Tests for running variants in separate processes."""
+
+    @pytest.fixture(autouse=True)
+    def _forked_fake_variants(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # fork (not spawn) so the patched _run_variant reaches the workers
+        monkeypatch.setattr("bmad_assist.experiments.ab.runner._VARIANT_MP_CONTEXT", "fork")
+        monkeypatch.setattr(ABTestRunner, "_run_variant", _fake_run_variant)
+
+    def _run(
+        self, tmp_path: Path, **overrides: object
+    ) -> tuple[ABVariantResult, ABVariantResult]:
+        runner = ABTestRunner(tmp_path / "experiments", project_root=tmp_path)
+        config = _make_ab_config(parallel=True, **overrides)
+        return runner._run_variants_parallel(
+            config,
+            WorktreeInfo(path=tmp_path / "wt-a", ref="HEAD", variant_label="A"),
+            WorktreeInfo(path=tmp_path / "wt-b", ref="HEAD", variant_label="B"),
+            tmp_path / "results",
+        )
+
+    def test_variants_overlap_and_stream_logs(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Both variants run at once; worker log records reach this process."""
+        caplog.set_level(logging.INFO)
+
+        result_a, result_b = self._run(tmp_path)
+
+        assert (result_a.label, result_b.label) == ("baseline", "experimental")
+        assert result_a.result_dir == tmp_path / "results" / "variant-a"
+        (a_start, a_end), (b_start, b_end) = _span(result_a), _span(result_b)
+        assert a_start < b_end and b_start < a_end
+        messages = [r.getMessage() for r in caplog.records]
+        assert "[A] fake variant running" in messages
+        assert "[B] fake variant running" in messages
+
+    def test_llm_session_cap_serializes_phases(self, tmp_path: Path) -> None:
+        """max_llm_sessions=1 keeps the variants' phases from overlapping."""
+        result_a, result_b = self._run(tmp_path, max_llm_sessions=1)
+
+        first, second = sorted([_span(result_a), _span(result_b)])
+        assert first[1] <= second[0]
+
+    def test_worker_error_becomes_failed_result(self, tmp_path: Path) -> None:
+        """An exception escaping a worker yields FAILED; the other variant is kept."""
+        variant_b = ABVariantConfig(label="explodes", config="haiku-solo", patch_set="exp")
+
+        result_a, result_b = self._run(tmp_path, variant_b=variant_b)
+
+        assert result_a.status == ExperimentStatus.COMPLETED
+        assert result_b.status == ExperimentStatus.FAILED
+        assert result_b.error is not None and "worker blew up" in result_b.error
@@ -4,7 +4,9 @@ Tests for IsolationResult dataclass, FixtureIsolator class,
 and IsolationError exception handling.
 """
 
+import errno
 import os
+import shutil
 import stat
 import time
 from pathlib import Path
@@ -971,3 +973,158 @@ class TestTarExtraction:
         # Source should be the directory, not a tar file
         assert result.source_path == minimal_fixture
         assert result.verified is True
+
+
+class TestIsolationBackends:
+    """Tests for reflink/copy backends and the single copy walk."""
+
+    def test_invalid_backend_rejected(self, runs_dir: Path) -> None:
+        """Unknown backends fail at construction."""
+        with pytest.raises(ConfigError, match="Invalid isolation backend"):
+            FixtureIsolator(runs_dir, backend="rsync")  # type: ignore[arg-type]
+
+    def test_reflink_used_when_supported(
+        self,
+        runs_dir: Path,
+        minimal_fixture: Path,
+    ) -> None:
+        """Files are cloned when the filesystem accepts FICLONE."""
+        clones: list[Path] = []
+
+        def fake_reflink(src: Path, dst: Path) -> None:
+            clones.append(src)
+            shutil.copy2(src, dst)
+
+        with (
+            patch("bmad_assist.experiments.isolation._reflink", fake_reflink),
+            patch("bmad_assist.experiments.isolation.sys.platform", "linux"),
+        ):
+            result = FixtureIsolator(runs_dir).isolate(minimal_fixture, "run-001")
+
+        assert result.method == "reflink"
+        assert len(clones) == result.file_count == 2
+
+    def test_reflink_falls_back_to_copy_once(
+        self,
+        runs_dir: Path,
+        minimal_fixture: Path,
+    ) -> None:
+        """An unsupported filesystem is probed once, then files are copied."""
+        attempts: list[Path] = []
+
+        def unsupported(src: Path, dst: Path) -> None:
+            attempts.append(src)
+            raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+        with (
+            patch("bmad_assist.experiments.isolation._reflink", unsupported),
+            patch("bmad_assist.experiments.isolation.sys.platform", "linux"),
+        ):
+            result = FixtureIsolator(runs_dir, backend="reflink").isolate(
+                minimal_fixture, "run-001"
+            )
+
+        assert len(attempts) == 1
+        assert result.method == "copy"
+        assert (result.snapshot_path / "docs" / "prd.md").read_text().startswith("# Minimal")
+
+    def test_copy_backend_never_clones(
+        self,
+        runs_dir: Path,
+        minimal_fixture: Path,
+    ) -> None:
+        """backend="copy" byte-copies every file."""
+        with patch("bmad_assist.experiments.isolation._reflink") as reflink:
+            result = FixtureIsolator(runs_dir, backend="copy").isolate(
+                minimal_fixture, "run-001"
+            )
+
+        reflink.assert_not_called()
+        assert result.method == "copy"
+
+    def test_hardlink_backend_rejected(self, runs_dir: Path) -> None:
+        """Hardlinks would write snapshot edits through to the fixture; not a backend."""
+        with pytest.raises(ConfigError, match="Invalid isolation backend"):
+            FixtureIsolator(runs_dir, backend="hardlink")  # type: ignore[arg-type]
+
+    def test_single_walk_without_deep_verify(
+        self,
+        runs_dir: Path,
+        minimal_fixture: Path,
+    ) -> None:
+        """Counting and sizing happen in the copy walk, not in separate passes."""
+        isolator = FixtureIsolator(runs_dir)
+
+        with patch.object(isolator, "_count_files", wraps=isolator._count_files) as count:
+            result = isolator.isolate(minimal_fixture, "run-001")
+
+        count.assert_not_called()
+        assert result.file_count == 2
+        assert result.total_bytes == sum(
+            f.stat().st_size for f in (minimal_fixture / "docs").iterdir()
+        )
+        assert set(result.timings) == {"walk_seconds", "verify_seconds"}
+
+    def test_deep_verify_rewalks(
+        self,
+        runs_dir: Path,
+        minimal_fixture: Path,
+    ) -> None:
+        """deep_verify=True also compares full source and snapshot walks."""
+        isolator = FixtureIsolator(runs_dir, deep_verify=True)
+
+        with patch.object(isolator, "_verify_copy", wraps=isolator._verify_copy) as verify:
+            result = isolator.isolate(minimal_fixture, "run-001")
+
+        verify.assert_called_once()
+        assert result.verified is True
+
+    def test_size_mismatch_detected_during_walk(
+        self,
+        runs_dir: Path,
+        minimal_fixture: Path,
+    ) -> None:
+        """A file created with the wrong size fails isolation immediately."""
+
+        def short_copy(src: Path, dst: Path) -> None:
+            Path(dst).write_text("X")
+
+        with (
+            patch("bmad_assist.experiments.isolation.shutil.copy2", short_copy),
+            pytest.raises(IsolationError, match="Size mismatch"),
+        ):
+            FixtureIsolator(runs_dir, backend="copy").isolate(minimal_fixture, "run-001")
+
+        assert not (runs_dir / "run-001" / "fixture-snapshot").exists()
+
+    def test_dir_symlink_loop_skipped(
+        self,
+        runs_dir: Path,
+        minimal_fixture: Path,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A directory symlink to its own ancestor is skipped, not followed forever."""
+        (minimal_fixture / "docs" / "loop").symlink_to(minimal_fixture)
+
+        with caplog.at_level("WARNING"):
+            result = FixtureIsolator(runs_dir).isolate(minimal_fixture, "run-001")
+
+        assert not (result.snapshot_path / "docs" / "loop").exists()
+        assert "symlink loop" in caplog.text
+
+    def test_tar_result_records_method_and_timings(
+        self,
+        runs_dir: Path,
+        minimal_fixture: Path,
+    ) -> None:
+        """Tar extraction reports its backend and per-step timings."""
+        import tarfile
+
+        with tarfile.open(f"{minimal_fixture}.tar", "w") as tar:
+            tar.add(minimal_fixture / "docs", arcname="docs")
+
+        result = FixtureIsolator(runs_dir).isolate(minimal_fixture, "run-001")
+
+        assert result.method == "tar"
+        assert set(result.timings) == {"extract_seconds", "verify_seconds"}
+        assert result.file_count == 2
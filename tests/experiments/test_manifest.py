@@ -1036,6 +1036,34 @@ class TestBuildResolvedFixture:
         assert "fixtures" in resolved.source
         assert "./fixture-snapshot" in resolved.snapshot
 
+    def test_build_records_isolation_method_and_timings(self, tmp_path: Path) -> None:
+        """Isolation backend and timings are carried into the manifest."""
+        from bmad_assist.experiments.fixture import FixtureEntry
+        from bmad_assist.experiments.isolation import IsolationResult
+
+        entry = FixtureEntry(id="test-fixture", name="Test Fixture", path="./fixtures/test")
+        run_dir = tmp_path / "runs" / "run-001"
+
+        isolation = IsolationResult(
+            source_path=tmp_path / "fixtures" / "test",
+            snapshot_path=run_dir / "fixture-snapshot",
+            file_count=10,
+            total_bytes=1024,
+            duration_seconds=0.25,
+            verified=True,
+            method="reflink+copy",
+            timings={"walk_seconds": 0.2, "verify_seconds": 0.05},
+        )
+
+        resolved = build_resolved_fixture(entry, isolation, run_dir)
+
+        assert resolved.isolation_method == "reflink+copy"
+        assert resolved.isolation_timings == {
+            "walk_seconds": 0.2,
+            "verify_seconds": 0.05,
+            "total_seconds": 0.25,
+        }
+
 
 class TestBuildResolvedConfig:
     """Tests for build_resolved_config helper."""
@@ -0,0 +1,222 @@
+"""Tests for the warm workflow worker.
+
+The worker is served from a background thread with _run_job() patched, and
+driven through SyncSocketClient over a real socket in tmp_path.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import typer
+
+from bmad_assist.ipc.client import IPCCommandError, SyncSocketClient
+from bmad_assist.ipc.protocol import ErrorCode
+from bmad_assist.ipc.worker import (
+    WORKER_JOB_DONE_MARKER,
+    WorkflowWorker,
+    _WarmSetup,
+    get_worker_socket_path,
+)
+
+
+class _Served:
+    """WorkflowWorker running serve() in a thread, with scripted jobs."""
+
+    def __init__(self, tmp_path: Path, hold: bool = False) -> None:
+        self.worker = WorkflowWorker(tmp_path, socket_path=tmp_path / "w.worker")
+        self.params: list[dict[str, Any]] = []
+        self.release = threading.Event()
+        if not hold:
+            self.release.set()
+        self.worker._run_job = self._fake_job  # type: ignore[method-assign]
+        self.jobs_run: int | None = None
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+        deadline = time.monotonic() + 5
+        while not self.worker.socket_path.exists():
+            assert time.monotonic() < deadline, "worker socket never appeared"
+            time.sleep(0.01)
+
+    def _serve(self) -> None:
+        self.jobs_run = self.worker.serve()
+
+    def _fake_job(self, params: dict[str, Any]) -> dict[str, Any]:
+        self.params.append(params)
+        self.release.wait(5)
+        return {"exit_code": 0, "duration_ms": 1, "job": len(self.params)}
+
+
+class TestWorkerSocketPath:
+    """Tests for get_worker_socket_path()."""
+
+    def test_not_a_runner_socket(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Worker sockets use their own suffix so discovery ignores them."""
+        monkeypatch.setattr("bmad_assist.ipc.worker.get_socket_dir", lambda: tmp_path)
+
+        path = get_worker_socket_path(tmp_path / "project")
+
+        assert path.parent == tmp_path
+        assert path.suffix == ".worker"
+
+
+class TestWorkflowWorker:
+    """Tests for WorkflowWorker request handling."""
+
+    def test_runs_workflows_until_shutdown(self, tmp_path: Path) -> None:
+        """Jobs run in order on the serving thread; shutdown ends serve()."""
+        served = _Served(tmp_path)
+        client = SyncSocketClient(served.worker.socket_path, auto_reconnect=False)
+        client.connect()
+        try:
+            first = client.send_command("run_workflow", {"log_level": "debug"})
+            second = client.send_command("run_workflow", {})
+            client.send_command("shutdown")
+        finally:
+            client.disconnect()
+        served.thread.join(5)
+
+        assert (first["job"], second["job"]) == (1, 2)
+        assert served.params == [{"log_level": "debug"}, {}]
+        assert not served.worker.socket_path.exists()
+
+    def test_ping_and_busy_during_job(self, tmp_path: Path) -> None:
+        """Pings are answered while a job runs; a second job is rejected."""
+        served = _Served(tmp_path, hold=True)
+        client = SyncSocketClient(served.worker.socket_path, auto_reconnect=False)
+        client.connect()
+        try:
+            job = threading.Thread(target=client.send_command, args=("run_workflow",))
+            job.start()
+            while not served.params:
+                time.sleep(0.01)
+
+            assert client.ping(timeout=2).pong is True
+            with pytest.raises(IPCCommandError) as exc_info:
+                client.send_command("run_workflow", timeout=2)
+            assert exc_info.value.code == int(ErrorCode.RUNNER_BUSY.value)
+
+            served.release.set()
+            job.join(5)
+        finally:
+            client.disconnect()
+        served.thread.join(5)
+
+        assert not served.thread.is_alive()
+
+    def test_client_disconnect_stops_worker(self, tmp_path: Path) -> None:
+        """The worker exits when the dashboard connection goes away."""
+        served = _Served(tmp_path)
+        client = SyncSocketClient(served.worker.socket_path, auto_reconnect=False)
+        client.connect()
+        client.disconnect()
+
+        served.thread.join(5)
+
+        assert not served.thread.is_alive()
+
+    def test_run_job_reports_exit_code_and_marker(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """_run_job() returns the job's exit code and prints the end-of-job marker."""
+        worker = WorkflowWorker(tmp_path, socket_path=tmp_path / "w.worker")
+        monkeypatch.setattr(worker, "_prepare", lambda: False)
+
+        def halted() -> int:
+            raise typer.Exit(code=3)
+
+        monkeypatch.setattr(worker, "_run_warm", halted)
+        monkeypatch.setenv("BMAD_LOG_LEVEL", "INFO")
+
+        result = worker._run_job({"log_level": "warning"})
+
+        assert result["exit_code"] == 3
+        assert result["job"] == 1
+        assert result["config_reused"] is False
+        assert f"{WORKER_JOB_DONE_MARKER}1" in capsys.readouterr().out
+        assert os.environ["BMAD_LOG_LEVEL"] == "WARNING"
+
+    def test_setup_reused_until_config_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Config, paths and handlers load once and reload after a config edit."""
+        config_file = tmp_path / "bmad-assist.yaml"
+        config_file.write_text("providers: {}\n")
+        loads = MagicMock(return_value=MagicMock(name="config"))
+        handlers = MagicMock()
+        monkeypatch.setattr("bmad_assist.core.config.load_config_with_project", loads)
+        monkeypatch.setattr("bmad_assist.core.config.load_loop_config", MagicMock())
+        monkeypatch.setattr("bmad_assist.core.config.set_loop_config", MagicMock())
+        monkeypatch.setattr("bmad_assist.cli._init_project_paths", MagicMock())
+        monkeypatch.setattr(
+            "bmad_assist.core.project_setup.ensure_project_setup",
+            MagicMock(return_value=MagicMock(has_skipped=False)),
+        )
+        monkeypatch.setattr("bmad_assist.core.project_setup.check_gitignore_warning", MagicMock())
+        monkeypatch.setattr("bmad_assist.notifications.dispatcher.init_dispatcher", MagicMock())
+        monkeypatch.setattr("bmad_assist.core.loop.dispatch.init_handlers", handlers)
+
+        worker = WorkflowWorker(tmp_path, socket_path=tmp_path / "w.worker")
+        worker._config_files = [config_file]
+        monkeypatch.setattr(worker, "_run_warm", lambda: 0)
+
+        first = worker._run_job({})
+        second = worker._run_job({})
+        config_file.write_text("providers: {master: {}}\n")
+        third = worker._run_job({})
+
+        assert [r["config_reused"] for r in (first, second, third)] == [False, True, False]
+        assert loads.call_count == 2
+        assert handlers.call_count == 2
+
+    def test_run_warm_calls_loop_with_ready_handlers(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Warm jobs re-read project state and skip run_loop()'s own setup."""
+        run_loop = MagicMock(return_value="completed")
+        finish = MagicMock()
+        monkeypatch.setattr("bmad_assist.core.loop.run_loop", run_loop)
+        monkeypatch.setattr(
+            "bmad_assist.cli._load_epic_data", MagicMock(return_value=([1], {1: ["1.1"]}))
+        )
+        monkeypatch.setattr("bmad_assist.cli._finish_run", finish)
+
+        worker = WorkflowWorker(tmp_path, socket_path=tmp_path / "w.worker")
+        config = MagicMock()
+        paths = MagicMock()
+        paths.find_sprint_status.return_value = tmp_path / "sprint-status.yaml"
+        worker._setup = _WarmSetup(config, paths, (), workflows_skipped=False)
+
+        assert worker._run_warm() == 0
+
+        args, kwargs = run_loop.call_args
+        assert args[:3] == (config, tmp_path.resolve(), [1])
+        assert args[3](1) == ["1.1"]
+        assert kwargs == {"handlers_ready": True}
+        finish.assert_called_once_with("completed", workflows_skipped=False)
+
+    def test_missing_sprint_status_falls_back_to_run_command(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without sprint-status.yaml the job runs `run`, which generates it."""
+        calls: list[list[str]] = []
+
+        def fake_app(args: list[str], **kwargs: Any) -> int:
+            calls.append(args)
+            raise SystemExit(3)
+
+        monkeypatch.setattr("bmad_assist.cli.app", fake_app)
+        worker = WorkflowWorker(tmp_path, socket_path=tmp_path / "w.worker")
+        paths = MagicMock()
+        paths.find_sprint_status.return_value = None
+        worker._setup = _WarmSetup(MagicMock(), paths, (), workflows_skipped=False)
+
+        assert worker._run_warm() == 3
+        assert calls == [["run", "--project", str(tmp_path.resolve()), "--no-interactive"]]
+        assert worker._setup is None
@@ -0,0 +1,194 @@
+"""Tests for the background notification worker.
+
+Providers talk to a local HTTP stand-in (http.server on 127.0.0.1) so the
+pooled clients, digests and flush-on-shutdown are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from bmad_assist.notifications.base import NotificationProvider
+from bmad_assist.notifications.config import NotificationConfig
+from bmad_assist.notifications.discord import DiscordProvider
+from bmad_assist.notifications.dispatcher import EventDispatcher
+from bmad_assist.notifications.events import (
+    ErrorOccurredPayload,
+    EventPayload,
+    EventType,
+    StoryStartedPayload,
+)
+from bmad_assist.notifications.telegram import TelegramProvider
+from bmad_assist.notifications.worker import NotificationWorker
+
+
+class _StandIn:
+    """Records JSON POST bodies and the client port of each request."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, dict[str, Any], int]] = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is visible
+
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                stand_in.requests.append((self.path, body, self.client_address[1]))
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stand_in() -> Iterator[_StandIn]:
+    """Local HTTP server standing in for Discord/Telegram."""
+    server = _StandIn()
+    yield server
+    server.close()
+
+
+def _started(story: str) -> StoryStartedPayload:
+    return StoryStartedPayload(project="p", epic=1, story=story, phase="DEV_STORY")
+
+
+def _error() -> ErrorOccurredPayload:
+    return ErrorOccurredPayload(
+        project="p", epic=1, story="1-1", error_type="boom", message="it broke"
+    )
+
+
+class TestNotificationWorker:
+    """NotificationWorker delivery against the stand-in."""
+
+    def test_low_priority_events_coalesce_into_digest(self, stand_in: _StandIn) -> None:
+        """Low-priority events share one webhook message; high priority flushes them."""
+        provider = DiscordProvider(webhook_url=f"{stand_in.url}/webhook")
+        worker = NotificationWorker([provider], digest_window=30.0)
+        worker.start()
+
+        for story in ("1-1", "1-2", "1-3"):
+            assert worker.submit(EventType.STORY_STARTED, _started(story))
+        worker.submit(EventType.ERROR_OCCURRED, _error())
+        worker.shutdown()
+
+        embeds = [len(body["embeds"]) for _, body, _ in stand_in.requests]
+        assert embeds == [3, 1]
+        assert worker.sent_count == 4
+        # Both messages went over one pooled keep-alive connection
+        assert len({port for _, _, port in stand_in.requests}) == 1
+
+    def test_shutdown_flushes_pending_digest(self, stand_in: _StandIn) -> None:
+        """Events still waiting for their digest window are sent on shutdown."""
+        provider = DiscordProvider(webhook_url=f"{stand_in.url}/webhook")
+        worker = NotificationWorker([provider], digest_window=60.0)
+        worker.start()
+
+        worker.submit(EventType.STORY_STARTED, _started("1-1"))
+        assert stand_in.requests == []
+        worker.shutdown()
+
+        assert len(stand_in.requests) == 1
+        assert not worker.is_running
+        assert not worker.submit(EventType.STORY_STARTED, _started("1-2"))
+
+    def test_flush_delivers_without_stopping(self, stand_in: _StandIn) -> None:
+        """flush() sends the pending digest and the worker keeps accepting events."""
+        provider = DiscordProvider(webhook_url=f"{stand_in.url}/webhook")
+        worker = NotificationWorker([provider], digest_window=60.0)
+        worker.start()
+        try:
+            worker.submit(EventType.STORY_STARTED, _started("1-1"))
+            assert worker.flush(timeout=5)
+            assert len(stand_in.requests) == 1
+            assert worker.is_running
+        finally:
+            worker.shutdown()
+
+    def test_telegram_digest_splits_at_message_limit(self, stand_in: _StandIn) -> None:
+        """Telegram digests join messages but never exceed the length limit."""
+        provider = TelegramProvider(bot_token="123:ABC", chat_id="999")
+        provider.TELEGRAM_API_URL = f"{stand_in.url}/bot{{token}}/sendMessage"
+        provider.MAX_MESSAGE_LENGTH = 40
+        worker = NotificationWorker([provider], digest_window=30.0)
+        worker.start()
+
+        for story in ("1-1", "1-2", "1-3", "1-4"):
+            worker.submit(EventType.STORY_STARTED, _started(story))
+        worker.shutdown()
+
+        texts = [body["text"] for _, body, _ in stand_in.requests]
+        assert len(texts) == 2
+        assert all(len(text) <= 40 for text in texts)
+        assert sum(text.count("Develop") for text in texts) == 4
+
+    def test_full_queue_drops_instead_of_blocking(self) -> None:
+        """submit() never blocks: events beyond max_pending are dropped and counted."""
+        entered = threading.Event()
+        release = threading.Event()
+        delivered: list[EventType] = []
+
+        class SlowProvider(NotificationProvider):
+            @property
+            def provider_name(self) -> str:
+                return "slow"
+
+            async def send(self, event: EventType, payload: EventPayload) -> bool:
+                entered.set()
+                await asyncio.to_thread(release.wait, 5)
+                delivered.append(event)
+                return True
+
+        worker = NotificationWorker([SlowProvider()], max_pending=1, digest_window=0)
+        worker.start()
+
+        assert worker.submit(EventType.ERROR_OCCURRED, _error())
+        assert entered.wait(5)
+        assert worker.submit(EventType.ERROR_OCCURRED, _error())
+        assert not worker.submit(EventType.ERROR_OCCURRED, _error())
+        release.set()
+        worker.shutdown()
+
+        assert worker.dropped_count == 1
+        assert delivered == [EventType.ERROR_OCCURRED] * 2
+
+
+class TestDispatcherSubmit:
+    """EventDispatcher.submit() hands events to the worker."""
+
+    def test_submit_uses_background_worker(self, stand_in: _StandIn) -> None:
+        """The worker starts lazily and shutdown() delivers what was queued."""
+        config = NotificationConfig(
+            enabled=True,
+            providers=[{"type": "discord", "webhook_url": f"{stand_in.url}/hook"}],
+            events=["story_started"],
+        )
+        dispatcher = EventDispatcher(config)
+
+        assert not dispatcher.submit(EventType.ERROR_OCCURRED, _error())
+        assert dispatcher._worker is None
+        assert dispatcher.submit(EventType.STORY_STARTED, _started("1-1"))
+        dispatcher.shutdown()
+
+        assert [path for path, _, _ in stand_in.requests] == ["/hook"]
+        assert dispatcher._worker is None
@@ -323,6 +323,7 @@ class TestBaseProviderAbstractMethods:
             "cancel_token",
             "reasoning_effort",
             "guard",
+            "text_callback",
         ]
 
         # Check prompt is positional
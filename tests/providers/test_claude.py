@@ -20,6 +20,7 @@ Tests cover:
 - AC12: Package exports ClaudeSubprocessProvider
 """
 
+import json
 from pathlib import Path
 from subprocess import TimeoutExpired
 from unittest.mock import MagicMock, patch
@@ -935,3 +936,35 @@ class TestClaudeSubprocessProviderCancelSupport:
             provider.invoke("Hello")
 
             assert provider._current_process is None
+
+
+class TestTextCallback:
+    """invoke() streams response text to text_callback."""
+
+    @pytest.fixture
+    def provider(self) -> ClaudeSubprocessProvider:
+        """Create ClaudeSubprocessProvider instance."""
+        return ClaudeSubprocessProvider()
+
+    def test_callback_returning_false_ends_stream(
+        self, provider: ClaudeSubprocessProvider
+    ) -> None:
+        """Text after the callback asks to stop is not read."""
+        messages = [
+            json.dumps(
+                {"type": "assistant", "message": {"content": [{"type": "text", "text": text}]}}
+            )
+            for text in ("part one", "part two", "never read")
+        ]
+        seen: list[str] = []
+
+        def callback(text: str) -> bool:
+            seen.append(text)
+            return text != "part two"
+
+        with patch("bmad_assist.providers.claude.Popen") as mock:
+            mock.return_value = create_mock_process(stdout_content="\n".join(messages))
+            result = provider.invoke("Hello", text_callback=callback)
+
+        assert seen == ["part one", "part two"]
+        assert result.stdout == "part onepart two"
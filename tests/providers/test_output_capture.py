@@ -11,17 +11,19 @@ Test Structure:
     - TestOutputCaptureSeparation: AC1, AC5, AC6 (stdout/stderr separation)
     - TestOutputCaptureEncoding: AC2, AC8 (UTF-8 handling)
     - TestOutputCaptureLarge: AC3 (large output)
+    - TestStreamCapture: bounded-memory StreamCapture buffer
     - TestOutputCaptureEmpty: AC7 (empty output)
     - TestOutputCaptureConfig: AC9 (configuration)
 
 """
 
+import tracemalloc
 from unittest.mock import patch
 
 import pytest
 
 from bmad_assist.providers import ClaudeSubprocessProvider
-from bmad_assist.providers.base import ProviderResult
+from bmad_assist.providers.base import ProviderResult, StreamCapture
 
 from .conftest import create_mock_process
 
@@ -314,6 +316,58 @@ class TestOutputCaptureLarge:
             assert large_stderr in result.stderr
 
 
+class TestStreamCapture:
+    """StreamCapture keeps a bounded buffer and spills the rest to disk."""
+
+    def test_small_capture_stays_in_memory(self) -> None:
+        """Below the limit the capture behaves like separator.join()."""
+        capture = StreamCapture(separator="\n")
+        assert not capture
+        capture.append("first")
+        capture.append("second")
+
+        assert len(capture) == 2
+        assert not capture.spilled
+        assert capture.getvalue() == "first\nsecond"
+
+    def test_spilled_capture_round_trips(self) -> None:
+        """Spilled text, including non-ASCII, reads back unchanged."""
+        parts = [f"część {i} 日本語 🎉\n" for i in range(100)]
+        capture = StreamCapture(memory_limit=64)
+        for part in parts:
+            capture.append(part)
+
+        assert capture.spilled
+        assert capture.getvalue() == "".join(parts)
+        capture.append("tail")
+        assert capture.getvalue() == "".join(parts) + "tail"
+
+    def test_memory_stays_bounded(self) -> None:
+        """Appending 16MB holds about one buffer in memory, not the whole output."""
+        line = "x" * 1023 + "\n"
+        limit = 256 * 1024
+        with StreamCapture(memory_limit=limit) as capture:
+            tracemalloc.start()
+            try:
+                for _ in range(16 * 1024):
+                    capture.append(line)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            assert peak < 4 * limit
+            assert len(capture.getvalue()) == 16 * 1024 * 1024
+
+    def test_close_releases_spill_file(self) -> None:
+        """close() drops the buffer and the temp file."""
+        capture = StreamCapture(memory_limit=1)
+        capture.append("spilled")
+        capture.close()
+
+        assert not capture.spilled
+        assert capture.getvalue() == ""
+
+
 class TestOutputCaptureEmpty:
     """Test AC7: Empty output handling."""
 
@@ -0,0 +1,281 @@
+"""Tests for the shared provider stream multiplexer in providers/base.py.
+
+Streams come from real subprocess pipes, so the selector path is exercised;
+MagicMock streams (as used by the provider tests) take the readline fallback.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from bmad_assist.providers.base import (
+    StreamMultiplexer,
+    get_active_provider,
+    json_line_handler,
+    set_active_provider,
+    start_stream_reader,
+    stderr_line_handler,
+)
+
+
+def _pipe() -> tuple[Any, int]:
+    """Create a pipe; returns its text-mode read end and the write descriptor."""
+    read_fd, write_fd = os.pipe()
+    return os.fdopen(read_fd, encoding="utf-8"), write_fd
+
+
+def _spawn(code: str) -> subprocess.Popen[str]:
+    return subprocess.Popen(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+
+
+class TestStartStreamReader:
+    """start_stream_reader() on real pipes and on test doubles."""
+
+    def test_reads_lines_like_readline(self) -> None:
+        """Lines keep their newline, CRLF is translated, the tail has none."""
+        process = _spawn(
+            "import sys\n"
+            "for i in range(3): print('line', i)\n"
+            "sys.stdout.write('a\\r\\nb\\rzaż')\n"
+            "sys.stderr.write('oops\\n')"
+        )
+        out: list[str] = []
+        err: list[str] = []
+        readers = [
+            start_stream_reader(process.stdout, out.append),
+            start_stream_reader(process.stderr, err.append),
+        ]
+        process.wait(timeout=10)
+        for reader in readers:
+            reader.join(timeout=5)
+
+        assert out == ["line 0\n", "line 1\n", "line 2\n", "a\n", "b\n", "zaż"]
+        assert err == ["oops\n"]
+        assert not any(reader.is_alive() for reader in readers)
+        assert process.stdout is not None and process.stdout.closed
+
+    def test_many_processes_share_one_thread(self) -> None:
+        """Ten concurrent processes add at most one reader thread."""
+        before = threading.active_count()
+        processes = [_spawn(f"print({i}); print({i} * 2)") for i in range(10)]
+        outputs: list[list[str]] = [[] for _ in processes]
+        readers = [
+            start_stream_reader(p.stdout, outputs[i].append) for i, p in enumerate(processes)
+        ]
+
+        assert threading.active_count() <= before + 1
+        for process, reader in zip(processes, readers, strict=True):
+            process.wait(timeout=10)
+            reader.join(timeout=5)
+            process.stderr.close()  # type: ignore[union-attr]
+        assert outputs == [[f"{i}\n", f"{i * 2}\n"] for i in range(10)]
+
+    def test_handler_returning_false_stops_reading(self) -> None:
+        """Returning False closes the stream; later lines are not delivered."""
+        process = _spawn("import time\nprint('stop')\nprint('more', flush=True)\ntime.sleep(30)")
+        seen: list[str] = []
+
+        def handler(line: str) -> bool:
+            seen.append(line)
+            return False
+
+        reader = start_stream_reader(process.stdout, handler)
+        reader.join(timeout=5)
+        process.kill()
+        process.wait()
+        process.stderr.close()  # type: ignore[union-attr]
+
+        assert not reader.is_alive()
+        assert seen == ["stop\n"]
+
+    def test_handler_runs_with_callers_active_provider(self) -> None:
+        """Dashboard attribution follows the stream onto the reader thread."""
+        process = _spawn("print('x')")
+        providers: list[str | None] = []
+        set_active_provider("gemini")
+        try:
+            reader = start_stream_reader(
+                process.stdout, lambda _: providers.append(get_active_provider())
+            )
+        finally:
+            set_active_provider(None)
+        process.wait(timeout=10)
+        reader.join(timeout=5)
+        process.stderr.close()  # type: ignore[union-attr]
+
+        assert providers == ["gemini"]
+
+    def test_mock_streams_use_readline_fallback(self) -> None:
+        """Streams without a pipe descriptor are read with readline()."""
+        lines = iter(["one\n", "two\n", ""])
+        stream = MagicMock()
+        stream.readline.side_effect = lambda: next(lines)
+        seen: list[str] = []
+
+        reader = start_stream_reader(stream, seen.append)
+        reader.join(timeout=5)
+
+        assert seen == ["one\n", "two\n"]
+        stream.close.assert_called_once()
+
+
+class TestMultiplexerFailures:
+    """A failing stream or reader loop must not strand other streams."""
+
+    def test_failing_stream_is_dropped_and_others_continue(self) -> None:
+        """An exception serving one stream finishes it; the loop keeps going."""
+        multiplexer = StreamMultiplexer()
+        bad_stream, bad_w = _pipe()
+        good_stream, good_w = _pipe()
+        bad = multiplexer.add(bad_stream, lambda _: True)
+        bad._feed = MagicMock(side_effect=RuntimeError("boom"))  # type: ignore[method-assign]
+        seen: list[str] = []
+        good = multiplexer.add(good_stream, seen.append)
+
+        os.write(bad_w, b"x\n")
+        bad.join(timeout=5)
+        os.write(good_w, b"ok\n")
+        os.close(good_w)
+        good.join(timeout=5)
+        os.close(bad_w)
+
+        assert not bad.is_alive()
+        assert not good.is_alive()
+        assert seen == ["ok\n"]
+
+    def test_loop_failure_releases_readers_and_restarts(self) -> None:
+        """If the selector breaks, joins return and the next add() starts a new loop."""
+        multiplexer = StreamMultiplexer()
+        first_stream, first_w = _pipe()
+        first = multiplexer.add(first_stream, lambda _: True)
+        selector, thread = multiplexer._selector, multiplexer._thread
+        assert selector is not None and thread is not None
+
+        broken = MagicMock(side_effect=OSError("selector broken"))
+        selector.select = broken  # type: ignore[method-assign]
+        os.write(multiplexer._wake_w, b"\0")
+        thread.join(timeout=5)
+        first.join(timeout=5)
+        os.close(first_w)
+
+        assert not thread.is_alive()
+        assert multiplexer._thread is None
+        assert not first.is_alive()
+
+        second_stream, second_w = _pipe()
+        seen: list[str] = []
+        second = multiplexer.add(second_stream, seen.append)
+        os.write(second_w, b"again\n")
+        os.close(second_w)
+        second.join(timeout=5)
+
+        assert multiplexer._thread is not thread
+        assert seen == ["again\n"]
+
+
+class TestLineHandlers:
+    """json_line_handler() and stderr_line_handler()."""
+
+    def test_json_handler_decodes_objects_and_skips_blanks(self) -> None:
+        """Objects reach the decoder; blank and non-JSON lines do not."""
+        messages: list[dict[str, object]] = []
+        logged: list[str] = []
+        handle = json_line_handler(lambda msg: messages.append(msg), None, log_line=logged.append)
+
+        for line in ['{"type": "init"}\n', "\n", "not json\n", "[1, 2]\n"]:
+            assert handle(line) is not False
+
+        assert messages == [{"type": "init"}]
+        assert logged == ['{"type": "init"}', "not json", "[1, 2]"]
+
+    def test_json_handler_passes_through_stop(self) -> None:
+        """A decoder returning False stops the stream."""
+        handle = json_line_handler(lambda msg: False, None)
+
+        assert handle('{"type": "result"}\n') is False
+
+    def test_stderr_handler_skips_informational_progress(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every line is collected; skip_prefixes only hide progress output."""
+        shown: list[str] = []
+        monkeypatch.setattr("bmad_assist.providers.base.should_print_progress", lambda: True)
+        monkeypatch.setattr("bmad_assist.providers.base.write_progress", shown.append)
+        chunks: list[str] = []
+        handle = stderr_line_handler(chunks, None, ("YOLO mode",))
+
+        handle("YOLO mode enabled\n")
+        handle("real error\n")
+
+        assert chunks == ["YOLO mode enabled\n", "real error\n"]
+        assert len(shown) == 1 and shown[0].endswith("real error")
+
+
+class TestStreamBenchmark:
+    """CPU cost per streamed MB: multiplexer vs one readline thread per pipe."""
+
+    @pytest.mark.slow
+    def test_benchmark_cpu_per_mb(self) -> None:
+        """Report process CPU seconds per MB of stream-json for both readers."""
+        megabytes = 8
+        line = json.dumps({"type": "assistant", "message": {"content": "x" * 400}})
+        code = (
+            "import sys\n"
+            f"line = {line!r} + '\\n'\n"
+            f"for _ in range({megabytes} * 1024 * 1024 // len(line)): sys.stdout.write(line)\n"
+        )
+        streams = 6
+
+        def read_on_thread(stream: Any, handle: Callable[[str], None]) -> None:
+            for line in iter(stream.readline, ""):
+                handle(line)
+            stream.close()
+
+        def run(use_multiplexer: bool) -> float:
+            processes = [_spawn(code) for _ in range(streams)]
+            decoded = [0]
+
+            def decode(line: str) -> None:
+                decoded[0] += len(line)
+
+            cpu_started = time.process_time()
+            if use_multiplexer:
+                waiters: list[Any] = [start_stream_reader(p.stdout, decode) for p in processes]
+            else:
+                waiters = [
+                    threading.Thread(target=read_on_thread, args=(p.stdout, decode))
+                    for p in processes
+                ]
+                for thread in waiters:
+                    thread.start()
+            for process, waiter in zip(processes, waiters, strict=True):
+                process.wait()
+                waiter.join()
+                process.stderr.close()  # type: ignore[union-attr]
+            cpu = time.process_time() - cpu_started
+            assert decoded[0] >= streams * (megabytes * 1024 * 1024 - len(line) - 1)
+            return cpu / (streams * megabytes)
+
+        threads = run(use_multiplexer=False)
+        multiplexed = run(use_multiplexer=True)
+
+        print(
+            f"\nCPU per streamed MB: threads {threads * 1000:.1f} ms, "
+            f"multiplexer {multiplexed * 1000:.1f} ms"
+        )
+        assert multiplexed > 0
@@ -0,0 +1,178 @@
+"""Tests for qa/batch_executor.py — concurrent batch execution."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+import yaml
+
+from bmad_assist.qa import batch_executor
+from bmad_assist.qa.batch_executor import (
+    BatchResult,
+    ExecutionState,
+    execute_tests_in_batches,
+)
+from bmad_assist.qa.batch_executor import TestResult as QATestResult
+from bmad_assist.qa.parser import ParsedTestPlan
+from bmad_assist.qa.parser import TestCase as QATestCase
+
+
+def _plan(a_count: int, b_count: int = 0) -> ParsedTestPlan:
+    tests = [QATestCase(id=f"E1-A{i:02d}", name=f"a{i}", category="A") for i in range(a_count)]
+    tests += [QATestCase(id=f"E1-B{i:02d}", name=f"b{i}", category="B") for i in range(b_count)]
+    return ParsedTestPlan(epic_id="1", tests=tests)
+
+
+def _config(batch_concurrency: int = 1) -> Any:
+    return SimpleNamespace(qa=SimpleNamespace(batch_concurrency=batch_concurrency))
+
+
+class _FakeBatches:
+    """Stands in for execute_batch(); later batches finish first."""
+
+    def __init__(self, total_batches: int) -> None:
+        self.total_batches = total_batches
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.summaries: dict[int, str] = {}
+
+    def __call__(
+        self,
+        config: Any,
+        project_path: Path,
+        epic_id: Any,
+        tests: list[QATestCase],
+        batch_id: int,
+        total_batches: int,
+        previous_summary: str = "",
+    ) -> BatchResult:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.summaries[batch_id] = previous_summary
+        time.sleep(0.02 * (self.total_batches - batch_id + 1))
+        result = BatchResult(batch_id=batch_id, completed_at="now")
+        for tc in tests:
+            result.add_result(
+                QATestResult(test_id=tc.id, name=tc.name, category=tc.category, status="PASS")
+            )
+        with self.lock:
+            self.running -= 1
+        return result
+
+
+@pytest.fixture
+def qa_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[list[int]]:
+    """Redirect output paths, skip summaries, and record every incremental save."""
+    monkeypatch.setattr(
+        batch_executor, "get_paths", lambda: SimpleNamespace(output_folder=tmp_path)
+    )
+    monkeypatch.setattr("bmad_assist.qa.summary.generate_summary", lambda path, config: None)
+
+    saves: list[list[int]] = []
+    real_write = batch_executor._atomic_write_yaml
+
+    def recording_write(path: Path, data: dict[str, Any]) -> None:
+        saves.append([b["batch_id"] for b in data["batches"]])
+        real_write(path, data)
+
+    monkeypatch.setattr(batch_executor, "_atomic_write_yaml", recording_write)
+    return saves
+
+
+class TestConcurrentBatches:
+    """execute_tests_in_batches() with batch concurrency."""
+
+    def test_batches_run_in_parallel_and_merge_in_order(
+        self, qa_env: list[list[int]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Batches overlap up to the limit; saved results stay in batch order."""
+        fake = _FakeBatches(total_batches=5)
+        monkeypatch.setattr(batch_executor, "execute_batch", fake)
+
+        state = execute_tests_in_batches(
+            _config(), Path("."), 1, _plan(10), batch_size=2, concurrency=3
+        )
+
+        assert 1 < fake.max_running <= 3
+        assert [b.batch_id for b in state.completed_batches] == [1, 2, 3, 4, 5]
+        assert state.completed_test_count == 10
+        # One incremental save per batch, each sorted, plus the final save
+        assert len(qa_env) == 6
+        assert all(ids == sorted(ids) for ids in qa_env)
+        saved = yaml.safe_load(state.results_path.read_text())
+        assert [b["batch_id"] for b in saved["batches"]] == [1, 2, 3, 4, 5]
+
+    def test_sequential_keeps_previous_summary(
+        self, qa_env: list[list[int]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Concurrency 1 (the config default) runs one batch at a time with context."""
+        fake = _FakeBatches(total_batches=2)
+        monkeypatch.setattr(batch_executor, "execute_batch", fake)
+
+        execute_tests_in_batches(_config(), Path("."), 1, _plan(4), batch_size=2)
+
+        assert fake.max_running == 1
+        assert fake.summaries[1] == ""
+        assert fake.summaries[2].startswith("Previous batches: 1 completed")
+
+    def test_concurrency_defaults_to_config(
+        self, qa_env: list[list[int]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without an explicit value, qa.batch_concurrency applies."""
+        fake = _FakeBatches(total_batches=4)
+        monkeypatch.setattr(batch_executor, "execute_batch", fake)
+
+        execute_tests_in_batches(_config(batch_concurrency=4), Path("."), 1, _plan(8), batch_size=2)
+
+        assert fake.max_running > 1
+
+    def test_categories_run_side_by_side(
+        self, qa_env: list[list[int]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Category B runs alongside A into its own file; merged results list A first."""
+        monkeypatch.setattr(batch_executor, "execute_batch", _FakeBatches(total_batches=2))
+        b_started = threading.Event()
+        b_paths: list[Path | None] = []
+
+        def fake_playwright(
+            config: Any,
+            project_path: Path,
+            epic_id: Any,
+            tests: list[QATestCase],
+            results_path: Path | None = None,
+        ) -> ExecutionState:
+            b_started.set()
+            b_paths.append(results_path)
+            batch = BatchResult(batch_id=1, completed_at="now")
+            for tc in tests:
+                batch.add_result(QATestResult(tc.id, tc.name, "B", "FAIL"))
+            return ExecutionState(
+                epic_id=epic_id,
+                category="B",
+                batch_size=len(tests),
+                run_id="run-b",
+                started_at="now",
+                results_path=results_path or Path(),
+                completed_batches=[batch],
+                total_tests=len(tests),
+                total_batches=1,
+            )
+
+        monkeypatch.setattr(batch_executor, "_execute_playwright_category", fake_playwright)
+
+        state = execute_tests_in_batches(
+            _config(), Path("."), 1, _plan(4, 3), category="all", batch_size=2, concurrency=2
+        )
+
+        assert b_started.is_set()
+        assert b_paths[0] is not None and b_paths[0].name.endswith("-playwright.yaml")
+        assert [b.batch_id for b in state.completed_batches] == [1, 2, 3]
+        assert state.completed_batches[-1].tests[0].category == "B"
+        assert (state.total_passed, state.total_failed) == (4, 3)
@@ -0,0 +1,183 @@
+"""Tests for single-walk evidence discovery."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from bmad_assist.testarch.evidence import discovery, get_evidence_collector
+from bmad_assist.testarch.evidence.collector import clear_all_collectors
+from bmad_assist.testarch.evidence.discovery import clear_discovery_cache, find_evidence_files
+
+PATTERNS = (
+    "coverage/lcov.info",
+    "**/coverage-summary.json",
+    ".coverage",
+    "**/junit.xml",
+    "**/playwright-report/results.json",
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    clear_discovery_cache()
+    yield
+    clear_all_collectors()
+
+
+@pytest.fixture
+def scans(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every directory the discovery walk scans."""
+    scanned: list[str] = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path: str) -> object:
+        scanned.append(os.path.basename(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(discovery.os, "scandir", recording_scandir)
+    return scanned
+
+
+def _touch(root: Path, *paths: str) -> None:
+    for rel in paths:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+
+
+class TestFindEvidenceFiles:
+    """find_evidence_files() matching and pruning."""
+
+    def test_matches_like_glob(self, tmp_path: Path) -> None:
+        """Without ignored directories the result equals per-pattern globbing."""
+        _touch(
+            tmp_path,
+            "coverage/lcov.info",
+            "lcov.info",
+            "web/coverage/coverage-summary.json",
+            "junit.xml",
+            "a/b/junit.xml",
+            "e2e/playwright-report/results.json",
+            "results.json",
+            ".coverage",
+        )
+
+        found = find_evidence_files(tmp_path, PATTERNS)
+
+        expected = [
+            match
+            for pattern in PATTERNS
+            for match in tmp_path.glob(pattern)
+            if match.is_file()
+        ]
+        assert set(found) == set(expected)
+        assert found[tmp_path / ".coverage"] == (tmp_path / ".coverage").stat().st_mtime
+
+    def test_ignored_directories_are_pruned(self, tmp_path: Path, scans: list[str]) -> None:
+        """node_modules and gitignored directories are not walked."""
+        _touch(tmp_path, "node_modules/pkg/junit.xml", "build/out/junit.xml", "src/junit.xml")
+        (tmp_path / ".gitignore").write_text("build/\n")
+
+        found = find_evidence_files(tmp_path, PATTERNS)
+
+        assert list(found) == [tmp_path / "src" / "junit.xml"]
+        assert "node_modules" not in scans and "build" not in scans
+
+    def test_named_directories_and_ignored_files_are_found(self, tmp_path: Path) -> None:
+        """Evidence is usually gitignored; directories named by a pattern are searched."""
+        _touch(
+            tmp_path,
+            "coverage/lcov.info",
+            "e2e/playwright-report/results.json",
+            "junit.xml",
+            ".coverage",
+        )
+        (tmp_path / ".gitignore").write_text("coverage/\nplaywright-report/\njunit.xml\n")
+
+        found = find_evidence_files(tmp_path, PATTERNS)
+
+        assert set(found) == {
+            tmp_path / "coverage" / "lcov.info",
+            tmp_path / "e2e" / "playwright-report" / "results.json",
+            tmp_path / "junit.xml",
+            tmp_path / ".coverage",
+        }
+
+    def test_unreachable_directories_are_not_walked(self, tmp_path: Path, scans: list[str]) -> None:
+        """Anchored patterns only scan the directories they name."""
+        _touch(tmp_path, "coverage/lcov.info", "src/deep/junit.xml")
+
+        found = find_evidence_files(tmp_path, ("coverage/lcov.info", ".coverage"))
+
+        assert list(found) == [tmp_path / "coverage" / "lcov.info"]
+        assert sorted(scans) == sorted([tmp_path.name, "coverage"])
+
+
+class TestDiscoveryCache:
+    """Snapshots are reused until a scanned directory changes."""
+
+    def test_unchanged_tree_is_not_walked_again(self, tmp_path: Path, scans: list[str]) -> None:
+        """A repeat lookup, or one for a subset of patterns, only stats directories."""
+        _touch(tmp_path, "a/junit.xml", "coverage/lcov.info")
+        find_evidence_files(tmp_path, PATTERNS)
+        scans.clear()
+
+        assert list(find_evidence_files(tmp_path, ("**/junit.xml",))) == [
+            tmp_path / "a" / "junit.xml"
+        ]
+        assert scans == []
+
+    def test_new_file_invalidates(self, tmp_path: Path) -> None:
+        """Creating a file changes its directory's mtime."""
+        _touch(tmp_path, "a/junit.xml")
+        find_evidence_files(tmp_path, PATTERNS)
+        os.utime(tmp_path / "a", ns=(0, 0))
+        clear_discovery_cache()
+        find_evidence_files(tmp_path, PATTERNS)
+
+        _touch(tmp_path, "a/b/junit.xml")
+
+        assert tmp_path / "a" / "b" / "junit.xml" in find_evidence_files(tmp_path, PATTERNS)
+
+    def test_rewritten_file_reports_new_mtime(self, tmp_path: Path, scans: list[str]) -> None:
+        """File mtimes are read fresh on every lookup."""
+        _touch(tmp_path, "junit.xml")
+        junit = tmp_path / "junit.xml"
+        find_evidence_files(tmp_path, PATTERNS)
+        scans.clear()
+
+        os.utime(junit, (1000, 1000))
+
+        assert find_evidence_files(tmp_path, PATTERNS) == {junit: 1000}
+        assert scans == []
+
+    def test_gitignore_change_invalidates(self, tmp_path: Path) -> None:
+        """Un-ignoring a directory makes its evidence visible."""
+        _touch(tmp_path, "build/junit.xml")
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("build/\n")
+        assert find_evidence_files(tmp_path, PATTERNS) == {}
+        os.utime(tmp_path, ns=(0, 0))
+        clear_discovery_cache()
+        assert find_evidence_files(tmp_path, PATTERNS) == {}
+
+        gitignore.write_text("dist/\n")
+        os.utime(gitignore, ns=(10**9, 10**9))
+
+        assert list(find_evidence_files(tmp_path, PATTERNS)) == [tmp_path / "build" / "junit.xml"]
+
+    def test_collector_shares_one_walk(self, temp_project_root: Path, scans: list[str]) -> None:
+        """collect_all() walks once for all sources and not at all on a cache hit."""
+        collector = get_evidence_collector(temp_project_root)
+
+        first = collector.collect_all()
+        walked = list(scans)
+        scans.clear()
+        second = collector.collect_all()
+
+        assert first.coverage is not None and first.test_results is not None
+        assert walked.count(temp_project_root.name) == 1
+        assert second is first
+        assert scans == []
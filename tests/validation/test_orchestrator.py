@@ -21,6 +21,7 @@ from bmad_assist.core.config import (
     MasterProviderConfig,
     MultiProviderConfig,
     ProviderConfig,
+    ValidationQuorumConfig,
 )
 from bmad_assist.providers.base import BaseProvider, ProviderResult
 
@@ -375,6 +376,139 @@ class TestParallelInvocation:
                 assert time_spread < 0.5, f"Invocations not parallel: spread={time_spread}s"
 
 
+# =============================================================================
+# Test quorum-based early completion
+# =============================================================================
+
+
+class TestValidationQuorum:
+    """Tests for quorum mode in run_validation_phase."""
+
+    @staticmethod
+    def _run_with_straggler(config: Config, project_path: Path) -> Any:
+        """Run the phase with one validator that blocks until cancelled."""
+        import threading
+
+        from bmad_assist.validation.orchestrator import run_validation_phase
+
+        lock = threading.Lock()
+        call_count = 0
+
+        def invoke_side_effect(*args: Any, **kwargs: Any) -> ProviderResult:
+            nonlocal call_count
+            with lock:
+                call_count += 1
+                is_straggler = call_count == 1
+            if is_straggler:
+                token = kwargs.get("cancel_token")
+                cancelled = token.wait(10) if token is not None else False
+                return ProviderResult(
+                    stdout="",
+                    stderr="cancelled" if cancelled else "",
+                    exit_code=-1 if cancelled else 0,
+                    duration_ms=100,
+                    model="test-model",
+                    command=("test",),
+                )
+            return ProviderResult(
+                stdout="Validation output",
+                stderr="",
+                exit_code=0,
+                duration_ms=100,
+                model="test-model",
+                command=("test",),
+            )
+
+        with (
+            patch("bmad_assist.validation.orchestrator.get_provider") as mock_get_provider,
+            patch("bmad_assist.validation.orchestrator.compile_workflow") as mock_compile,
+        ):
+            mock_provider = MagicMock(spec=BaseProvider)
+            mock_provider.provider_name = "test"
+            mock_provider.invoke.side_effect = invoke_side_effect
+            mock_get_provider.return_value = mock_provider
+
+            mock_compiled = MagicMock()
+            mock_compiled.context = "<compiled-workflow>test</compiled-workflow>"
+            mock_compile.return_value = mock_compiled
+
+            return asyncio.run(
+                run_validation_phase(
+                    config=config,
+                    project_path=project_path,
+                    epic_num=11,
+                    story_num=7,
+                )
+            )
+
+    def test_straggler_cancelled_after_quorum(
+        self,
+        validation_config: Config,
+        project_with_story: Path,
+    ) -> None:
+        """Straggler is cancelled via its token once quorum is reached."""
+        config = validation_config.model_copy(
+            update={
+                "validation_quorum": ValidationQuorumConfig(
+                    enabled=True, min_validators=2, grace_period=0, cancel_wait=5
+                )
+            }
+        )
+
+        result = self._run_with_straggler(config, project_with_story)
+
+        assert result.validation_count == 2
+        assert result.quorum is not None
+        assert result.quorum.reached
+        assert result.quorum.required == 2
+        assert result.quorum.total == 3
+        assert result.quorum.cancelled_validators == result.failed_validators
+        assert len(result.quorum.cancelled_validators) == 1
+        assert result.quorum.max_saved_ms > 0
+        assert result.to_dict()["quorum"]["reached"] is True
+
+    def test_quorum_disabled_waits_for_all(
+        self,
+        validation_config: Config,
+        project_with_story: Path,
+    ) -> None:
+        """Without quorum mode every validator is awaited and no decision recorded."""
+        from bmad_assist.validation.orchestrator import run_validation_phase
+
+        with (
+            patch("bmad_assist.validation.orchestrator.get_provider") as mock_get_provider,
+            patch("bmad_assist.validation.orchestrator.compile_workflow") as mock_compile,
+        ):
+            mock_provider = MagicMock(spec=BaseProvider)
+            mock_provider.provider_name = "test"
+            mock_provider.invoke.return_value = ProviderResult(
+                stdout="Validation output",
+                stderr="",
+                exit_code=0,
+                duration_ms=100,
+                model="test-model",
+                command=("test",),
+            )
+            mock_get_provider.return_value = mock_provider
+
+            mock_compiled = MagicMock()
+            mock_compiled.context = "<compiled-workflow>test</compiled-workflow>"
+            mock_compile.return_value = mock_compiled
+
+            result = asyncio.run(
+                run_validation_phase(
+                    config=validation_config,
+                    project_path=project_with_story,
+                    epic_num=11,
+                    story_num=7,
+                )
+            )
+
+        assert result.validation_count == 3
+        assert result.quorum is None
+        assert "quorum" not in result.to_dict()
+
+
 # =============================================================================
 # Test all-fail scenario (AC: #11)
 # =============================================================================